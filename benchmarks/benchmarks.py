@@ -0,0 +1,381 @@
+# -*- coding: utf-8 -*-
+"""
+benchmarks.benchmarks
+~~~~~~~~~~~~~~~~~~~~~
+
+Benchmarks of the public functions of py_vollib, in the layout of
+airspeed velocity (asv): one class per function, parametrized by the
+number of rows, with ``time_batch`` and ``peakmem_batch`` methods.  They
+can be run by asv, or without it by ``python -m benchmarks.run``.
+
+Functions of the model packages are found by introspection, and their
+arguments are filled in by parameter name from one set of random inputs
+per size.  A function is timed on whole arrays if it accepts them and
+gives the same results as one call per row, and otherwise on a Python
+loop over the rows, which is what a caller has to write for it.  Loops
+stop at ``LOOP_MAX_SIZE`` rows; the slower engines have their own
+limits.
+
+``ImportTime`` times importing each module of py_vollib in a fresh
+interpreter, which must not load any of ``LAZY_DEPENDENCIES``.
+
+"""
+
+
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+from __future__ import division
+import importlib
+import inspect
+import os
+import subprocess
+import sys
+import warnings
+
+# Related third party imports
+import numpy
+
+# Local application/library specific imports
+from py_vollib.binomial import leisen_reimer
+from py_vollib.curves import Curve
+from py_vollib.day_count import Calendar, act_365
+from py_vollib.dividends import DividendSchedule
+from py_vollib.dividends import black_scholes as dividend_black_scholes
+from py_vollib.finite_difference import crank_nicolson
+from py_vollib.helpers.analytical_greeks import GREEKS, greeks
+from py_vollib.helpers.workspace import Workspace
+from py_vollib.monte_carlo import European, monte_carlo
+from py_vollib.portfolio import Portfolio
+from py_vollib.ref_python.black import black
+from py_vollib.ref_python.black_scholes import black_scholes
+from py_vollib.ref_python.black_scholes_merton import black_scholes_merton
+from py_vollib.scenarios import scenario_pnl
+
+
+# -----------------------------------------------------------------------------
+# DATA
+
+SIZES = [1, 10, 100, 1000, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]
+LOOP_MAX_SIZE = 10 ** 5
+
+MODELS = ('black', 'black_scholes', 'black_scholes_merton')
+MODULES = ['', '.greeks.analytical', '.greeks.numerical', '.implied_volatility']
+REF_MODULES = ['', '.greeks.analytical', '.greeks.numerical', '.greeks.automatic', '.greeks.adjoint',
+               '.implied_volatility']
+EXTRA_MODULES = ['py_vollib.black.implied_volatility_table', 'py_vollib.bjerksund_stensland',
+                 'py_vollib.bjerksund_stensland.greeks.numerical']
+# pricing function aliases, doctest drivers and table maintenance
+NOT_BENCHMARKED = ('f', 'test', 'hull_book_tests', 'build_table', 'save_table', 'load_table')
+
+# filled in with the price of the model of the function's package
+PRICE_ARGUMENTS = ('price', 'discounted_option_price')
+
+# imported on first use of the functions that need them
+LAZY_DEPENDENCIES = ('scipy', 'pandas')
+IMPORTED_MODULES = (['py_vollib'] +
+                    ['py_vollib.' + model + suffix for model in MODELS for suffix in MODULES] +
+                    ['py_vollib.ref_python.' + model + suffix for model in MODELS for suffix in REF_MODULES] +
+                    EXTRA_MODULES +
+                    ['py_vollib.' + name for name in ('binomial', 'curves', 'day_count', 'dividends',
+                                                      'finite_difference', 'monte_carlo', 'portfolio',
+                                                      'scenarios')])
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_IMPORT_SCRIPT = '''
+import sys, timeit
+start = timeit.default_timer()
+import {module}
+print(timeit.default_timer() - start)
+print(' '.join(name for name in {lazy!r} if name in sys.modules))
+'''
+
+
+# -----------------------------------------------------------------------------
+# FUNCTIONS - INPUTS
+
+
+class _Inputs(object):
+    """Random option inputs for one size, with the model prices computed
+    on first use."""
+
+    def __init__(self, size):
+        rng = numpy.random.RandomState(size)
+        self.size = size
+        self.flag = numpy.where(rng.rand(size) < .5, 'c', 'p')
+        self.S = numpy.full(size, 100.)
+        self.F = self.S.copy()
+        self.K = rng.uniform(80., 120., size)
+        self.t = rng.uniform(.1, 2., size)
+        self.r = rng.uniform(0., .05, size)
+        self.sigma = rng.uniform(.15, .5, size)
+        self.q = rng.uniform(0., .03, size)
+        self.b = self.r - self.q
+        self.N = numpy.full(size, 2)
+        self._prices = {}
+
+    def price(self, model):
+        if model not in self._prices:
+            if model == 'black':
+                price = black(self.flag, self.F, self.K, self.t, self.r, self.sigma)
+            elif model == 'black_scholes':
+                price = black_scholes(self.flag, self.S, self.K, self.t, self.r, self.sigma)
+            else:
+                price = black_scholes_merton(self.flag, self.S, self.K, self.t, self.r, self.sigma, self.q)
+            self._prices[model] = price
+        return self._prices[model]
+
+    def argument(self, name, model):
+        """Return the input for a parameter name, or None."""
+
+        if name in PRICE_ARGUMENTS:
+            return self.price(model)
+        if name == 'undiscounted_option_price':
+            return self.price('black') * numpy.exp(self.r * self.t)
+        if name == 'x':
+            return numpy.log(self.F / self.K)
+        if name == 's':
+            return self.sigma * numpy.sqrt(self.t)
+        if name == 'beta':
+            return self.price('black') * numpy.exp(self.r * self.t) / numpy.sqrt(self.F * self.K)
+        return getattr(self, name, None)
+
+
+_cache = {}
+
+
+def inputs(size):
+    """Return the inputs for a size, keeping only the latest."""
+
+    if size not in _cache:
+        _cache.clear()
+        _cache[size] = _Inputs(size)
+    return _cache[size]
+
+
+def _rows(arrays, size):
+    return list(zip(*[a.tolist() if isinstance(a, numpy.ndarray) else [a] * size for a in arrays]))
+
+
+def _same(vector, loop):
+    if isinstance(vector, dict):
+        return all(_same(vector[key], [row[key] for row in loop]) for key in vector)
+    vector = numpy.asarray(vector, dtype=float)
+    if not vector.ndim:
+        # a book total
+        return bool(numpy.isclose(vector, numpy.sum(loop), rtol=1e-10, atol=1e-14))
+    return vector.shape == (len(loop),) and bool(numpy.allclose(vector, loop, rtol=1e-10, atol=1e-14,
+                                                               equal_nan=True))
+
+
+def import_time(module):
+    """Import a module in a fresh interpreter.
+
+    :param module: dotted name of the module
+    :type module: str
+
+    :returns:  tuple of the seconds taken, and the list of the
+        ``LAZY_DEPENDENCIES`` the import loaded
+    """
+
+    script = _IMPORT_SCRIPT.format(module=module, lazy=LAZY_DEPENDENCIES)
+    output = subprocess.check_output([sys.executable, '-c', script], cwd=_ROOT).decode().splitlines()
+    return float(output[0]), output[1].split()
+
+
+# -----------------------------------------------------------------------------
+# CLASSES - CASES
+
+
+class Case(object):
+    """A benchmarked function.
+
+    :param name: dotted name of the function
+    :type name: str
+    :param build: returns the function of no arguments to time on some
+        inputs, called with the inputs and whether to use whole arrays
+    :type build: callable
+    :param max_size: largest number of rows
+    :type max_size: int
+    :param check: tells from some inputs whether the function accepts
+        whole arrays; None if it always does
+    :type check: callable or None
+    """
+
+    def __init__(self, name, build, max_size=max(SIZES), check=None):
+        self.name = name
+        self.build = build
+        self.max_size = max_size
+        self.check = check
+        self._vectorized = None
+
+    @property
+    def vectorized(self):
+        if self._vectorized is None:
+            self._vectorized = True if self.check is None else self.check(_Inputs(4))
+        return self._vectorized
+
+    def prepare(self, size):
+        """Return the function of no arguments to time.  Raises
+        NotImplementedError above the size limit, which asv reports as
+        skipped."""
+
+        if size > (self.max_size if self.vectorized else min(self.max_size, LOOP_MAX_SIZE)):
+            raise NotImplementedError("{} is not run on {} rows".format(self.name, size))
+        return self.build(inputs(size), self.vectorized)
+
+
+def _row_case(name, function, model):
+    """Return the case of a function taking one option per row, or None
+    if some of its parameters have no input."""
+
+    names = [p.name for p in inspect.signature(function).parameters.values()
+             if p.default is inspect.Parameter.empty]
+    if any(_Inputs(1).argument(n, model) is None for n in names):
+        return None
+
+    def check(data):
+        arrays = [data.argument(n, model) for n in names]
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            try:
+                return _same(function(*arrays), [function(*row) for row in _rows(arrays, data.size)])
+            except Exception:
+                return False
+
+    def build(data, vectorized):
+        arrays = [data.argument(n, model) for n in names]
+        if vectorized:
+            return lambda: function(*arrays)
+        rows = _rows(arrays, data.size)
+        return lambda: [function(*row) for row in rows]
+
+    return Case(name, build, check=check)
+
+
+def _introspected_cases():
+    modules = ['py_vollib.' + model + suffix for model in MODELS for suffix in MODULES]
+    modules += ['py_vollib.ref_python.' + model + suffix for model in MODELS for suffix in REF_MODULES]
+    cases = []
+    for module_name in modules + EXTRA_MODULES:
+        module = importlib.import_module(module_name)
+        model = next((m for m in reversed(MODELS) if '.' + m in module_name), 'black')
+        for name, function in inspect.getmembers(module, inspect.isfunction):
+            if (function.__module__ != module.__name__ or name.startswith(('_', 'test_')) or
+                    name in NOT_BENCHMARKED):
+                continue
+            case = _row_case(module_name + '.' + name, function, model)
+            if case is not None:
+                cases.append(case)
+    return cases
+
+
+def _engine_cases():
+    curve = Curve([.25, .5, 1., 2., 5.], [.03, .032, .035, .037, .04])
+    schedule = DividendSchedule([.5, .5, .5, .5], [.2, .45, .7, .95])
+    calendar = Calendar(holidays=['2024-07-04', '2024-12-25'], session=(9.5, 16.), overnight_weight=.1)
+
+    def generalized(function):
+        def build(data, vectorized):
+            return lambda: function(data.flag, data.S, data.K, data.t, data.r, data.sigma, data.b)
+        return build
+
+    def paths(data, vectorized):
+        return lambda: monte_carlo(European('c', 100.), 100., 1., .02, .2, 0., paths=data.size, seed=0)
+
+    def scenarios(data, vectorized):
+        return lambda: scenario_pnl(data.flag, data.S, data.K, data.t, data.r, data.sigma, data.q,
+                                    spot_shocks=(-.1, 0., .1), vol_shocks=(-.05, .05), horizons=(0., 1 / 12.),
+                                    aggregate=True)
+
+    def in_place_prices(data, vectorized):
+        out, workspace = numpy.empty(data.size), Workspace()
+        return lambda: black_scholes_merton(data.flag, data.S, data.K, data.t, data.r, data.sigma, data.q,
+                                            out=out, workspace=workspace)
+
+    def in_place_greeks(data, vectorized):
+        out, workspace = dict((name, numpy.empty(data.size)) for name in GREEKS), Workspace()
+        return lambda: greeks(data.flag, data.S, data.K, data.t, data.r, data.sigma, data.b,
+                              out=out, workspace=workspace)
+
+    def portfolio(data, vectorized):
+        return lambda: Portfolio(data.flag, data.S, data.K, data.t, data.r, data.sigma, data.q).greeks()
+
+    def zero_rates(data, vectorized):
+        # a chain has few distinct expirations
+        t = numpy.round(data.t, 2)
+        return lambda: Curve(curve.times, curve.rates).zero_rate(t)
+
+    def dividends(data, vectorized):
+        return lambda: dividend_black_scholes(data.flag, data.S, data.K, data.t, .03, data.sigma, schedule)
+
+    def times(data):
+        now = numpy.datetime64('2024-01-02T10:00') + (data.t * 1e6).astype('timedelta64[s]')
+        return now, now + (data.t * 3.15e7).astype('timedelta64[s]')
+
+    def act(data, vectorized):
+        now, expiry = times(data)
+        return lambda: act_365(now, expiry)
+
+    def business(data, vectorized):
+        now, expiry = times(data)
+        return lambda: calendar.year_fraction(now, expiry)
+
+    return [
+        Case('py_vollib.binomial.leisen_reimer', generalized(leisen_reimer), 10 ** 5),
+        Case('py_vollib.finite_difference.crank_nicolson', generalized(crank_nicolson), 10 ** 5),
+        Case('py_vollib.monte_carlo.monte_carlo', paths),
+        Case('py_vollib.scenarios.scenario_pnl', scenarios, 10 ** 6),
+        Case('py_vollib.ref_python.black_scholes_merton.black_scholes_merton.in_place', in_place_prices),
+        Case('py_vollib.helpers.analytical_greeks.greeks.in_place', in_place_greeks),
+        Case('py_vollib.portfolio.Portfolio.greeks', portfolio),
+        Case('py_vollib.curves.Curve.zero_rate', zero_rates),
+        Case('py_vollib.dividends.black_scholes', dividends),
+        Case('py_vollib.day_count.act_365', act),
+        Case('py_vollib.day_count.Calendar.year_fraction', business),
+    ]
+
+
+def cases():
+    """Return every benchmarked function."""
+
+    return _introspected_cases() + _engine_cases()
+
+
+# -----------------------------------------------------------------------------
+# CLASSES - ASV
+
+
+class Benchmark(object):
+    """Times one function over the sizes of ``SIZES``."""
+
+    params = [SIZES]
+    param_names = ['size']
+    timeout = 3600
+    case = None
+
+    def setup(self, size):
+        self.call = self.case.prepare(size)
+
+    def time_batch(self, size):
+        self.call()
+
+    def peakmem_batch(self, size):
+        self.call()
+
+
+class ImportTime(object):
+    """Times importing a module of py_vollib in a fresh interpreter."""
+
+    params = [IMPORTED_MODULES]
+    param_names = ['module']
+
+    def timeraw_import(self, module):
+        return 'import ' + module
+
+
+for _case in cases():
+    _name = _case.name.replace('py_vollib.', '').replace('.', '_')
+    globals()[_name] = type(_name, (Benchmark,), {'case': _case})
+del _case, _name
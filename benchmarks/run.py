@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""
+benchmarks.run
+~~~~~~~~~~~~~~
+
+Runs the benchmarks of ``benchmarks.benchmarks`` without asv, and writes
+the results as JSON::
+
+    python -m benchmarks.run --sizes 1 1000 100000 --filter 'implied_volatility' -o results.json
+
+Each (function, size) pair is first called once untimed, which warms it
+up and measures its peak memory: the most memory allocated during the
+call beyond what was allocated before it, as traced by ``tracemalloc``,
+which numpy reports its array buffers to.  It is then called repeatedly,
+one timed call at a time, until both ``--repeat`` calls and ``--budget``
+seconds are used up, or just once if the first call alone took longer
+than the budget.  The latencies of the calls give the percentiles, and
+the median gives the throughput in rows per second.
+
+Each module of ``IMPORTED_MODULES`` is then imported ``--repeat`` times,
+each time in a fresh interpreter, under the name ``import <module>``.
+Its result lists the ``LAZY_DEPENDENCIES`` the import loaded, which
+should be none.
+
+"""
+
+
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+from __future__ import division, print_function
+import argparse
+import json
+import platform
+import re
+import subprocess
+import sys
+import time
+import timeit
+import tracemalloc
+
+# Related third party imports
+import numpy
+import scipy
+
+# Local application/library specific imports
+from benchmarks.benchmarks import IMPORTED_MODULES, SIZES, cases, import_time
+
+
+# -----------------------------------------------------------------------------
+# DATA
+
+REPEAT = 3
+BUDGET = 1.
+MAX_CALLS = 10000
+PERCENTILES = (50, 90, 99)
+
+
+# -----------------------------------------------------------------------------
+# FUNCTIONS
+
+
+def measure(call, size, repeat=REPEAT, budget=BUDGET):
+    """Time and trace the memory of one prepared benchmark.
+
+    :param call: function of no arguments
+    :type call: callable
+    :param size: number of rows it processes
+    :type size: int
+    :param repeat: minimum number of timed calls
+    :type repeat: int
+    :param budget: seconds spent on timed calls
+    :type budget: float
+
+    :returns:  dict
+    """
+
+    # the untimed first call warms up and traces the memory
+    clock = timeit.default_timer
+    tracemalloc.start()
+    try:
+        start = clock()
+        baseline = tracemalloc.get_traced_memory()[0]
+        call()
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+        warm_up = clock() - start
+    finally:
+        tracemalloc.stop()
+
+    minimum = repeat if warm_up < budget else 1
+    latencies = []
+    start = clock()
+    while len(latencies) < minimum or (clock() - start < budget and len(latencies) < MAX_CALLS):
+        before = clock()
+        call()
+        latencies.append(clock() - before)
+
+    median = numpy.median(latencies)
+    result = {
+        'size': size,
+        'calls': len(latencies),
+        'latency': _latency(latencies),
+        'throughput': size / median if median > 0 else None,
+        'peak_memory': peak,
+    }
+    return result
+
+
+def measure_import(module, repeat=REPEAT):
+    """Time importing a module, each time in a fresh interpreter.
+
+    :param module: dotted name of the module
+    :type module: str
+    :param repeat: number of imports
+    :type repeat: int
+
+    :returns:  dict
+    """
+
+    latencies, loaded = [], set()
+    for _ in range(repeat):
+        seconds, dependencies = import_time(module)
+        latencies.append(seconds)
+        loaded.update(dependencies)
+    return {
+        'calls': repeat,
+        'latency': _latency(latencies),
+        'loaded': sorted(loaded),
+    }
+
+
+def _latency(latencies):
+    latencies = numpy.array(latencies)
+    return dict([('min', latencies.min()), ('max', latencies.max())] +
+                [('p{}'.format(p), numpy.percentile(latencies, p)) for p in PERCENTILES])
+
+
+def metadata():
+    """Describe the machine and the versions the results come from."""
+
+    try:
+        commit = subprocess.check_output(['git', 'rev-parse', 'HEAD'], stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'date': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'commit': commit,
+        'python': platform.python_version(),
+        'numpy': numpy.__version__,
+        'scipy': scipy.__version__,
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+    }
+
+
+def run(sizes=SIZES, pattern=None, repeat=REPEAT, budget=BUDGET, log=None):
+    """Run the benchmarks whose names match a regular expression.
+
+    :returns:  dict with keys 'metadata' and 'results'
+    """
+
+    results = []
+    for case in cases():
+        if pattern is not None and not re.search(pattern, case.name):
+            continue
+        for size in sizes:
+            try:
+                call = case.prepare(size)
+            except NotImplementedError:
+                continue
+            result = measure(call, size, repeat, budget)
+            result.update(benchmark=case.name, vectorized=case.vectorized)
+            results.append(result)
+            if log is not None:
+                print('{:<90} {:>9} {:>12.3e} s {:>12.4g} rows/s {:>12} B'.format(
+                    case.name, size, result['latency']['p50'], result['throughput'] or float('nan'),
+                    result['peak_memory']), file=log)
+
+    for module in IMPORTED_MODULES:
+        name = 'import ' + module
+        if pattern is not None and not re.search(pattern, name):
+            continue
+        result = measure_import(module, repeat)
+        result.update(benchmark=name)
+        results.append(result)
+        if log is not None:
+            print('{:<90} {:>9} {:>12.3e} s {}'.format(name, '', result['latency']['p50'],
+                                                       ' '.join(result['loaded'])), file=log)
+    return {'metadata': metadata(), 'results': results}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES, help='numbers of rows')
+    parser.add_argument('--filter', default=None, help='regular expression on the benchmark names')
+    parser.add_argument('--repeat', type=int, default=REPEAT, help='minimum number of timed calls')
+    parser.add_argument('--budget', type=float, default=BUDGET, help='seconds of timed calls per benchmark')
+    parser.add_argument('-o', '--output', default=None, help='JSON file; standard output if omitted')
+    args = parser.parse_args(argv)
+
+    report = run(args.sizes, args.filter, args.repeat, args.budget, log=sys.stderr)
+    if args.output is None:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        with open(args.output, 'w') as output:
+            json.dump(report, output, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+"""
+py_vollib.binomial
+~~~~~~~~~~~~~~~~~~
+
+A library for option pricing, implied volatility, and
+greek calculation.  py_vollib is based on lets_be_rational,
+a Python wrapper for LetsBeRational by Peter Jaeckel as
+described below.
+
+:copyright: © 2017 Gammon Capital LLC
+:license: MIT, see LICENSE for more details.
+
+About LetsBeRational:
+~~~~~~~~~~~~~~~~~~~~~
+
+The source code of LetsBeRational resides at www.jaeckel.org/LetsBeRational.7z .
+
+::
+
+    ========================================================================================
+    Copyright © 2013-2014 Peter Jäckel.
+
+    Permission to use, copy, modify, and distribute this software is freely granted,
+    provided that this notice is preserved.
+
+    WARRANTY DISCLAIMER
+    The Software is provided "as is" without warranty of any kind, either express or implied,
+    including without limitation any implied warranties of condition, uninterrupted use,
+    merchantability, fitness for a particular purpose, or non-infringement.
+    ========================================================================================
+
+
+Note about the parameter "b":
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+::
+
+    ======================================================================================
+    from Espen Gaarder Haug's
+    "The Complete Guide to Option Pricing Formulas," Second Edition,
+    page 90.
+    
+    +-----------+------------------------------------------------------+
+    | b = r     |  gives the Black and Scholes (1973) stock option     |
+    |           |  model                                               |
+    +-----------+------------------------------------------------------+
+    | b = r -q  |  gives the Merton (1973) stock option model with     |
+    |           |  continuous dividend yield q                         |
+    +-----------+------------------------------------------------------+
+    | b = 0     |  gives the Black (1976) futures option model         |
+    +-----------+------------------------------------------------------+
+    | b = 0 and |  gives the Asay (1982) margined futures option model |
+    | r = 0     |                                                      |
+    +-----------+------------------------------------------------------+
+    ======================================================================================
+
+
+Leisen-Reimer binomial trees:
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Leisen and Reimer (1996) choose the up and down probabilities of a
+binomial tree with the Peizer-Pratt inversion of the normal distribution,
+so that European prices converge at second order in the number of steps,
+which must be odd.  Many options are priced at once: every row of the
+batch carries its own tree, and backward induction updates a single layer
+of node values in place, so memory is proportional to the number of steps
+times the number of options.  Delta, gamma and theta are read off the
+first layers of the same trees.
+
+"""
+
+
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+from __future__ import division
+
+# Related third party imports
+import numpy
+
+# Local application/library specific imports
+from py_vollib.curves import zero_rate
+from py_vollib.helpers import binary_flag_array
+
+
+# -----------------------------------------------------------------------------
+# DATA
+
+STEPS = 201
+
+
+# -----------------------------------------------------------------------------
+# FUNCTIONS - HELPERS
+
+
+def _peizer_pratt(z, n):
+    """The Peizer-Pratt method 2 inversion used by Leisen and Reimer."""
+
+    return .5 + numpy.sign(z) * .5 * numpy.sqrt(
+        1. - numpy.exp(-(z / (n + 1. / 3. + .1 / (n + 1.))) ** 2 * (n + 1. / 6.)))
+
+
+def _backward_induction(sign, S, K, t, r, sigma, b, american, steps):
+    """Roll a batch of trees back to their roots.
+
+    American rows must come first in the batch.  Returns the node values
+    of the first three layers and the tree parameters needed to read the
+    greeks off them.
+    """
+
+    dt = t / steps
+    sigma_sqrt_t = sigma * numpy.sqrt(t)
+    d1 = (numpy.log(S / K) + (b + sigma * sigma / 2.) * t) / sigma_sqrt_t
+    d2 = d1 - sigma_sqrt_t
+    p = _peizer_pratt(d2, steps)
+    growth = numpy.exp(b * dt)
+    u = growth * _peizer_pratt(d1, steps) / p
+    d = (growth - p * u) / (1. - p)
+    discount = numpy.exp(-r * dt)
+
+    # nodes run along the first axis and options along the second, so that
+    # each layer is a contiguous block of memory
+    up = numpy.arange(steps + 1)[:, None]
+    spot = S * numpy.exp(up * numpy.log(u) + (steps - up) * numpy.log(d))
+    value = numpy.maximum(sign * (spot - K), 0.)
+    work = numpy.empty_like(value)
+
+    n_american = numpy.count_nonzero(american)
+    american = slice(0, n_american)
+    signed_spot = sign[american] * spot[:, american]
+    signed_K = sign[american] * K[american]
+    p_discount = p * discount
+    q_discount = (1. - p) * discount
+
+    layers = {}
+    for i in range(steps - 1, -1, -1):
+        nodes = slice(0, i + 1)
+        numpy.multiply(value[1:i + 2], p_discount, out=work[nodes])
+        numpy.multiply(value[nodes], q_discount, out=value[nodes])
+        value[nodes] += work[nodes]
+
+        if n_american:
+            numpy.divide(signed_spot[nodes], d[american], out=signed_spot[nodes])
+            exercise = work[nodes, american]
+            numpy.subtract(signed_spot[nodes], signed_K, out=exercise)
+            numpy.maximum(value[nodes, american], exercise, out=value[nodes, american])
+
+        if i < 3:
+            layers[i] = value[nodes].copy()
+
+    return layers, u, d, dt
+
+
+def _lattice(flag, S, K, t, r, sigma, b, steps, american, greeks):
+    """Price a batch with Leisen-Reimer trees, optionally with tree greeks."""
+
+    sign = binary_flag_array(flag)
+    sign, S, K, t, r, sigma, b, american = numpy.broadcast_arrays(
+        sign, *[numpy.asarray(v, dtype=float) for v in (S, K, t, r, sigma, b)] + [numpy.asarray(american, dtype=bool)])
+    shape = S.shape
+    sign, S, K, t, r, sigma, b, american = [v.ravel() for v in (sign, S, K, t, r, sigma, b, american)]
+    steps = max(int(steps) | 1, 3)
+
+    result = {
+        'price': numpy.maximum(sign * (S - K), 0.),
+        'delta': numpy.where(S == K, .5 * sign, numpy.where(sign * (S - K) > 0, sign, 0.)),
+        'gamma': numpy.where(S == K, numpy.inf, 0.),
+        'theta': numpy.zeros(S.size),
+    }
+
+    live = numpy.flatnonzero(t > 0)
+    live = live[numpy.argsort(~american[live], kind='stable')]
+    if live.size:
+        args = [v[live] for v in (sign, S, K, t, r, sigma, b, american)]
+        layers, u, d, dt = _backward_induction(*args, steps=steps)
+        S_ = S[live]
+        result['price'][live] = layers[0][0]
+
+        if greeks:
+            S_u, S_d = S_ * u, S_ * d
+            S_uu, S_ud, S_dd = S_u * u, S_u * d, S_d * d
+            V1, V2 = layers[1], layers[2]
+            delta = (V1[1] - V1[0]) / (S_u - S_d)
+            gamma = ((V2[2] - V2[1]) / (S_uu - S_ud) -
+                     (V2[1] - V2[0]) / (S_ud - S_dd)) / (.5 * (S_uu - S_dd))
+            # the middle node of the second layer is not at S, so take the
+            # move in the underlying out of it before differencing in time
+            dS = S_ud - S_
+            theta = (V2[1] - delta * dS - .5 * gamma * dS * dS - layers[0][0]) / (2. * dt)
+            result['delta'][live] = delta
+            result['gamma'][live] = gamma
+            result['theta'][live] = theta / 365.
+
+    return dict((name, value.reshape(shape)[()]) for name, value in result.items())
+
+
+# -----------------------------------------------------------------------------
+# FUNCTIONS - PRICING
+
+
+def leisen_reimer(flag, S, K, t, r, sigma, b, steps=STEPS, american=True):
+    """Return the Leisen-Reimer binomial tree price of American or
+    European options.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param S: underlying asset price
+    :type S: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: annualized standard deviation, or volatility
+    :type sigma: float or numpy.ndarray
+    :param b: cost of carry, see above
+    :type b: float or numpy.ndarray
+    :param steps: number of time steps, rounded up to an odd number
+    :type steps: int
+    :param american: allow early exercise
+    :type american: bool or numpy.ndarray
+
+    :returns:  float or numpy.ndarray
+
+    >>> from py_vollib.black_scholes import black_scholes
+    >>> european = leisen_reimer('p', 100., 105., .5, .05, .25, .05, american=False)
+    >>> abs(european - black_scholes('p', 100., 105., .5, .05, .25)) < 1e-4
+    True
+    >>> bool(leisen_reimer('p', 100., 105., .5, .05, .25, .05) > european)
+    True
+    >>> leisen_reimer(['c', 'p'], 100., 95., 0., .05, .2, .05)
+    array([5., 0.])
+    """
+
+    r = zero_rate(r, t)
+    return _lattice(flag, S, K, t, r, sigma, b, steps, american, greeks=False)['price']
+
+
+def leisen_reimer_greeks(flag, S, K, t, r, sigma, b, steps=STEPS, american=True):
+    """Return the Leisen-Reimer price, delta, gamma and theta of American or
+    European options, all read off one set of trees.  Theta is per
+    calendar day, as in ``py_vollib.helpers.numerical_greeks``.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param S: underlying asset price
+    :type S: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: annualized standard deviation, or volatility
+    :type sigma: float or numpy.ndarray
+    :param b: cost of carry, see above
+    :type b: float or numpy.ndarray
+    :param steps: number of time steps, rounded up to an odd number
+    :type steps: int
+    :param american: allow early exercise
+    :type american: bool or numpy.ndarray
+
+    :returns:  dict with keys 'price', 'delta', 'gamma' and 'theta'
+
+    >>> from py_vollib.black_scholes.greeks import analytical
+    >>> result = leisen_reimer_greeks('c', 100., 105., .5, .05, .25, .05, american=False)
+    >>> abs(result['delta'] - analytical.delta('c', 100., 105., .5, .05, .25)) < 1e-3
+    True
+    >>> abs(result['theta'] - analytical.theta('c', 100., 105., .5, .05, .25)) < 1e-4
+    True
+    """
+
+    r = zero_rate(r, t)
+    return _lattice(flag, S, K, t, r, sigma, b, steps, american, greeks=True)
+
+
+if __name__ == "__main__":
+    from py_vollib.helpers.doctest_helper import run_doctest
+    run_doctest()
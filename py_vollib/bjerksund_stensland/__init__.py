@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+
+"""
+py_vollib.bjerksund_stensland
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+A library for option pricing, implied volatility, and
+greek calculation.  py_vollib is based on lets_be_rational,
+a Python wrapper for LetsBeRational by Peter Jaeckel as
+described below.
+
+:copyright: © 2017 Gammon Capital LLC
+:license: MIT, see LICENSE for more details.
+
+About LetsBeRational:
+~~~~~~~~~~~~~~~~~~~~~
+
+The source code of LetsBeRational resides at www.jaeckel.org/LetsBeRational.7z .
+
+::
+
+    ========================================================================================
+    Copyright © 2013-2014 Peter Jäckel.
+
+    Permission to use, copy, modify, and distribute this software is freely granted,
+    provided that this notice is preserved.
+
+    WARRANTY DISCLAIMER
+    The Software is provided "as is" without warranty of any kind, either express or implied,
+    including without limitation any implied warranties of condition, uninterrupted use,
+    merchantability, fitness for a particular purpose, or non-infringement.
+    ========================================================================================
+
+
+Note about the parameter "b":
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+::
+
+    ======================================================================================
+    from Espen Gaarder Haug's
+    "The Complete Guide to Option Pricing Formulas," Second Edition,
+    page 90.
+    
+    +-----------+------------------------------------------------------+
+    | b = r     |  gives the Black and Scholes (1973) stock option     |
+    |           |  model                                               |
+    +-----------+------------------------------------------------------+
+    | b = r -q  |  gives the Merton (1973) stock option model with     |
+    |           |  continuous dividend yield q                         |
+    +-----------+------------------------------------------------------+
+    | b = 0     |  gives the Black (1976) futures option model         |
+    +-----------+------------------------------------------------------+
+    | b = 0 and |  gives the Asay (1982) margined futures option model |
+    | r = 0     |                                                      |
+    +-----------+------------------------------------------------------+
+    ======================================================================================
+
+
+Bjerksund-Stensland (2002):
+~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+American options are priced with the two-step flat exercise boundary
+approximation of Bjerksund and Stensland (2002), as given on pages 104-107
+of Haug.  A call is never exercised early when ``b >= r`` and is then
+worth the generalized Black-Scholes price.  Puts are priced through the
+put-call transformation ``P(S, K, t, r, b) = C(K, S, t, r - b, -b)``.
+All inputs may be arrays; only the rows that can be exercised early go
+through the approximation.
+
+"""
+
+
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+from __future__ import division
+
+# Related third party imports
+import numpy
+
+# Local application/library specific imports
+from py_vollib.curves import zero_rate
+from py_vollib.helpers import binary_flag_array
+from py_vollib.helpers.distributions import CND, CBND
+
+
+# -----------------------------------------------------------------------------
+# FUNCTIONS - HELPERS
+
+
+def _european_call(S, K, t, r, sigma, b):
+    """The generalized Black-Scholes price of a European call."""
+
+    sigma_sqrt_t = sigma * numpy.sqrt(t)
+    d1 = (numpy.log(S / K) + (b + sigma * sigma / 2.) * t) / sigma_sqrt_t
+    d2 = d1 - sigma_sqrt_t
+    return S * numpy.exp((b - r) * t) * CND(d1) - K * numpy.exp(-r * t) * CND(d2)
+
+
+def _phi(S, T, gamma, H, I, r, b, sigma):
+    """Haug's phi function for a single flat exercise boundary I."""
+
+    sigma2 = sigma * sigma
+    sigma_sqrt_T = sigma * numpy.sqrt(T)
+    lambda_ = (-r + gamma * b + .5 * gamma * (gamma - 1) * sigma2) * T
+    d = -(numpy.log(S / H) + (b + (gamma - .5) * sigma2) * T) / sigma_sqrt_T
+    kappa = 2 * b / sigma2 + (2 * gamma - 1)
+    return numpy.exp(lambda_) * S ** gamma * (
+        CND(d) - (I / S) ** kappa * CND(d - 2 * numpy.log(I / S) / sigma_sqrt_T))
+
+
+def _psi(S, T2, gamma, H, I2, I1, t1, r, b, sigma):
+    """Haug's psi function for the boundaries I1 (until t1) and I2 (until T2)."""
+
+    sigma2 = sigma * sigma
+    drift = (b + (gamma - .5) * sigma2)
+    sigma_sqrt_t1 = sigma * numpy.sqrt(t1)
+    sigma_sqrt_T2 = sigma * numpy.sqrt(T2)
+
+    e1 = (numpy.log(S / I1) + drift * t1) / sigma_sqrt_t1
+    e2 = (numpy.log(I2 ** 2 / (S * I1)) + drift * t1) / sigma_sqrt_t1
+    e3 = (numpy.log(S / I1) - drift * t1) / sigma_sqrt_t1
+    e4 = (numpy.log(I2 ** 2 / (S * I1)) - drift * t1) / sigma_sqrt_t1
+
+    f1 = (numpy.log(S / H) + drift * T2) / sigma_sqrt_T2
+    f2 = (numpy.log(I2 ** 2 / (S * H)) + drift * T2) / sigma_sqrt_T2
+    f3 = (numpy.log(I1 ** 2 / (S * H)) + drift * T2) / sigma_sqrt_T2
+    f4 = (numpy.log(S * I1 ** 2 / (H * I2 ** 2)) + drift * T2) / sigma_sqrt_T2
+
+    rho = numpy.sqrt(t1 / T2)
+    lambda_ = -r + gamma * b + .5 * gamma * (gamma - 1) * sigma2
+    kappa = 2 * b / sigma2 + (2 * gamma - 1)
+
+    return numpy.exp(lambda_ * T2) * S ** gamma * (
+        CBND(-e1, -f1, rho) - (I2 / S) ** kappa * CBND(-e2, -f2, rho)
+        - (I1 / S) ** kappa * CBND(-e3, -f3, -rho) + (I1 / I2) ** kappa * CBND(-e4, -f4, -rho))
+
+
+def _american_call(S, K, T, r, sigma, b):
+    """The Bjerksund-Stensland (2002) price of American calls with b < r and T > 0."""
+
+    sigma2 = sigma * sigma
+    t1 = .5 * (numpy.sqrt(5.) - 1) * T
+    beta = (.5 - b / sigma2) + numpy.sqrt((b / sigma2 - .5) ** 2 + 2 * r / sigma2)
+    B_infinity = beta / (beta - 1) * K
+    B0 = numpy.maximum(K, r / (r - b) * K)
+    scale = K * K / ((B_infinity - B0) * B0)
+    ht1 = -(b * t1 + 2 * sigma * numpy.sqrt(t1)) * scale
+    ht2 = -(b * T + 2 * sigma * numpy.sqrt(T)) * scale
+    I1 = B0 + (B_infinity - B0) * (1 - numpy.exp(ht1))
+    I2 = B0 + (B_infinity - B0) * (1 - numpy.exp(ht2))
+    alpha1 = (I1 - K) * I1 ** -beta
+    alpha2 = (I2 - K) * I2 ** -beta
+
+    args = (r, b, sigma)
+    price = (alpha2 * S ** beta - alpha2 * _phi(S, t1, beta, I2, I2, *args)
+             + _phi(S, t1, 1, I2, I2, *args) - _phi(S, t1, 1, I1, I2, *args)
+             - K * _phi(S, t1, 0, I2, I2, *args) + K * _phi(S, t1, 0, I1, I2, *args)
+             + alpha1 * _phi(S, t1, beta, I1, I2, *args)
+             - alpha1 * _psi(S, T, beta, I1, I2, I1, t1, *args)
+             + _psi(S, T, 1, I1, I2, I1, t1, *args) - _psi(S, T, 1, K, I2, I1, t1, *args)
+             - K * _psi(S, T, 0, I1, I2, I1, t1, *args) + K * _psi(S, T, 0, K, I2, I1, t1, *args))
+
+    return numpy.where(S >= I2, S - K, price)
+
+
+# -----------------------------------------------------------------------------
+# FUNCTIONS - PRICING
+
+
+def bjerksund_stensland(flag, S, K, t, r, sigma, b):
+    """Return the Bjerksund-Stensland (2002) price of an American option.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param S: underlying asset price
+    :type S: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: annualized standard deviation, or volatility
+    :type sigma: float or numpy.ndarray
+    :param b: cost of carry, see above
+    :type b: float or numpy.ndarray
+
+    :returns:  float or numpy.ndarray
+
+    An American call on a future, compared with a 4000 step binomial tree.
+
+    >>> c_tree_value = 3.1265
+    >>> c_calc = bjerksund_stensland('c', 100., 100., .1, .1, .25, 0.)
+    >>> abs(c_calc - c_tree_value) < .001
+    True
+
+    Options expiring now are worth their intrinsic value, and a call on a
+    non-dividend paying stock is never exercised early.
+
+    >>> bjerksund_stensland(['c', 'p'], 100., 95., 0., .05, .2, .05)
+    array([5., 0.])
+    >>> from py_vollib.black_scholes import black_scholes
+    >>> abs(bjerksund_stensland('c', 100., 95., .5, .05, .2, .05) - black_scholes('c', 100., 95., .5, .05, .2)) < 1e-12
+    True
+    """
+
+    r = zero_rate(r, t)
+    sign = binary_flag_array(flag)
+    sign, S, K, t, r, sigma, b = numpy.broadcast_arrays(
+        sign, *[numpy.asarray(v, dtype=float) for v in (S, K, t, r, sigma, b)])
+    shape = S.shape
+    sign, S, K, t, r, sigma, b = [v.ravel() for v in (sign, S, K, t, r, sigma, b)]
+
+    put = sign < 0
+    S, K = numpy.where(put, K, S), numpy.where(put, S, K)
+    r, b = numpy.where(put, r - b, r), numpy.where(put, -b, b)
+
+    price = numpy.maximum(S - K, 0.)
+    live = t > 0
+    european = numpy.flatnonzero(live & (b >= r))
+    american = numpy.flatnonzero(live & (b < r))
+    price[european] = _european_call(*[v[european] for v in (S, K, t, r, sigma, b)])
+    price[american] = _american_call(*[v[american] for v in (S, K, t, r, sigma, b)])
+
+    return price.reshape(shape)[()]
+
+
+if __name__ == "__main__":
+    from py_vollib.helpers.doctest_helper import run_doctest
+    run_doctest()
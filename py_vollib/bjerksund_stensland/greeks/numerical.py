@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+
+"""
+py_vollib.bjerksund_stensland.greeks.numerical
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+A library for option pricing, implied volatility, and
+greek calculation.  py_vollib is based on lets_be_rational,
+a Python wrapper for LetsBeRational by Peter Jaeckel as
+described below.
+
+:copyright: © 2017 Gammon Capital LLC
+:license: MIT, see LICENSE for more details.
+
+About LetsBeRational:
+~~~~~~~~~~~~~~~~~~~~~
+
+The source code of LetsBeRational resides at www.jaeckel.org/LetsBeRational.7z .
+
+::
+
+    ========================================================================================
+    Copyright © 2013-2014 Peter Jäckel.
+
+    Permission to use, copy, modify, and distribute this software is freely granted,
+    provided that this notice is preserved.
+
+    WARRANTY DISCLAIMER
+    The Software is provided "as is" without warranty of any kind, either express or implied,
+    including without limitation any implied warranties of condition, uninterrupted use,
+    merchantability, fitness for a particular purpose, or non-infringement.
+    ========================================================================================
+
+
+Note about the parameter "b":
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+::
+
+    ======================================================================================
+    from Espen Gaarder Haug's
+    "The Complete Guide to Option Pricing Formulas," Second Edition,
+    page 90.
+    
+    +-----------+------------------------------------------------------+
+    | b = r     |  gives the Black and Scholes (1973) stock option     |
+    |           |  model                                               |
+    +-----------+------------------------------------------------------+
+    | b = r -q  |  gives the Merton (1973) stock option model with     |
+    |           |  continuous dividend yield q                         |
+    +-----------+------------------------------------------------------+
+    | b = 0     |  gives the Black (1976) futures option model         |
+    +-----------+------------------------------------------------------+
+    | b = 0 and |  gives the Asay (1982) margined futures option model |
+    | r = 0     |                                                      |
+    +-----------+------------------------------------------------------+
+    ======================================================================================
+
+
+Greeks of the Bjerksund-Stensland price:
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+The approximation has no convenient closed-form sensitivities, so the
+greeks are central differences with the same bumps, units and expiry
+conventions as ``py_vollib.helpers.numerical_greeks``.  Each bump
+reprices every option at once, so all inputs may be arrays.
+
+"""
+
+
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+from __future__ import division
+
+# Related third party imports
+import numpy
+
+# Local application/library specific imports
+from py_vollib.bjerksund_stensland import bjerksund_stensland
+from py_vollib.curves import zero_rate
+from py_vollib.helpers.numerical_greeks import dS
+
+
+# -----------------------------------------------------------------------------
+# FUNCTIONS - NUMERICAL GREEK CALCULATION
+
+
+def _one_day_earlier(t):
+    t = numpy.asarray(t, dtype=float)
+    return numpy.where(t <= 1. / 365., 0.00001, t - 1. / 365.)
+
+
+def _gamma(flag, S, K, t, r, sigma, b, price):
+    S = numpy.asarray(S, dtype=float)
+    gamma = (bjerksund_stensland(flag, S + dS, K, t, r, sigma, b) - 2. * price +
+             bjerksund_stensland(flag, S - dS, K, t, r, sigma, b)) / dS ** 2.
+    return numpy.where(numpy.asarray(t) == 0, numpy.where(S == K, numpy.inf, 0.), gamma)[()]
+
+
+def delta(flag, S, K, t, r, sigma, b):
+    """Returns the Bjerksund-Stensland delta of an American option.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param S: underlying asset price
+    :type S: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: annual risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: volatility
+    :type sigma: float or numpy.ndarray
+    :param b: cost of carry
+    :type b: float or numpy.ndarray
+
+    :returns:  float or numpy.ndarray
+
+    >>> delta(['c', 'p'], 100., [90., 110.], 0., .05, .2, 0.)
+    array([ 1., -1.])
+    """
+
+    r = zero_rate(r, t)
+    S = numpy.asarray(S, dtype=float)
+    return (bjerksund_stensland(flag, S + dS, K, t, r, sigma, b) -
+            bjerksund_stensland(flag, S - dS, K, t, r, sigma, b)) / (2 * dS)
+
+
+def theta(flag, S, K, t, r, sigma, b):
+    """Returns the Bjerksund-Stensland theta of an American option,
+    the change in price over one calendar day.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param S: underlying asset price
+    :type S: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: annual risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: volatility
+    :type sigma: float or numpy.ndarray
+    :param b: cost of carry
+    :type b: float or numpy.ndarray
+
+    :returns:  float or numpy.ndarray
+    """
+
+    r = zero_rate(r, t)
+    return (bjerksund_stensland(flag, S, K, _one_day_earlier(t), r, sigma, b) -
+            bjerksund_stensland(flag, S, K, t, r, sigma, b))
+
+
+def vega(flag, S, K, t, r, sigma, b):
+    """Returns the Bjerksund-Stensland vega of an American option,
+    per percentage point of volatility.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param S: underlying asset price
+    :type S: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: annual risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: volatility
+    :type sigma: float or numpy.ndarray
+    :param b: cost of carry
+    :type b: float or numpy.ndarray
+
+    :returns:  float or numpy.ndarray
+    """
+
+    r = zero_rate(r, t)
+    sigma = numpy.asarray(sigma, dtype=float)
+    return (bjerksund_stensland(flag, S, K, t, r, sigma + 0.01, b) -
+            bjerksund_stensland(flag, S, K, t, r, sigma - 0.01, b)) / 2.
+
+
+def rho(flag, S, K, t, r, sigma, b):
+    """Returns the Bjerksund-Stensland rho of an American option, per
+    percentage point of the interest rate.  As in
+    ``py_vollib.helpers.numerical_greeks``, r and b move together.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param S: underlying asset price
+    :type S: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: annual risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: volatility
+    :type sigma: float or numpy.ndarray
+    :param b: cost of carry
+    :type b: float or numpy.ndarray
+
+    :returns:  float or numpy.ndarray
+    """
+
+    r = zero_rate(r, t)
+    r = numpy.asarray(r, dtype=float)
+    b = numpy.asarray(b, dtype=float)
+    return (bjerksund_stensland(flag, S, K, t, r + 0.01, sigma, b + 0.01) -
+            bjerksund_stensland(flag, S, K, t, r - 0.01, sigma, b - 0.01)) / 2.
+
+
+def gamma(flag, S, K, t, r, sigma, b):
+    """Returns the Bjerksund-Stensland gamma of an American option.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param S: underlying asset price
+    :type S: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: annual risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: volatility
+    :type sigma: float or numpy.ndarray
+    :param b: cost of carry
+    :type b: float or numpy.ndarray
+
+    :returns:  float or numpy.ndarray
+    """
+
+    r = zero_rate(r, t)
+    return _gamma(flag, S, K, t, r, sigma, b, bjerksund_stensland(flag, S, K, t, r, sigma, b))
+
+
+def greeks(flag, S, K, t, r, sigma, b):
+    """Returns the Bjerksund-Stensland price, delta, gamma, theta, vega and
+    rho of American options, sharing the unbumped price between them.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param S: underlying asset price
+    :type S: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: annual risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: volatility
+    :type sigma: float or numpy.ndarray
+    :param b: cost of carry
+    :type b: float or numpy.ndarray
+
+    :returns:  dict with keys 'price', 'delta', 'gamma', 'theta', 'vega' and 'rho'
+
+    >>> result = greeks('p', 100., 100., .5, .08, .2, .08)
+    >>> abs(result['vega'] - vega('p', 100., 100., .5, .08, .2, .08)) < 1e-15
+    True
+    """
+
+    r = zero_rate(r, t)
+    price = bjerksund_stensland(flag, S, K, t, r, sigma, b)
+    return {
+        'price': price,
+        'delta': delta(flag, S, K, t, r, sigma, b),
+        'gamma': _gamma(flag, S, K, t, r, sigma, b, price),
+        'theta': bjerksund_stensland(flag, S, K, _one_day_earlier(t), r, sigma, b) - price,
+        'vega': vega(flag, S, K, t, r, sigma, b),
+        'rho': rho(flag, S, K, t, r, sigma, b),
+    }
+
+
+if __name__ == "__main__":
+    from py_vollib.helpers.doctest_helper import run_doctest
+    run_doctest()
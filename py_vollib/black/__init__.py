@@ -48,6 +48,7 @@ import numpy
 from numpy import log, sqrt
 
 # Local application/library specific imports
+from py_vollib.curves import zero_rate
 from py_vollib.helpers import binary_flag
 
 
@@ -78,6 +79,7 @@ def black(flag, F, K, t, r, sigma):
 
     """
     
+    r = zero_rate(r, t)
     deflater = numpy.exp(-r * t)
     return undiscounted_black(F, K, sigma, t, flag) * deflater
 
@@ -46,7 +46,8 @@ import numpy
 
 # Local application/library specific imports
 from py_lets_be_rational import norm_cdf as N
-from py_vollib.helpers import pdf
+from py_vollib.curves import zero_rate
+from py_vollib.helpers import analytical_greeks, as_dtype, pdf
 from py_vollib.black import black
 from py_vollib.ref_python.black import d1, d2
 
@@ -84,6 +85,7 @@ def delta(flag, F, K, t, r, sigma):
     True
     """
 
+    r = zero_rate(r, t)
     D1 = d1(F, K, t, r, sigma)
 
     if flag == 'p':
@@ -127,6 +129,7 @@ def theta(flag, F, K, t, r, sigma):
     True
     """
 
+    r = zero_rate(r, t)
     e_to_the_minus_rt = numpy.exp(-r*t)
     two_sqrt_t = 2 * numpy.sqrt(t)
 
@@ -178,6 +181,7 @@ def gamma(flag, F, K, t, r, sigma):
     True
     """
 
+    r = zero_rate(r, t)
     D1 = d1(F, K, t, r, sigma)
     return pdf(D1)*numpy.exp(-r*t)/(F*sigma*numpy.sqrt(t))
 
@@ -221,6 +225,7 @@ def vega(flag, F, K, t, r, sigma):
     True
     """
 
+    r = zero_rate(r, t)
     D1 = d1(F, K, t, r, sigma)
     return F * numpy.exp(-r*t) * pdf(D1) * numpy.sqrt(t) * 0.01
 
@@ -268,9 +273,215 @@ def rho(flag, F, K, t, r, sigma):
     True
     """
 
+    r = zero_rate(r, t)
     return -t * black(flag, F, K, t, r, sigma) * .01
 
 
+def vanna(flag, F, K, t, r, sigma):
+    """Returns the Black vanna of an option, the change in delta
+    per 1% change in volatility.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param F: underlying futures price
+    :type F: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: annual risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: volatility
+    :type sigma: float or numpy.ndarray
+
+    :returns:  float or numpy.ndarray
+    """
+
+    r = zero_rate(r, t)
+    b = 0
+
+    return analytical_greeks.vanna(flag, F, K, t, r, sigma, b)
+
+
+def volga(flag, F, K, t, r, sigma):
+    """Returns the Black volga of an option, the change in vega
+    per 1% change in volatility.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param F: underlying futures price
+    :type F: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: annual risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: volatility
+    :type sigma: float or numpy.ndarray
+
+    :returns:  float or numpy.ndarray
+    """
+
+    r = zero_rate(r, t)
+    b = 0
+
+    return analytical_greeks.volga(flag, F, K, t, r, sigma, b)
+
+
+def charm(flag, F, K, t, r, sigma):
+    """Returns the Black charm of an option, the change in delta
+    per calendar day.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param F: underlying futures price
+    :type F: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: annual risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: volatility
+    :type sigma: float or numpy.ndarray
+
+    :returns:  float or numpy.ndarray
+    """
+
+    r = zero_rate(r, t)
+    b = 0
+
+    return analytical_greeks.charm(flag, F, K, t, r, sigma, b)
+
+
+def speed(flag, F, K, t, r, sigma):
+    """Returns the Black speed of an option, the rate of change
+    of gamma with the underlying price.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param F: underlying futures price
+    :type F: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: annual risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: volatility
+    :type sigma: float or numpy.ndarray
+
+    :returns:  float or numpy.ndarray
+    """
+
+    r = zero_rate(r, t)
+    b = 0
+
+    return analytical_greeks.speed(flag, F, K, t, r, sigma, b)
+
+
+def zomma(flag, F, K, t, r, sigma):
+    """Returns the Black zomma of an option, the change in gamma
+    per 1% change in volatility.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param F: underlying futures price
+    :type F: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: annual risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: volatility
+    :type sigma: float or numpy.ndarray
+
+    :returns:  float or numpy.ndarray
+    """
+
+    r = zero_rate(r, t)
+    b = 0
+
+    return analytical_greeks.zomma(flag, F, K, t, r, sigma, b)
+
+
+def color(flag, F, K, t, r, sigma):
+    """Returns the Black color of an option, the change in gamma
+    per calendar day.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param F: underlying futures price
+    :type F: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: annual risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: volatility
+    :type sigma: float or numpy.ndarray
+
+    :returns:  float or numpy.ndarray
+    """
+
+    r = zero_rate(r, t)
+    b = 0
+
+    return analytical_greeks.color(flag, F, K, t, r, sigma, b)
+
+
+def greeks(flag, F, K, t, r, sigma, profile=False, dtype=None, out=None, workspace=None):
+    """Returns the Black price, delta, gamma, theta, vega, rho,
+    vanna, volga, charm, speed, zomma and color of an option, computing
+    d1, d2 and pdf(d1) once.
+
+    The first-order greeks match the functions above, and every
+    argument, including the flag, may be an array.
+
+    Rho holds the futures price fixed, as in ``rho``.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param F: underlying futures price
+    :type F: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: annual risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: volatility
+    :type sigma: float or numpy.ndarray
+    :param profile: also return a ``py_vollib.helpers.profiling.Profile`` of the call
+    :type profile: bool
+    :param dtype: floating point type to compute in, see ``py_vollib.ref_python``
+    :type dtype: numpy.dtype or None
+    :param out: arrays to write the greeks into, by name, see
+        ``py_vollib.helpers.analytical_greeks.greeks``
+    :type out: dict or None
+    :param workspace: scratch arrays to compute in place with
+    :type workspace: py_vollib.helpers.workspace.Workspace or None
+
+    :returns:  dict, and the profile if profile is True
+    """
+
+    r = zero_rate(r, t)
+    b = 0
+
+    result = analytical_greeks.greeks(flag, F, K, t, r, sigma, b, profile, dtype, out, workspace)
+    values = result[0] if profile else result
+    if out is not None or workspace is not None:
+        numpy.multiply(values['price'], numpy.negative(t), out=values['rho'], casting='same_kind')
+        numpy.multiply(values['rho'], .01, out=values['rho'])
+    else:
+        values['rho'] = as_dtype(dtype, -t * values['price'] * .01)[0]
+
+    return result
+
+
 if __name__ == "__main__":
     from py_vollib.helpers.doctest_helper import run_doctest
     run_doctest()
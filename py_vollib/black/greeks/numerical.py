@@ -44,6 +44,7 @@ The source code of LetsBeRational resides at www.jaeckel.org/LetsBeRational.7z .
 
 # Local application/library specific imports
 from py_vollib.black import black
+from py_vollib.curves import zero_rate
 from py_vollib.helpers.numerical_greeks import delta as numerical_delta
 from py_vollib.helpers.numerical_greeks import vega as numerical_vega
 from py_vollib.helpers.numerical_greeks import theta as numerical_theta
@@ -78,6 +79,7 @@ def delta(flag, F, K, t, r, sigma):
     :returns:  float 
     """
     
+    r = zero_rate(r, t)
     b = 0
     
     return numerical_delta(flag, F, K, t, r, sigma, b, f)
@@ -102,6 +104,7 @@ def theta(flag, F, K, t, r, sigma):
     :returns:  float 
     """   
 
+    r = zero_rate(r, t)
     b = 0
 
     return numerical_theta(flag, F, K, t, r, sigma, b, f)
@@ -126,6 +129,7 @@ def vega(flag, F, K, t, r, sigma):
     :returns:  float 
     """   
     
+    r = zero_rate(r, t)
     b = 0
 
     return numerical_vega(flag, F, K, t, r, sigma, b, f)
@@ -150,6 +154,7 @@ def rho(flag, F, K, t, r, sigma):
     :returns:  float 
     """   
 
+    r = zero_rate(r, t)
     b = 0
 
     return numerical_rho(flag, F, K, t, r, sigma, b, f)
@@ -174,6 +179,7 @@ def gamma(flag, F, K, t, r, sigma):
     :returns:  float 
     """   
 
+    r = zero_rate(r, t)
     b = 0
 
     return numerical_gamma(flag, F, K, t, r, sigma, b, f)
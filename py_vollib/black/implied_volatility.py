@@ -49,14 +49,17 @@ import numpy
 from py_vollib.black import black
 from py_vollib.black import undiscounted_black
 from py_vollib.black import normalised_black
+from py_vollib.curves import zero_rate
 from py_vollib.helpers import binary_flag
 from py_vollib.helpers.exceptions import PriceIsAboveMaximum, PriceIsBelowIntrinsic
+from py_vollib.helpers.instrumentation import instrumented
 from py_vollib.helpers.constants import MINUS_FLOAT_MAX, FLOAT_MAX
 
 
 # -----------------------------------------------------------------------------
 # FUNCTIONS - IMPLIED VOLATILITY
 
+@instrumented
 def implied_volatility_of_discounted_option_price(discounted_option_price, F, K, r, t, flag):
     """Calculate the implied volatility of the Black option price
 
@@ -93,6 +96,7 @@ def implied_volatility_of_discounted_option_price(discounted_option_price, F, K,
     True
     """
     
+    r = zero_rate(r, t)
     deflater = numpy.exp(-r * t)
     undiscounted_option_price = discounted_option_price / deflater
     sigma_calc = lets_be_rational.implied_volatility_from_a_transformed_rational_guess(
@@ -109,6 +113,7 @@ def implied_volatility_of_discounted_option_price(discounted_option_price, F, K,
     return sigma_calc
 
 
+@instrumented
 def implied_volatility(discounted_option_price, F, K, r, t, flag):
     """Calculate the implied volatility of the Black option price
 
@@ -145,12 +150,14 @@ def implied_volatility(discounted_option_price, F, K, r, t, flag):
     True
     """
 
+    r = zero_rate(r, t)
     return implied_volatility_of_discounted_option_price(discounted_option_price, F, K, r, t, flag)
 
 
 # -----------------------------------------------------------------------------
 # FUNCTIONS - IMPLIED VOLATILITY, FOR TEST & REFERENCE
 
+@instrumented
 def normalised_implied_volatility(beta, x, flag):
     """Calculate the normalised Black implied volatility,
     a time invariant transformation
@@ -192,6 +199,7 @@ def normalised_implied_volatility(beta, x, flag):
         beta, x, q)
 
 
+@instrumented
 def normalised_implied_volatility_limited_iterations(beta, x, flag, N):
     """Calculate the normalised Black implied volatility,
     with limited iterations.
@@ -230,6 +238,7 @@ def normalised_implied_volatility_limited_iterations(beta, x, flag, N):
         beta, x, q, N)
 
 
+@instrumented
 def implied_volatility_of_undiscounted_option_price(
         undiscounted_option_price,
         F,
@@ -276,6 +285,7 @@ def implied_volatility_of_undiscounted_option_price(
     )
 
 
+@instrumented
 def implied_volatility_of_undiscounted_option_price_limited_iterations(
     undiscounted_option_price, F, K, t, flag, N):
     """Calculate implied volatility of the undiscounted Black 
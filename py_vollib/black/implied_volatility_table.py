@@ -0,0 +1,416 @@
+# -*- coding: utf-8 -*-
+
+"""
+py_vollib.black.implied_volatility_table
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+A library for option pricing, implied volatility, and
+greek calculation.  py_vollib is based on lets_be_rational,
+a Python wrapper for LetsBeRational by Peter Jaeckel as
+described below.
+
+:copyright: © 2017 Gammon Capital LLC
+:license: MIT, see LICENSE for more details.
+
+About LetsBeRational:
+~~~~~~~~~~~~~~~~~~~~~
+
+The source code of LetsBeRational resides at www.jaeckel.org/LetsBeRational.7z .
+
+::
+
+    ========================================================================================
+    Copyright © 2013-2014 Peter Jäckel.
+
+    Permission to use, copy, modify, and distribute this software is freely granted,
+    provided that this notice is preserved.
+
+    WARRANTY DISCLAIMER
+    The Software is provided "as is" without warranty of any kind, either express or implied,
+    including without limitation any implied warranties of condition, uninterrupted use,
+    merchantability, fitness for a particular purpose, or non-infringement.
+    ========================================================================================
+
+
+About the table:
+~~~~~~~~~~~~~~~~
+
+::
+
+    ========================================================================================
+    The normalised Black implied volatility s(beta, x) depends on two variables only.
+    By put-call symmetry and by subtracting the normalised intrinsic value, every
+    quote is reduced to an out-of-the-money call with x <= 0.  For that call,
+
+        u  = beta / exp(x/2)                          (fraction of the maximum price)
+        w  = 2 sqrt(2) erfinv(u)                      (exact solution for x = 0)
+        s0 = sqrt(w**2 + x**2 / (|x| - 2 ln(u)))      (closed-form guess)
+
+    and the correction ln(s/s0) is a smooth, bounded function of
+
+        a = |x| / (|x| + s0)     in [0, A_MAX]
+        z = ln(s0)               in [Z_MIN, Z_MAX]
+
+    The table stores a tensor Chebyshev expansion of ln(s/s0) on each cell of a
+    uniform grid over (a, z).  A query costs one cell lookup, one polynomial
+    evaluation and a single third order Householder step on ln(b(s)).
+
+    Accuracy, measured over 10^5 random out-of-the-money quotes with
+    1e-6 <= s <= 8 and |x| <= 4:
+
+        s >= 1e-3                 maximum relative error of s about 2e-12
+        1e-6 <= s < 1e-3          maximum absolute error of s about 2e-15
+        all quotes                median relative error of s about 5e-15
+
+    For small s the polish step is limited by the cancellation in the
+    normalised Black formula rather than by the table.  Quotes outside the
+    table domain (a > A_MAX or s0 > exp(Z_MAX), i.e. u below about 1e-125
+    or above about 1 - 1e-6) are solved row by row with lets_be_rational.
+    ========================================================================================
+
+
+"""
+
+
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+from __future__ import division
+import os
+
+# Related third party imports
+import numpy
+from numpy.polynomial.chebyshev import chebvander
+
+# Local application/library specific imports
+from py_vollib.black.implied_volatility import normalised_implied_volatility as _normalised_implied_volatility
+from py_vollib.helpers import CALL, ONE_OVER_SQRT_TWO_PI
+from py_vollib.helpers import binary_flag_array
+from py_vollib.helpers.constants import FLOAT_MAX, MINUS_FLOAT_MAX
+from py_vollib.helpers.distributions import erfinv, ndtr
+
+
+# -----------------------------------------------------------------------------
+# DATA
+
+A_CELLS = 16
+Z_CELLS = 32
+DEGREE = 8
+A_MAX = 0.96
+Z_MIN = numpy.log(1e-7)
+Z_MAX = numpy.log(10.)
+
+TABLE_VERSION = 1
+DEFAULT_TABLE_PATH = os.path.join(
+    os.path.expanduser('~'), '.py_vollib', 'normalised_implied_volatility_table.npz')
+
+CHUNK_SIZE = 65536
+
+_table = None
+
+
+# -----------------------------------------------------------------------------
+# FUNCTIONS - TABLE CONSTRUCTION AND PERSISTENCE
+
+def _guess(abs_x, ln_u):
+    """Closed-form guess s0 for an out-of-the-money call, used both to place
+    a quote on the table grid and as the base the tabulated correction is
+    applied to."""
+
+    w = 2 * numpy.sqrt(2) * erfinv(numpy.exp(ln_u))
+    return numpy.sqrt(w * w + abs_x * abs_x / (abs_x - 2 * ln_u))
+
+
+def _inverse_guess(abs_x, s0):
+    """Find ln(u) such that _guess(abs_x, ln(u)) == s0 by bisection."""
+
+    lo = numpy.full_like(s0, -700.)
+    hi = numpy.full_like(s0, -1e-17)
+    for _ in range(120):
+        mid = .5 * (lo + hi)
+        above = _guess(abs_x, mid) > s0
+        hi = numpy.where(above, mid, hi)
+        lo = numpy.where(above, lo, mid)
+    return .5 * (lo + hi)
+
+
+def build_table(path=None):
+    """Build the Chebyshev table from exact lets_be_rational solutions.
+
+    Building takes a couple of seconds.  If `path` is given the table is
+    also saved there.
+
+    :param path: file to save the table to, or None
+    :type path: str
+
+    :returns: dict with the Chebyshev coefficients and grid description
+    """
+
+    nodes = numpy.cos(numpy.pi * (numpy.arange(DEGREE) + .5) / DEGREE)[::-1]
+    a_width = A_MAX / A_CELLS
+    z_width = (Z_MAX - Z_MIN) / Z_CELLS
+    a_start = a_width * numpy.arange(A_CELLS)
+    z_start = Z_MIN + z_width * numpy.arange(Z_CELLS)
+
+    # (a cell, z cell, a node, z node)
+    a = a_start[:, None, None, None] + a_width * (nodes[None, None, :, None] + 1) / 2
+    z = z_start[None, :, None, None] + z_width * (nodes[None, None, None, :] + 1) / 2
+    a, z = numpy.broadcast_arrays(a, z)
+
+    s0 = numpy.exp(z)
+    abs_x = a * s0 / (1 - a)
+    ln_u = _inverse_guess(abs_x, s0)
+    beta = numpy.exp(ln_u - abs_x / 2)
+
+    s = numpy.empty_like(s0)
+    for i in numpy.ndindex(*s.shape):
+        s[i] = _normalised_implied_volatility(beta[i], -abs_x[i], 'c')
+    correction = numpy.log(s / s0)
+
+    inverse_vandermonde = numpy.linalg.inv(chebvander(nodes, DEGREE - 1))
+    coefficients = numpy.einsum(
+        'kp,ijpq,lq->ijkl', inverse_vandermonde, correction, inverse_vandermonde)
+
+    table = {
+        'version': TABLE_VERSION,
+        'coefficients': coefficients,
+        'a_max': A_MAX,
+        'z_min': Z_MIN,
+        'z_max': Z_MAX,
+    }
+    if path is not None:
+        save_table(table, path)
+    return table
+
+
+def save_table(table, path):
+    """Save a table created by :func:`build_table` to `path` (npz format).
+
+    :param table: the table
+    :type table: dict
+    :param path: destination file
+    :type path: str
+    """
+
+    directory = os.path.dirname(path)
+    if directory and not os.path.isdir(directory):
+        os.makedirs(directory)
+    with open(path, 'wb') as f:
+        numpy.savez(f, **table)
+
+
+def load_table(path=DEFAULT_TABLE_PATH):
+    """Load a table saved by :func:`save_table` and make it the one used
+    by this module.  If `path` does not exist, or holds a table built by an
+    incompatible version, the table is rebuilt and saved there.
+
+    :param path: table file
+    :type path: str
+
+    :returns: dict with the Chebyshev coefficients and grid description
+    """
+
+    global _table
+
+    table = None
+    if os.path.exists(path):
+        with numpy.load(path) as data:
+            table = dict((key, data[key]) for key in data.files)
+        if int(table['version']) != TABLE_VERSION or \
+                table['coefficients'].shape != (A_CELLS, Z_CELLS, DEGREE, DEGREE) or \
+                not numpy.allclose([table['a_max'], table['z_min'], table['z_max']], [A_MAX, Z_MIN, Z_MAX]):
+            table = None
+
+    if table is None:
+        table = build_table()
+        try:
+            save_table(table, path)
+        except (IOError, OSError):
+            pass  # a read-only location only costs a rebuild next time
+
+    _table = table
+    return table
+
+
+def _get_table():
+    if _table is None:
+        load_table()
+    return _table
+
+
+# -----------------------------------------------------------------------------
+# FUNCTIONS - EVALUATION
+
+def _normalised_black_otm_call(x, s):
+    return numpy.exp(x / 2) * ndtr(x / s + s / 2) - numpy.exp(-x / 2) * ndtr(x / s - s / 2)
+
+
+def _polish(x, ln_beta, s):
+    """One third order Householder step on ln(b(s)) - ln(beta)."""
+
+    b = _normalised_black_otm_call(x, s)
+    h = x / s
+    b1 = ONE_OVER_SQRT_TWO_PI * numpy.exp(-.5 * (h * h + s * s / 4)) / b
+    h2 = x * x / (s * s * s) - s / 4
+    h3 = h2 * h2 - 3 * x * x / (s * s * s * s) - .25
+
+    f2 = h2 - b1
+    f3 = h3 - 3 * b1 * h2 + 2 * b1 * b1
+    nu = (ln_beta - numpy.log(b)) / b1
+
+    return s + nu * (1 + .5 * f2 * nu) / (1 + nu * (f2 + f3 * nu / 6))
+
+
+def _table_lookup(table, x, s0):
+    coefficients = table['coefficients']
+    a_width = A_MAX / A_CELLS
+    z_width = (Z_MAX - Z_MIN) / Z_CELLS
+
+    a = -x / (-x + s0)
+    z = numpy.maximum(numpy.log(s0), Z_MIN)
+
+    i = numpy.minimum((a / a_width).astype(int), A_CELLS - 1)
+    j = numpy.minimum(((z - Z_MIN) / z_width).astype(int), Z_CELLS - 1)
+    local_a = 2 * (a - i * a_width) / a_width - 1
+    local_z = 2 * (z - Z_MIN - j * z_width) / z_width - 1
+
+    correction = numpy.einsum(
+        'nkl,nk,nl->n',
+        coefficients[i, j],
+        chebvander(local_a, DEGREE - 1),
+        chebvander(local_z, DEGREE - 1))
+
+    return s0 * numpy.exp(correction)
+
+
+def _out_of_the_money_call_implied_volatility(beta, x):
+    """Solve b(x, s) = beta for s, where b is the normalised Black price of
+    an out-of-the-money call (x <= 0) and 0 < beta < exp(x/2).  Rows outside
+    the table domain are solved with lets_be_rational."""
+
+    table = _get_table()
+    sigma = numpy.empty_like(beta)
+    solved = numpy.zeros(len(beta), dtype=bool)
+    ln_beta = numpy.log(beta)
+    ln_u = ln_beta - x / 2
+
+    for start in range(0, len(beta), CHUNK_SIZE):
+        rows = numpy.arange(start, min(start + CHUNK_SIZE, len(beta)))
+        with numpy.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            s0 = _guess(-x[rows], ln_u[rows])
+            inside = (-x[rows] <= A_MAX * (-x[rows] + s0)) & (s0 <= numpy.exp(Z_MAX))
+        rows, s0 = rows[inside], s0[inside]
+        s = _table_lookup(table, x[rows], s0)
+        sigma[rows] = _polish(x[rows], ln_beta[rows], s)
+        solved[rows] = True
+
+    for i in numpy.flatnonzero(~solved):
+        sigma[i] = _normalised_implied_volatility(beta[i], x[i], CALL)
+
+    return sigma
+
+
+def _implied_volatility(beta, beta_otm, x, maximum):
+    """Flatten the inputs, signal rows outside the arbitrage bounds and
+    solve the others as out-of-the-money calls."""
+
+    beta, beta_otm, x, maximum = numpy.broadcast_arrays(beta, beta_otm, x, maximum)
+    shape = beta.shape
+    beta, beta_otm, x, maximum = beta.ravel(), beta_otm.ravel(), x.ravel(), maximum.ravel()
+
+    sigma = numpy.full(beta.shape, numpy.nan)
+    sigma[beta_otm == 0] = 0.
+    sigma[beta_otm < 0] = MINUS_FLOAT_MAX
+    sigma[beta >= maximum] = FLOAT_MAX
+    rows = numpy.flatnonzero((beta_otm > 0) & (beta < maximum))
+    sigma[rows] = _out_of_the_money_call_implied_volatility(beta_otm[rows], -numpy.abs(x[rows]))
+
+    return sigma.reshape(shape) if shape else sigma[0]
+
+
+def normalised_implied_volatility(beta, x, flag):
+    """Calculate the normalised Black implied volatility from the
+    precomputed Chebyshev table.  All arguments may be arrays.
+
+    Agrees with
+    :func:`py_vollib.black.implied_volatility.normalised_implied_volatility`
+    to the accuracy documented at the top of this module.  Rather than
+    raising, rows priced at or above the maximum return FLOAT_MAX and rows
+    priced below intrinsic return MINUS_FLOAT_MAX (see
+    :mod:`py_vollib.helpers.constants`).
+
+    :param beta: the normalized Black price
+    :type beta: float or array
+    :param x: ln(F/K) where K is the strike price, and F is the futures price
+    :type x: float or array
+    :param flag: 'p' or 'c' for put or call
+    :type flag: str or array
+
+    >>> from py_vollib.black import normalised_black
+    >>> beta_call = normalised_black(0.0, 0.2, 'c')
+    >>> beta_put = normalised_black(0.1, 0.23232323888, 'p')
+    >>> iv = normalised_implied_volatility([beta_call, beta_put], [0.0, 0.1], ['c', 'p'])
+    >>> bool(abs(iv[0] - 0.2) < 1e-12 and abs(iv[1] - 0.23232323888) < 1e-12)
+    True
+    """
+
+    beta = numpy.asarray(beta, dtype=float)
+    x = numpy.asarray(x, dtype=float)
+    q = binary_flag_array(flag)
+
+    intrinsic = numpy.where(q * x > 0, 2 * numpy.sinh(numpy.abs(x) / 2), 0.)
+    maximum = numpy.exp(q * x / 2)
+
+    return _implied_volatility(beta, beta - intrinsic, x, maximum)
+
+
+def implied_volatility_of_undiscounted_option_price(undiscounted_option_price, F, K, t, flag):
+    """Calculate the implied volatility of the undiscounted Black option
+    price from the precomputed Chebyshev table.  All arguments may be arrays.
+
+    Rows priced at or above the maximum return FLOAT_MAX and rows priced
+    below intrinsic return MINUS_FLOAT_MAX, as in
+    :func:`normalised_implied_volatility`.
+
+    :param undiscounted_option_price: undiscounted Black price of a futures option
+    :type undiscounted_option_price: float or array
+    :param F: underlying futures price
+    :type F: float or array
+    :param K: strike price
+    :type K: float or array
+    :param t: time to expiration in years
+    :type t: float or array
+    :param flag: 'p' or 'c' for put or call
+    :type flag: str or array
+
+    >>> from py_vollib.black import undiscounted_black
+    >>> F = 100
+    >>> K = [90, 100, 110]
+    >>> t = .5
+    >>> prices = [undiscounted_black(F, k, .2, t, 'c') for k in K]
+    >>> iv = implied_volatility_of_undiscounted_option_price(prices, F, K, t, 'c')
+    >>> bool(numpy.all(abs(iv - .2) < 1e-12))
+    True
+    """
+
+    price = numpy.asarray(undiscounted_option_price, dtype=float)
+    F = numpy.asarray(F, dtype=float)
+    K = numpy.asarray(K, dtype=float)
+    q = binary_flag_array(flag)
+
+    # subtract the intrinsic value before normalising, where it is exact
+    scale = numpy.sqrt(F) * numpy.sqrt(K)
+    price_otm = price - numpy.maximum(q * (F - K), 0.)
+    maximum = numpy.where(q > 0, F, K)
+
+    s = _implied_volatility(price / scale, price_otm / scale, numpy.log(F / K), maximum / scale)
+
+    # keep the values that signal prices out of bounds
+    with numpy.errstate(over='ignore'):
+        return numpy.where(numpy.abs(s) == FLOAT_MAX, s, s / numpy.sqrt(t))[()]
+
+
+if __name__ == "__main__":
+    from py_vollib.helpers.doctest_helper import run_doctest
+    run_doctest()
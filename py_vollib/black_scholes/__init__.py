@@ -46,6 +46,7 @@ import numpy
 
 # Local application/library specific imports
 from py_vollib.black import undiscounted_black
+from py_vollib.curves import zero_rate
 
 
 # -----------------------------------------------------------------------------
@@ -77,6 +78,7 @@ def black_scholes(flag, S, K, t, r, sigma):
     True
     """   
     
+    r = zero_rate(r, t)
     deflater = numpy.exp(-r * t)
     F = S / deflater
     return undiscounted_black(F, K, sigma, t, flag) * deflater
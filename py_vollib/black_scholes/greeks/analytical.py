@@ -46,7 +46,8 @@ from py_lets_be_rational import norm_cdf as N
 import numpy
 
 # Local application/library specific imports
-from py_vollib.helpers import pdf
+from py_vollib.curves import zero_rate
+from py_vollib.helpers import analytical_greeks, pdf
 from py_vollib.ref_python.black_scholes import d1,d2
 
 
@@ -84,6 +85,7 @@ def delta(flag, S, K, t, r, sigma):
     True
     """
 
+    r = zero_rate(r, t)
     d_1 = d1(S, K, t, r, sigma)
 
     if flag == 'p':
@@ -140,6 +142,7 @@ def theta(flag, S, K, t, r, sigma):
     True
     """
     
+    r = zero_rate(r, t)
     two_sqrt_t = 2 * numpy.sqrt(t)
 
     D1 = d1(S, K, t, r, sigma)
@@ -189,6 +192,7 @@ def gamma(flag, S, K, t, r, sigma):
     True
     """
 
+    r = zero_rate(r, t)
     d_1 = d1(S, K, t, r, sigma)
     v_squared = sigma**2
     return pdf(d_1)/(S*sigma*numpy.sqrt(t))
@@ -229,6 +233,7 @@ def vega(flag, S, K, t, r, sigma):
     True
     """
 
+    r = zero_rate(r, t)
     d_1 = d1(S, K, t, r, sigma)
     return S * pdf(d_1) * numpy.sqrt(t) * 0.01
 
@@ -268,6 +273,7 @@ def rho(flag, S, K, t, r, sigma):
     True
     """
 
+    r = zero_rate(r, t)
     d_2 = d2(S, K, t, r, sigma)
     e_to_the_minus_rt = numpy.exp(-r*t)
     if flag == 'c':
@@ -276,6 +282,201 @@ def rho(flag, S, K, t, r, sigma):
         return -t*K*e_to_the_minus_rt * N(-d_2) * .01
 
 
+def vanna(flag, S, K, t, r, sigma):
+    """Returns the Black-Scholes vanna of an option, the change in delta
+    per 1% change in volatility.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param S: underlying asset price
+    :type S: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: annual risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: volatility
+    :type sigma: float or numpy.ndarray
+
+    :returns:  float or numpy.ndarray
+    """
+
+    r = zero_rate(r, t)
+    b = r
+
+    return analytical_greeks.vanna(flag, S, K, t, r, sigma, b)
+
+
+def volga(flag, S, K, t, r, sigma):
+    """Returns the Black-Scholes volga of an option, the change in vega
+    per 1% change in volatility.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param S: underlying asset price
+    :type S: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: annual risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: volatility
+    :type sigma: float or numpy.ndarray
+
+    :returns:  float or numpy.ndarray
+    """
+
+    r = zero_rate(r, t)
+    b = r
+
+    return analytical_greeks.volga(flag, S, K, t, r, sigma, b)
+
+
+def charm(flag, S, K, t, r, sigma):
+    """Returns the Black-Scholes charm of an option, the change in delta
+    per calendar day.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param S: underlying asset price
+    :type S: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: annual risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: volatility
+    :type sigma: float or numpy.ndarray
+
+    :returns:  float or numpy.ndarray
+    """
+
+    r = zero_rate(r, t)
+    b = r
+
+    return analytical_greeks.charm(flag, S, K, t, r, sigma, b)
+
+
+def speed(flag, S, K, t, r, sigma):
+    """Returns the Black-Scholes speed of an option, the rate of change
+    of gamma with the underlying price.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param S: underlying asset price
+    :type S: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: annual risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: volatility
+    :type sigma: float or numpy.ndarray
+
+    :returns:  float or numpy.ndarray
+    """
+
+    r = zero_rate(r, t)
+    b = r
+
+    return analytical_greeks.speed(flag, S, K, t, r, sigma, b)
+
+
+def zomma(flag, S, K, t, r, sigma):
+    """Returns the Black-Scholes zomma of an option, the change in gamma
+    per 1% change in volatility.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param S: underlying asset price
+    :type S: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: annual risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: volatility
+    :type sigma: float or numpy.ndarray
+
+    :returns:  float or numpy.ndarray
+    """
+
+    r = zero_rate(r, t)
+    b = r
+
+    return analytical_greeks.zomma(flag, S, K, t, r, sigma, b)
+
+
+def color(flag, S, K, t, r, sigma):
+    """Returns the Black-Scholes color of an option, the change in gamma
+    per calendar day.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param S: underlying asset price
+    :type S: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: annual risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: volatility
+    :type sigma: float or numpy.ndarray
+
+    :returns:  float or numpy.ndarray
+    """
+
+    r = zero_rate(r, t)
+    b = r
+
+    return analytical_greeks.color(flag, S, K, t, r, sigma, b)
+
+
+def greeks(flag, S, K, t, r, sigma, profile=False, dtype=None, out=None, workspace=None):
+    """Returns the Black-Scholes price, delta, gamma, theta, vega, rho,
+    vanna, volga, charm, speed, zomma and color of an option, computing
+    d1, d2 and pdf(d1) once.
+
+    The first-order greeks match the functions above, and every
+    argument, including the flag, may be an array.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param S: underlying asset price
+    :type S: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: annual risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: volatility
+    :type sigma: float or numpy.ndarray
+    :param profile: also return a ``py_vollib.helpers.profiling.Profile`` of the call
+    :type profile: bool
+    :param dtype: floating point type to compute in, see ``py_vollib.ref_python``
+    :type dtype: numpy.dtype or None
+    :param out: arrays to write the greeks into, by name, see
+        ``py_vollib.helpers.analytical_greeks.greeks``
+    :type out: dict or None
+    :param workspace: scratch arrays to compute in place with
+    :type workspace: py_vollib.helpers.workspace.Workspace or None
+
+    :returns:  dict, and the profile if profile is True
+    """
+
+    r = zero_rate(r, t)
+    b = r
+
+    return analytical_greeks.greeks(flag, S, K, t, r, sigma, b, profile, dtype, out, workspace)
+
+
 if __name__ == "__main__":
     from py_vollib.helpers.doctest_helper import run_doctest
     run_doctest()
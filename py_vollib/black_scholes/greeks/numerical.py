@@ -44,6 +44,7 @@ The source code of LetsBeRational resides at www.jaeckel.org/LetsBeRational.7z .
 
 # Local application/library specific imports
 from py_vollib.black_scholes import black_scholes
+from py_vollib.curves import zero_rate
 from py_vollib.helpers.numerical_greeks import delta as numerical_delta
 from py_vollib.helpers.numerical_greeks import vega as numerical_vega
 from py_vollib.helpers.numerical_greeks import theta as numerical_theta
@@ -79,6 +80,7 @@ def delta(flag, S, K, t, r, sigma):
     :type flag: str
     """
     
+    r = zero_rate(r, t)
     b = r
 
     return numerical_delta(flag, S, K, t, r, sigma, b, f)
@@ -102,6 +104,7 @@ def theta(flag, S, K, t, r, sigma):
 
     """    
     
+    r = zero_rate(r, t)
     b = r
 
     return numerical_theta(flag, S, K, t, r, sigma, b, f)
@@ -124,6 +127,7 @@ def vega(flag, S, K, t, r, sigma):
     :type flag: str
     """
 
+    r = zero_rate(r, t)
     b = r
 
     return numerical_vega(flag, S, K, t, r, sigma, b, f)
@@ -146,6 +150,7 @@ def rho(flag, S, K, t, r, sigma):
     :type flag: str
     """    
     
+    r = zero_rate(r, t)
     b = r
 
     return numerical_rho(flag, S, K, t, r, sigma, b, f)
@@ -168,6 +173,7 @@ def gamma(flag, S, K, t, r, sigma):
     :type flag: str
     """
 
+    r = zero_rate(r, t)
     b = r
 
     return numerical_gamma(flag, S, K, t, r, sigma, b, f)
@@ -46,15 +46,18 @@ import numpy
 
 # Local application/library specific imports
 from py_vollib.black_scholes import black_scholes
+from py_vollib.curves import zero_rate
 from py_vollib.helpers import binary_flag
 from py_vollib.helpers import forward_price
 from py_vollib.helpers.constants import FLOAT_MAX, MINUS_FLOAT_MAX
 from py_vollib.helpers.exceptions import PriceIsAboveMaximum, PriceIsBelowIntrinsic
+from py_vollib.helpers.instrumentation import instrumented
 
 
 # -----------------------------------------------------------------------------
 # FUNCTIONS
 
+@instrumented
 def implied_volatility(price, S, K, t, r, flag):
     """Calculate the Black-Scholes implied volatility.
 
@@ -89,6 +92,7 @@ def implied_volatility(price, S, K, t, r, flag):
     >>> abs(expected_iv - iv) < 0.00001
     True
     """
+    r = zero_rate(r, t)
     deflater = numpy.exp(-r * t)
     undiscounted_option_price = price / deflater
     F = forward_price(S, t, r)
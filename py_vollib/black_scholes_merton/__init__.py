@@ -45,6 +45,7 @@ import numpy
 
 # Local application/library specific imports
 from py_lets_be_rational import black
+from py_vollib.curves import zero_rate
 from py_vollib.helpers import binary_flag
 
 
@@ -83,6 +84,8 @@ def black_scholes_merton(flag, S, K, t, r, sigma, q):
     True
     """
     
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
     F = S * numpy.exp((r-q)*t)
     deflater = numpy.exp(-r * t)
     return black(F, K, sigma, t, binary_flag[flag]) * deflater
@@ -46,7 +46,8 @@ import numpy
 
 # Local application/library specific imports
 from py_lets_be_rational import norm_cdf as N
-from py_vollib.helpers import pdf
+from py_vollib.curves import zero_rate
+from py_vollib.helpers import analytical_greeks, pdf
 from py_vollib.ref_python.black_scholes_merton import d1, d2
 
 
@@ -90,6 +91,8 @@ def delta(flag, S, K, t, r, sigma, q):
     True
     """
 
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
     D1 = d1(S, K, t, r, sigma, q)
 
     if flag == 'p':
@@ -151,6 +154,8 @@ def theta(flag, S, K, t, r, sigma, q):
     True
     """
 
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
     D1 = d1(S, K, t, r, sigma, q)
     D2 = d2(S, K, t, r, sigma, q)
 
@@ -207,6 +212,8 @@ def gamma(flag, S, K, t, r, sigma, q):
     True
     """
 
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
     D1 = d1(S, K, t, r, sigma, q)
     numerator = numpy.exp(-q*t) * pdf(D1)
     denominator = S * sigma * numpy.sqrt(t)
@@ -254,6 +261,8 @@ def vega(flag, S, K, t, r, sigma, q):
     True
     """
 
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
     D1 = d1(S, K, t, r, sigma, q)
 
     return S * numpy.exp(-q*t) * pdf(D1) * numpy.sqrt(t) * 0.01
@@ -299,6 +308,8 @@ def rho(flag, S, K, t, r, sigma, q):
     True
     """
 
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
     D2 = d2(S, K, t, r, sigma, q)
 
     if flag == 'c':
@@ -307,6 +318,222 @@ def rho(flag, S, K, t, r, sigma, q):
         return -t * K * numpy.exp(-r*t) * N(-D2) * .01
 
 
+def vanna(flag, S, K, t, r, sigma, q):
+    """Returns the Black-Scholes-Merton vanna of an option, the change in delta
+    per 1% change in volatility.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param S: underlying asset price
+    :type S: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: annual risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: volatility
+    :type sigma: float or numpy.ndarray
+    :param q: annualized continuous dividend yield
+    :type q: float or numpy.ndarray
+
+    :returns:  float or numpy.ndarray
+    """
+
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
+    b = r - q
+
+    return analytical_greeks.vanna(flag, S, K, t, r, sigma, b)
+
+
+def volga(flag, S, K, t, r, sigma, q):
+    """Returns the Black-Scholes-Merton volga of an option, the change in vega
+    per 1% change in volatility.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param S: underlying asset price
+    :type S: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: annual risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: volatility
+    :type sigma: float or numpy.ndarray
+    :param q: annualized continuous dividend yield
+    :type q: float or numpy.ndarray
+
+    :returns:  float or numpy.ndarray
+    """
+
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
+    b = r - q
+
+    return analytical_greeks.volga(flag, S, K, t, r, sigma, b)
+
+
+def charm(flag, S, K, t, r, sigma, q):
+    """Returns the Black-Scholes-Merton charm of an option, the change in delta
+    per calendar day.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param S: underlying asset price
+    :type S: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: annual risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: volatility
+    :type sigma: float or numpy.ndarray
+    :param q: annualized continuous dividend yield
+    :type q: float or numpy.ndarray
+
+    :returns:  float or numpy.ndarray
+    """
+
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
+    b = r - q
+
+    return analytical_greeks.charm(flag, S, K, t, r, sigma, b)
+
+
+def speed(flag, S, K, t, r, sigma, q):
+    """Returns the Black-Scholes-Merton speed of an option, the rate of change
+    of gamma with the underlying price.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param S: underlying asset price
+    :type S: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: annual risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: volatility
+    :type sigma: float or numpy.ndarray
+    :param q: annualized continuous dividend yield
+    :type q: float or numpy.ndarray
+
+    :returns:  float or numpy.ndarray
+    """
+
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
+    b = r - q
+
+    return analytical_greeks.speed(flag, S, K, t, r, sigma, b)
+
+
+def zomma(flag, S, K, t, r, sigma, q):
+    """Returns the Black-Scholes-Merton zomma of an option, the change in gamma
+    per 1% change in volatility.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param S: underlying asset price
+    :type S: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: annual risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: volatility
+    :type sigma: float or numpy.ndarray
+    :param q: annualized continuous dividend yield
+    :type q: float or numpy.ndarray
+
+    :returns:  float or numpy.ndarray
+    """
+
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
+    b = r - q
+
+    return analytical_greeks.zomma(flag, S, K, t, r, sigma, b)
+
+
+def color(flag, S, K, t, r, sigma, q):
+    """Returns the Black-Scholes-Merton color of an option, the change in gamma
+    per calendar day.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param S: underlying asset price
+    :type S: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: annual risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: volatility
+    :type sigma: float or numpy.ndarray
+    :param q: annualized continuous dividend yield
+    :type q: float or numpy.ndarray
+
+    :returns:  float or numpy.ndarray
+    """
+
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
+    b = r - q
+
+    return analytical_greeks.color(flag, S, K, t, r, sigma, b)
+
+
+def greeks(flag, S, K, t, r, sigma, q, profile=False, dtype=None, out=None, workspace=None):
+    """Returns the Black-Scholes-Merton price, delta, gamma, theta, vega, rho,
+    vanna, volga, charm, speed, zomma and color of an option, computing
+    d1, d2 and pdf(d1) once.
+
+    The first-order greeks match the functions above, and every
+    argument, including the flag, may be an array.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param S: underlying asset price
+    :type S: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: annual risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: volatility
+    :type sigma: float or numpy.ndarray
+    :param q: annualized continuous dividend yield
+    :type q: float or numpy.ndarray
+    :param profile: also return a ``py_vollib.helpers.profiling.Profile`` of the call
+    :type profile: bool
+    :param dtype: floating point type to compute in, see ``py_vollib.ref_python``
+    :type dtype: numpy.dtype or None
+    :param out: arrays to write the greeks into, by name, see
+        ``py_vollib.helpers.analytical_greeks.greeks``
+    :type out: dict or None
+    :param workspace: scratch arrays to compute in place with
+    :type workspace: py_vollib.helpers.workspace.Workspace or None
+
+    :returns:  dict, and the profile if profile is True
+    """
+
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
+    b = r - q
+
+    return analytical_greeks.greeks(flag, S, K, t, r, sigma, b, profile, dtype, out, workspace)
+
+
 if __name__ == "__main__":
     from py_vollib.helpers.doctest_helper import run_doctest
     run_doctest()
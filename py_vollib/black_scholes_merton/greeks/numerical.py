@@ -44,6 +44,7 @@ The source code of LetsBeRational resides at www.jaeckel.org/LetsBeRational.7z .
 
 # Local application/library specific imports
 from py_vollib.black_scholes_merton import black_scholes_merton
+from py_vollib.curves import zero_rate
 from py_vollib.helpers.numerical_greeks import delta as numerical_delta
 from py_vollib.helpers.numerical_greeks import vega as numerical_vega
 from py_vollib.helpers.numerical_greeks import theta as numerical_theta
@@ -83,6 +84,8 @@ def delta(flag, S, K, t, r, sigma, q):
     :returns:  float 
     """   
 
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
     b = r-q
 
     return numerical_delta(flag, S, K, t, r, sigma, b, f)
@@ -109,6 +112,8 @@ def theta(flag, S, K, t, r, sigma, q):
     :returns:  float 
     """   
 
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
     b = r-q
 
     return numerical_theta(flag, S, K, t, r, sigma, b, f)
@@ -135,6 +140,8 @@ def vega(flag, S, K, t, r, sigma, q):
     :returns:  float 
     """
 
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
     b = r-q
 
     return numerical_vega(flag, S, K, t, r, sigma, b, f)
@@ -161,6 +168,8 @@ def rho(flag, S, K, t, r, sigma, q):
     :returns:  float 
     """
 
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
     b = r-q
 
     return numerical_rho(flag, S, K, t, r, sigma, b, f)
@@ -187,6 +196,8 @@ def gamma(flag, S, K, t, r, sigma, q):
     :returns:  float 
     """
 
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
     b = r-q
 
     return numerical_gamma(flag, S, K, t, r, sigma, b, f)
@@ -49,14 +49,17 @@ import numpy
 
 # Local application/library specific imports
 from py_vollib.black_scholes_merton import black_scholes_merton
+from py_vollib.curves import zero_rate
 from py_vollib.helpers import binary_flag
 from py_vollib.helpers.exceptions import PriceIsAboveMaximum, PriceIsBelowIntrinsic
+from py_vollib.helpers.instrumentation import instrumented
 from py_vollib.helpers.constants import MINUS_FLOAT_MAX, FLOAT_MAX
 
 
 # -----------------------------------------------------------------------------
 # FUNCTIONS
 
+@instrumented
 def implied_volatility(price, S, K, t, r, q, flag):
     """Calculate the Black-Scholes-Merton implied volatility.
 
@@ -95,6 +98,8 @@ def implied_volatility(price, S, K, t, r, q, flag):
     True
     """
 
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
     deflater = numpy.exp(-r * t)
     
     undiscounted_option_price = price / deflater
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+"""
+py_vollib.curves
+~~~~~~~~~~~~~~~~
+
+A library for option pricing, implied volatility, and
+greek calculation.  py_vollib is based on lets_be_rational,
+a Python wrapper for LetsBeRational by Peter Jaeckel as
+described below.
+
+:copyright: © 2017 Gammon Capital LLC
+:license: MIT, see LICENSE for more details.
+
+About LetsBeRational:
+~~~~~~~~~~~~~~~~~~~~~
+
+The source code of LetsBeRational resides at www.jaeckel.org/LetsBeRational.7z .
+
+::
+
+    ========================================================================================
+    Copyright © 2013-2014 Peter Jäckel.
+
+    Permission to use, copy, modify, and distribute this software is freely granted,
+    provided that this notice is preserved.
+
+    WARRANTY DISCLAIMER
+    The Software is provided "as is" without warranty of any kind, either express or implied,
+    including without limitation any implied warranties of condition, uninterrupted use,
+    merchantability, fitness for a particular purpose, or non-infringement.
+    ========================================================================================
+
+
+
+Curves:
+~~~~~~~
+
+A ``Curve`` holds continuously compounded zero rates at a set of node
+times, and can be passed in place of the flat rate ``r`` to any pricer,
+implied volatility or greek function of py_vollib.  Each function
+replaces the curve by its zero rate to the expiration of the option,
+which discounts exactly as the curve does, so rho is the sensitivity to
+a parallel shift of the zero curve.  Engines that roll the rate over the
+life of the option, the trees, the finite difference grid and the Monte
+Carlo paths, see it as a flat rate to expiration.
+
+The logarithm of the discount factor is interpolated linearly between
+the nodes, which is piecewise flat in the forward rate.  Zero rates are
+held flat before the first node and after the last one.  Nodes are
+located with ``numpy.searchsorted``, and the results are memoized per
+distinct expiration, so pricing a chain evaluates the curve once per
+expiry however many options it holds.
+
+The continuous dividend rate ``q`` of the Black-Scholes-Merton functions
+accepts a ``CarryCurve`` in the same way.  It adds an implied dividend
+yield curve and a stock borrow curve, and resolves to the total carry to
+expiration, which together with the rate fixes the forward of each
+expiry.
+
+"""
+
+
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+from __future__ import division
+
+# Related third party imports
+import numpy
+
+# Local application/library specific imports
+from py_vollib.helpers.exceptions import InvalidArgument
+
+
+# -----------------------------------------------------------------------------
+# DATA
+
+CACHE_SIZE = 4096
+
+
+# -----------------------------------------------------------------------------
+# CLASSES
+
+
+class Curve(object):
+    """A zero rate curve.
+
+    :param times: node times in years, positive and increasing
+    :type times: float or numpy.ndarray
+    :param rates: continuously compounded zero rates at the nodes
+    :type rates: float or numpy.ndarray
+
+    >>> curve = Curve([.25, 1., 5.], [.01, .02, .03])
+    >>> curve.zero_rate(numpy.array([.1, .25, .5, 1., 3., 10.]))
+    array([0.01      , 0.01      , 0.01666667, 0.02      , 0.02833333,
+           0.03      ])
+    >>> bool(numpy.isclose(curve.discount_factor(1.), numpy.exp(-.02)))
+    True
+
+    A flat curve discounts like the flat rate:
+
+    >>> from py_vollib.black_scholes import black_scholes
+    >>> price = black_scholes('c', 100., 100., .5, Curve(1., .05), .2)
+    >>> bool(numpy.isclose(price, black_scholes('c', 100., 100., .5, .05, .2), rtol=1e-15))
+    True
+    """
+
+    def __init__(self, times, rates):
+        times, rates = numpy.broadcast_arrays(numpy.asarray(times, dtype=float), numpy.asarray(rates, dtype=float))
+        if times.ndim > 1 or not times.size:
+            raise InvalidArgument("a curve needs a one-dimensional array of nodes")
+        times, rates = numpy.atleast_1d(times, rates)
+        if times[0] <= 0 or numpy.any(numpy.diff(times) <= 0):
+            raise InvalidArgument("curve node times must be positive and increasing")
+        self.times = times
+        self.rates = rates
+        # the origin, where the discount factor is one, is an extra node
+        self._times = numpy.concatenate(([0.], times))
+        self._log_discount = numpy.concatenate(([0.], -rates * times))
+        self._zero_rates = {}
+        self._discount_factors = {}
+
+    def _interpolate(self, t):
+        """Return the zero rates at the distinct expirations t."""
+
+        i = numpy.clip(numpy.searchsorted(self._times, t), 1, self._times.size - 1)
+        t_0, t_1 = self._times[i - 1], self._times[i]
+        weight = (t - t_0) / (t_1 - t_0)
+        log_discount = (1 - weight) * self._log_discount[i - 1] + weight * self._log_discount[i]
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            zero_rate = -log_discount / t
+        return numpy.where(t <= self.times[0], self.rates[0],
+                           numpy.where(t >= self.times[-1], self.rates[-1], zero_rate))
+
+    def _memoized(self, cache, function, t):
+        t = numpy.asarray(t, dtype=float)
+        if len(cache) > CACHE_SIZE:
+            cache.clear()
+        if not t.ndim:
+            key = float(t)
+            if key not in cache:
+                cache[key] = float(function(t[None])[0])
+            return cache[key]
+
+        expirations, index = numpy.unique(t, return_inverse=True)
+        expirations = expirations.tolist()
+        missing = [x for x in expirations if x not in cache]
+        if missing:
+            cache.update(zip(missing, function(numpy.array(missing)).tolist()))
+        return numpy.array([cache[x] for x in expirations])[index].reshape(t.shape)
+
+    def zero_rate(self, t):
+        """Return the continuously compounded zero rates to the expirations t.
+
+        :param t: time to expiration in years
+        :type t: float or numpy.ndarray
+
+        :returns:  float or numpy.ndarray
+        """
+
+        return self._memoized(self._zero_rates, self._interpolate, t)
+
+    def discount_factor(self, t):
+        """Return the discount factors to the expirations t.
+
+        :param t: time to expiration in years
+        :type t: float or numpy.ndarray
+
+        :returns:  float or numpy.ndarray
+        """
+
+        return self._memoized(self._discount_factors, lambda t: numpy.exp(-self._interpolate(t) * t), t)
+
+
+class CarryCurve(Curve):
+    """The cost of carry of a stock beyond the risk-free rate: an implied
+    dividend yield curve plus a borrow rate curve.
+
+    Each part is a curve, or a flat rate.  Both are log-linear in their
+    growth factors, so their sum is exactly the log-linear curve on the
+    union of their nodes.
+
+    :param dividend: implied dividend yield
+    :type dividend: float or Curve
+    :param borrow: stock borrow rate
+    :type borrow: float or Curve
+
+    >>> carry = CarryCurve(Curve([.5, 2.], [.01, .015]), Curve([1.], [.03]))
+    >>> carry.times
+    array([0.5, 1. , 2. ])
+    >>> bool(numpy.isclose(carry.zero_rate(1.5), carry.dividend.zero_rate(1.5) + .03, rtol=1e-15))
+    True
+
+    >>> from py_vollib.black_scholes_merton import black_scholes_merton
+    >>> price = black_scholes_merton('c', 100., 100., 1.5, .04, .2, carry)
+    >>> bool(numpy.isclose(price, black_scholes_merton('c', 100., 100., 1.5, .04, .2, carry.zero_rate(1.5))))
+    True
+    """
+
+    def __init__(self, dividend=0., borrow=0.):
+        self.dividend = dividend
+        self.borrow = borrow
+        nodes = [curve.times for curve in (dividend, borrow) if isinstance(curve, Curve)]
+        times = numpy.unique(numpy.concatenate(nodes)) if nodes else numpy.ones(1)
+        super(CarryCurve, self).__init__(times, zero_rate(dividend, times) + zero_rate(borrow, times))
+
+
+# -----------------------------------------------------------------------------
+# FUNCTIONS
+
+
+def zero_rate(r, t):
+    """Return the flat rate that a pricer uses to expiration: ``r`` itself,
+    or the zero rate of ``r`` to ``t`` if it is a curve.  Dividend rates
+    and carry curves resolve the same way.
+
+    :param r: a rate, or a curve
+    :type r: float, numpy.ndarray or Curve
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+
+    :returns:  float or numpy.ndarray
+
+    >>> zero_rate(.05, 2.)
+    0.05
+    >>> zero_rate(Curve([1., 2.], [.04, .05]), 2.)
+    0.05
+    """
+
+    if isinstance(r, Curve):
+        return r.zero_rate(t)
+    return r
+
+
+if __name__ == "__main__":
+    from py_vollib.helpers.doctest_helper import run_doctest
+    run_doctest()
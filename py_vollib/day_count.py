@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+"""
+py_vollib.day_count
+~~~~~~~~~~~~~~~~~~~
+
+A library for option pricing, implied volatility, and
+greek calculation.  py_vollib is based on lets_be_rational,
+a Python wrapper for LetsBeRational by Peter Jaeckel as
+described below.
+
+:copyright: © 2017 Gammon Capital LLC
+:license: MIT, see LICENSE for more details.
+
+About LetsBeRational:
+~~~~~~~~~~~~~~~~~~~~~
+
+The source code of LetsBeRational resides at www.jaeckel.org/LetsBeRational.7z .
+
+::
+
+    ========================================================================================
+    Copyright © 2013-2014 Peter Jäckel.
+
+    Permission to use, copy, modify, and distribute this software is freely granted,
+    provided that this notice is preserved.
+
+    WARRANTY DISCLAIMER
+    The Software is provided "as is" without warranty of any kind, either express or implied,
+    including without limitation any implied warranties of condition, uninterrupted use,
+    merchantability, fitness for a particular purpose, or non-infringement.
+    ========================================================================================
+
+
+
+Day counts:
+~~~~~~~~~~~
+
+The pricers take the time to expiration in years.  This module turns
+arrays of ``numpy.datetime64`` valuation times and expirations into year
+fractions, without Python loops:
+
+* ``act_365`` counts calendar time, ACT/365 fixed;
+* a ``Calendar`` counts business days, given a week mask and a list of
+  holidays, over ``days_per_year`` business days a year.  A business day
+  is spread evenly over its 24 hours, or, with trading session hours,
+  mostly over the session, the remaining ``overnight_weight`` of the day
+  being spread over the hours outside it.
+
+A calendar precomputes the number of business days before every date of
+its range once, so a year fraction is two table lookups and a weighting
+of the time of day, however many (valuation, expiration) pairs there are.
+
+"""
+
+
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+from __future__ import division
+
+# Related third party imports
+import numpy
+
+# Local application/library specific imports
+from py_vollib.helpers.exceptions import InvalidArgument
+
+
+# -----------------------------------------------------------------------------
+# DATA
+
+DAYS_PER_YEAR = 252
+START = '1970-01-01'
+END = '2100-01-01'
+
+_ONE_DAY = numpy.timedelta64(1, 'D')
+
+
+# -----------------------------------------------------------------------------
+# FUNCTIONS - INTERNAL
+
+
+def _datetime(x):
+    return numpy.asarray(x, dtype='datetime64[ns]')
+
+
+def _split(x):
+    """Return the dates of the times x, and the elapsed fractions of their days."""
+
+    day = x.astype('datetime64[D]')
+    return day, (x - day) / _ONE_DAY
+
+
+# -----------------------------------------------------------------------------
+# FUNCTIONS
+
+
+def act_365(now, expiry):
+    """Return the ACT/365 fixed year fractions between valuation times and
+    expirations.  Expirations before the valuation time give negative
+    fractions.
+
+    :param now: valuation time
+    :type now: numpy.datetime64 or numpy.ndarray
+    :param expiry: expiration time
+    :type expiry: numpy.datetime64 or numpy.ndarray
+
+    :returns:  float or numpy.ndarray
+
+    >>> expiry = numpy.array(['2024-07-01T12:00', '2025-01-01T00:00'], dtype='datetime64')
+    >>> act_365(numpy.datetime64('2024-01-01T12:00'), expiry)
+    array([0.49863014, 1.00136986])
+    """
+
+    return ((_datetime(expiry) - _datetime(now)) / numpy.timedelta64(365, 'D'))[()]
+
+
+# -----------------------------------------------------------------------------
+# CLASSES
+
+
+class Calendar(object):
+    """A business day calendar.
+
+    :param holidays: dates that are not business days
+    :type holidays: sequence of numpy.datetime64 or str
+    :param weekmask: business days of the week, Monday first, as for ``numpy.busday_count``
+    :type weekmask: str
+    :param days_per_year: number of business days in a year
+    :type days_per_year: float
+    :param session: opening and closing hours of the trading session, or
+        None to spread each business day evenly over 24 hours
+    :type session: (float, float) or None
+    :param overnight_weight: share of a business day outside the session
+    :type overnight_weight: float
+    :param start: first date of the precomputed range
+    :type start: numpy.datetime64 or str
+    :param end: end date of the precomputed range, excluded
+    :type end: numpy.datetime64 or str
+
+    >>> calendar = Calendar(holidays=['2024-07-04'])
+    >>> calendar.business_days('2024-07-01', ['2024-07-08', '2024-08-01'])
+    array([ 4, 22])
+    >>> calendar.year_fraction(numpy.datetime64('2024-07-03T12:00'), numpy.datetime64('2024-07-05T12:00')) * 252
+    1.0
+
+    Half an hour into a 9:30 to 16:00 session, with no weight overnight:
+
+    >>> session = Calendar(session=(9.5, 16.), days_per_year=1)
+    >>> session.year_fraction('2024-07-01T10:00', ['2024-07-01T16:00', '2024-07-02T09:00'])
+    array([0.92307692, 0.92307692])
+    """
+
+    def __init__(self, holidays=(), weekmask='1111100', days_per_year=DAYS_PER_YEAR, session=None,
+                 overnight_weight=0., start=START, end=END):
+        self.start = numpy.datetime64(start, 'D')
+        self.end = numpy.datetime64(end, 'D')
+        if self.end <= self.start:
+            raise InvalidArgument("the calendar must end after it starts")
+        if session is not None and not 0 <= session[0] < session[1] <= 24:
+            raise InvalidArgument("the session must open and close within the day")
+        if session is not None and not 0 <= overnight_weight < 1:
+            raise InvalidArgument("the overnight weight must be in [0, 1)")
+        self.holidays = numpy.asarray(holidays, dtype='datetime64[D]')
+        self.weekmask = weekmask
+        self.days_per_year = days_per_year
+        self.session = None if session is None else (session[0] / 24., session[1] / 24.)
+        self.overnight_weight = overnight_weight
+
+        dates = numpy.arange(self.start, self.end, dtype='datetime64[D]')
+        self._business_day = numpy.is_busday(dates, weekmask=weekmask, holidays=self.holidays)
+        # business days strictly before each date of the range, and its end
+        self._count = numpy.concatenate(([0], numpy.cumsum(self._business_day)))
+
+    def _index(self, day):
+        index = (day - self.start).astype(numpy.int64)
+        if numpy.any((index < 0) | (index >= self._business_day.size)):
+            raise InvalidArgument("dates must be within the calendar, from {} to {}".format(self.start, self.end))
+        return index
+
+    def _elapsed(self, fraction):
+        """Return the share of a business day elapsed at the given fractions
+        of the day."""
+
+        if self.session is None:
+            return fraction
+        opening, closing = self.session
+        length = closing - opening
+        overnight = self.overnight_weight / (1 - length) if self.overnight_weight else 0.
+        return (overnight * (numpy.minimum(fraction, opening) + numpy.maximum(fraction - closing, 0.)) +
+                (1 - self.overnight_weight) * numpy.clip(fraction - opening, 0., length) / length)
+
+    def _business_time(self, x):
+        """Return the whole business days before the times x, and the
+        elapsed share of their own day, kept apart for precision."""
+
+        day, fraction = _split(_datetime(x))
+        index = self._index(day)
+        return self._count[index], self._business_day[index] * self._elapsed(fraction)
+
+    def business_days(self, begin, end):
+        """Return the number of business days from the dates ``begin``,
+        included, to ``end``, excluded, like ``numpy.busday_count``.
+
+        :param begin: first dates
+        :type begin: numpy.datetime64 or numpy.ndarray
+        :param end: last dates
+        :type end: numpy.datetime64 or numpy.ndarray
+
+        :returns:  int or numpy.ndarray
+        """
+
+        begin = self._index(numpy.asarray(begin, dtype='datetime64[D]'))
+        end = self._index(numpy.asarray(end, dtype='datetime64[D]'))
+        return (self._count[end] - self._count[begin])[()]
+
+    def year_fraction(self, now, expiry):
+        """Return the business time from valuation times to expirations, in
+        years of ``days_per_year`` business days.
+
+        :param now: valuation time
+        :type now: numpy.datetime64 or numpy.ndarray
+        :param expiry: expiration time
+        :type expiry: numpy.datetime64 or numpy.ndarray
+
+        :returns:  float or numpy.ndarray
+        """
+
+        expiry_days, expiry_fraction = self._business_time(expiry)
+        now_days, now_fraction = self._business_time(now)
+        return (((expiry_days - now_days) + (expiry_fraction - now_fraction)) / self.days_per_year)[()]
+
+
+if __name__ == "__main__":
+    from py_vollib.helpers.doctest_helper import run_doctest
+    run_doctest()
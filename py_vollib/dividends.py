@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+"""
+py_vollib.dividends
+~~~~~~~~~~~~~~~~~~~
+
+A library for option pricing, implied volatility, and
+greek calculation.  py_vollib is based on lets_be_rational,
+a Python wrapper for LetsBeRational by Peter Jaeckel as
+described below.
+
+:copyright: © 2017 Gammon Capital LLC
+:license: MIT, see LICENSE for more details.
+
+About LetsBeRational:
+~~~~~~~~~~~~~~~~~~~~~
+
+The source code of LetsBeRational resides at www.jaeckel.org/LetsBeRational.7z .
+
+::
+
+    ========================================================================================
+    Copyright © 2013-2014 Peter Jäckel.
+
+    Permission to use, copy, modify, and distribute this software is freely granted,
+    provided that this notice is preserved.
+
+    WARRANTY DISCLAIMER
+    The Software is provided "as is" without warranty of any kind, either express or implied,
+    including without limitation any implied warranties of condition, uninterrupted use,
+    merchantability, fitness for a particular purpose, or non-infringement.
+    ========================================================================================
+
+
+
+Discrete dividends:
+~~~~~~~~~~~~~~~~~~~
+
+In the escrowed dividend model the known cash dividends paid before
+expiration are taken out of the spot at their present value, and the
+remaining risky part of the underlying follows Black-Scholes dynamics.
+A European option is then a Black option on the forward of that risky
+part, ``(S - PV) * exp(r * t)``, priced with the vectorized Black kernel
+of py_vollib.ref_python.
+
+The dividends of several underliers are given as padded arrays with one
+row per underlier, so a whole book is discounted in one pass.  The
+discounted dividends of every underlier are cached per valuation date
+and rate, and the options of a chain only differ in which of them fall
+before their expiration.
+
+Ex-dates and the valuation date are measured in years on the same
+clock, and time to expiration is measured from the valuation date.
+Dividends going ex on or before the valuation date are already paid;
+those going ex on the expiration date are paid before expiration.
+
+"""
+
+
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+from __future__ import division
+from collections import OrderedDict
+
+# Related third party imports
+import numpy
+
+# Local application/library specific imports
+from py_vollib.curves import Curve, zero_rate
+from py_vollib.helpers.exceptions import InvalidArgument
+from py_vollib.ref_python.black import black
+from py_vollib.ref_python.black.implied_volatility import vectorized_implied_volatility
+
+
+# -----------------------------------------------------------------------------
+# DATA
+
+CACHE_SIZE = 64
+
+
+# -----------------------------------------------------------------------------
+# CLASSES
+
+
+class DividendSchedule(object):
+    """The cash dividends of one or more underliers.
+
+    Rows shorter than the longest schedule are padded with nan ex-dates,
+    or zero amounts.  A one-dimensional schedule is a single underlier.
+
+    :param amounts: cash amount of each dividend
+    :type amounts: numpy.ndarray
+    :param ex_dates: ex-date of each dividend, in years
+    :type ex_dates: numpy.ndarray
+
+    >>> schedule = DividendSchedule([[.5, .5], [1., numpy.nan]], [[2 / 12, 5 / 12], [.25, numpy.nan]])
+    >>> len(schedule)
+    2
+    >>> pv = schedule.present_value(.5, .09, underlier=[0, 0, 1], valuation=[0., .25, 0.])
+    >>> pv.round(4)
+    array([0.9742, 0.4926, 0.9778])
+    """
+
+    def __init__(self, amounts, ex_dates):
+        amounts, ex_dates = numpy.broadcast_arrays(numpy.asarray(amounts, dtype=float),
+                                                   numpy.asarray(ex_dates, dtype=float))
+        if amounts.ndim > 2:
+            raise InvalidArgument("dividend schedules must be one or two-dimensional")
+        amounts, ex_dates = numpy.atleast_2d(amounts, ex_dates)
+        padding = numpy.isnan(ex_dates) | numpy.isnan(amounts) | (amounts == 0)
+        self.amounts = numpy.where(padding, 0., amounts)
+        self.ex_dates = numpy.where(padding, numpy.inf, ex_dates)
+        self._cache = OrderedDict()
+
+    def __len__(self):
+        return self.amounts.shape[0]
+
+    def discounted(self, valuation, r):
+        """Return the amounts discounted to the valuation date, zero for the
+        dividends already paid.
+
+        The result is cached per valuation date and rate, or curve.
+
+        :param valuation: valuation date, in years
+        :type valuation: float
+        :param r: risk-free interest rate, or a curve
+        :type r: float or py_vollib.curves.Curve
+
+        :returns:  numpy.ndarray shaped like the padded schedule
+        """
+
+        key = (float(valuation), r if isinstance(r, Curve) else float(r))
+        if key in self._cache:
+            self._cache.move_to_end(key)
+        else:
+            if len(self._cache) >= CACHE_SIZE:
+                self._cache.popitem(last=False)
+            tau = self.ex_dates - key[0]
+            unpaid = numpy.isfinite(tau) & (tau > 0)
+            tau = numpy.where(unpaid, tau, 0.)
+            if isinstance(r, Curve):
+                discount_factor = r.discount_factor(tau)
+            else:
+                discount_factor = numpy.exp(-key[1] * tau)
+            self._cache[key] = numpy.where(unpaid, self.amounts * discount_factor, 0.)
+        return self._cache[key]
+
+    def present_value(self, t, r, underlier=0, valuation=0.):
+        """Return the present value of the dividends going ex after the
+        valuation date and on or before expiration.
+
+        :param t: time to expiration in years
+        :type t: float or numpy.ndarray
+        :param r: risk-free interest rate, or a curve
+        :type r: float or py_vollib.curves.Curve
+        :param underlier: row of the schedule of each option
+        :type underlier: int or numpy.ndarray
+        :param valuation: valuation date, in years
+        :type valuation: float or numpy.ndarray
+
+        :returns:  float or numpy.ndarray
+        """
+
+        t, underlier, valuation = numpy.broadcast_arrays(numpy.asarray(t, dtype=float),
+                                                         numpy.asarray(underlier, dtype=int),
+                                                         numpy.asarray(valuation, dtype=float))
+        pv = numpy.zeros(t.shape)
+        # one pass per valuation date; a chain normally has a single one
+        for date in numpy.unique(valuation):
+            rows = valuation == date
+            before_expiration = self.ex_dates[underlier[rows]] <= (date + t[rows])[:, None]
+            pv[rows] = (self.discounted(date, r)[underlier[rows]] * before_expiration).sum(axis=-1)
+        return pv[()]
+
+    def clear_cache(self):
+        """Forget the cached discounted dividends."""
+
+        self._cache.clear()
+
+
+# -----------------------------------------------------------------------------
+# FUNCTIONS
+
+
+def _forward(S, t, r, schedule, underlier, valuation):
+    S = numpy.asarray(S, dtype=float)
+    escrowed = S - schedule.present_value(t, r, underlier, valuation)
+    if numpy.any(escrowed <= 0):
+        raise InvalidArgument("the dividends before expiration must be worth less than the spot")
+    return escrowed * numpy.exp(zero_rate(r, t) * numpy.asarray(t, dtype=float))
+
+
+def black_scholes(flag, S, K, t, r, sigma, schedule, underlier=0, valuation=0.):
+    """Calculate the price of a European option on an underlying paying
+    discrete cash dividends, in the escrowed dividend model.
+
+    All arguments other than ``r`` and ``schedule`` may be arrays; they
+    broadcast against each other.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param S: underlying asset price, including the dividends
+    :type S: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: risk-free interest rate, or a curve
+    :type r: float or py_vollib.curves.Curve
+    :param sigma: annualized standard deviation of the escrowed spot
+    :type sigma: float or numpy.ndarray
+    :param schedule: cash dividends of the underliers
+    :type schedule: DividendSchedule
+    :param underlier: row of the schedule of each option
+    :type underlier: int or numpy.ndarray
+    :param valuation: valuation date, in years
+    :type valuation: float or numpy.ndarray
+
+    :returns:  float or numpy.ndarray
+
+    Hull's example of a call with dividends of 0.50 going ex in two and
+    five months:
+
+    >>> schedule = DividendSchedule([.5, .5], [2 / 12, 5 / 12])
+    >>> price = black_scholes('c', 40., 40., .5, .09, .3, schedule)
+    >>> text_book_value = 3.67
+    >>> abs(price - text_book_value) < .01
+    True
+
+    Without dividends, the Black-Scholes price:
+
+    >>> from py_vollib.black_scholes import black_scholes as bs
+    >>> price = black_scholes(['c', 'p'], 40., 40., .5, .09, .3, schedule, valuation=.5)
+    >>> bool(numpy.allclose(price, [bs('c', 40., 40., .5, .09, .3), bs('p', 40., 40., .5, .09, .3)]))
+    True
+    """
+
+    return black(flag, _forward(S, t, r, schedule, underlier, valuation), K, t, r, sigma)
+
+
+def implied_volatility(price, S, K, t, r, flag, schedule, underlier=0, valuation=0.):
+    """Calculate the implied volatility of the escrowed spot from the
+    prices of European options on an underlying paying discrete cash
+    dividends.
+
+    All arguments other than ``r`` and ``schedule`` may be arrays; they
+    broadcast against each other.  Prices without a root in the bracket
+    of ``py_vollib.ref_python.black.implied_volatility`` give nan.
+
+    :param price: the option price
+    :type price: float or numpy.ndarray
+    :param S: underlying asset price, including the dividends
+    :type S: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: risk-free interest rate, or a curve
+    :type r: float or py_vollib.curves.Curve
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param schedule: cash dividends of the underliers
+    :type schedule: DividendSchedule
+    :param underlier: row of the schedule of each option
+    :type underlier: int or numpy.ndarray
+    :param valuation: valuation date, in years
+    :type valuation: float or numpy.ndarray
+
+    :returns:  float or numpy.ndarray
+
+    >>> schedule = DividendSchedule([[.5, .5, .5], [1.2, 0., 0.]], [[.1, .35, .6], [.4, 0., 0.]])
+    >>> K = numpy.array([90., 100., 110., 40.])
+    >>> t = numpy.array([.25, .5, .75, .5])
+    >>> S = numpy.array([100., 100., 100., 41.])
+    >>> sigma = numpy.array([.2, .25, .3, .35])
+    >>> underlier = [0, 0, 0, 1]
+    >>> price = black_scholes('p', S, K, t, .03, sigma, schedule, underlier)
+    >>> iv = implied_volatility(price, S, K, t, .03, 'p', schedule, underlier)
+    >>> bool(numpy.allclose(iv, sigma, rtol=1e-12, atol=0))
+    True
+    """
+
+    F = _forward(S, t, r, schedule, underlier, valuation)
+    return vectorized_implied_volatility(price, F, K, r, t, flag)
+
+
+if __name__ == "__main__":
+    from py_vollib.helpers.doctest_helper import run_doctest
+    run_doctest()
@@ -0,0 +1,349 @@
+# -*- coding: utf-8 -*-
+"""
+py_vollib.finite_difference
+~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+A library for option pricing, implied volatility, and
+greek calculation.  py_vollib is based on lets_be_rational,
+a Python wrapper for LetsBeRational by Peter Jaeckel as
+described below.
+
+:copyright: © 2017 Gammon Capital LLC
+:license: MIT, see LICENSE for more details.
+
+About LetsBeRational:
+~~~~~~~~~~~~~~~~~~~~~
+
+The source code of LetsBeRational resides at www.jaeckel.org/LetsBeRational.7z .
+
+::
+
+    ========================================================================================
+    Copyright © 2013-2014 Peter Jäckel.
+
+    Permission to use, copy, modify, and distribute this software is freely granted,
+    provided that this notice is preserved.
+
+    WARRANTY DISCLAIMER
+    The Software is provided "as is" without warranty of any kind, either express or implied,
+    including without limitation any implied warranties of condition, uninterrupted use,
+    merchantability, fitness for a particular purpose, or non-infringement.
+    ========================================================================================
+
+
+Note about the parameter "b":
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+::
+
+    ======================================================================================
+    from Espen Gaarder Haug's
+    "The Complete Guide to Option Pricing Formulas," Second Edition,
+    page 90.
+    
+    +-----------+------------------------------------------------------+
+    | b = r     |  gives the Black and Scholes (1973) stock option     |
+    |           |  model                                               |
+    +-----------+------------------------------------------------------+
+    | b = r -q  |  gives the Merton (1973) stock option model with     |
+    |           |  continuous dividend yield q                         |
+    +-----------+------------------------------------------------------+
+    | b = 0     |  gives the Black (1976) futures option model         |
+    +-----------+------------------------------------------------------+
+    | b = 0 and |  gives the Asay (1982) margined futures option model |
+    | r = 0     |                                                      |
+    +-----------+------------------------------------------------------+
+    ======================================================================================
+
+
+Crank-Nicolson finite differences:
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+The Black-Scholes-Merton equation is solved in the log of the underlying
+price on a uniform grid centred on today's price, so the price, delta and
+gamma are read off the centre node without interpolation.  The grid spans
+a number of standard deviations either side of the centre.  The first
+time steps are fully implicit (Rannacher smoothing), which damps the
+oscillations Crank-Nicolson otherwise shows near the strike; the
+remaining steps are Crank-Nicolson.
+
+A batch of contracts is solved together.  Each contract contributes one
+column to a stack of tridiagonal systems, and the Thomas algorithm sweeps
+all of the columns at once.  Every contract's grid is laid out with its
+in-the-money end last.  Early exercise is then a projection onto the
+payoff during the back substitution, the Brennan-Schwartz algorithm.
+This solves the same linear complementarity problem as projected SOR,
+but in a single sweep instead of an iteration.
+
+"""
+
+
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+from __future__ import division
+
+# Related third party imports
+import numpy
+
+# Local application/library specific imports
+from py_vollib.curves import zero_rate
+from py_vollib.helpers import binary_flag_array
+
+
+# -----------------------------------------------------------------------------
+# DATA
+
+SPACE_STEPS = 200
+TIME_STEPS = 50
+RANNACHER_STEPS = 2
+STANDARD_DEVIATIONS = 5.
+CHUNK_SIZE = 4096
+
+
+# -----------------------------------------------------------------------------
+# FUNCTIONS - HELPERS
+
+
+def _factorize(lower, diagonal, upper, nodes):
+    """Eliminate the sub-diagonal of a stack of tridiagonal matrices.
+
+    Each column is a Toeplitz matrix with the given constant diagonals, of
+    order ``nodes``.  Returns the multipliers of the forward sweep, the
+    reciprocals of the pivots and the super-diagonal of the resulting unit
+    upper triangular matrices.
+    """
+
+    pivot = numpy.empty((nodes,) + diagonal.shape)
+    pivot[0] = diagonal
+    for j in range(1, nodes):
+        pivot[j] = diagonal - lower * upper / pivot[j - 1]
+    inverse_pivot = 1. / pivot
+    return lower * inverse_pivot[1:], inverse_pivot, upper * inverse_pivot[:-1]
+
+
+def _solve(factors, rhs, floor, n_american):
+    """Solve a stack of factorized tridiagonal systems in place.
+
+    The first ``n_american`` columns are projected onto ``floor`` as the
+    back substitution moves from their in-the-money end.
+    """
+
+    multiplier, inverse_pivot, upper = factors
+    rhs *= inverse_pivot
+    work = numpy.empty(rhs.shape[1])
+    for j in range(1, rhs.shape[0]):
+        numpy.multiply(multiplier[j - 1], rhs[j - 1], out=work)
+        rhs[j] -= work
+    if n_american:
+        numpy.maximum(rhs[-1, :n_american], floor[-1, :n_american], out=rhs[-1, :n_american])
+    for j in range(rhs.shape[0] - 2, -1, -1):
+        numpy.multiply(upper[j], rhs[j + 1], out=work)
+        rhs[j] -= work
+        if n_american:
+            numpy.maximum(rhs[j, :n_american], floor[j, :n_american], out=rhs[j, :n_american])
+    return rhs
+
+
+def _solve_chunk(sign, S, K, t, r, sigma, b, n_american, space_steps, time_steps):
+    """Roll the grids of a chunk of live contracts back to today.
+
+    American contracts must come first.  Returns the values at the three
+    centre nodes today, the value at the centre node one time step later
+    and the grid spacings.
+    """
+
+    nodes = space_steps + 1
+    centre = space_steps // 2
+    sigma2 = sigma * sigma
+    drift = b - sigma2 / 2.
+    dx = 2. * (STANDARD_DEVIATIONS * sigma * numpy.sqrt(t) + numpy.abs(drift) * t) / space_steps
+    # stretch the spacing so that the strike falls midway between two nodes
+    moneyness = numpy.abs(numpy.log(K / S))
+    cells = numpy.floor(moneyness / dx)
+    dx = numpy.where(cells >= 1, moneyness / (cells + .5), dx)
+    dtau = t / time_steps
+
+    # node j lies at log(S) + sign * (j - centre) * dx, so the
+    # in-the-money end of every grid is the last node
+    offset = (numpy.arange(nodes) - centre)[:, None]
+    spot = S * numpy.exp(sign * offset * dx)
+    payoff = numpy.maximum(sign * (spot - K), 0.)
+    floor = payoff[1:-1, :n_american]
+
+    diffusion = sigma2 / (2. * dx * dx)
+    convection = sign * drift / (2. * dx)
+    lower = diffusion - convection
+    upper = diffusion + convection
+    diagonal = -2. * diffusion - r
+
+    def factorize(theta):
+        return _factorize(-theta * dtau * lower, 1. - theta * dtau * diagonal, -theta * dtau * upper, nodes - 2)
+
+    implicit = factorize(1.)
+    crank_nicolson = factorize(.5)
+    half_step = .5 * dtau
+    explicit_lower, explicit_diagonal, explicit_upper = half_step * lower, 1. + half_step * diagonal, half_step * upper
+
+    value = payoff.copy()
+    previous = numpy.empty_like(value)
+    previous[0] = 0.
+    value[0] = 0.
+    work = numpy.empty_like(value[1:-1])
+    for step in range(1, time_steps + 1):
+        value, previous = previous, value
+        rhs = value[1:-1]
+        tau = step * dtau
+
+        if step <= RANNACHER_STEPS:
+            theta, factors = 1., implicit
+            rhs[...] = previous[1:-1]
+        else:
+            theta, factors = .5, crank_nicolson
+            numpy.multiply(previous[1:-1], explicit_diagonal, out=rhs)
+            rhs += numpy.multiply(previous[:-2], explicit_lower, out=work)
+            rhs += numpy.multiply(previous[2:], explicit_upper, out=work)
+
+        boundary = sign * (spot[-1] * numpy.exp((b - r) * tau) - K * numpy.exp(-r * tau))
+        boundary[:n_american] = numpy.maximum(boundary[:n_american], payoff[-1, :n_american])
+        rhs[-1] += theta * dtau * upper * boundary
+        value[-1] = boundary
+        _solve(factors, rhs, floor, n_american)
+
+    return value[centre - 1:centre + 2], previous[centre], dx, dtau
+
+
+def _finite_difference(flag, S, K, t, r, sigma, b, american, space_steps, time_steps, chunk_size, greeks):
+    """Price a batch on Crank-Nicolson grids, optionally with grid greeks."""
+
+    sign = binary_flag_array(flag)
+    sign, S, K, t, r, sigma, b, american = numpy.broadcast_arrays(
+        sign, *[numpy.asarray(v, dtype=float) for v in (S, K, t, r, sigma, b)] + [numpy.asarray(american, dtype=bool)])
+    shape = S.shape
+    sign, S, K, t, r, sigma, b, american = [v.ravel() for v in (sign, S, K, t, r, sigma, b, american)]
+    space_steps = max(int(space_steps) + int(space_steps) % 2, 4)
+    time_steps = max(int(time_steps), RANNACHER_STEPS + 1)
+
+    result = {
+        'price': numpy.maximum(sign * (S - K), 0.),
+        'delta': numpy.where(S == K, .5 * sign, numpy.where(sign * (S - K) > 0, sign, 0.)),
+        'gamma': numpy.where(S == K, numpy.inf, 0.),
+        'theta': numpy.zeros(S.size),
+    }
+
+    live = numpy.flatnonzero(t > 0)
+    for start in range(0, live.size, chunk_size):
+        rows = live[start:start + chunk_size]
+        rows = rows[numpy.argsort(~american[rows], kind='stable')]
+        centre, previous, dx, dtau = _solve_chunk(
+            *[v[rows] for v in (sign, S, K, t, r, sigma, b)], n_american=numpy.count_nonzero(american[rows]),
+            space_steps=space_steps, time_steps=time_steps)
+        result['price'][rows] = centre[1]
+
+        if greeks:
+            S_ = S[rows]
+            V_x = sign[rows] * (centre[2] - centre[0]) / (2. * dx)
+            V_xx = (centre[2] - 2. * centre[1] + centre[0]) / (dx * dx)
+            result['delta'][rows] = V_x / S_
+            result['gamma'][rows] = (V_xx - V_x) / (S_ * S_)
+            result['theta'][rows] = (previous - centre[1]) / dtau / 365.
+
+    return dict((name, value.reshape(shape)[()]) for name, value in result.items())
+
+
+# -----------------------------------------------------------------------------
+# FUNCTIONS - PRICING
+
+
+def crank_nicolson(flag, S, K, t, r, sigma, b, american=True, space_steps=SPACE_STEPS,
+                   time_steps=TIME_STEPS, chunk_size=CHUNK_SIZE):
+    """Return the finite difference price of American or European options.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param S: underlying asset price
+    :type S: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: annualized standard deviation, or volatility
+    :type sigma: float or numpy.ndarray
+    :param b: cost of carry, see above
+    :type b: float or numpy.ndarray
+    :param american: allow early exercise
+    :type american: bool or numpy.ndarray
+    :param space_steps: number of grid intervals in the underlying, rounded up to an even number
+    :type space_steps: int
+    :param time_steps: number of time steps
+    :type time_steps: int
+    :param chunk_size: number of contracts solved together
+    :type chunk_size: int
+
+    :returns:  float or numpy.ndarray
+
+    >>> from py_vollib.black_scholes import black_scholes
+    >>> european = crank_nicolson('p', 100., 105., .5, .05, .25, .05, american=False)
+    >>> abs(european - black_scholes('p', 100., 105., .5, .05, .25)) < 1e-3
+    True
+    >>> from py_vollib.binomial import leisen_reimer
+    >>> abs(crank_nicolson('p', 100., 105., .5, .05, .25, .05) - leisen_reimer('p', 100., 105., .5, .05, .25, .05)) < 5e-3
+    True
+    """
+
+    r = zero_rate(r, t)
+    return _finite_difference(flag, S, K, t, r, sigma, b, american, space_steps, time_steps, chunk_size,
+                              greeks=False)['price']
+
+
+def crank_nicolson_greeks(flag, S, K, t, r, sigma, b, american=True, space_steps=SPACE_STEPS,
+                          time_steps=TIME_STEPS, chunk_size=CHUNK_SIZE):
+    """Return the finite difference price, delta, gamma and theta of American
+    or European options.  The greeks are differences on the pricing grid, so
+    they cost nothing beyond the price.  Theta is per calendar day, as in
+    ``py_vollib.helpers.numerical_greeks``.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param S: underlying asset price
+    :type S: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: annualized standard deviation, or volatility
+    :type sigma: float or numpy.ndarray
+    :param b: cost of carry, see above
+    :type b: float or numpy.ndarray
+    :param american: allow early exercise
+    :type american: bool or numpy.ndarray
+    :param space_steps: number of grid intervals in the underlying, rounded up to an even number
+    :type space_steps: int
+    :param time_steps: number of time steps
+    :type time_steps: int
+    :param chunk_size: number of contracts solved together
+    :type chunk_size: int
+
+    :returns:  dict with keys 'price', 'delta', 'gamma' and 'theta'
+
+    >>> from py_vollib.black_scholes.greeks import analytical
+    >>> result = crank_nicolson_greeks('c', 100., 105., .5, .05, .25, .05, american=False)
+    >>> abs(result['delta'] - analytical.delta('c', 100., 105., .5, .05, .25)) < 1e-3
+    True
+    >>> abs(result['gamma'] - analytical.gamma('c', 100., 105., .5, .05, .25)) < 1e-4
+    True
+    """
+
+    r = zero_rate(r, t)
+    return _finite_difference(flag, S, K, t, r, sigma, b, american, space_steps, time_steps, chunk_size,
+                              greeks=True)
+
+
+if __name__ == "__main__":
+    from py_vollib.helpers.doctest_helper import run_doctest
+    run_doctest()
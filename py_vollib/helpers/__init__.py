@@ -45,6 +45,7 @@ from __future__ import division
 import numpy
 
 # Local application/library specific imports
+from py_vollib.helpers.exceptions import InvalidArgument
 
 
 # -----------------------------------------------------------------------------
@@ -113,6 +114,48 @@ def forward_price(S,t,r):
     return S/numpy.exp(-r*t)
 
 
+def binary_flag_array(flag):
+    """Convert a flag, or an array of flags, to an array of
+    +1 (call) and -1 (put) values, as used by ``binary_flag``.
+
+    :param flag: 'c' or 'p' for call or put, or an array of them
+    :type flag: str or array
+
+    >>> binary_flag_array(['c', 'p', 'c'])
+    array([ 1, -1,  1])
+    >>> binary_flag_array('p')
+    array(-1)
+    """
+
+    flag = numpy.asarray(flag)
+    is_call = flag == CALL
+    if not numpy.all(is_call | (flag == PUT)):
+        raise InvalidArgument("flags must be '{}' or '{}'".format(CALL, PUT))
+    return numpy.where(is_call, binary_flag[CALL], binary_flag[PUT])
+
+
+def as_dtype(dtype, *values):
+    """Convert values to a floating point type, for the ``dtype``
+    argument of the vectorized functions.  Arrays stay arrays and scalars
+    stay scalars.  With dtype None the values are returned as they are.
+
+    :param dtype: floating point type, or None
+    :type dtype: numpy.dtype or None
+
+    :returns:  tuple
+
+    >>> S, K = as_dtype(numpy.float32, 100.0, [90.0, 110.0])
+    >>> type(S), K.dtype
+    (<class 'numpy.float32'>, dtype('float32'))
+    >>> as_dtype(None, 100.0, 90.0)
+    (100.0, 90.0)
+    """
+
+    if dtype is None:
+        return values
+    return tuple(numpy.asarray(value, dtype=dtype)[()] for value in values)
+
+
 if __name__ == "__main__":
     from py_vollib.helpers.doctest_helper import run_doctest
     run_doctest()
@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+"""
+py_vollib.helpers.adjoint
+~~~~~~~~~~~~~~~~~~~~~~~~~
+
+A library for option pricing, implied volatility, and
+greek calculation.  py_vollib is based on lets_be_rational,
+a Python wrapper for LetsBeRational by Peter Jaeckel as
+described below.
+
+:copyright: © 2017 Gammon Capital LLC
+:license: MIT, see LICENSE for more details.
+
+About LetsBeRational:
+~~~~~~~~~~~~~~~~~~~~~
+
+The source code of LetsBeRational resides at www.jaeckel.org/LetsBeRational.7z .
+
+::
+
+    ========================================================================================
+    Copyright © 2013-2014 Peter Jäckel.
+
+    Permission to use, copy, modify, and distribute this software is freely granted,
+    provided that this notice is preserved.
+
+    WARRANTY DISCLAIMER
+    The Software is provided "as is" without warranty of any kind, either express or implied,
+    including without limitation any implied warranties of condition, uninterrupted use,
+    merchantability, fitness for a particular purpose, or non-infringement.
+    ========================================================================================
+
+
+
+
+Reverse-mode automatic differentiation:
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+A ``Variable`` wraps a value, usually a numpy array, and records every
+operation applied to it together with the local partial derivatives.
+Evaluating a scalar function, such as the total value of a book of
+options, on ``Variable`` inputs builds that record in one forward sweep.
+A single backward sweep then yields the derivative of the result with
+respect to every input, whatever the number of inputs.  Gradients of
+inputs that were broadcast, such as one spot price shared by many
+options, are summed back to the shape of the input.
+
+The same functions as ``py_vollib.helpers.dual`` are supported:
+arithmetic, ``numpy.exp``, ``numpy.log``, ``numpy.sqrt`` and
+``scipy.special.ndtr``.
+
+"""
+
+
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+from __future__ import division
+import itertools
+
+# Related third party imports
+import numpy
+
+# Local application/library specific imports
+from py_vollib.helpers import ONE_OVER_SQRT_TWO_PI
+from py_vollib.helpers.distributions import ndtr
+
+
+# -----------------------------------------------------------------------------
+# CLASSES
+
+_counter = itertools.count()
+
+
+class Variable(object):
+    """A value recorded for reverse-mode differentiation.
+
+    ``parents`` holds ``(variable, partial)`` pairs, where ``partial`` is the
+    derivative of this value with respect to the parent, elementwise.
+
+    >>> x = Variable(numpy.array([1.0, 2.0]))
+    >>> y = (x * x + 3 * x).sum()
+    >>> y.backward()
+    >>> x.adjoint
+    array([5., 7.])
+    """
+
+    __slots__ = ('value', 'parents', 'adjoint', '_order')
+
+    def __init__(self, value, parents=()):
+        self.value = value
+        self.parents = parents
+        self.adjoint = None
+        self._order = next(_counter)
+
+    def __repr__(self):
+        return 'Variable({!r})'.format(self.value)
+
+    def _unary(self, value, partial):
+        return Variable(value, ((self, partial),))
+
+    def _binary(self, other, value, partial_self, partial_other):
+        if isinstance(other, Variable):
+            return Variable(value, ((self, partial_self), (other, partial_other)))
+        return Variable(value, ((self, partial_self),))
+
+    def __neg__(self):
+        return self._unary(-self.value, -1.0)
+
+    def __pos__(self):
+        return self
+
+    def __add__(self, other):
+        return self._binary(other, self.value + _value(other), 1.0, 1.0)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return self._binary(other, self.value - _value(other), 1.0, -1.0)
+
+    def __rsub__(self, other):
+        return self._binary(other, _value(other) - self.value, -1.0, 1.0)
+
+    def __mul__(self, other):
+        return self._binary(other, self.value * _value(other), _value(other), self.value)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        inverse = 1.0 / _value(other)
+        value = self.value * inverse
+        return self._binary(other, value, inverse, -value * inverse)
+
+    def __rtruediv__(self, other):
+        inverse = 1.0 / self.value
+        value = _value(other) * inverse
+        return self._binary(other, value, -value * inverse, inverse)
+
+    __div__ = __truediv__
+    __rdiv__ = __rtruediv__
+
+    def __pow__(self, exponent):
+        if isinstance(exponent, Variable):
+            return numpy.exp(exponent * numpy.log(self))
+        return self._unary(self.value ** exponent, exponent * self.value ** (exponent - 1))
+
+    def __rpow__(self, base):
+        return numpy.exp(self * numpy.log(base))
+
+    def reciprocal(self):
+        inverse = 1.0 / self.value
+        return self._unary(inverse, -inverse * inverse)
+
+    def exp(self):
+        value = numpy.exp(self.value)
+        return self._unary(value, value)
+
+    def log(self):
+        return self._unary(numpy.log(self.value), 1.0 / self.value)
+
+    def sqrt(self):
+        value = numpy.sqrt(self.value)
+        return self._unary(value, 0.5 / value)
+
+    def ndtr(self):
+        return self._unary(ndtr(self.value), ONE_OVER_SQRT_TWO_PI * numpy.exp(-0.5 * self.value * self.value))
+
+    def sum(self):
+        return self._unary(numpy.sum(self.value), numpy.ones_like(self.value))
+
+    def backward(self):
+        """Propagate adjoints from this (scalar) value back to every
+        variable it depends on."""
+
+        nodes = []
+        seen = set()
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if id(node) in seen:
+                continue
+            seen.add(id(node))
+            nodes.append(node)
+            node.adjoint = None
+            stack.extend(parent for parent, _ in node.parents)
+
+        self.adjoint = numpy.ones_like(self.value, dtype=float)
+        for node in sorted(nodes, key=lambda n: n._order, reverse=True):
+            if node.adjoint is None:
+                continue
+            for parent, partial in node.parents:
+                contribution = _unbroadcast(node.adjoint * partial, numpy.shape(parent.value))
+                parent.adjoint = contribution if parent.adjoint is None else parent.adjoint + contribution
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method != '__call__' or kwargs:
+            return NotImplemented
+        name = ufunc.__name__
+        if name in _unary:
+            return getattr(inputs[0], _unary[name])()
+        if name in _binary:
+            a, b = inputs
+            if isinstance(a, Variable):
+                return getattr(a, '__{}__'.format(_binary[name]))(b)
+            return getattr(b, '__r{}__'.format(_binary[name]))(a)
+        return NotImplemented
+
+
+_unary = {
+    'negative': '__neg__',
+    'reciprocal': 'reciprocal',
+    'exp': 'exp',
+    'log': 'log',
+    'sqrt': 'sqrt',
+    'ndtr': 'ndtr',
+}
+
+_binary = {
+    'add': 'add',
+    'subtract': 'sub',
+    'multiply': 'mul',
+    'true_divide': 'truediv',
+    'divide': 'truediv',
+    'power': 'pow',
+}
+
+
+# -----------------------------------------------------------------------------
+# FUNCTIONS
+
+
+def _value(x):
+    return x.value if isinstance(x, Variable) else x
+
+
+def _unbroadcast(gradient, shape):
+    """Sum a gradient over the axes along which an input of the given
+    shape was broadcast."""
+
+    gradient = numpy.asarray(gradient)
+    while gradient.ndim > len(shape):
+        gradient = gradient.sum(axis=0)
+    for axis, size in enumerate(shape):
+        if size == 1 and gradient.shape[axis] != 1:
+            gradient = gradient.sum(axis=axis, keepdims=True)
+    return gradient if gradient.shape == tuple(shape) else numpy.broadcast_to(gradient, shape).copy()
+
+
+def gradient(function, args, wrt):
+    """Evaluate function(*args) and differentiate its sum with respect to
+    the arguments at the positions in wrt, in one backward sweep.
+
+    :param function: a function built from the supported operations
+    :type function: python function object
+    :param args: the arguments of function
+    :type args: sequence
+    :param wrt: positions of the arguments to differentiate with respect to
+    :type wrt: sequence of int
+
+    :returns:  (value, list of gradients shaped like the corresponding arguments)
+
+    >>> f = lambda x, y: x * numpy.exp(y)
+    >>> value, (dx, dy) = gradient(f, (numpy.array([1.0, 2.0]), 0.0), (0, 1))
+    >>> value
+    3.0
+    >>> dx
+    array([1., 1.])
+    >>> dy
+    3.0
+    """
+
+    args = list(args)
+    for i in wrt:
+        args[i] = Variable(numpy.asarray(args[i], dtype=float))
+    result = function(*args)
+    if not isinstance(result, Variable):
+        return numpy.sum(result), [numpy.zeros_like(args[i].value, dtype=float)[()] for i in wrt]
+    if numpy.ndim(result.value):
+        result = result.sum()
+    result.backward()
+
+    gradients = []
+    for i in wrt:
+        adjoint = args[i].adjoint
+        if adjoint is None:
+            adjoint = numpy.zeros_like(args[i].value, dtype=float)
+        gradients.append(numpy.asarray(adjoint)[()])
+    return result.value, gradients
+
+
+if __name__ == "__main__":
+    from py_vollib.helpers.doctest_helper import run_doctest
+    run_doctest()
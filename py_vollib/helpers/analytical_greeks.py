@@ -0,0 +1,567 @@
+# -*- coding: utf-8 -*-
+"""
+py_vollib.helpers.analytical_greeks
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+A library for option pricing, implied volatility, and
+greek calculation.  py_vollib is based on lets_be_rational,
+a Python wrapper for LetsBeRational by Peter Jaeckel as
+described below.
+
+:copyright: © 2017 Gammon Capital LLC
+:license: MIT, see LICENSE for more details.
+
+About LetsBeRational:
+~~~~~~~~~~~~~~~~~~~~~
+
+The source code of LetsBeRational resides at www.jaeckel.org/LetsBeRational.7z .
+
+::
+
+    ========================================================================================
+    Copyright © 2013-2014 Peter Jäckel.
+
+    Permission to use, copy, modify, and distribute this software is freely granted,
+    provided that this notice is preserved.
+
+    WARRANTY DISCLAIMER
+    The Software is provided "as is" without warranty of any kind, either express or implied,
+    including without limitation any implied warranties of condition, uninterrupted use,
+    merchantability, fitness for a particular purpose, or non-infringement.
+    ========================================================================================
+
+
+Note about the parameter "b":
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+::
+
+    ======================================================================================
+    from Espen Gaarder Haug's
+    "The Complete Guide to Option Pricing Formulas," Second Edition,
+    page 90.
+    
+    +-----------+------------------------------------------------------+
+    | b = r     |  gives the Black and Scholes (1973) stock option     |
+    |           |  model                                               |
+    +-----------+------------------------------------------------------+
+    | b = r -q  |  gives the Merton (1973) stock option model with     |
+    |           |  continuous dividend yield q                         |
+    +-----------+------------------------------------------------------+
+    | b = 0     |  gives the Black (1976) futures option model         |
+    +-----------+------------------------------------------------------+
+    | b = 0 and |  gives the Asay (1982) margined futures option model |
+    | r = 0     |                                                      |
+    +-----------+------------------------------------------------------+
+    ======================================================================================
+
+
+
+Closed-form greeks in the generalized Black-Scholes-Merton model:
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+The formulas follow Haug, chapter 2, written with the cost of carry b.
+The shared terms d1, d2 and pdf(d1) are computed once per call, and every
+argument, including the flag, may be an array.  The greeks use the same
+units as the rest of py_vollib:
+
+    ========  ====================================================
+    delta     dV/dS
+    gamma     d2V/dS2
+    theta     change in value per calendar day
+    vega      change in value per 1% change in volatility
+    rho       change in value per 1% change in r, with b moving with r
+    vanna     change in delta per 1% change in volatility
+    volga     change in vega per 1% change in volatility
+    charm     change in delta per calendar day
+    speed     d3V/dS3
+    zomma     change in gamma per 1% change in volatility
+    color     change in gamma per calendar day
+    ========  ====================================================
+
+"""
+
+
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+from __future__ import division
+
+# Related third party imports
+import numpy
+
+# Local application/library specific imports
+from py_vollib.curves import zero_rate
+from py_vollib.helpers import ONE_OVER_SQRT_TWO_PI, as_dtype, binary_flag_array, pdf
+from py_vollib.helpers.distributions import ndtr as N
+from py_vollib.helpers.profiling import profiler
+from py_vollib.helpers.workspace import Workspace, compute_dtype, output
+
+
+# -----------------------------------------------------------------------------
+# DATA
+
+GREEKS = ('price', 'delta', 'gamma', 'theta', 'vega', 'rho',
+          'vanna', 'volga', 'charm', 'speed', 'zomma', 'color')
+
+
+# -----------------------------------------------------------------------------
+# CLASSES
+
+
+class _Terms(object):
+    """The terms shared by the closed-form greeks of one set of inputs."""
+
+    def __init__(self, sign, S, K, t, r, sigma, b):
+        self.sign = sign
+        self.S, self.K, self.t, self.r, self.sigma, self.b = S, K, t, r, sigma, b
+        self.sqrt_t = numpy.sqrt(t)
+        self.sigma_sqrt_t = sigma * self.sqrt_t
+        self.d1 = (numpy.log(S / K) + (b + sigma * sigma / 2.0) * t) / self.sigma_sqrt_t
+        self.d2 = self.d1 - self.sigma_sqrt_t
+        self.pdf_d1 = pdf(self.d1)
+        self.carry = numpy.exp((b - r) * t)
+        self.discount = numpy.exp(-r * t)
+
+    def price(self):
+        sign = self.sign
+        return sign * (self.S * self.carry * N(sign * self.d1) - self.K * self.discount * N(sign * self.d2))
+
+    def delta(self):
+        return self.sign * self.carry * N(self.sign * self.d1)
+
+    def gamma(self):
+        return self.carry * self.pdf_d1 / (self.S * self.sigma_sqrt_t)
+
+    def theta(self):
+        sign = self.sign
+        annual = (-self.S * self.carry * self.pdf_d1 * self.sigma / (2 * self.sqrt_t)
+                  - sign * (self.b - self.r) * self.S * self.carry * N(sign * self.d1)
+                  - sign * self.r * self.K * self.discount * N(sign * self.d2))
+        return annual / 365.0
+
+    def vega(self):
+        return self.S * self.carry * self.pdf_d1 * self.sqrt_t * .01
+
+    def rho(self):
+        return self.sign * self.t * self.K * self.discount * N(self.sign * self.d2) * .01
+
+    def vanna(self):
+        return -self.carry * self.pdf_d1 * self.d2 / self.sigma * .01
+
+    def volga(self):
+        return self.vega() * self.d1 * self.d2 / self.sigma * .01
+
+    def charm(self):
+        annual = -self.carry * (self.pdf_d1 * (self.b / self.sigma_sqrt_t - self.d2 / (2 * self.t))
+                                + self.sign * (self.b - self.r) * N(self.sign * self.d1))
+        return annual / 365.0
+
+    def speed(self):
+        return -self.gamma() / self.S * (1 + self.d1 / self.sigma_sqrt_t)
+
+    def zomma(self):
+        return self.gamma() * (self.d1 * self.d2 - 1) / self.sigma * .01
+
+    def color(self):
+        annual = self.gamma() * (self.r - self.b + self.b * self.d1 / self.sigma_sqrt_t
+                                 + (1 - self.d1 * self.d2) / (2 * self.t))
+        return annual / 365.0
+
+
+# -----------------------------------------------------------------------------
+# FUNCTIONS - GENERIC FUNCTIONS FOR ANALYTICAL GREEK CALCULATION
+
+
+def vanna(flag, S, K, t, r, sigma, b):
+    """Calculate option vanna, the change in delta per 1% change in volatility.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param S: underlying asset price
+    :type S: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: annualized standard deviation, or volatility
+    :type sigma: float or numpy.ndarray
+    :param b: see above
+    :type b: float or numpy.ndarray
+
+    :returns:  float or numpy.ndarray
+    """
+
+    r = zero_rate(r, t)
+    return _Terms(binary_flag_array(flag), S, K, t, r, sigma, b).vanna()
+
+
+def volga(flag, S, K, t, r, sigma, b):
+    """Calculate option volga, the change in vega per 1% change in volatility.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param S: underlying asset price
+    :type S: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: annualized standard deviation, or volatility
+    :type sigma: float or numpy.ndarray
+    :param b: see above
+    :type b: float or numpy.ndarray
+
+    :returns:  float or numpy.ndarray
+    """
+
+    r = zero_rate(r, t)
+    return _Terms(binary_flag_array(flag), S, K, t, r, sigma, b).volga()
+
+
+def charm(flag, S, K, t, r, sigma, b):
+    """Calculate option charm, the change in delta per calendar day.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param S: underlying asset price
+    :type S: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: annualized standard deviation, or volatility
+    :type sigma: float or numpy.ndarray
+    :param b: see above
+    :type b: float or numpy.ndarray
+
+    :returns:  float or numpy.ndarray
+    """
+
+    r = zero_rate(r, t)
+    return _Terms(binary_flag_array(flag), S, K, t, r, sigma, b).charm()
+
+
+def speed(flag, S, K, t, r, sigma, b):
+    """Calculate option speed, the rate of change of gamma with the underlying price.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param S: underlying asset price
+    :type S: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: annualized standard deviation, or volatility
+    :type sigma: float or numpy.ndarray
+    :param b: see above
+    :type b: float or numpy.ndarray
+
+    :returns:  float or numpy.ndarray
+    """
+
+    r = zero_rate(r, t)
+    return _Terms(binary_flag_array(flag), S, K, t, r, sigma, b).speed()
+
+
+def zomma(flag, S, K, t, r, sigma, b):
+    """Calculate option zomma, the change in gamma per 1% change in volatility.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param S: underlying asset price
+    :type S: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: annualized standard deviation, or volatility
+    :type sigma: float or numpy.ndarray
+    :param b: see above
+    :type b: float or numpy.ndarray
+
+    :returns:  float or numpy.ndarray
+    """
+
+    r = zero_rate(r, t)
+    return _Terms(binary_flag_array(flag), S, K, t, r, sigma, b).zomma()
+
+
+def color(flag, S, K, t, r, sigma, b):
+    """Calculate option color, the change in gamma per calendar day.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param S: underlying asset price
+    :type S: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: annualized standard deviation, or volatility
+    :type sigma: float or numpy.ndarray
+    :param b: see above
+    :type b: float or numpy.ndarray
+
+    :returns:  float or numpy.ndarray
+    """
+
+    r = zero_rate(r, t)
+    return _Terms(binary_flag_array(flag), S, K, t, r, sigma, b).color()
+
+
+def greeks(flag, S, K, t, r, sigma, b, profile=False, dtype=None, out=None, workspace=None):
+    """Calculate the price and the first, second and third order greeks
+    of an option, sharing d1, d2 and pdf(d1) between them.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param S: underlying asset price
+    :type S: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: annualized standard deviation, or volatility
+    :type sigma: float or numpy.ndarray
+    :param b: see above
+    :type b: float or numpy.ndarray
+    :param profile: also return a ``py_vollib.helpers.profiling.Profile`` of the call
+    :type profile: bool
+    :param dtype: floating point type to compute in, see ``py_vollib.ref_python``
+    :type dtype: numpy.dtype or None
+    :param out: arrays to write the greeks into, by name; the greeks
+        missing from it are written into new arrays.  See
+        ``py_vollib.helpers.workspace``
+    :type out: dict or None
+    :param workspace: scratch arrays to compute in place with
+    :type workspace: py_vollib.helpers.workspace.Workspace or None
+
+    :returns:  dict with keys 'price', 'delta', 'gamma', 'theta', 'vega', 'rho',
+        'vanna', 'volga', 'charm', 'speed', 'zomma' and 'color', and the profile
+        if profile is True
+
+    >>> S, K, t, r, sigma, q = 100.0, numpy.array([90.0, 110.0]), .5, .05, .25, .02
+    >>> result = greeks(['p', 'c'], S, K, t, r, sigma, r - q)
+    >>> bump = 1e-4
+    >>> up = greeks(['p', 'c'], S, K, t, r, sigma + bump, r - q)
+    >>> down = greeks(['p', 'c'], S, K, t, r, sigma - bump, r - q)
+    >>> numpy.allclose(result['vanna'], (up['delta'] - down['delta']) / (2 * bump) * .01)
+    True
+    >>> numpy.allclose(result['volga'], (up['vega'] - down['vega']) / (2 * bump) * .01)
+    True
+
+    >>> out = {'theta': numpy.empty(2)}
+    >>> in_place = greeks(['p', 'c'], S, K, t, r, sigma, r - q, out=out)
+    >>> in_place['theta'] is out['theta'], numpy.allclose(in_place['theta'], result['theta'], rtol=1e-15, atol=0)
+    (True, True)
+    """
+
+    stages = profiler(profile)
+    if out is not None or workspace is not None:
+        result = _greeks_into(flag, S, K, t, r, sigma, b, dtype, out or {}, workspace or Workspace(), stages)
+        return (result, stages) if profile else result
+
+    sign = binary_flag_array(flag)
+    sign, S, K, t, sigma, b = as_dtype(dtype, sign, S, K, t, sigma, b)
+    stages.lap('input', sign)
+
+    r = zero_rate(r, t)
+    r = as_dtype(dtype, r)[0]
+    terms = _Terms(sign, S, K, t, r, sigma, b)
+    stages.lap('setup', r, terms.d1, terms.d2, terms.pdf_d1, terms.carry, terms.discount)
+
+    price = terms.price()
+    stages.lap('solver', price)
+
+    result = {
+        'price': price,
+        'delta': terms.delta(),
+        'gamma': terms.gamma(),
+        'theta': terms.theta(),
+        'vega': terms.vega(),
+        'rho': terms.rho(),
+        'vanna': terms.vanna(),
+        'volga': terms.volga(),
+        'charm': terms.charm(),
+        'speed': terms.speed(),
+        'zomma': terms.zomma(),
+        'color': terms.color(),
+    }
+    result = dict(zip(result, as_dtype(dtype, *result.values())))
+    stages.lap('greeks', *list(result.values())[1:])
+
+    return (result, stages) if profile else result
+
+
+def _greeks_into(flag, S, K, t, r, sigma, b, dtype, out, workspace, stages):
+    """Compute ``greeks`` in place, into the arrays of ``out`` and the
+    scratch arrays of ``workspace``.  The shared terms of ``_Terms`` are
+    kept in the workspace, and each greek needs at most three more."""
+
+    dtype = compute_dtype(dtype, next(iter(out.values()), None))
+    sign = workspace.sign(flag, dtype)
+    S, K, t, sigma, b = as_dtype(dtype, S, K, t, sigma, b)
+    stages.lap('input', sign)
+
+    r = zero_rate(r, t)
+    r = as_dtype(dtype, r)[0]
+    shape = numpy.broadcast(sign, S, K, t, r, sigma, b).shape
+    result = dict((name, output(out.get(name), shape, dtype)) for name in GREEKS)
+    scratch = lambda name: workspace.array(name, shape, dtype)
+    u, v, w = scratch('a'), scratch('b'), scratch('c')
+
+    sqrt_t = numpy.sqrt(t, out=scratch('sqrt_t'))
+    sigma_sqrt_t = numpy.multiply(sigma, sqrt_t, out=scratch('sigma_sqrt_t'))
+    d1 = numpy.divide(S, K, out=scratch('d1'))
+    numpy.log(d1, out=d1)
+    numpy.multiply(sigma, sigma, out=u)
+    numpy.divide(u, 2.0, out=u)
+    numpy.add(b, u, out=u)
+    numpy.multiply(u, t, out=u)
+    numpy.add(d1, u, out=d1)
+    numpy.divide(d1, sigma_sqrt_t, out=d1)
+    d2 = numpy.subtract(d1, sigma_sqrt_t, out=scratch('d2'))
+    pdf_d1 = numpy.multiply(-.5, d1, out=scratch('pdf_d1'))
+    numpy.multiply(pdf_d1, d1, out=pdf_d1)
+    numpy.exp(pdf_d1, out=pdf_d1)
+    numpy.multiply(ONE_OVER_SQRT_TWO_PI, pdf_d1, out=pdf_d1)
+    carry = numpy.subtract(b, r, out=scratch('carry'))
+    numpy.multiply(carry, t, out=carry)
+    numpy.exp(carry, out=carry)
+    discount = numpy.negative(r, out=scratch('discount'))
+    numpy.multiply(discount, t, out=discount)
+    numpy.exp(discount, out=discount)
+    N_d1 = numpy.multiply(sign, d1, out=scratch('N_d1'))
+    N(N_d1, out=N_d1)
+    N_d2 = numpy.multiply(sign, d2, out=scratch('N_d2'))
+    N(N_d2, out=N_d2)
+    b_minus_r = numpy.subtract(b, r, out=scratch('b_minus_r'))
+    stages.lap('setup', d1, d2, pdf_d1, carry, discount)
+
+    price = result['price']
+    numpy.multiply(S, carry, out=u)
+    numpy.multiply(u, N_d1, out=u)
+    numpy.multiply(K, discount, out=v)
+    numpy.multiply(v, N_d2, out=v)
+    numpy.subtract(u, v, out=u)
+    numpy.multiply(sign, u, out=price)
+    stages.lap('solver', price)
+
+    delta = result['delta']
+    numpy.multiply(sign, carry, out=delta)
+    numpy.multiply(delta, N_d1, out=delta)
+
+    gamma = result['gamma']
+    numpy.multiply(carry, pdf_d1, out=gamma)
+    numpy.multiply(S, sigma_sqrt_t, out=u)
+    numpy.divide(gamma, u, out=gamma)
+
+    theta = result['theta']
+    numpy.negative(S, out=theta)
+    numpy.multiply(theta, carry, out=theta)
+    numpy.multiply(theta, pdf_d1, out=theta)
+    numpy.multiply(theta, sigma, out=theta)
+    numpy.multiply(2, sqrt_t, out=u)
+    numpy.divide(theta, u, out=theta)
+    numpy.multiply(sign, b_minus_r, out=u)
+    numpy.multiply(u, S, out=u)
+    numpy.multiply(u, carry, out=u)
+    numpy.multiply(u, N_d1, out=u)
+    numpy.subtract(theta, u, out=theta)
+    numpy.multiply(sign, r, out=u)
+    numpy.multiply(u, K, out=u)
+    numpy.multiply(u, discount, out=u)
+    numpy.multiply(u, N_d2, out=u)
+    numpy.subtract(theta, u, out=theta)
+    numpy.divide(theta, 365.0, out=theta)
+
+    vega = result['vega']
+    numpy.multiply(S, carry, out=vega)
+    numpy.multiply(vega, pdf_d1, out=vega)
+    numpy.multiply(vega, sqrt_t, out=vega)
+    numpy.multiply(vega, .01, out=vega)
+
+    rho = result['rho']
+    numpy.multiply(sign, t, out=rho)
+    numpy.multiply(rho, K, out=rho)
+    numpy.multiply(rho, discount, out=rho)
+    numpy.multiply(rho, N_d2, out=rho)
+    numpy.multiply(rho, .01, out=rho)
+
+    vanna = result['vanna']
+    numpy.negative(carry, out=vanna)
+    numpy.multiply(vanna, pdf_d1, out=vanna)
+    numpy.multiply(vanna, d2, out=vanna)
+    numpy.divide(vanna, sigma, out=vanna)
+    numpy.multiply(vanna, .01, out=vanna)
+
+    volga = result['volga']
+    numpy.multiply(vega, d1, out=volga)
+    numpy.multiply(volga, d2, out=volga)
+    numpy.divide(volga, sigma, out=volga)
+    numpy.multiply(volga, .01, out=volga)
+
+    charm = result['charm']
+    numpy.divide(b, sigma_sqrt_t, out=u)
+    numpy.multiply(2, t, out=v)
+    numpy.divide(d2, v, out=v)
+    numpy.subtract(u, v, out=u)
+    numpy.multiply(pdf_d1, u, out=u)
+    numpy.multiply(sign, b_minus_r, out=v)
+    numpy.multiply(v, N_d1, out=v)
+    numpy.add(u, v, out=u)
+    numpy.negative(carry, out=charm)
+    numpy.multiply(charm, u, out=charm)
+    numpy.divide(charm, 365.0, out=charm)
+
+    speed = result['speed']
+    numpy.negative(gamma, out=speed)
+    numpy.divide(speed, S, out=speed)
+    numpy.divide(d1, sigma_sqrt_t, out=u)
+    numpy.add(1, u, out=u)
+    numpy.multiply(speed, u, out=speed)
+
+    zomma = result['zomma']
+    numpy.multiply(d1, d2, out=u)
+    numpy.subtract(u, 1, out=u)
+    numpy.multiply(gamma, u, out=zomma)
+    numpy.divide(zomma, sigma, out=zomma)
+    numpy.multiply(zomma, .01, out=zomma)
+
+    color = result['color']
+    numpy.subtract(r, b, out=u)
+    numpy.multiply(b, d1, out=v)
+    numpy.divide(v, sigma_sqrt_t, out=v)
+    numpy.add(u, v, out=u)
+    numpy.multiply(d1, d2, out=v)
+    numpy.subtract(1, v, out=v)
+    numpy.multiply(2, t, out=w)
+    numpy.divide(v, w, out=v)
+    numpy.add(u, v, out=u)
+    numpy.multiply(gamma, u, out=color)
+    numpy.divide(color, 365.0, out=color)
+
+    stages.lap('greeks', *list(result.values())[1:])
+    return result
+
+
+if __name__ == "__main__":
+    from py_vollib.helpers.doctest_helper import run_doctest
+    run_doctest()
@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+"""
+py_vollib.helpers.automatic_greeks
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+A library for option pricing, implied volatility, and
+greek calculation.  py_vollib is based on lets_be_rational,
+a Python wrapper for LetsBeRational by Peter Jaeckel as
+described below.
+
+:copyright: © 2017 Gammon Capital LLC
+:license: MIT, see LICENSE for more details.
+
+About LetsBeRational:
+~~~~~~~~~~~~~~~~~~~~~
+
+The source code of LetsBeRational resides at www.jaeckel.org/LetsBeRational.7z .
+
+::
+
+    ========================================================================================
+    Copyright © 2013-2014 Peter Jäckel.
+
+    Permission to use, copy, modify, and distribute this software is freely granted,
+    provided that this notice is preserved.
+
+    WARRANTY DISCLAIMER
+    The Software is provided "as is" without warranty of any kind, either express or implied,
+    including without limitation any implied warranties of condition, uninterrupted use,
+    merchantability, fitness for a particular purpose, or non-infringement.
+    ========================================================================================
+
+
+Note about the parameter "b":
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+::
+
+    ======================================================================================
+    from Espen Gaarder Haug's
+    "The Complete Guide to Option Pricing Formulas," Second Edition,
+    page 90.
+    
+    +-----------+------------------------------------------------------+
+    | b = r     |  gives the Black and Scholes (1973) stock option     |
+    |           |  model                                               |
+    +-----------+------------------------------------------------------+
+    | b = r -q  |  gives the Merton (1973) stock option model with     |
+    |           |  continuous dividend yield q                         |
+    +-----------+------------------------------------------------------+
+    | b = 0     |  gives the Black (1976) futures option model         |
+    +-----------+------------------------------------------------------+
+    | b = 0 and |  gives the Asay (1982) margined futures option model |
+    | r = 0     |                                                      |
+    +-----------+------------------------------------------------------+
+    ======================================================================================
+
+
+
+Greeks by forward-mode automatic differentiation:
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+The pricing function is evaluated once on dual numbers (see
+``py_vollib.helpers.dual``) instead of being repriced at bumped inputs,
+so the results carry no finite-difference step error.  Any pricing
+function written with numpy arithmetic, ``numpy.exp``, ``numpy.log``,
+``numpy.sqrt`` and ``scipy.special.ndtr`` can be used, on scalars or
+arrays.  The greeks are scaled like those in
+``py_vollib.helpers.numerical_greeks``: theta per calendar day, vega and
+rho per percentage point.
+
+"""
+
+
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+from __future__ import division
+
+# Related third party imports
+
+# Local application/library specific imports
+from py_vollib.curves import zero_rate
+from py_vollib.helpers.dual import Dual, tangent, value_of
+
+
+# -----------------------------------------------------------------------------
+# FUNCTIONS - GENERIC FUNCTIONS FOR AUTOMATIC GREEK CALCULATION
+
+
+def _first_derivative(flag, S, K, t, r, sigma, b, pricing_function, seeded):
+    """Differentiate pricing_function along the inputs named in seeded."""
+
+    inputs = {'S': S, 't': t, 'r': r, 'sigma': sigma, 'b': b}
+    for name in seeded:
+        inputs[name] = Dual(inputs[name], (1.0,))
+    price = pricing_function(flag, inputs['S'], K, inputs['t'], inputs['r'], inputs['sigma'], inputs['b'])
+    return tangent(price, 0)
+
+
+def delta(flag, S, K, t, r, sigma, b, pricing_function):
+    """Calculate option delta using automatic differentiation.
+
+    :param S: underlying asset price
+    :type S: float
+    :param K: strike price
+    :type K: float
+    :param sigma: annualized standard deviation, or volatility
+    :type sigma: float
+    :param t: time to expiration in years
+    :type t: float
+    :param r: risk-free interest rate
+    :type r: float
+    :param b: see above
+    :type b: float
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str
+    :param pricing_function: any function returning the price of an option
+    :type pricing_function: python function object
+    """
+
+    r = zero_rate(r, t)
+    return _first_derivative(flag, S, K, t, r, sigma, b, pricing_function, ('S',))
+
+
+def theta(flag, S, K, t, r, sigma, b, pricing_function):
+    """Calculate option theta using automatic differentiation.
+
+    :param S: underlying asset price
+    :type S: float
+    :param K: strike price
+    :type K: float
+    :param sigma: annualized standard deviation, or volatility
+    :type sigma: float
+    :param t: time to expiration in years
+    :type t: float
+    :param r: risk-free interest rate
+    :type r: float
+    :param b: see above
+    :type b: float
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str
+    :param pricing_function: any function returning the price of an option
+    :type pricing_function: python function object
+    """
+
+    r = zero_rate(r, t)
+    return -_first_derivative(flag, S, K, t, r, sigma, b, pricing_function, ('t',)) / 365.
+
+
+def vega(flag, S, K, t, r, sigma, b, pricing_function):
+    """Calculate option vega using automatic differentiation.
+
+    :param S: underlying asset price
+    :type S: float
+    :param K: strike price
+    :type K: float
+    :param sigma: annualized standard deviation, or volatility
+    :type sigma: float
+    :param t: time to expiration in years
+    :type t: float
+    :param r: risk-free interest rate
+    :type r: float
+    :param b: see above
+    :type b: float
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str
+    :param pricing_function: any function returning the price of an option
+    :type pricing_function: python function object
+    """
+
+    r = zero_rate(r, t)
+    return _first_derivative(flag, S, K, t, r, sigma, b, pricing_function, ('sigma',)) * .01
+
+
+def rho(flag, S, K, t, r, sigma, b, pricing_function):
+    """Calculate option rho using automatic differentiation.
+
+    As in ``py_vollib.helpers.numerical_greeks``, r and b move together.
+
+    :param S: underlying asset price
+    :type S: float
+    :param K: strike price
+    :type K: float
+    :param sigma: annualized standard deviation, or volatility
+    :type sigma: float
+    :param t: time to expiration in years
+    :type t: float
+    :param r: risk-free interest rate
+    :type r: float
+    :param b: see above
+    :type b: float
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str
+    :param pricing_function: any function returning the price of an option
+    :type pricing_function: python function object
+    """
+
+    r = zero_rate(r, t)
+    return _first_derivative(flag, S, K, t, r, sigma, b, pricing_function, ('r', 'b')) * .01
+
+
+def gamma(flag, S, K, t, r, sigma, b, pricing_function):
+    """Calculate option gamma using second-order automatic differentiation.
+
+    :param S: underlying asset price
+    :type S: float
+    :param K: strike price
+    :type K: float
+    :param sigma: annualized standard deviation, or volatility
+    :type sigma: float
+    :param t: time to expiration in years
+    :type t: float
+    :param r: risk-free interest rate
+    :type r: float
+    :param b: see above
+    :type b: float
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str
+    :param pricing_function: any function returning the price of an option
+    :type pricing_function: python function object
+    """
+
+    r = zero_rate(r, t)
+    S = Dual(Dual(S, (1.0,)), (Dual(1.0, (0.0,)),))
+    price = pricing_function(flag, S, K, t, r, sigma, b)
+    return tangent(tangent(price, 0), 0)
+
+
+def greeks(flag, S, K, t, r, sigma, b, pricing_function):
+    """Calculate the price, delta, gamma, theta, vega and rho of an option
+    in a single evaluation of the pricing function.
+
+    :param S: underlying asset price
+    :type S: float
+    :param K: strike price
+    :type K: float
+    :param sigma: annualized standard deviation, or volatility
+    :type sigma: float
+    :param t: time to expiration in years
+    :type t: float
+    :param r: risk-free interest rate
+    :type r: float
+    :param b: see above
+    :type b: float
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str
+    :param pricing_function: any function returning the price of an option
+    :type pricing_function: python function object
+
+    :returns:  dict with keys 'price', 'delta', 'gamma', 'theta', 'vega' and 'rho'
+    """
+
+    r = zero_rate(r, t)
+    S = Dual(Dual(S, (1.0,)), (Dual(1.0, (0.0,)), 0.0, 0.0, 0.0))
+    sigma = Dual(sigma, (0.0, 1.0, 0.0, 0.0))
+    r = Dual(r, (0.0, 0.0, 1.0, 0.0))
+    b = Dual(b, (0.0, 0.0, 1.0, 0.0))
+    t = Dual(t, (0.0, 0.0, 0.0, 1.0))
+
+    price = pricing_function(flag, S, K, t, r, sigma, b)
+
+    return {
+        'price': value_of(price),
+        'delta': value_of(tangent(price, 0)),
+        'gamma': tangent(tangent(price, 0), 0),
+        'vega': value_of(tangent(price, 1)) * .01,
+        'rho': value_of(tangent(price, 2)) * .01,
+        'theta': -value_of(tangent(price, 3)) / 365.,
+    }
+
+
+if __name__ == "__main__":
+    from py_vollib.helpers.doctest_helper import run_doctest
+    run_doctest()
@@ -40,7 +40,6 @@ The source code of LetsBeRational resides at www.jaeckel.org/LetsBeRational.7z .
 
 # Standard library imports
 from __future__ import division
-import math
 
 # Related third party imports
 import numpy
@@ -48,38 +47,132 @@ import numpy
 # Local application/library specific imports
 
 
+# -----------------------------------------------------------------------------
+# DATA
+
+# Gauss-Legendre weights and abscissae (negative half) of orders 6, 12 and 20
+_GAUSS_LEGENDRE = (
+    (numpy.array([0.17132449237917, 0.360761573048138, 0.46791393457269]),
+     numpy.array([-0.932469514203152, -0.661209386466265, -0.238619186083197])),
+    (numpy.array([4.71753363865118E-02, 0.106939325995318, 0.160078328543346,
+                  0.203167426723066, 0.233492536538355, 0.249147045813403]),
+     numpy.array([-0.981560634246719, -0.904117256370475, -0.769902674194305,
+                  -0.587317954286617, -0.36783149899818, -0.125233408511469])),
+    (numpy.array([1.76140071391521E-02, 4.06014298003869E-02, 6.26720483341091E-02,
+                  8.32767415767048E-02, 0.10193011981724, 0.118194531961518,
+                  0.131688638449177, 0.142096109318382, 0.149172986472604,
+                  0.152753387130726]),
+     numpy.array([-0.993128599185095, -0.963971927277914, -0.912234428251326,
+                  -0.839116971822219, -0.746331906460151, -0.636053680726515,
+                  -0.510867001950827, -0.37370608871542, -0.227785851141645,
+                  -7.65265211334973E-02])),
+)
+
+
+# -----------------------------------------------------------------------------
+# FUNCTIONS
+
+
 def CND(x):
+    """The cumulative normal distribution, computed with Hart's double
+    precision algorithm.  ``x`` may be a float or an array.
+
+    >>> CND(0.)
+    0.5
+    >>> CND(numpy.array([-40., 40.]))
+    array([0., 1.])
+    """
+
+    x = numpy.asarray(x, dtype=float)
     y = numpy.abs(x)
-    if y > 37.:
-        CND = 0
-    else:
-        Exponential = numpy.exp(-y ** 2 / 2.)
-        if y < 7.07106781186547:
-            SumA = 3.52624965998911E-02 * y + 0.700383064443688
-            SumA = SumA * y + 6.37396220353165
-            SumA = SumA * y + 33.912866078383
-            SumA = SumA * y + 112.079291497871
-            SumA = SumA * y + 221.213596169931
-            SumA = SumA * y + 220.206867912376
-            SumB = 8.83883476483184E-02 * y + 1.75566716318264
-            SumB = SumB * y + 16.064177579207
-            SumB = SumB * y + 86.7807322029461
-            SumB = SumB * y + 296.564248779674
-            SumB = SumB * y + 637.333633378831
-            SumB = SumB * y + 793.826512519948
-            SumB = SumB * y + 440.413735824752
-            CND = Exponential * SumA / SumB
-        else:
-            SumA = y + 0.65
-            SumA = y + 4. / SumA
-            SumA = y + 3. / SumA
-            SumA = y + 2. / SumA
-            SumA = y + 1. / SumA
-            CND = Exponential / (SumA * 2.506628274631)
-
-    CND = 1 - CND if x > 0 else CND
-
-    return CND
+    Exponential = numpy.exp(-y ** 2 / 2.)
+
+    SumA = 3.52624965998911E-02 * y + 0.700383064443688
+    SumA = SumA * y + 6.37396220353165
+    SumA = SumA * y + 33.912866078383
+    SumA = SumA * y + 112.079291497871
+    SumA = SumA * y + 221.213596169931
+    SumA = SumA * y + 220.206867912376
+    SumB = 8.83883476483184E-02 * y + 1.75566716318264
+    SumB = SumB * y + 16.064177579207
+    SumB = SumB * y + 86.7807322029461
+    SumB = SumB * y + 296.564248779674
+    SumB = SumB * y + 637.333633378831
+    SumB = SumB * y + 793.826512519948
+    SumB = SumB * y + 440.413735824752
+    near = Exponential * SumA / SumB
+
+    SumA = y + 0.65
+    SumA = y + 4. / SumA
+    SumA = y + 3. / SumA
+    SumA = y + 2. / SumA
+    SumA = y + 1. / SumA
+    far = Exponential / (SumA * 2.506628274631)
+
+    CND = numpy.where(y < 7.07106781186547, near, far)
+    CND = numpy.where(y > 37., 0., CND)
+    CND = numpy.where(x > 0, 1 - CND, CND)
+
+    return CND[()]
+
+
+def _moderate_correlation(h, k, rho):
+    """Drezner and Wesolowsky's integral for ``|rho| < 0.925``."""
+
+    hk = h * k
+    hs = (h * h + k * k) / 2.
+    asr = numpy.arcsin(rho)
+    abs_rho = numpy.abs(rho)
+    order = numpy.where(abs_rho < 0.3, 0, numpy.where(abs_rho < 0.75, 1, 2))
+
+    BVN = numpy.zeros(h.size)
+    for NG, (W, XX) in enumerate(_GAUSS_LEGENDRE):
+        rows = numpy.flatnonzero(order == NG)
+        if not rows.size:
+            continue
+        for ISs in (-1, 1):
+            sn = numpy.sin(asr[rows, None] * (ISs * XX + 1) / 2)
+            BVN[rows] += numpy.exp((sn * hk[rows, None] - hs[rows, None]) / (1 - sn * sn)).dot(W)
+    BVN = BVN * asr / (4. * numpy.pi)
+
+    return BVN + CND(-h) * CND(-k)
+
+
+def _high_correlation(h, k, rho):
+    """Genz's expansion for ``|rho| >= 0.925``."""
+
+    k = numpy.where(rho < 0, -k, k)
+    hk = h * k
+    inside = numpy.abs(rho) < 1.
+    W, XX = _GAUSS_LEGENDRE[2]
+
+    with numpy.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        Ass = (1. - rho) * (1. + rho)
+        A = numpy.sqrt(Ass)
+        bs = (h - k) ** 2
+        c = (4. - hk) / 8.
+        d = (12. - hk) / 16.
+        asr = -(bs / Ass + hk) / 2.
+        BVN = A * numpy.exp(asr) * (1 - c * (bs - Ass) * (1 - d * bs / 5.) / 3. + c * d * Ass * Ass / 5.)
+        BVN = numpy.where(inside & (asr > -100), BVN, 0.)
+
+        b = numpy.sqrt(bs)
+        tail = numpy.exp(-hk / 2.) * numpy.sqrt(2. * numpy.pi) * CND(-b / A) * b * (1. - c * bs * (1. - d * bs / 5.) / 3.)
+        BVN = numpy.where(inside & (-hk < 100), BVN - tail, BVN)
+
+        A = A / 2
+        for ISs in (-1, 1):
+            xs = (A[:, None] * (ISs * XX + 1)) ** 2
+            rs = numpy.sqrt(1 - xs)
+            asr = -(bs[:, None] / xs + hk[:, None]) / 2
+            term = A[:, None] * W * numpy.exp(asr) * (
+                numpy.exp(-hk[:, None] * (1 - rs) / (2 * (1 + rs))) / rs - (1 + c[:, None] * xs * (1 + d[:, None] * xs)))
+            BVN = BVN + numpy.where(inside[:, None] & (asr > -100), term, 0.).sum(axis=1)
+
+    BVN = -BVN / (2. * numpy.pi)
+
+    return numpy.where(rho > 0., BVN + CND(-numpy.maximum(h, k)),
+                       numpy.where(k > h, CND(k) - CND(h), 0.) - BVN)
 
 
 def CBND(x, y, rho):
@@ -106,131 +199,75 @@ def CBND(x, y, rho):
     
     with major modifications for double precision, and for ``|R|`` close to 1.
     This code was originally transelated into VBA by Graeme West
-    
-    """
-
-    W  = numpy.zeros((11,4))
-    XX = numpy.zeros((11,4))
-
-    W[1][1] = 0.17132449237917
-    XX[1][1] = -0.932469514203152
-
-    W[2][1] = 0.360761573048138
-    XX[2][1] = -0.661209386466265
-
-    W[3][1] = 0.46791393457269
-    XX[3][1] = -0.238619186083197
 
-    W[1][2] = 4.71753363865118E-02
-    XX[1][2] = -0.981560634246719
+    ``x``, ``y`` and ``rho`` may be floats or arrays that broadcast
+    together; each element selects its own quadrature rule.
 
-    W[2][2] = 0.106939325995318
-    XX[2][2] = -0.904117256370475
-
-    W[3][2] = 0.160078328543346
-    XX[3][2] = -0.769902674194305
+    >>> CBND(0., 0., 0.)
+    0.25
+    >>> abs(CBND(0., 0., .5) - 1. / 3.) < 1e-15
+    True
+    >>> numpy.allclose(CBND([0., 1.], [0., 1.], [-.95, 1.]), [.5 - numpy.arccos(-.95) / (2 * numpy.pi), CND(1.)])
+    True
+    """
 
-    W[4][2] = 0.203167426723066
-    XX[4][2] = -0.587317954286617
+    x, y, rho = numpy.broadcast_arrays(*[numpy.asarray(v, dtype=float) for v in (x, y, rho)])
+    h = -x.ravel()
+    k = -y.ravel()
+    rho_ = rho.ravel()
 
-    W[5][2] = 0.233492536538355
-    XX[5][2] = -0.36783149899818
+    CBND = numpy.empty(h.size)
+    moderate = numpy.abs(rho_) < 0.925
+    CBND[moderate] = _moderate_correlation(h[moderate], k[moderate], rho_[moderate])
+    CBND[~moderate] = _high_correlation(h[~moderate], k[~moderate], rho_[~moderate])
 
-    W[6][2] = 0.249147045813403
-    XX[6][2] = -0.125233408511469
+    return CBND.reshape(x.shape)[()]
 
-    W[1][3] = 1.76140071391521E-02
-    XX[1][3] = -0.993128599185095
-    W[2][3] = 4.06014298003869E-02
-    XX[2][3] = -0.963971927277914
-    W[3][3] = 6.26720483341091E-02
-    XX[3][3] = -0.912234428251326
 
-    W[4][3] = 8.32767415767048E-02
-    XX[4][3] = -0.839116971822219
+# -----------------------------------------------------------------------------
+# FUNCTIONS - SCIPY SPECIAL FUNCTIONS
+#
+# scipy takes longer to import than the rest of py_vollib, so these import it
+# on their first call, and importing py_vollib only loads numpy and
+# py_lets_be_rational.  They accept what the scipy ufuncs accept, including
+# the duals of py_vollib.helpers.dual and py_vollib.helpers.adjoint.
+
+
+def ndtr(x, out=None):
+    """The standard normal distribution function, ``scipy.special.ndtr``,
+    optionally into an output array.
+
+    >>> ndtr(0.)
+    0.5
+    >>> ndtr(numpy.array([-40., 40.]))
+    array([0., 1.])
+    """
 
-    W[5][3] = 0.10193011981724
-    XX[5][3] = -0.746331906460151
+    from scipy.special import ndtr as _ndtr
+    return _ndtr(x, out=out)
 
-    W[6][3] = 0.118194531961518
-    XX[6][3] = -0.636053680726515
 
-    W[7][3] = 0.131688638449177
-    XX[7][3] = -0.510867001950827
+def ndtri(p):
+    """The inverse of the standard normal distribution function,
+    ``scipy.special.ndtri``.
 
-    W[8][3] = 0.142096109318382
-    XX[8][3] = -0.37370608871542
+    >>> ndtri(.5)
+    0.0
+    """
 
-    W[9][3] = 0.149172986472604
-    XX[9][3] = -0.227785851141645
+    from scipy.special import ndtri as _ndtri
+    return _ndtri(p)
 
-    W[10][3] = 0.152753387130726
-    XX[10][3] = -7.65265211334973E-02
 
-    if numpy.abs(rho) < 0.3:
-        NG = 1
-        LG = 3
-    elif numpy.abs(rho) < 0.75:
-        NG = 2
-        LG = 6
-    else:
-        NG = 3
-        LG = 10
+def erfinv(y):
+    """The inverse error function, ``scipy.special.erfinv``.
 
-    h = -x
-    k = -y
-    hk = h * k
-    BVN = 0
-
-    if numpy.abs(rho) < 0.925:
-        if numpy.abs(rho) > 0:
-            hs = (h * h + k * k) / 2.
-            asr = math.asin(rho)
-            for i in range(1,LG+1):
-                for ISs in [-1,1]:
-                    sn = math.sin(asr * (ISs * XX[i][NG] + 1) / 2)
-                BVN = BVN + W[i][NG] * numpy.exp((sn * hk - hs) / (1 - sn * sn))
-            BVN = BVN * asr / (4. * numpy.pi)
-        BVN = BVN + CND(-h) * CND(-k)
-    else:
-        if rho < 0:
-            k = -k
-            hk = -hk
-
-        if numpy.abs(rho) < 1.:
-            Ass = (1. - rho) * (1. + rho)
-            A = numpy.sqrt(Ass)
-            bs = (h - k) ** 2
-            c = (4. - hk) / 8.
-            d = (12. - hk) / 16.
-            asr = -(bs / Ass + hk) / 2.
-            if asr > -100:
-                BVN = A * numpy.exp(asr) * (1 - c * (bs - Ass) * (1 - d * bs / 5.) / 3. + c * d * Ass * Ass / 5.)
-        if -hk < 100:
-            b = numpy.sqrt(bs)
-            BVN = BVN - numpy.exp(-hk / 2.) * numpy.sqrt(2. * numpy.pi) * CND(-b / A) * b * (1. - c * bs * (1. - d * bs / 5.) / 3.)
+    >>> erfinv(0.)
+    0.0
+    """
 
-        A = A / 2
-        for i in range(1,LG+1):
-            for ISs in [-1,1]:
-                xs = (A * (ISs * XX[i][NG] + 1)) ** 2
-                rs = numpy.sqrt(1 - xs)
-                asr = -(bs / xs + hk) / 2
-                if asr > -100:
-                    BVN = BVN + A * W(i, NG) * numpy.exp(asr) * (numpy.exp(-hk * (1 - rs) / (2 * (1 + rs))) / rs - (1 + c * xs * (1 + d * xs)))
-
-        BVN = -BVN / (2. * numpy.pi)
-
-        if rho > 0.:
-            BVN = BVN + CND(-max(h, k))
-        else:
-            BVN = -BVN
-            if k > h:
-                BVN = BVN + CND(k) - CND(h)
-
-    CBND = BVN
-
-    return CBND
+    from scipy.special import erfinv as _erfinv
+    return _erfinv(y)
 
 
 if __name__ == "__main__":
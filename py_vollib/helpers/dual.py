@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+py_vollib.helpers.dual
+~~~~~~~~~~~~~~~~~~~~~~
+
+A library for option pricing, implied volatility, and
+greek calculation.  py_vollib is based on lets_be_rational,
+a Python wrapper for LetsBeRational by Peter Jaeckel as
+described below.
+
+:copyright: © 2017 Gammon Capital LLC
+:license: MIT, see LICENSE for more details.
+
+About LetsBeRational:
+~~~~~~~~~~~~~~~~~~~~~
+
+The source code of LetsBeRational resides at www.jaeckel.org/LetsBeRational.7z .
+
+::
+
+    ========================================================================================
+    Copyright © 2013-2014 Peter Jäckel.
+
+    Permission to use, copy, modify, and distribute this software is freely granted,
+    provided that this notice is preserved.
+
+    WARRANTY DISCLAIMER
+    The Software is provided "as is" without warranty of any kind, either express or implied,
+    including without limitation any implied warranties of condition, uninterrupted use,
+    merchantability, fitness for a particular purpose, or non-infringement.
+    ========================================================================================
+
+
+
+Forward-mode automatic differentiation with dual numbers:
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+A ``Dual`` carries a value together with one tangent per differentiation
+direction.  Arithmetic and the numpy functions used by the pricing code
+(``exp``, ``log``, ``sqrt`` and ``scipy.special.ndtr``) propagate the
+tangents by the chain rule, so a pricing function evaluated on ``Dual``
+inputs returns its first derivatives along with the price.  Values and
+tangents may be numpy arrays, and may themselves be ``Dual`` numbers,
+which yields second derivatives.
+
+"""
+
+
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+from __future__ import division
+
+# Related third party imports
+import numpy
+
+# Local application/library specific imports
+from py_vollib.helpers import ONE_OVER_SQRT_TWO_PI
+from py_vollib.helpers.distributions import ndtr
+
+
+# -----------------------------------------------------------------------------
+# CLASSES
+
+
+class Dual(object):
+    """A dual number ``value + sum(tangents[i] * e_i)``.
+
+    >>> x = Dual(2.0, (1.0,))
+    >>> y = x * x + 3 * x
+    >>> y.value, y.tangents[0]
+    (10.0, 7.0)
+
+    >>> x = Dual(Dual(2.0, (1.0,)), (Dual(1.0, (0.0,)),))
+    >>> y = numpy.exp(x)
+    >>> numpy.allclose([y.value.value, y.tangents[0].tangents[0]], numpy.exp(2.0))
+    True
+    """
+
+    __slots__ = ('value', 'tangents')
+
+    def __init__(self, value, tangents):
+        self.value = value
+        self.tangents = tuple(tangents)
+
+    def __repr__(self):
+        return 'Dual({!r}, {!r})'.format(self.value, self.tangents)
+
+    def _scale(self, value, factor):
+        return Dual(value, [factor * d for d in self.tangents])
+
+    def __neg__(self):
+        return Dual(-self.value, [-d for d in self.tangents])
+
+    def __pos__(self):
+        return self
+
+    def __add__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value + other.value, [a + b for a, b in zip(self.tangents, other.tangents)])
+        return Dual(self.value + other, self.tangents)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return self + (-other)
+
+    def __rsub__(self, other):
+        return (-self) + other
+
+    def __mul__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value * other.value,
+                        [a * other.value + self.value * b for a, b in zip(self.tangents, other.tangents)])
+        return Dual(self.value * other, [d * other for d in self.tangents])
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, Dual):
+            return self * other.reciprocal()
+        return Dual(self.value / other, [d / other for d in self.tangents])
+
+    def __rtruediv__(self, other):
+        return self.reciprocal() * other
+
+    __div__ = __truediv__
+    __rdiv__ = __rtruediv__
+
+    def __pow__(self, exponent):
+        if isinstance(exponent, Dual):
+            return numpy.exp(exponent * numpy.log(self))
+        return self._scale(self.value ** exponent, exponent * self.value ** (exponent - 1))
+
+    def __rpow__(self, base):
+        return numpy.exp(self * numpy.log(base))
+
+    def reciprocal(self):
+        inverse = 1.0 / self.value
+        return self._scale(inverse, -inverse * inverse)
+
+    def exp(self):
+        value = numpy.exp(self.value)
+        return self._scale(value, value)
+
+    def log(self):
+        return self._scale(numpy.log(self.value), 1.0 / self.value)
+
+    def sqrt(self):
+        value = numpy.sqrt(self.value)
+        return self._scale(value, 0.5 / value)
+
+    def ndtr(self):
+        return self._scale(ndtr(self.value), ONE_OVER_SQRT_TWO_PI * numpy.exp(-0.5 * self.value * self.value))
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method != '__call__' or kwargs:
+            return NotImplemented
+        name = ufunc.__name__
+        if name in _unary:
+            return getattr(inputs[0], _unary[name])()
+        if name in _binary:
+            a, b = inputs
+            if isinstance(a, Dual):
+                return getattr(a, '__{}__'.format(_binary[name]))(b)
+            return getattr(b, '__r{}__'.format(_binary[name]))(a)
+        return NotImplemented
+
+
+_unary = {
+    'negative': '__neg__',
+    'reciprocal': 'reciprocal',
+    'exp': 'exp',
+    'log': 'log',
+    'sqrt': 'sqrt',
+    'ndtr': 'ndtr',
+}
+
+_binary = {
+    'add': 'add',
+    'subtract': 'sub',
+    'multiply': 'mul',
+    'true_divide': 'truediv',
+    'divide': 'truediv',
+    'power': 'pow',
+}
+
+
+# -----------------------------------------------------------------------------
+# FUNCTIONS
+
+
+def value_of(x):
+    """Return the value of a (possibly nested) dual number.
+
+    >>> value_of(Dual(Dual(1.5, (1.0,)), (Dual(1.0, (0.0,)),)))
+    1.5
+    >>> value_of(1.5)
+    1.5
+    """
+
+    while isinstance(x, Dual):
+        x = x.value
+    return x
+
+
+def tangent(x, i):
+    """Return the i-th tangent of a dual number, or zero for a constant.
+
+    >>> tangent(Dual(1.5, (2.0, 3.0)), 1)
+    3.0
+    >>> tangent(1.5, 0)
+    0.0
+    """
+
+    return x.tangents[i] if isinstance(x, Dual) else 0.0
+
+
+if __name__ == "__main__":
+    from py_vollib.helpers.doctest_helper import run_doctest
+    run_doctest()
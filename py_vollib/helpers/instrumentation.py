@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+"""
+py_vollib.helpers.instrumentation
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+A library for option pricing, implied volatility, and
+greek calculation.  py_vollib is based on lets_be_rational,
+a Python wrapper for LetsBeRational by Peter Jaeckel as
+described below.
+
+:copyright: © 2017 Gammon Capital LLC
+:license: MIT, see LICENSE for more details.
+
+About LetsBeRational:
+~~~~~~~~~~~~~~~~~~~~~
+
+The source code of LetsBeRational resides at www.jaeckel.org/LetsBeRational.7z .
+
+::
+
+    ========================================================================================
+    Copyright © 2013-2014 Peter Jäckel.
+
+    Permission to use, copy, modify, and distribute this software is freely granted,
+    provided that this notice is preserved.
+
+    WARRANTY DISCLAIMER
+    The Software is provided "as is" without warranty of any kind, either express or implied,
+    including without limitation any implied warranties of condition, uninterrupted use,
+    merchantability, fitness for a particular purpose, or non-infringement.
+    ========================================================================================
+
+
+
+Instrumentation:
+~~~~~~~~~~~~~~~~
+
+Opt-in counters for the implied volatility functions of
+``py_vollib.black``, ``py_vollib.black_scholes``,
+``py_vollib.black_scholes_merton`` and their ``ref_python`` versions.
+Counting is off by default, and an instrumented function then costs one
+test of a flag more than the bare function.  After ``enable()``, every
+call of an instrumented function records, under its dotted name:
+
+* ``calls``: the number of calls
+* ``time``: the seconds spent in them, wall clock
+* ``exceptions``: the number of calls that raised, by exception type
+* ``iterations``: a histogram of solver iterations, keyed by the number
+  of iterations, for the solvers that report them: per call for the
+  scalar ``ref_python`` functions, and per row for the vectorized ones
+* ``unconverged``: the rows a vectorized solver returned as nan
+
+LetsBeRational does not report how many of its (at most two)
+Householder iterations it took, so the functions built on it record no
+iterations.  ``snapshot()`` returns a copy of the counters as a dict and
+``reset()`` clears them.  A function called from another instrumented
+function is counted under both names, and iterations are recorded
+against the innermost one.  Counters are shared by all threads.
+
+"""
+
+
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+import collections
+import functools
+import threading
+import timeit
+
+# Related third party imports
+
+# Local application/library specific imports
+
+
+# -----------------------------------------------------------------------------
+# DATA
+
+_enabled = False
+_lock = threading.Lock()
+_local = threading.local()
+_counters = {}
+
+
+# -----------------------------------------------------------------------------
+# CLASSES
+
+
+class _Counters(object):
+    """The counters of one function."""
+
+    def __init__(self):
+        self.calls = 0
+        self.time = 0.
+        self.exceptions = collections.Counter()
+        self.iterations = collections.Counter()
+        self.unconverged = 0
+
+    def as_dict(self):
+        return {
+            'calls': self.calls,
+            'time': self.time,
+            'exceptions': dict(self.exceptions),
+            'iterations': dict(sorted(self.iterations.items())),
+            'unconverged': self.unconverged,
+        }
+
+
+# -----------------------------------------------------------------------------
+# FUNCTIONS - CONTROL
+
+
+def enable():
+    """Start counting."""
+
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    """Stop counting, keeping the counts so far."""
+
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    """Return whether calls are being counted."""
+
+    return _enabled
+
+
+def reset():
+    """Clear all counters."""
+
+    with _lock:
+        _counters.clear()
+
+
+def snapshot():
+    """Return a copy of the counters of every function called since the
+    last reset while counting was enabled.
+
+    :returns:  dict of dicts, keyed by the dotted function name
+
+    >>> @instrumented
+    ... def solve(x):
+    ...     record_iterations({3: 1})
+    ...     if x < 0:
+    ...         raise ValueError(x)
+    ...     return x
+    >>> enable()
+    >>> solve(1.)
+    1.0
+    >>> solve(-1.)
+    Traceback (most recent call last):
+    ...
+    ValueError: -1.0
+    >>> disable()
+    >>> counters = snapshot()['py_vollib.helpers.instrumentation.solve']
+    >>> counters['calls'], counters['exceptions'], counters['iterations']
+    (2, {'ValueError': 1}, {3: 2})
+    >>> reset()
+    >>> snapshot()
+    {}
+    """
+
+    with _lock:
+        return dict((name, counters.as_dict()) for name, counters in sorted(_counters.items()))
+
+
+# -----------------------------------------------------------------------------
+# FUNCTIONS - RECORDING
+
+
+def _get(name):
+    counters = _counters.get(name)
+    if counters is None:
+        counters = _counters[name] = _Counters()
+    return counters
+
+
+def instrumented(function):
+    """Decorate a function to be counted while counting is enabled.
+
+    :param function: the function to count
+    :type function: callable
+
+    :returns:  callable
+    """
+
+    name = function.__module__ + '.' + function.__name__
+    clock = timeit.default_timer
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if not _enabled:
+            return function(*args, **kwargs)
+
+        stack = getattr(_local, 'stack', None)
+        if stack is None:
+            stack = _local.stack = []
+        stack.append(name)
+        exception = None
+        start = clock()
+        try:
+            return function(*args, **kwargs)
+        except Exception as e:
+            exception = type(e).__name__
+            raise
+        finally:
+            elapsed = clock() - start
+            stack.pop()
+            with _lock:
+                counters = _get(name)
+                counters.calls += 1
+                counters.time += elapsed
+                if exception is not None:
+                    counters.exceptions[exception] += 1
+
+    return wrapper
+
+
+def record_iterations(histogram, unconverged=0):
+    """Record solver iterations against the innermost instrumented call
+    in progress.  Does nothing while counting is disabled, or outside an
+    instrumented call.
+
+    :param histogram: number of solves, keyed by their number of iterations
+    :type histogram: dict
+    :param unconverged: number of rows left without a root
+    :type unconverged: int
+    """
+
+    if not _enabled:
+        return
+    stack = getattr(_local, 'stack', None)
+    if not stack:
+        return
+    with _lock:
+        counters = _get(stack[-1])
+        counters.iterations.update(histogram)
+        counters.unconverged += int(unconverged)
+
+
+if __name__ == "__main__":
+    from py_vollib.helpers.doctest_helper import run_doctest
+    run_doctest()
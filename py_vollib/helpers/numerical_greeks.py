@@ -68,6 +68,7 @@ from __future__ import division
 # Related third party imports
 
 # Local application/library specific imports
+from py_vollib.curves import zero_rate
 
 
 # -----------------------------------------------------------------------------
@@ -96,6 +97,7 @@ def delta(flag, S, K, t, r, sigma, b, pricing_function):
     :param pricing_function: any function returning the price of an option
     :type pricing_function: python function object
     """
+    r = zero_rate(r, t)
     if t == 0.0:
         if S == K:
             return {'c':0.5, 'p':-0.5}[flag]
@@ -129,6 +131,7 @@ def theta(flag, S, K, t, r, sigma, b, pricing_function):
     :type pricing_function: python function object
     """
 
+    r = zero_rate(r, t)
     if t <= 1. / 365.:
         return pricing_function(flag, S, K, 0.00001, r, sigma, b) - \
                pricing_function(flag, S, K, t, r, sigma, b)
@@ -158,6 +161,7 @@ def vega(flag, S, K, t, r, sigma, b, pricing_function):
     :type pricing_function: python function object
     """
 
+    r = zero_rate(r, t)
     return (pricing_function(flag, S, K, t, r, sigma + 0.01, b) - \
             pricing_function(flag, S, K, t, r, sigma - 0.01, b)) / 2.
 
@@ -183,6 +187,7 @@ def rho(flag, S, K, t, r, sigma, b, pricing_function):
     :type pricing_function: python function object
     """
 
+    r = zero_rate(r, t)
     return (pricing_function(flag, S, K, t, r + 0.01, sigma,  b + 0.01) - \
             pricing_function(flag, S, K, t, r - 0.01, sigma, b - 0.01)) / 2.
 
@@ -208,6 +213,7 @@ def gamma(flag, S, K, t, r, sigma, b, pricing_function):
     :type pricing_function: python function object
     """
 
+    r = zero_rate(r, t)
     if t == 0:
         return float("inf") if S == K else 0.0
 
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""
+py_vollib.helpers.profiling
+~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+A library for option pricing, implied volatility, and
+greek calculation.  py_vollib is based on lets_be_rational,
+a Python wrapper for LetsBeRational by Peter Jaeckel as
+described below.
+
+:copyright: © 2017 Gammon Capital LLC
+:license: MIT, see LICENSE for more details.
+
+About LetsBeRational:
+~~~~~~~~~~~~~~~~~~~~~
+
+The source code of LetsBeRational resides at www.jaeckel.org/LetsBeRational.7z .
+
+::
+
+    ========================================================================================
+    Copyright © 2013-2014 Peter Jäckel.
+
+    Permission to use, copy, modify, and distribute this software is freely granted,
+    provided that this notice is preserved.
+
+    WARRANTY DISCLAIMER
+    The Software is provided "as is" without warranty of any kind, either express or implied,
+    including without limitation any implied warranties of condition, uninterrupted use,
+    merchantability, fitness for a particular purpose, or non-infringement.
+    ========================================================================================
+
+
+
+Stage profiles:
+~~~~~~~~~~~~~~~
+
+The batch functions of py_vollib, the ``ref_python`` pricers, the
+vectorized implied volatility solvers and
+``py_vollib.helpers.analytical_greeks.greeks``, take ``profile=True`` to
+return a ``Profile`` of the call along with their result.  A profile
+splits the wall time of the call into consecutive stages:
+
+    ========  ========================================================
+    input     flag conversion, dtype coercion and broadcasting
+    setup     zero rates, forwards, discount factors and starting points
+    solver    the pricing formula, or the root finder
+    greeks    the sensitivities
+    output    reshaping and assembling the result
+    ========  ========================================================
+
+Each stage ends where the next one begins, so the stages add up to the
+time of the call.  A stage entered more than once accumulates.  The rows
+of a stage are the largest array it produced, and its bytes the total
+size of those arrays; temporaries that do not outlive the stage are not
+counted.  Without ``profile`` the functions call a stand-in that records
+nothing.
+
+"""
+
+
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+from __future__ import division
+import collections
+import timeit
+
+# Related third party imports
+import numpy
+
+# Local application/library specific imports
+
+
+# -----------------------------------------------------------------------------
+# CLASSES
+
+
+class Profile(object):
+    """Wall time, rows and bytes of the stages of one batch call.
+
+    >>> profile = Profile()
+    >>> x = numpy.zeros(1000)
+    >>> profile.lap('input', x)
+    >>> profile.lap('solver', x, x)
+    >>> profile.lap('input', numpy.zeros(10))
+    >>> list(profile.stages)
+    ['input', 'solver']
+    >>> profile.stages['input']['rows'], profile.stages['input']['bytes']
+    (1000, 8080)
+    >>> profile.stages['solver']['bytes']
+    16000
+    >>> abs(profile.total - sum(s['time'] for s in profile.stages.values())) < 1e-12
+    True
+    """
+
+    def __init__(self):
+        self.stages = collections.OrderedDict()
+        self._clock = timeit.default_timer
+        self._last = self._clock()
+
+    def lap(self, stage, *arrays):
+        """End a stage, which began where the previous one ended.
+
+        :param stage: name of the stage
+        :type stage: str
+        :param arrays: the arrays the stage produced
+        :type arrays: numpy.ndarray
+        """
+
+        elapsed = self._clock() - self._last
+        record = self.stages.get(stage)
+        if record is None:
+            record = self.stages[stage] = {'time': 0., 'rows': 0, 'bytes': 0}
+        record['time'] += elapsed
+        for array in arrays:
+            record['rows'] = max(record['rows'], int(numpy.size(array)))
+            record['bytes'] += int(getattr(array, 'nbytes', 0))
+        # the bookkeeping is not charged to the next stage
+        self._last = self._clock()
+
+    @property
+    def total(self):
+        """Seconds spent in all stages."""
+
+        return sum(record['time'] for record in self.stages.values())
+
+    def as_dict(self):
+        """Return the stages as a dict, with the total time."""
+
+        return {'stages': dict((stage, dict(record)) for stage, record in self.stages.items()),
+                'total': self.total}
+
+    def __str__(self):
+        total = self.total
+        lines = ['{:<8} {:>12} {:>7} {:>10} {:>14}'.format('stage', 'seconds', 'share', 'rows', 'bytes')]
+        for stage, record in self.stages.items():
+            lines.append('{:<8} {:>12.6f} {:>6.1f}% {:>10} {:>14}'.format(
+                stage, record['time'], 100. * record['time'] / total if total else 0.,
+                record['rows'], record['bytes']))
+        lines.append('{:<8} {:>12.6f}'.format('total', total))
+        return '\n'.join(lines)
+
+
+class _NoProfile(object):
+    """Stands in for a Profile when none was asked for."""
+
+    def lap(self, stage, *arrays):
+        pass
+
+
+_NO_PROFILE = _NoProfile()
+
+
+# -----------------------------------------------------------------------------
+# FUNCTIONS
+
+
+def profiler(profile):
+    """Return a new Profile if ``profile`` is true, and otherwise a
+    stand-in whose ``lap`` does nothing.
+
+    :param profile: whether to profile the call
+    :type profile: bool
+
+    :returns:  Profile
+    """
+
+    return Profile() if profile else _NO_PROFILE
+
+
+if __name__ == "__main__":
+    from py_vollib.helpers.doctest_helper import run_doctest
+    run_doctest()
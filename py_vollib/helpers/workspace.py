@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""
+py_vollib.helpers.workspace
+~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+A library for option pricing, implied volatility, and
+greek calculation.  py_vollib is based on lets_be_rational,
+a Python wrapper for LetsBeRational by Peter Jaeckel as
+described below.
+
+:copyright: © 2017 Gammon Capital LLC
+:license: MIT, see LICENSE for more details.
+
+About LetsBeRational:
+~~~~~~~~~~~~~~~~~~~~~
+
+The source code of LetsBeRational resides at www.jaeckel.org/LetsBeRational.7z .
+
+::
+
+    ========================================================================================
+    Copyright © 2013-2014 Peter Jäckel.
+
+    Permission to use, copy, modify, and distribute this software is freely granted,
+    provided that this notice is preserved.
+
+    WARRANTY DISCLAIMER
+    The Software is provided "as is" without warranty of any kind, either express or implied,
+    including without limitation any implied warranties of condition, uninterrupted use,
+    merchantability, fitness for a particular purpose, or non-infringement.
+    ========================================================================================
+
+
+
+Workspaces and output buffers:
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+The ``ref_python`` pricers and ``py_vollib.helpers.analytical_greeks.greeks``
+take an ``out`` argument, preallocated arrays that receive the result,
+and a ``workspace``, a ``Workspace`` that holds the scratch arrays of
+their intermediate terms.  Given either, they compute every term in
+place, through the ``out`` arguments of the numpy ufuncs, so that once
+the workspace has seen a shape, a call allocates no arrays the size of
+its inputs::
+
+    workspace = Workspace()
+    price = numpy.empty(len(K))
+    for S in ticks:
+        black_scholes_merton(flag, S, K, t, r, sigma, q, out=price, workspace=workspace)
+
+A workspace keeps one array per name, and allocates it again only when
+a call asks for another shape or type, so a loop over batches of
+alternating shapes should keep one workspace per shape.  Workspaces are
+not safe to share between threads.
+
+Some arguments still allocate on every call: flags given as lists
+rather than arrays, rates given as curves, whose zero rates are new
+arrays, and arrays of another floating point type than the call
+computes in, which are converted.  The vectorized implied volatility
+solvers take ``out`` only; their working set shrinks as rows converge,
+which allocates on every iteration.
+
+"""
+
+
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+
+# Related third party imports
+import numpy
+
+# Local application/library specific imports
+from py_vollib.helpers import CALL, PUT
+from py_vollib.helpers.exceptions import InvalidArgument
+
+
+# -----------------------------------------------------------------------------
+# CLASSES
+
+
+class Workspace(object):
+    """Named scratch arrays, reused from one call to the next.
+
+    >>> workspace = Workspace()
+    >>> d1 = workspace.array('d1', (3,))
+    >>> workspace.array('d1', (3,)) is d1
+    True
+    >>> workspace.array('d1', (3,), numpy.float32) is d1
+    False
+    >>> workspace.allocations, workspace.nbytes
+    (2, 12)
+    """
+
+    def __init__(self):
+        self._arrays = {}
+        self.allocations = 0
+
+    def array(self, name, shape, dtype=float):
+        """Return the scratch array of a name, allocating it if it does
+        not have the shape and type asked for.  Its contents are whatever
+        the last call left in it.
+
+        :param name: name of the array
+        :type name: str
+        :param shape: shape of the array
+        :type shape: tuple
+        :param dtype: type of the array
+        :type dtype: numpy.dtype
+
+        :returns:  numpy.ndarray
+        """
+
+        shape = tuple(shape)
+        array = self._arrays.get(name)
+        if array is None or array.shape != shape or array.dtype != dtype:
+            array = self._arrays[name] = numpy.empty(shape, dtype=dtype)
+            self.allocations += 1
+        return array
+
+    def sign(self, flag, dtype=float):
+        """Convert flags to +1 (call) and -1 (put) like
+        ``py_vollib.helpers.binary_flag_array``, into a scratch array.
+
+        :param flag: 'c' or 'p' for call or put, or an array of them
+        :type flag: str or numpy.ndarray
+        :param dtype: floating point type of the result
+        :type dtype: numpy.dtype
+
+        :returns:  numpy.ndarray
+
+        >>> Workspace().sign(numpy.array(['c', 'p', 'c']))
+        array([ 1., -1.,  1.])
+        """
+
+        flag = numpy.asarray(flag)
+        is_call = numpy.equal(flag, CALL, out=self.array('is_call', flag.shape, bool))
+        is_valid = numpy.equal(flag, PUT, out=self.array('is_valid', flag.shape, bool))
+        numpy.logical_or(is_call, is_valid, out=is_valid)
+        if not is_valid.all():
+            raise InvalidArgument("flags must be '{}' or '{}'".format(CALL, PUT))
+        sign = numpy.multiply(is_call, 2, out=self.array('sign', flag.shape, dtype))
+        return numpy.subtract(sign, 1, out=sign)
+
+    @property
+    def nbytes(self):
+        """Bytes held by the scratch arrays."""
+
+        return sum(array.nbytes for array in self._arrays.values())
+
+    def clear(self):
+        """Release the scratch arrays."""
+
+        self._arrays.clear()
+
+
+# -----------------------------------------------------------------------------
+# FUNCTIONS
+
+
+def compute_dtype(dtype, out):
+    """Return the floating point type a call computes in: ``dtype`` if
+    given, otherwise the type of ``out``, and otherwise float64.
+
+    :param dtype: floating point type, or None
+    :type dtype: numpy.dtype or None
+    :param out: output array, or None
+    :type out: numpy.ndarray or None
+
+    :returns:  numpy.dtype
+
+    >>> compute_dtype(None, numpy.empty(2, numpy.float32))
+    dtype('float32')
+    >>> compute_dtype(None, None)
+    dtype('float64')
+    """
+
+    if dtype is not None:
+        return numpy.dtype(dtype)
+    if out is not None:
+        return out.dtype
+    return numpy.dtype(float)
+
+
+def output(out, shape, dtype=float):
+    """Return ``out`` after checking that it can hold a result of a
+    shape and type, or a new array if it is None.
+
+    :param out: output array, or None
+    :type out: numpy.ndarray or None
+    :param shape: shape of the result
+    :type shape: tuple
+    :param dtype: type of the result
+    :type dtype: numpy.dtype
+
+    :returns:  numpy.ndarray
+
+    >>> output(None, (2,)).shape
+    (2,)
+    >>> output(numpy.empty(3), (2,))
+    Traceback (most recent call last):
+    ...
+    py_vollib.helpers.exceptions.InvalidArgument: out has shape (3,), the result has shape (2,)
+    """
+
+    if out is None:
+        return numpy.empty(shape, dtype=dtype)
+    if not isinstance(out, numpy.ndarray) or out.shape != tuple(shape):
+        raise InvalidArgument('out has shape {}, the result has shape {}'.format(numpy.shape(out), tuple(shape)))
+    if out.dtype != dtype:
+        raise InvalidArgument('out has type {}, the result has type {}'.format(out.dtype, numpy.dtype(dtype)))
+    return out
+
+
+if __name__ == "__main__":
+    from py_vollib.helpers.doctest_helper import run_doctest
+    run_doctest()
@@ -0,0 +1,492 @@
+# -*- coding: utf-8 -*-
+"""
+py_vollib.monte_carlo
+~~~~~~~~~~~~~~~~~~~~~
+
+A library for option pricing, implied volatility, and
+greek calculation.  py_vollib is based on lets_be_rational,
+a Python wrapper for LetsBeRational by Peter Jaeckel as
+described below.
+
+:copyright: © 2017 Gammon Capital LLC
+:license: MIT, see LICENSE for more details.
+
+About LetsBeRational:
+~~~~~~~~~~~~~~~~~~~~~
+
+The source code of LetsBeRational resides at www.jaeckel.org/LetsBeRational.7z .
+
+::
+
+    ========================================================================================
+    Copyright © 2013-2014 Peter Jäckel.
+
+    Permission to use, copy, modify, and distribute this software is freely granted,
+    provided that this notice is preserved.
+
+    WARRANTY DISCLAIMER
+    The Software is provided "as is" without warranty of any kind, either express or implied,
+    including without limitation any implied warranties of condition, uninterrupted use,
+    merchantability, fitness for a particular purpose, or non-infringement.
+    ========================================================================================
+
+
+
+Monte Carlo simulation:
+~~~~~~~~~~~~~~~~~~~~~~~
+
+The underlying follows geometric Brownian motion with the drift
+``r - q`` used by ``py_vollib.black_scholes_merton``, sampled exactly on
+``steps`` equally spaced monitoring dates.  Paths are generated in blocks
+of a fixed size.  Within a block, each payoff folds the spot into a small
+running state as the simulation steps forward, so a block never holds
+more than one spot per path, and the full path matrix is never stored.
+A payoff is any object with three methods: ``start(spot)`` returns its
+initial state, ``update(state, spot)`` folds in the spot at each
+monitoring date, and ``finish(state, spot)`` returns the payoff of every
+path.
+Blocks are reduced to a count, a mean and a sum of squared deviations,
+which are merged in block order.
+
+Each block draws from its own generator, seeded by a child of one
+``numpy.random.SeedSequence``.  Results therefore depend only on the seed
+and the block size, not on how many processes ran the blocks.
+
+Variance reduction:
+~~~~~~~~~~~~~~~~~~~
+
+Three techniques can be switched on independently:
+
+* antithetic variates pair every path with its mirror image and treat
+  each pair as one sample;
+* scrambled Sobol points replace the pseudo-random normals.  Each block
+  is an independent scramble, and the standard error is estimated from
+  the spread of the block means, so at least two blocks are needed;
+* a control variate is a second payoff with a closed-form expectation,
+  ``European`` or ``GeometricAsian``, evaluated on the same paths.  The
+  blocks carry the joint moments of the payoff and the control, and the
+  optimal coefficient is estimated from all the paths together.
+
+The variance reduction factor reported alongside the price is the
+variance of plain Monte Carlo over the same number of paths, estimated
+from the simulated payoffs, divided by the variance of the estimator.
+
+Greeks:
+~~~~~~~
+
+Delta, gamma and vega come out of the same simulation as the price, so
+a full set costs little more than the price alone.  The simulation
+carries the derivative of the spot with respect to the volatility next
+to the spot itself, and a payoff that supports greeks has three more
+methods, ``start_greeks``, ``update_greeks`` and ``finish_greeks``,
+which also take that derivative and finally return the payoff with its
+derivatives with respect to the log of today's price and to the
+volatility.  Delta and vega are the discounted averages of these
+pathwise derivatives.  The payoff is not differentiable twice, so gamma
+weights the pathwise delta by the likelihood ratio of the first step.
+
+"""
+
+
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+from __future__ import division
+import multiprocessing
+
+# Related third party imports
+import numpy
+
+# Local application/library specific imports
+from py_vollib.black_scholes_merton import black_scholes_merton
+from py_vollib.curves import zero_rate
+from py_vollib.helpers import binary_flag_array
+from py_vollib.helpers.distributions import ndtri
+from py_vollib.helpers.exceptions import InvalidArgument
+
+
+# -----------------------------------------------------------------------------
+# DATA
+
+PATHS = 100000
+BLOCK_SIZE = 10000
+
+
+# -----------------------------------------------------------------------------
+# CLASSES - PAYOFFS
+
+
+class European(object):
+    """A call or put on the underlying price at expiration.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    """
+
+    def __init__(self, flag, K):
+        self.flag = numpy.asarray(flag)
+        self.sign = binary_flag_array(flag)
+        self.K = numpy.asarray(K, dtype=float)
+
+    def _expand(self, x):
+        return x.reshape(x.shape + (1,) * numpy.broadcast(self.sign, self.K).nd)
+
+    def _payoff(self, x):
+        return numpy.maximum(self.sign * (self._expand(x) - self.K), 0.)
+
+    def _greeks(self, x, x_tangent):
+        """The payoff of each path, with its derivatives along the path
+        with respect to the log of today's price and the volatility."""
+        x, x_tangent = self._expand(x), self._expand(x_tangent)
+        slope = numpy.where(self.sign * (x - self.K) > 0, self.sign, 0.)
+        return numpy.maximum(self.sign * (x - self.K), 0.), slope * x, slope * x_tangent
+
+    def start(self, spot):
+        return None
+
+    def update(self, state, spot):
+        return state
+
+    def finish(self, state, spot):
+        return self._payoff(spot)
+
+    def start_greeks(self, spot, tangent):
+        return None
+
+    def update_greeks(self, state, spot, tangent):
+        return state
+
+    def finish_greeks(self, state, spot, tangent):
+        return self._greeks(spot, tangent)
+
+    def expected_value(self, S, t, r, sigma, q, steps):
+        """The Black-Scholes-Merton price, for use as a control variate."""
+        return numpy.vectorize(black_scholes_merton)(self.flag, S, self.K, t, r, sigma, q)[()]
+
+
+class ArithmeticAsian(European):
+    """A call or put on the arithmetic average of the underlying price over
+    the monitoring dates, excluding today.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    """
+
+    def start(self, spot):
+        return [numpy.zeros_like(spot), 0]
+
+    def update(self, state, spot):
+        state[0] += spot
+        state[1] += 1
+        return state
+
+    def finish(self, state, spot):
+        return self._payoff(state[0] / state[1])
+
+    def start_greeks(self, spot, tangent):
+        return [numpy.zeros_like(spot), numpy.zeros_like(spot), 0]
+
+    def update_greeks(self, state, spot, tangent):
+        state[0] += spot
+        state[1] += tangent
+        state[2] += 1
+        return state
+
+    def finish_greeks(self, state, spot, tangent):
+        return self._greeks(state[0] / state[2], state[1] / state[2])
+
+
+class GeometricAsian(European):
+    """A call or put on the geometric average of the underlying price over
+    the monitoring dates, excluding today.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    """
+
+    def start(self, spot):
+        return [numpy.zeros_like(spot), 0]
+
+    def update(self, state, spot):
+        state[0] += numpy.log(spot)
+        state[1] += 1
+        return state
+
+    def finish(self, state, spot):
+        return self._payoff(numpy.exp(state[0] / state[1]))
+
+    def start_greeks(self, spot, tangent):
+        return [numpy.zeros_like(spot), numpy.zeros_like(spot), 0]
+
+    def update_greeks(self, state, spot, tangent):
+        state[0] += numpy.log(spot)
+        state[1] += tangent / spot
+        state[2] += 1
+        return state
+
+    def finish_greeks(self, state, spot, tangent):
+        average = numpy.exp(state[0] / state[2])
+        return self._greeks(average, average * state[1] / state[2])
+
+    def expected_value(self, S, t, r, sigma, q, steps):
+        """The closed-form price, for use as a control variate.
+
+        The log of the geometric average is normal, so the option is priced
+        by ``black_scholes_merton`` with the volatility and dividend rate
+        that reproduce its mean and variance.
+        """
+        dt = t / steps
+        mean = numpy.log(S) + (r - q - sigma * sigma / 2.) * dt * (steps + 1) / 2.
+        variance = sigma * sigma * dt * (steps + 1) * (2 * steps + 1) / (6. * steps)
+        sigma_average = numpy.sqrt(variance / t)
+        q_average = r - (mean + variance / 2. - numpy.log(S)) / t
+        return numpy.vectorize(black_scholes_merton)(self.flag, S, self.K, t, r, sigma_average, q_average)[()]
+
+
+# -----------------------------------------------------------------------------
+# FUNCTIONS - HELPERS
+
+
+def _moments(values):
+    """Reduce samples of one or more variables, stacked along axis 1, to
+    their count, means and matrix of co-moments."""
+
+    mean = values.mean(axis=0)
+    deviation = values - mean
+    return len(values), mean, numpy.einsum('ij...,ik...->jk...', deviation, deviation)
+
+
+def _merge(blocks):
+    """Merge moments in order, with Chan's pairwise update."""
+
+    n, mean, comoment = blocks[0]
+    for n_b, mean_b, comoment_b in blocks[1:]:
+        delta = mean_b - mean
+        total = n + n_b
+        mean = mean + delta * n_b / total
+        comoment = comoment + comoment_b + delta[:, None] * delta[None, :] * (n * n_b / total)
+        n = total
+    return n, mean, comoment
+
+
+def _normals(rng, sobol, n, steps):
+    """Yield a vector of n standard normals for each monitoring date."""
+
+    if sobol:
+        from scipy.stats import qmc
+        points = qmc.Sobol(d=steps, scramble=True, seed=rng).random(n)
+        for normals in ndtri(points).T:
+            yield normals
+    else:
+        for _ in range(steps):
+            yield rng.standard_normal(n)
+
+
+def _simulate_block(task):
+    """Simulate one block of paths.
+
+    Returns the moments of the individual discounted payoffs, and the
+    joint moments of the samples (paths, or antithetic pairs) of the
+    payoff, its greek estimators if requested, and the control variate.
+    """
+
+    payoff, control, S, t, r, sigma, q, steps, n_paths, antithetic, sobol, greeks, seed = task
+    rng = numpy.random.default_rng(seed)
+    dt = t / steps
+    drift = (r - q - sigma * sigma / 2.) * dt
+    diffusion = sigma * numpy.sqrt(dt)
+
+    spot = numpy.full(n_paths, S, dtype=float)
+    tangent = numpy.zeros(n_paths)
+    state = payoff.start_greeks(spot, tangent) if greeks else payoff.start(spot)
+    control_state = None if control is None else control.start(spot)
+    for step, normals in enumerate(_normals(rng, sobol, n_paths // 2 if antithetic else n_paths, steps)):
+        if antithetic:
+            normals = numpy.concatenate((normals, -normals))
+        growth = numpy.exp(drift + diffusion * normals)
+        spot *= growth
+        if greeks:
+            if not step:
+                first_normals = normals
+            # the derivative of the spot with respect to the volatility
+            tangent *= growth
+            tangent += spot * (numpy.sqrt(dt) * normals - sigma * dt)
+            state = payoff.update_greeks(state, spot, tangent)
+        else:
+            state = payoff.update(state, spot)
+        if control is not None:
+            control_state = control.update(control_state, spot)
+
+    if greeks:
+        value, log_spot_slope, vega = payoff.finish_greeks(state, spot, tangent)
+        delta = log_spot_slope / S
+        # likelihood ratio of the first step applied to the pathwise delta
+        score = first_normals / (S * diffusion)
+        gamma = delta * (score.reshape(score.shape + (1,) * (delta.ndim - 1)) - 1. / S)
+        values = [value, delta, gamma, vega * .01]
+    else:
+        values = [payoff.finish(state, spot)]
+    if control is not None:
+        values.append(control.finish(control_state, spot))
+
+    ndim = max(v.ndim for v in values)
+    values = [v.reshape(v.shape + (1,) * (ndim - v.ndim)) for v in values]
+    values = numpy.exp(-r * t) * numpy.stack(numpy.broadcast_arrays(*values), axis=1)
+    raw = _moments(values[:, :1])
+    if antithetic:
+        values = .5 * (values[:n_paths // 2] + values[n_paths // 2:])
+    return raw, _moments(values)
+
+
+def _blocks(paths, block_size, seed, equal=False, even=False):
+    """Split the paths into blocks, each with its own seed sequence.  With
+    equal set, the last block is filled up to block_size; with even set,
+    it is rounded up to an even number of paths."""
+
+    sizes = [block_size] * (paths // block_size)
+    if paths % block_size:
+        remainder = paths % block_size
+        sizes.append(block_size if equal else remainder + remainder % 2 if even else remainder)
+    return zip(sizes, numpy.random.SeedSequence(seed).spawn(len(sizes)))
+
+
+# -----------------------------------------------------------------------------
+# FUNCTIONS - PRICING
+
+
+def monte_carlo(payoff, S, t, r, sigma, q, steps=1, paths=PATHS, block_size=BLOCK_SIZE, seed=None, processes=1,
+                antithetic=False, sobol=False, control_variate=None, greeks=False):
+    """Return the Monte Carlo price of a payoff on an underlying that follows
+    Black-Scholes-Merton dynamics, with its standard error.
+
+    With ``greeks`` the same paths also give delta and vega, by
+    differentiating each path with respect to today's price and the
+    volatility (pathwise), and gamma, by weighting the pathwise delta
+    with the score of the first step (likelihood ratio).  The control
+    variate only applies to the price.
+
+    :param payoff: the payoff, e.g. ``European``, ``ArithmeticAsian`` or ``GeometricAsian``
+    :type payoff: object with start, update and finish methods
+    :param S: underlying asset price
+    :type S: float
+    :param t: time to expiration in years
+    :type t: float
+    :param r: risk-free interest rate
+    :type r: float
+    :param sigma: annualized standard deviation, or volatility
+    :type sigma: float
+    :param q: annualized continuous dividend rate
+    :type q: float
+    :param steps: number of equally spaced monitoring dates
+    :type steps: int
+    :param paths: number of simulated paths, rounded up to an even number
+        with antithetic variates
+    :type paths: int
+    :param block_size: number of paths simulated together, even with
+        antithetic variates and best a power of two with Sobol points
+    :type block_size: int
+    :param seed: seed for numpy.random.SeedSequence; fresh entropy if None
+    :type seed: int or None
+    :param processes: number of worker processes the blocks are spread over
+    :type processes: int
+    :param antithetic: use antithetic variates
+    :type antithetic: bool
+    :param sobol: use scrambled Sobol points; paths are rounded up to whole
+        blocks, and there must be at least two of them, since the standard
+        error comes from the spread between the blocks
+    :type sobol: bool
+    :param control_variate: a payoff with an ``expected_value`` method,
+        ``European`` or ``GeometricAsian``, used as a control variate
+    :type control_variate: object or None
+    :param greeks: also estimate delta, gamma and vega, in the units of
+        py_vollib.black_scholes_merton.greeks.analytical
+    :type greeks: bool
+
+    :returns:  dict with keys 'price', 'standard_error', 'paths' and 'variance_reduction',
+        and with greeks also 'delta', 'gamma', 'vega' and their '<greek>_standard_error'
+
+    >>> from py_vollib.black_scholes_merton import black_scholes_merton
+    >>> result = monte_carlo(European('c', 100.), 100., .5, .05, .2, .01, paths=200000, seed=0)
+    >>> bsm = black_scholes_merton('c', 100., 100., .5, .05, .2, .01)
+    >>> abs(result['price'] - bsm) < 3 * result['standard_error']
+    True
+    >>> result['paths']
+    200000
+    >>> asian = monte_carlo(ArithmeticAsian('c', 100.), 100., 1., .05, .2, 0., steps=12, paths=2 ** 14,
+    ...                     block_size=2 ** 11, seed=0, sobol=True, control_variate=GeometricAsian('c', 100.))
+    >>> bool(asian['variance_reduction'] > 100)
+    True
+    >>> from py_vollib.black_scholes_merton.greeks.analytical import delta
+    >>> result = monte_carlo(European('p', 100.), 100., .5, .05, .2, .01, paths=200000, seed=0, greeks=True)
+    >>> abs(result['delta'] - delta('p', 100., 100., .5, .05, .2, .01)) < 3 * result['delta_standard_error']
+    True
+    """
+
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
+    if antithetic and block_size % 2:
+        raise InvalidArgument("block_size must be even with antithetic variates")
+    tasks = [(payoff, control_variate, S, t, r, sigma, q, steps, n_paths, antithetic, sobol, greeks, child)
+             for n_paths, child in _blocks(int(paths), int(block_size), seed, equal=sobol, even=antithetic)]
+    if sobol and len(tasks) < 2:
+        raise InvalidArgument("sobol needs at least two blocks of paths to estimate the standard error")
+    if processes > 1 and len(tasks) > 1:
+        pool = multiprocessing.Pool(processes)
+        try:
+            blocks = pool.map(_simulate_block, tasks)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        blocks = [_simulate_block(task) for task in tasks]
+
+    n_paths, _, raw = _merge([block[0] for block in blocks])
+    samples = [block[1] for block in blocks]
+    n, mean, comoment = _merge(samples)
+
+    if control_variate is None:
+        estimate = lambda mean: mean[0]
+    else:
+        beta = comoment[0, -1] / comoment[-1, -1]
+        expected = control_variate.expected_value(S, t, r, sigma, q, steps)
+        estimate = lambda mean: mean[0] - beta * (mean[-1] - expected)
+    names = ('delta', 'gamma', 'vega') if greeks else ()
+
+    # a control that matches the payoff exactly leaves no variance at all
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        if sobol:
+            block_estimates = numpy.array([estimate(block_mean) for _, block_mean, _ in samples])
+            variance = block_estimates.var(axis=0, ddof=1) / len(samples)
+            block_means = numpy.array([block_mean for _, block_mean, _ in samples])
+            greek_variances = [block_means[:, i].var(axis=0, ddof=1) / len(samples)
+                               for i in range(1, len(names) + 1)]
+        else:
+            residual = comoment[0, 0]
+            if control_variate is not None:
+                residual = numpy.maximum(residual - 2 * beta * comoment[0, -1] + beta * beta * comoment[-1, -1], 0.)
+            variance = residual / (n - 1) / n
+            greek_variances = [comoment[i, i] / (n - 1) / n for i in range(1, len(names) + 1)]
+        reduction = raw[0, 0] / (n_paths - 1) / n_paths / variance
+
+    result = {
+        'price': estimate(mean),
+        'standard_error': numpy.sqrt(variance),
+        'paths': n_paths,
+        'variance_reduction': reduction,
+    }
+    for i, (name, greek_variance) in enumerate(zip(names, greek_variances)):
+        result[name] = mean[i + 1]
+        result[name + '_standard_error'] = numpy.sqrt(greek_variance)
+    return result
+
+
+if __name__ == "__main__":
+    from py_vollib.helpers.doctest_helper import run_doctest
+    run_doctest()
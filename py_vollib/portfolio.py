@@ -0,0 +1,322 @@
+# -*- coding: utf-8 -*-
+"""
+py_vollib.portfolio
+~~~~~~~~~~~~~~~~~~~
+
+A library for option pricing, implied volatility, and
+greek calculation.  py_vollib is based on lets_be_rational,
+a Python wrapper for LetsBeRational by Peter Jaeckel as
+described below.
+
+:copyright: © 2017 Gammon Capital LLC
+:license: MIT, see LICENSE for more details.
+
+About LetsBeRational:
+~~~~~~~~~~~~~~~~~~~~~
+
+The source code of LetsBeRational resides at www.jaeckel.org/LetsBeRational.7z .
+
+::
+
+    ========================================================================================
+    Copyright © 2013-2014 Peter Jäckel.
+
+    Permission to use, copy, modify, and distribute this software is freely granted,
+    provided that this notice is preserved.
+
+    WARRANTY DISCLAIMER
+    The Software is provided "as is" without warranty of any kind, either express or implied,
+    including without limitation any implied warranties of condition, uninterrupted use,
+    merchantability, fitness for a particular purpose, or non-infringement.
+    ========================================================================================
+
+
+
+
+Portfolios:
+~~~~~~~~~~~
+
+A ``Portfolio`` holds a book of European options as parallel arrays, one
+entry per position, together with the quantity, contract multiplier,
+underlier and expiry bucket of each position.  Greeks are computed for all
+positions at once with ``py_vollib.helpers.analytical_greeks`` and netted
+by underlier, by expiry bucket, or by both, with ``numpy.bincount`` on
+integer group codes that are worked out once when the portfolio is built.
+
+The portfolio also keeps running totals of the tracked greeks per
+underlier and expiry bucket.  ``update`` applies a list of changed
+positions, such as fills or new quotes, by subtracting their old
+contributions from the totals and adding their new ones, so its cost
+depends only on the number of changes.  ``recompute`` rebuilds the totals
+from scratch and should be called periodically to clear rounding drift.
+
+Rates and dividend rates given as curves are kept per position along with
+the zero rates resolved from them, so that a change of expiry, rate or
+dividend rate resolves the changed positions again.
+
+"""
+
+
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+from __future__ import division
+
+# Related third party imports
+import numpy
+
+# Local application/library specific imports
+from py_vollib.curves import Curve, zero_rate
+from py_vollib.helpers import analytical_greeks
+from py_vollib.helpers.exceptions import InvalidArgument
+
+
+# -----------------------------------------------------------------------------
+# CLASSES
+
+
+class Portfolio(object):
+    """A book of Black-Scholes-Merton options.
+
+    All arguments broadcast against each other to one entry per position.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param S: underlying asset price
+    :type S: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: risk-free interest rate, or a curve resolved per position
+    :type r: float, numpy.ndarray or py_vollib.curves.Curve
+    :param sigma: annualized standard deviation, or volatility
+    :type sigma: float or numpy.ndarray
+    :param q: annualized continuous dividend rate, or a carry curve
+    :type q: float, numpy.ndarray or py_vollib.curves.CarryCurve
+    :param quantity: number of contracts held in each position
+    :type quantity: float or numpy.ndarray
+    :param multiplier: number of options per contract
+    :type multiplier: float or numpy.ndarray
+    :param underlier: identifier of the underlier of each position
+    :type underlier: any sortable value, or numpy.ndarray of them
+    :param bucket: identifier of the expiry bucket of each position
+    :type bucket: any sortable value, or numpy.ndarray of them
+    :param tracked: names of the greeks kept as running totals
+    :type tracked: sequence of str
+
+    >>> portfolio = Portfolio(['c', 'p', 'c', 'c'], [100.0, 100.0, 50.0, 100.0], [100.0, 95.0, 55.0, 110.0],
+    ...                       [.5, .5, .25, 1.0], .02, [.2, .22, .3, .18], 0.0,
+    ...                       quantity=[10, -4, 7, 2], multiplier=100,
+    ...                       underlier=['SPX', 'SPX', 'XYZ', 'SPX'], bucket=['6M', '6M', '3M', '1Y'])
+    >>> portfolio.underliers
+    array(['SPX', 'XYZ'], dtype='<U3')
+    >>> netted = portfolio.aggregate(('delta', 'vega'), by='underlier')
+    >>> position = portfolio.position_greeks(('delta',))['delta']
+    >>> bool(numpy.allclose(netted['delta'], [position[[0, 1, 3]].sum(), position[2]]))
+    True
+    >>> portfolio.aggregate(('delta',), by=('underlier', 'bucket'))['delta'].shape
+    (2, 3)
+
+    A fill of 5 more contracts of the second position, and a new quote for
+    the third:
+
+    >>> portfolio.update([1, 2], quantity=[-9, 7], S=[100.0, 51.0])
+    >>> after = portfolio.totals(by='underlier')['delta']
+    >>> bool(numpy.allclose(after, portfolio.aggregate(('delta',), by='underlier')['delta']))
+    True
+
+    ``r`` and ``q`` are the zero rates the positions are priced with, and
+    ``rate`` and ``dividend`` the rates or curves they resolve from:
+
+    >>> curve = Curve([.25, 2.], [.01, .06])
+    >>> portfolio = Portfolio('c', 100.0, 100.0, [.25, .25], curve, .2)
+    >>> portfolio.update([0], t=2.0)
+    >>> portfolio.r
+    array([0.06, 0.01])
+    """
+
+    INPUTS = ('flag', 'S', 'K', 't', 'r', 'sigma', 'q', 'quantity', 'multiplier')
+
+    def __init__(self, flag, S, K, t, r, sigma, q=0.0, quantity=1.0, multiplier=1.0, underlier=0, bucket=0,
+                 tracked=('price', 'delta', 'gamma', 'theta', 'vega', 'rho')):
+        rate, dividend = r, q
+        r = zero_rate(r, t)
+        q = zero_rate(q, t)
+        arrays = numpy.broadcast_arrays(
+            numpy.asarray(flag), numpy.asarray(underlier), numpy.asarray(bucket),
+            *[numpy.asarray(x, dtype=float) for x in (S, K, t, r, sigma, q, quantity, multiplier)])
+        arrays = [numpy.array(x.ravel()) for x in arrays]
+        (self.flag, underlier, bucket,
+         self.S, self.K, self.t, self.r, self.sigma, self.q, self.quantity, self.multiplier) = arrays
+        self.rate = _sources(rate, self.r)
+        self.dividend = _sources(dividend, self.q)
+
+        self.underliers, self.underlier_codes = numpy.unique(underlier, return_inverse=True)
+        self.buckets, self.bucket_codes = numpy.unique(bucket, return_inverse=True)
+        self.tracked = tuple(tracked)
+        self._greeks = None
+        self._totals = None
+
+    def __len__(self):
+        return self.S.size
+
+    def greeks(self):
+        """Return the greeks of one option of each position, per
+        ``py_vollib.helpers.analytical_greeks.greeks``.
+
+        The result is cached until the portfolio changes.
+
+        :returns:  dict of numpy.ndarray
+        """
+
+        if self._greeks is None:
+            self._greeks = analytical_greeks.greeks(self.flag, self.S, self.K, self.t, self.r, self.sigma,
+                                                    self.r - self.q)
+        return self._greeks
+
+    def position_greeks(self, names=('price', 'delta', 'gamma', 'theta', 'vega', 'rho')):
+        """Return the named greeks of each position, scaled by quantity and
+        multiplier.
+
+        :param names: names of the greeks, as keys of ``greeks``
+        :type names: sequence of str
+
+        :returns:  dict of numpy.ndarray
+        """
+
+        greeks = self.greeks()
+        weight = self.quantity * self.multiplier
+        return dict((name, weight * greeks[name]) for name in names)
+
+    def aggregate(self, names=('delta', 'vega'), by='underlier'):
+        """Net the named position greeks by underlier, by expiry bucket, or
+        by both.
+
+        :param names: names of the greeks, as keys of ``greeks``
+        :type names: sequence of str
+        :param by: 'underlier', 'bucket' or ('underlier', 'bucket')
+        :type by: str or tuple
+
+        :returns:  dict of numpy.ndarray indexed like ``underliers``, like ``buckets``,
+            or by (underlier, bucket) when grouping by both
+        """
+
+        codes, shape = self._group(by)
+        size = int(numpy.prod(shape))
+        return dict((name, numpy.bincount(codes, weights=value, minlength=size).reshape(shape))
+                    for name, value in self.position_greeks(names).items())
+
+    def recompute(self):
+        """Recompute the greeks of every position and rebuild the running
+        totals from them."""
+
+        self._greeks = None
+        self._totals = self.aggregate(self.tracked, by=('underlier', 'bucket'))
+
+    def totals(self, by=('underlier', 'bucket')):
+        """Return the running totals of the tracked greeks.
+
+        :param by: 'underlier', 'bucket' or ('underlier', 'bucket')
+        :type by: str or tuple
+
+        :returns:  dict of numpy.ndarray, shaped as by ``aggregate``
+        """
+
+        if self._totals is None:
+            self.recompute()
+        if by == 'underlier':
+            return dict((name, total.sum(axis=1)) for name, total in self._totals.items())
+        if by == 'bucket':
+            return dict((name, total.sum(axis=0)) for name, total in self._totals.items())
+        self._group(by)
+        return dict((name, total.copy()) for name, total in self._totals.items())
+
+    def update(self, index, **inputs):
+        """Change the inputs of some positions and update the running totals
+        by the change in their contributions.
+
+        :param index: positions to change, without repeats
+        :type index: int or sequence of int
+        :param inputs: new values, keyed by any of ``INPUTS``; ``r`` and
+            ``q`` may be curves
+        :type inputs: float, numpy.ndarray or py_vollib.curves.Curve
+        """
+
+        unknown = set(inputs) - set(self.INPUTS)
+        if unknown:
+            raise InvalidArgument("cannot update {}".format(', '.join(sorted(unknown))))
+        index = numpy.atleast_1d(numpy.asarray(index, dtype=int))
+        if numpy.unique(index).size != index.size:
+            raise InvalidArgument("positions to update must not repeat")
+        if self._totals is None:
+            self.recompute()
+
+        old = self._contributions(index)
+        sources = {'r': self.rate, 'q': self.dividend}
+        for name, value in inputs.items():
+            if name in sources:
+                sources[name][index] = value
+            else:
+                getattr(self, name)[index] = value
+        if set(inputs) & {'t', 'r', 'q'}:
+            self.r[index] = _zero_rates(self.rate[index], self.t[index])
+            self.q[index] = _zero_rates(self.dividend[index], self.t[index])
+
+        greeks = analytical_greeks.greeks(self.flag[index], self.S[index], self.K[index], self.t[index],
+                                          self.r[index], self.sigma[index], self.r[index] - self.q[index])
+        for name, value in greeks.items():
+            self._greeks[name][index] = value
+
+        new = self._contributions(index)
+        codes = self.underlier_codes[index] * self.buckets.size + self.bucket_codes[index]
+        for name in self.tracked:
+            numpy.add.at(self._totals[name].reshape(-1), codes, new[name] - old[name])
+
+    def _contributions(self, index):
+        weight = self.quantity[index] * self.multiplier[index]
+        return dict((name, weight * self.greeks()[name][index]) for name in self.tracked)
+
+    def _group(self, by):
+        if by == 'underlier':
+            return self.underlier_codes, (self.underliers.size,)
+        if by == 'bucket':
+            return self.bucket_codes, (self.buckets.size,)
+        if tuple(by) == ('underlier', 'bucket'):
+            codes = self.underlier_codes * self.buckets.size + self.bucket_codes
+            return codes, (self.underliers.size, self.buckets.size)
+        raise InvalidArgument("by must be 'underlier', 'bucket' or ('underlier', 'bucket')")
+
+
+# -----------------------------------------------------------------------------
+# FUNCTIONS
+
+
+def _sources(value, resolved):
+    """Return the rate or curve of each position, as an object array."""
+
+    sources = numpy.empty(resolved.size, dtype=object)
+    if isinstance(value, Curve):
+        sources[:] = [value] * resolved.size
+    else:
+        sources[:] = resolved.tolist()
+    return sources
+
+
+def _zero_rates(sources, t):
+    """Resolve the rates or curves of some positions to their zero rates
+    to expiries t, one call per distinct curve."""
+
+    rates = numpy.empty(t.shape)
+    is_curve = numpy.array([isinstance(source, Curve) for source in sources], dtype=bool)
+    rates[~is_curve] = sources[~is_curve].astype(float)
+    for curve in dict((id(source), source) for source in sources[is_curve]).values():
+        rows = numpy.array([source is curve for source in sources], dtype=bool)
+        rates[rows] = curve.zero_rate(t[rows])
+    return rates
+
+
+if __name__ == "__main__":
+    from py_vollib.helpers.doctest_helper import run_doctest
+    run_doctest()
@@ -15,4 +15,33 @@ described below.
 py_vollib.ref_python is a pure python version of py_vollib without any dependence on LetsBeRational. It is provided purely as a reference implementation for sanity checking. It is not recommended for industrial use.
 +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 
+Single precision:
+~~~~~~~~~~~~~~~~~
+
+The vectorized pricers of ``py_vollib.ref_python``, their vectorized
+implied volatility solvers, ``py_vollib.helpers.analytical_greeks.greeks``
+and the scenario cubes of ``py_vollib.scenarios`` take a ``dtype``
+argument.  With ``dtype=numpy.float32`` the inputs are converted once and
+every intermediate array and the result are single precision, which
+halves the memory traffic and the cache footprint of a batch.  Scalar
+inputs are converted to ``numpy.float32`` scalars as well, so a call on
+scalars is single precision throughout and carries the same errors.
+
+On a million random options (spot 100, strikes 50 to 150, expirations
+one week to two years, volatilities 10% to 80%) the single precision
+results differ from the double precision ones by at most:
+
+    ====================  ==============================================
+    prices                5e-7 of the spot, and 2e-5 relative for prices
+                          above 0.1% of the spot
+    greeks                4e-6 of the largest magnitude of the greek
+    implied volatility    2e-4 absolute, 1e-5 for 99% of the rows, where
+                          vega is above 0.001
+    ====================  ==============================================
+
+Implied volatilities are solved to a relative tolerance of two float32
+epsilons.  Rows that do not converge in single precision, usually deep
+out of the money quotes whose time value is lost to rounding, are solved
+again in double precision unless ``escalate=False``.
+
 """
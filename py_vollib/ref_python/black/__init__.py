@@ -28,12 +28,16 @@ from math import log, sqrt
 # Related third party imports
 import numpy
 from numpy import log, sqrt
-from scipy.stats import norm
 
 # Local application/library specific imports
+from py_vollib.curves import zero_rate
+from py_vollib.helpers import as_dtype, binary_flag_array
+from py_vollib.helpers.distributions import ndtr
+from py_vollib.helpers.profiling import profiler
+from py_vollib.helpers.workspace import Workspace, compute_dtype, output
 
 
-N = norm.cdf
+N = ndtr
 
 
 # -----------------------------------------------------------------------------
@@ -74,7 +78,7 @@ def d1(F, K, t, r, sigma):  # keep r argument for consistency
     """
 
     sigma_squared = sigma * sigma
-    numerator = log(F / float(K)) + sigma_squared * t / 2.0
+    numerator = log(F / K) + sigma_squared * t / 2.0
     denominator = sigma * sqrt(t)
 
     return numerator / denominator
@@ -141,6 +145,7 @@ def black_call(F, K, t, r, sigma):  # Equation 16.9
     True
     """
 
+    r = zero_rate(r, t)
     deflater = numpy.exp(-r * t)
     N_d1 = N(d1(F, K, t, r, sigma))
     N_d2 = N(d2(F, K, t, r, sigma))
@@ -177,6 +182,7 @@ def black_put(F, K, t, r, sigma):  # Equation 16.10
     True
     """
 
+    r = zero_rate(r, t)
     deflater = numpy.exp(-r * t)
     N_of_minus_d1 = N(-d1(F, K, t, r, sigma))
     N_of_minus_d2 = N(-d2(F, K, t, r, sigma))
@@ -184,17 +190,32 @@ def black_put(F, K, t, r, sigma):  # Equation 16.10
     return deflater * (-F * N_of_minus_d1 + K * N_of_minus_d2)
 
 
-def black(flag, F, K, t, r, sigma):
+def black(flag, F, K, t, r, sigma, profile=False, dtype=None, out=None, workspace=None):
     """Calculate the (discounted) Black option price.
 
+    All arguments may be arrays, including ``flag``; they broadcast
+    against each other.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
     :param F: underlying futures price
-    :type F: float
+    :type F: float or numpy.ndarray
     :param K: strike price
-    :type K: float
+    :type K: float or numpy.ndarray
     :param sigma: annualized standard deviation, or volatility
-    :type sigma: float
+    :type sigma: float or numpy.ndarray
     :param t: time to expiration in years
-    :type t: float
+    :type t: float or numpy.ndarray
+    :param r: risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param profile: also return a ``py_vollib.helpers.profiling.Profile`` of the call
+    :type profile: bool
+    :param dtype: floating point type to compute in, see ``py_vollib.ref_python``
+    :type dtype: numpy.dtype or None
+    :param out: array to write the prices into, see ``py_vollib.helpers.workspace``
+    :type out: numpy.ndarray or None
+    :param workspace: scratch arrays to compute in place with
+    :type workspace: py_vollib.helpers.workspace.Workspace or None
 
     >>> F = 100
     >>> K = 100
@@ -207,14 +228,87 @@ def black(flag, F, K, t, r, sigma):
     >>> actual = black(flag, F, K, t, r, sigma)
     >>> abs(expected - actual) < 1e-12
     True
+
+    >>> actual = black(['c', 'p'], F, numpy.array([90, 110]), t, r, sigma)
+    >>> expected = [black_call(F, 90, t, r, sigma), black_put(F, 110, t, r, sigma)]
+    >>> numpy.allclose(actual, expected, rtol=1e-15, atol=0)
+    True
+
+    >>> price = numpy.empty(2)
+    >>> _ = black(['c', 'p'], F, numpy.array([90, 110]), t, r, sigma, out=price)
+    >>> numpy.array_equal(price, actual)
+    True
     """
 
-    if flag == 'c':
-        return black_call(F, K, t, r, sigma)
-    elif flag == 'p':
-        return black_put(F, K, t, r, sigma)
-    else:
-        raise Exception("flag '{}' is invalid.".format(flag))
+    stages = profiler(profile)
+    if out is not None or workspace is not None:
+        price = _black_into(flag, F, K, t, r, sigma, dtype, out, workspace or Workspace(), stages)
+        return (price, stages) if profile else price
+
+    theta = binary_flag_array(flag)
+    theta, F, K, t, sigma = as_dtype(dtype, theta, F, K, t, sigma)
+    stages.lap('input', theta)
+
+    r = zero_rate(r, t)
+    r = as_dtype(dtype, r)[0]
+    deflater = numpy.exp(-r * t)
+    stages.lap('setup', r, deflater)
+
+    D1 = d1(F, K, t, r, sigma)
+    D2 = d2(F, K, t, r, sigma)
+    price = deflater * theta * (F * N(theta * D1) - K * N(theta * D2))
+    price = as_dtype(dtype, price)[0]
+    stages.lap('solver', D1, D2, price)
+
+    if profile:
+        return price, stages
+    return price
+
+
+def _black_into(flag, F, K, t, r, sigma, dtype, out, workspace, stages):
+    """Compute ``black`` in place, in the same order of operations, into
+    ``out`` and three scratch arrays of ``workspace``."""
+
+    dtype = compute_dtype(dtype, out)
+    theta = workspace.sign(flag, dtype)
+    F, K, t, sigma = as_dtype(dtype, F, K, t, sigma)
+    stages.lap('input', theta)
+
+    r = zero_rate(r, t)
+    r = as_dtype(dtype, r)[0]
+    shape = numpy.broadcast(theta, F, K, t, r, sigma).shape
+    out = output(out, shape, dtype)
+    a, b, c = [workspace.array(name, shape, dtype) for name in ('a', 'b', 'c')]
+    numpy.negative(r, out=c)
+    numpy.multiply(c, t, out=c)
+    numpy.exp(c, out=c)
+    stages.lap('setup', out, c)
+
+    # d1 into a and d2 into b
+    numpy.divide(F, K, out=a)
+    numpy.log(a, out=a)
+    numpy.multiply(sigma, sigma, out=b)
+    numpy.multiply(b, t, out=b)
+    numpy.divide(b, 2.0, out=b)
+    numpy.add(a, b, out=a)
+    numpy.sqrt(t, out=b)
+    numpy.multiply(sigma, b, out=b)
+    numpy.divide(a, b, out=a)
+    numpy.subtract(a, b, out=b)
+
+    # F * N(theta * d1) - K * N(theta * d2) into a
+    numpy.multiply(theta, a, out=a)
+    N(a, out=a)
+    numpy.multiply(F, a, out=a)
+    numpy.multiply(theta, b, out=b)
+    N(b, out=b)
+    numpy.multiply(K, b, out=b)
+    numpy.subtract(a, b, out=a)
+
+    numpy.multiply(c, theta, out=c)
+    price = numpy.multiply(c, a, out=out)
+    stages.lap('solver', price)
+    return price
 
 
 if __name__ == "__main__":
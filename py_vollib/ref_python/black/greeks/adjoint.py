@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+"""
+py_vollib.ref_python.black.greeks.adjoint
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+A library for option pricing, implied volatility, and
+greek calculation.  py_vollib is based on lets_be_rational,
+a Python wrapper for LetsBeRational by Peter Jaeckel as
+described below.
+
+:copyright: © 2017 Gammon Capital LLC
+:license: MIT, see LICENSE for more details.
+
+py_vollib.ref_python is a pure python version of py_vollib without any dependence on LetsBeRational. It is provided purely as a reference implementation for sanity checking. It is not recommended for industrial use.
++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+"""
+
+
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+
+# Related third party imports
+import numpy
+
+# Local application/library specific imports
+from py_vollib.curves import zero_rate
+from py_vollib.helpers.adjoint import gradient
+from py_vollib.ref_python.black import black
+from py_vollib.ref_python.black.greeks import automatic
+
+
+# -----------------------------------------------------------------------------
+# FUNCTIONS - ADJOINT BOOK SENSITIVITIES
+
+
+def book_sensitivities(flag, F, K, t, r, sigma, quantity=1.0):
+    """Returns the value of a book of Black options and its
+    sensitivities to every input, from one forward and one backward sweep.
+
+    The inputs broadcast against each other.  The sensitivity to an input
+    has the shape of that input: an input shared by the whole book, given
+    as a scalar, gets the total sensitivity of the book, while an input
+    given per option gets one sensitivity per option.  Sensitivities are
+    plain partial derivatives of the book value, not scaled like greeks.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param F: underlying futures price
+    :type F: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: annual risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param sigma: volatility
+    :type sigma: float or numpy.ndarray
+    :param quantity: number of options held in each position
+    :type quantity: float or numpy.ndarray
+
+    :returns:  dict with keys 'value', 'F', 't', 'r', 'sigma'
+
+    >>> F = 100.0
+    >>> K = numpy.array([90.0, 100.0, 110.0])
+    >>> sigma = numpy.array([.25, .2, .22])
+    >>> t, r = .5, .02
+    >>> quantity = numpy.array([10.0, -5.0, 3.0])
+    >>> flag = ['p', 'c', 'c']
+
+    >>> book = book_sensitivities(flag, F, K, t, r, sigma, quantity)
+    >>> greeks = automatic.greeks(flag, F, K, t, r, sigma)
+    >>> abs(book['F'] - numpy.sum(quantity * greeks['delta'])) < 1e-12
+    True
+    >>> numpy.allclose(book['sigma'], quantity * greeks['vega'] * 100, rtol=1e-12, atol=0)
+    True
+    """
+
+    r = zero_rate(r, t)
+    book = lambda F, t, r, sigma: quantity * black(flag, F, K, t, r, sigma)
+    value, (d_F, d_t, d_r, d_sigma) = gradient(book, (F, t, r, sigma), range(4))
+
+    return {
+        'value': value,
+        'F': d_F,
+        't': d_t,
+        'r': d_r,
+        'sigma': d_sigma,
+    }
+
+
+if __name__ == "__main__":
+    from py_vollib.helpers.doctest_helper import run_doctest
+    run_doctest()
@@ -26,14 +26,15 @@ from __future__ import division
 
 # Related third party imports
 import numpy
-from scipy.stats import norm
 
 # Local application/library specific imports
+from py_vollib.curves import zero_rate
 from py_vollib.helpers import pdf
+from py_vollib.helpers.distributions import ndtr
 from py_vollib.ref_python.black import d1, d2, black
 
 
-N = norm.cdf
+N = ndtr
 
 
 # -----------------------------------------------------------------------------
@@ -69,6 +70,7 @@ def delta(flag, F, K, t, r, sigma):
     True
     """
 
+    r = zero_rate(r, t)
     D1 = d1(F, K, t, r, sigma)
 
     if flag == 'p':
@@ -112,6 +114,7 @@ def theta(flag, F, K, t, r, sigma):
     True
     """
 
+    r = zero_rate(r, t)
     e_to_the_minus_rt = numpy.exp(-r * t)
     two_sqrt_t = 2 * numpy.sqrt(t)
 
@@ -165,6 +168,7 @@ def gamma(flag, F, K, t, r, sigma):
     True
     """
 
+    r = zero_rate(r, t)
     D1 = d1(F, K, t, r, sigma)
     return pdf(D1) * numpy.exp(-r * t) / (F * sigma * numpy.sqrt(t))
 
@@ -208,6 +212,7 @@ def vega(flag, F, K, t, r, sigma):
     True
     """
 
+    r = zero_rate(r, t)
     D1 = d1(F, K, t, r, sigma)
     return F * numpy.exp(-r * t) * pdf(D1) * numpy.sqrt(t) * 0.01
 
@@ -255,6 +260,7 @@ def rho(flag, F, K, t, r, sigma):
     True
     """
 
+    r = zero_rate(r, t)
     return -t * black(flag, F, K, t, r, sigma) * .01
 
 
@@ -26,6 +26,7 @@ py_vollib.ref_python is a pure python version of py_vollib without any dependenc
 # Related third party imports
 
 # Local application/library specific imports
+from py_vollib.curves import zero_rate
 from py_vollib.ref_python.black import black
 from py_vollib.helpers.numerical_greeks import delta as numerical_delta
 from py_vollib.helpers.numerical_greeks import vega as numerical_vega
@@ -61,6 +62,7 @@ def delta(flag, F, K, t, r, sigma):
     :returns:  float 
     """
 
+    r = zero_rate(r, t)
     b = 0
 
     return numerical_delta(flag, F, K, t, r, sigma, b, f)
@@ -85,6 +87,7 @@ def theta(flag, F, K, t, r, sigma):
     :returns:  float 
     """
 
+    r = zero_rate(r, t)
     b = 0
 
     return numerical_theta(flag, F, K, t, r, sigma, b, f)
@@ -109,6 +112,7 @@ def vega(flag, F, K, t, r, sigma):
     :returns:  float 
     """
 
+    r = zero_rate(r, t)
     b = 0
 
     return numerical_vega(flag, F, K, t, r, sigma, b, f)
@@ -133,6 +137,7 @@ def rho(flag, F, K, t, r, sigma):
     :returns:  float 
     """
 
+    r = zero_rate(r, t)
     b = 0
 
     return numerical_rho(flag, F, K, t, r, sigma, b, f)
@@ -157,6 +162,7 @@ def gamma(flag, F, K, t, r, sigma):
     :returns:  float 
     """
 
+    r = zero_rate(r, t)
     b = 0
 
     return numerical_gamma(flag, F, K, t, r, sigma, b, f)
@@ -26,12 +26,16 @@ from __future__ import division
 
 # Related third party imports
 import numpy
-from scipy.stats import norm
 
 # Local application/library specific imports
+from py_vollib.curves import zero_rate
+from py_vollib.helpers import as_dtype, binary_flag_array
+from py_vollib.helpers.distributions import ndtr
+from py_vollib.helpers.profiling import profiler
+from py_vollib.helpers.workspace import Workspace, compute_dtype, output
 
 
-N = norm.cdf
+N = ndtr
 
 
 # -----------------------------------------------------------------------------
@@ -65,12 +69,11 @@ def d1(S, K, t, r, sigma):  # see Hull, page 292
     True
     """
 
+    r = zero_rate(r, t)
     sigma_squared = sigma * sigma
-    numerator = numpy.log(S / float(K)) + (r + sigma_squared / 2.) * t
+    numerator = numpy.log(S / K) + (r + sigma_squared / 2.) * t
     denominator = sigma * numpy.sqrt(t)
 
-    if not denominator:
-        print ('')
     return numerator / denominator
 
 
@@ -102,40 +105,127 @@ def d2(S, K, t, r, sigma):  # see Hull, page 292
     True
     """
 
+    r = zero_rate(r, t)
     return d1(S, K, t, r, sigma) - sigma * numpy.sqrt(t)
 
 
-def black_scholes(flag, S, K, t, r, sigma):
+def black_scholes(flag, S, K, t, r, sigma, profile=False, dtype=None, out=None, workspace=None):
     """Return the Black-Scholes option price implemented in
         python (for reference).
 
+    All arguments may be arrays, including ``flag``; they broadcast
+    against each other.
+
     :param S: underlying asset price
-    :type S: float
+    :type S: float or numpy.ndarray
     :param K: strike price
-    :type K: float
+    :type K: float or numpy.ndarray
     :param sigma: annualized standard deviation, or volatility
-    :type sigma: float
+    :type sigma: float or numpy.ndarray
     :param t: time to expiration in years
-    :type t: float
+    :type t: float or numpy.ndarray
     :param r: risk-free interest rate
-    :type r: float
+    :type r: float or numpy.ndarray
     :param flag: 'c' or 'p' for call or put.
-    :type flag: str
+    :type flag: str or numpy.ndarray
+    :param profile: also return a ``py_vollib.helpers.profiling.Profile`` of the call
+    :type profile: bool
+    :param dtype: floating point type to compute in, see ``py_vollib.ref_python``
+    :type dtype: numpy.dtype or None
+    :param out: array to write the prices into, see ``py_vollib.helpers.workspace``
+    :type out: numpy.ndarray or None
+    :param workspace: scratch arrays to compute in place with
+    :type workspace: py_vollib.helpers.workspace.Workspace or None
 
     >>> S,K,t,r,sigma = 60,65,.25,.08,.3
     >>> expected = 2.13336844492
     >>> actual = black_scholes('c',S,K,t,r,sigma)
     >>> abs(expected-actual) < 1e-11
     True
+
+    >>> actual = black_scholes(['c', 'p'], S, numpy.array([60, 65]), t, r, sigma)
+    >>> expected = [black_scholes('c', S, 60, t, r, sigma), black_scholes('p', S, 65, t, r, sigma)]
+    >>> numpy.allclose(actual, expected, rtol=1e-15, atol=0)
+    True
+
+    >>> price = numpy.empty(2)
+    >>> _ = black_scholes(['c', 'p'], S, numpy.array([60, 65]), t, r, sigma, out=price)
+    >>> numpy.array_equal(price, actual)
+    True
     """
 
+    stages = profiler(profile)
+    if out is not None or workspace is not None:
+        price = _black_scholes_into(flag, S, K, t, r, sigma, dtype, out, workspace or Workspace(), stages)
+        return (price, stages) if profile else price
+
+    theta = binary_flag_array(flag)
+    theta, S, K, t, sigma = as_dtype(dtype, theta, S, K, t, sigma)
+    stages.lap('input', theta)
+
+    r = zero_rate(r, t)
+    r = as_dtype(dtype, r)[0]
     e_to_the_minus_rt = numpy.exp(-r * t)
+    stages.lap('setup', r, e_to_the_minus_rt)
+
     D1 = d1(S, K, t, r, sigma)
     D2 = d2(S, K, t, r, sigma)
-    if flag == 'c':
-        return S * N(D1) - K * e_to_the_minus_rt * N(D2)
-    else:
-        return - S * N(-D1) + K * e_to_the_minus_rt * N(-D2)
+    price = theta * (S * N(theta * D1) - K * e_to_the_minus_rt * N(theta * D2))
+    price = as_dtype(dtype, price)[0]
+    stages.lap('solver', D1, D2, price)
+
+    if profile:
+        return price, stages
+    return price
+
+
+def _black_scholes_into(flag, S, K, t, r, sigma, dtype, out, workspace, stages):
+    """Compute ``black_scholes`` in place, in the same order of
+    operations, into ``out`` and three scratch arrays of ``workspace``."""
+
+    dtype = compute_dtype(dtype, out)
+    theta = workspace.sign(flag, dtype)
+    S, K, t, sigma = as_dtype(dtype, S, K, t, sigma)
+    stages.lap('input', theta)
+
+    r = zero_rate(r, t)
+    r = as_dtype(dtype, r)[0]
+    shape = numpy.broadcast(theta, S, K, t, r, sigma).shape
+    out = output(out, shape, dtype)
+    a, b, c = [workspace.array(name, shape, dtype) for name in ('a', 'b', 'c')]
+    stages.lap('setup', out)
+
+    # d1 into a and d2 into b
+    numpy.divide(S, K, out=a)
+    numpy.log(a, out=a)
+    numpy.multiply(sigma, sigma, out=b)
+    numpy.divide(b, 2., out=b)
+    numpy.add(r, b, out=b)
+    numpy.multiply(b, t, out=b)
+    numpy.add(a, b, out=a)
+    numpy.sqrt(t, out=b)
+    numpy.multiply(sigma, b, out=b)
+    numpy.divide(a, b, out=a)
+    numpy.subtract(a, b, out=b)
+
+    # S * N(theta * d1) into a
+    numpy.multiply(theta, a, out=a)
+    N(a, out=a)
+    numpy.multiply(S, a, out=a)
+
+    # K * e^(-rt) * N(theta * d2) into b
+    numpy.multiply(theta, b, out=b)
+    N(b, out=b)
+    numpy.negative(r, out=c)
+    numpy.multiply(c, t, out=c)
+    numpy.exp(c, out=c)
+    numpy.multiply(K, c, out=c)
+    numpy.multiply(c, b, out=b)
+
+    numpy.subtract(a, b, out=a)
+    price = numpy.multiply(theta, a, out=out)
+    stages.lap('solver', price)
+    return price
 
 
 if __name__ == "__main__":
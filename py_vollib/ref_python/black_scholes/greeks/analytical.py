@@ -26,14 +26,15 @@ from __future__ import division
 
 # Related third party imports
 import numpy
-from scipy.stats import norm
 
 # Local application/library specific imports
+from py_vollib.curves import zero_rate
 from py_vollib.helpers import pdf
+from py_vollib.helpers.distributions import ndtr
 from py_vollib.ref_python.black_scholes import d1, d2
 
 
-N = norm.cdf
+N = ndtr
 
 
 # -----------------------------------------------------------------------------
@@ -70,6 +71,7 @@ def delta(flag, S, K, t, r, sigma):
     True
     """
 
+    r = zero_rate(r, t)
     d_1 = d1(S, K, t, r, sigma)
 
     if flag == 'p':
@@ -126,6 +128,7 @@ def theta(flag, S, K, t, r, sigma):
     True
     """
 
+    r = zero_rate(r, t)
     two_sqrt_t = 2 * numpy.sqrt(t)
 
     D1 = d1(S, K, t, r, sigma)
@@ -173,6 +176,7 @@ def gamma(flag, S, K, t, r, sigma):
     True
     """
 
+    r = zero_rate(r, t)
     d_1 = d1(S, K, t, r, sigma)
     v_squared = sigma ** 2
     return pdf(d_1) / (S * sigma * numpy.sqrt(t))
@@ -213,6 +217,7 @@ def vega(flag, S, K, t, r, sigma):
     True
     """
 
+    r = zero_rate(r, t)
     d_1 = d1(S, K, t, r, sigma)
     return S * pdf(d_1) * numpy.sqrt(t) * 0.01
 
@@ -252,6 +257,7 @@ def rho(flag, S, K, t, r, sigma):
     True
     """
 
+    r = zero_rate(r, t)
     d_2 = d2(S, K, t, r, sigma)
     e_to_the_minus_rt = numpy.exp(-r * t)
     if flag == 'c':
@@ -26,6 +26,7 @@ py_vollib.ref_python is a pure python version of py_vollib without any dependenc
 # Related third party imports
 
 # Local application/library specific imports
+from py_vollib.curves import zero_rate
 from py_vollib.ref_python.black_scholes import black_scholes
 from py_vollib.helpers.numerical_greeks import delta as numerical_delta
 from py_vollib.helpers.numerical_greeks import vega as numerical_vega
@@ -63,6 +64,7 @@ def delta(flag, S, K, t, r, sigma):
     :type flag: str
     """
 
+    r = zero_rate(r, t)
     b = r
 
     return numerical_delta(flag, S, K, t, r, sigma, b, f)
@@ -85,6 +87,7 @@ def theta(flag, S, K, t, r, sigma):
     :type flag: str
     """
 
+    r = zero_rate(r, t)
     b = r
 
     return numerical_theta(flag, S, K, t, r, sigma, b, f)
@@ -107,6 +110,7 @@ def vega(flag, S, K, t, r, sigma):
     :type flag: str
     """
 
+    r = zero_rate(r, t)
     b = r
 
     return numerical_vega(flag, S, K, t, r, sigma, b, f)
@@ -129,6 +133,7 @@ def rho(flag, S, K, t, r, sigma):
     :type flag: str
     """
 
+    r = zero_rate(r, t)
     b = r
 
     return numerical_rho(flag, S, K, t, r, sigma, b, f)
@@ -151,6 +156,7 @@ def gamma(flag, S, K, t, r, sigma):
     :type flag: str
     """
 
+    r = zero_rate(r, t)
     b = r
 
     return numerical_gamma(flag, S, K, t, r, sigma, b, f)
@@ -26,12 +26,16 @@ from __future__ import division
 
 # Related third party imports
 import numpy
-from scipy.stats import norm
 
 # Local application/library specific imports
+from py_vollib.curves import zero_rate
+from py_vollib.helpers import as_dtype, binary_flag_array
+from py_vollib.helpers.distributions import ndtr
+from py_vollib.helpers.profiling import profiler
+from py_vollib.helpers.workspace import Workspace, compute_dtype, output
 
 
-N = norm.cdf
+N = ndtr
 
 
 # -----------------------------------------------------------------------------
@@ -69,7 +73,9 @@ def d1(S, K, t, r, sigma, q):
     True
     """
 
-    numerator = numpy.log(S / float(K)) + ((r - q) + sigma * sigma / 2.0) * t
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
+    numerator = numpy.log(S / K) + ((r - q) + sigma * sigma / 2.0) * t
     denominator = sigma * numpy.sqrt(t)
     return numerator / denominator
 
@@ -106,6 +112,8 @@ def d2(S, K, t, r, sigma, q):
     True
     """
 
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
     return d1(S, K, t, r, sigma, q) - sigma * numpy.sqrt(t)
 
 
@@ -127,6 +135,8 @@ def bsm_call(S, K, t, r, sigma, q):
     :type q: float
     """
 
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
     D1 = d1(S, K, t, r, sigma, q)
     D2 = d2(S, K, t, r, sigma, q)
 
@@ -166,29 +176,42 @@ def bsm_put(S, K, t, r, sigma, q):
     True
     """
 
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
     D1 = d1(S, K, t, r, sigma, q)
     D2 = d2(S, K, t, r, sigma, q)
     return K * numpy.exp(-r * t) * N(-D2) - S * numpy.exp(-q * t) * N(-D1)
 
 
-def black_scholes_merton(flag, S, K, t, r, sigma, q):
-    """Return the Black-Scholes-Merton call price implemented in
+def black_scholes_merton(flag, S, K, t, r, sigma, q, profile=False, dtype=None, out=None, workspace=None):
+    """Return the Black-Scholes-Merton option price implemented in
     python (for reference).
 
+    All arguments may be arrays, including ``flag``; they broadcast
+    against each other.
+
     :param S: underlying asset price
-    :type S: float
+    :type S: float or numpy.ndarray
     :param K: strike price
-    :type K: float
+    :type K: float or numpy.ndarray
     :param sigma: annualized standard deviation, or volatility
-    :type sigma: float
+    :type sigma: float or numpy.ndarray
     :param t: time to expiration in years
-    :type t: float
+    :type t: float or numpy.ndarray
     :param r: risk-free interest rate
-    :type r: float
+    :type r: float or numpy.ndarray
     :param q: annualized continuous dividend rate
-    :type q: float
+    :type q: float or numpy.ndarray
     :param flag: 'c' or 'p' for call or put.
-    :type flag: str
+    :type flag: str or numpy.ndarray
+    :param profile: also return a ``py_vollib.helpers.profiling.Profile`` of the call
+    :type profile: bool
+    :param dtype: floating point type to compute in, see ``py_vollib.ref_python``
+    :type dtype: numpy.dtype or None
+    :param out: array to write the prices into, see ``py_vollib.helpers.workspace``
+    :type out: numpy.ndarray or None
+    :param workspace: scratch arrays to compute in place with
+    :type workspace: py_vollib.helpers.workspace.Workspace or None
 
     From Espen Haug, The Complete Guide To Option Pricing Formulas
     Page 4
@@ -204,12 +227,98 @@ def black_scholes_merton(flag, S, K, t, r, sigma, q):
     >>> p_calc = black_scholes_merton('p', S, K, t, r, sigma, q)
     >>> abs(p_published_value - p_calc) < 0.0001
     True
+
+    >>> actual = black_scholes_merton(['c', 'p'], S, numpy.array([90, 95]), t, r, sigma, q)
+    >>> expected = [bsm_call(S, 90, t, r, sigma, q), bsm_put(S, 95, t, r, sigma, q)]
+    >>> numpy.allclose(actual, expected, rtol=1e-15, atol=0)
+    True
+
+    >>> price = numpy.empty(2)
+    >>> _ = black_scholes_merton(['c', 'p'], S, numpy.array([90, 95]), t, r, sigma, q, out=price)
+    >>> numpy.array_equal(price, actual)
+    True
     """
 
-    if flag == 'c':
-        return bsm_call(S, K, t, r, sigma, q)
-    else:
-        return bsm_put(S, K, t, r, sigma, q)
+    stages = profiler(profile)
+    if out is not None or workspace is not None:
+        price = _black_scholes_merton_into(flag, S, K, t, r, sigma, q, dtype, out, workspace or Workspace(), stages)
+        return (price, stages) if profile else price
+
+    theta = binary_flag_array(flag)
+    theta, S, K, t, sigma = as_dtype(dtype, theta, S, K, t, sigma)
+    stages.lap('input', theta)
+
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
+    r, q = as_dtype(dtype, r, q)
+    carry = numpy.exp(-q * t)
+    discount = numpy.exp(-r * t)
+    stages.lap('setup', r, q, carry, discount)
+
+    D1 = d1(S, K, t, r, sigma, q)
+    D2 = d2(S, K, t, r, sigma, q)
+    price = theta * (S * carry * N(theta * D1) - K * discount * N(theta * D2))
+    price = as_dtype(dtype, price)[0]
+    stages.lap('solver', D1, D2, price)
+
+    if profile:
+        return price, stages
+    return price
+
+
+def _black_scholes_merton_into(flag, S, K, t, r, sigma, q, dtype, out, workspace, stages):
+    """Compute ``black_scholes_merton`` in place, in the same order of
+    operations, into ``out`` and three scratch arrays of ``workspace``."""
+
+    dtype = compute_dtype(dtype, out)
+    theta = workspace.sign(flag, dtype)
+    S, K, t, sigma = as_dtype(dtype, S, K, t, sigma)
+    stages.lap('input', theta)
+
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
+    r, q = as_dtype(dtype, r, q)
+    shape = numpy.broadcast(theta, S, K, t, r, sigma, q).shape
+    out = output(out, shape, dtype)
+    a, b, c = [workspace.array(name, shape, dtype) for name in ('a', 'b', 'c')]
+    stages.lap('setup', out)
+
+    # d1 into a and d2 into b
+    numpy.divide(S, K, out=a)
+    numpy.log(a, out=a)
+    numpy.subtract(r, q, out=b)
+    numpy.multiply(sigma, sigma, out=c)
+    numpy.divide(c, 2.0, out=c)
+    numpy.add(b, c, out=b)
+    numpy.multiply(b, t, out=b)
+    numpy.add(a, b, out=a)
+    numpy.sqrt(t, out=b)
+    numpy.multiply(sigma, b, out=b)
+    numpy.divide(a, b, out=a)
+    numpy.subtract(a, b, out=b)
+
+    # S * carry * N(theta * d1) into a
+    numpy.multiply(theta, a, out=a)
+    N(a, out=a)
+    numpy.negative(q, out=c)
+    numpy.multiply(c, t, out=c)
+    numpy.exp(c, out=c)
+    numpy.multiply(S, c, out=c)
+    numpy.multiply(c, a, out=a)
+
+    # K * discount * N(theta * d2) into b
+    numpy.multiply(theta, b, out=b)
+    N(b, out=b)
+    numpy.negative(r, out=c)
+    numpy.multiply(c, t, out=c)
+    numpy.exp(c, out=c)
+    numpy.multiply(K, c, out=c)
+    numpy.multiply(c, b, out=b)
+
+    numpy.subtract(a, b, out=a)
+    price = numpy.multiply(theta, a, out=out)
+    stages.lap('solver', price)
+    return price
 
 
 if __name__ == "__main__":
@@ -26,14 +26,15 @@ from __future__ import division
 
 # Related third party imports
 import numpy
-from scipy.stats import norm
 
 # Local application/library specific imports
+from py_vollib.curves import zero_rate
 from py_vollib.helpers import pdf
+from py_vollib.helpers.distributions import ndtr
 from py_vollib.ref_python.black_scholes_merton import d1, d2
 
 
-N = norm.cdf
+N = ndtr
 
 
 # -----------------------------------------------------------------------------
@@ -75,6 +76,8 @@ def delta(flag, S, K, t, r, sigma, q):
     True
     """
 
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
     D1 = d1(S, K, t, r, sigma, q)
 
     if flag == 'p':
@@ -136,6 +139,8 @@ def theta(flag, S, K, t, r, sigma, q):
     True
     """
 
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
     D1 = d1(S, K, t, r, sigma, q)
     D2 = d2(S, K, t, r, sigma, q)
 
@@ -192,6 +197,8 @@ def gamma(flag, S, K, t, r, sigma, q):
     True
     """
 
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
     D1 = d1(S, K, t, r, sigma, q)
     numerator = numpy.exp(-q * t) * pdf(D1)
     denominator = S * sigma * numpy.sqrt(t)
@@ -239,6 +246,8 @@ def vega(flag, S, K, t, r, sigma, q):
     True
     """
 
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
     D1 = d1(S, K, t, r, sigma, q)
 
     return S * numpy.exp(-q * t) * pdf(D1) * numpy.sqrt(t) * 0.01
@@ -284,6 +293,8 @@ def rho(flag, S, K, t, r, sigma, q):
     True
     """
 
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
     D2 = d2(S, K, t, r, sigma, q)
 
     if flag == 'c':
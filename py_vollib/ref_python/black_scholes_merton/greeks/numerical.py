@@ -26,6 +26,7 @@ py_vollib.ref_python is a pure python version of py_vollib without any dependenc
 # Related third party imports
 
 # Local application/library specific imports
+from py_vollib.curves import zero_rate
 from py_vollib.ref_python.black_scholes_merton import black_scholes_merton
 from py_vollib.helpers.numerical_greeks import delta as numerical_delta
 from py_vollib.helpers.numerical_greeks import vega as numerical_vega
@@ -66,6 +67,8 @@ def delta(flag, S, K, t, r, sigma, q):
     :returns:  float
     """
 
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
     return numerical_delta(flag, S, K, t, r, sigma, r-q, f)
 
 
@@ -90,6 +93,8 @@ def theta(flag, S, K, t, r, sigma, q):
     :returns:  float
     """
 
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
     return numerical_theta(flag, S, K, t, r, sigma, r-q, f)
 
 
@@ -113,6 +118,8 @@ def vega(flag, S, K, t, r, sigma, q):
 
     :returns:  float
     """
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
     return numerical_vega(flag, S, K, t, r, sigma, r-q, f)
 
 
@@ -136,6 +143,8 @@ def rho(flag, S, K, t, r, sigma, q):
 
     :returns:  float
     """
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
     return numerical_rho(flag, S, K, t, r, sigma, r-q, f)
 
 
@@ -159,6 +168,8 @@ def gamma(flag, S, K, t, r, sigma, q):
 
     :returns:  float
     """
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
     return numerical_gamma(flag, S, K, t, r, sigma, r-q, f)
 
 
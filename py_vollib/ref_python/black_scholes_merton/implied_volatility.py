@@ -24,15 +24,26 @@ py_vollib.ref_python is a pure python version of py_vollib without any dependenc
 # Standard library imports
 
 # Related third party imports
-from scipy.optimize import brentq
+import numpy
 
 # Local application/library specific imports
+from py_vollib.curves import zero_rate
+from py_vollib.helpers import binary_flag_array, pdf
+from py_vollib.helpers.distributions import ndtr
+from py_vollib.helpers.instrumentation import instrumented, record_iterations
+from py_vollib.helpers.profiling import profiler
+from py_vollib.helpers.workspace import compute_dtype, output
 from py_vollib.ref_python.black_scholes_merton import black_scholes_merton
+from py_vollib.ref_python.solvers import broadcast_columns, newton_bisection, select_rows
+
+
+N = ndtr
 
 
 # -----------------------------------------------------------------------------
 # FUNCTIONS
 
+@instrumented
 def implied_volatility(price, S, K, t, r, q, flag):
     """Calculate the Black-Scholes-Merton implied volatility.
 
@@ -72,17 +83,140 @@ def implied_volatility(price, S, K, t, r, q, flag):
     0.30000000000000027
     """
 
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
     f = lambda sigma: price - black_scholes_merton(flag, S, K, t, r, sigma, q)
 
-    return brentq(
+    from scipy.optimize import brentq
+    sigma, result = brentq(
         f,
         a=1e-12,
         b=100,
         xtol=1e-15,
         rtol=1e-15,
         maxiter=1000,
-        full_output=False
+        full_output=True
     )
+    record_iterations({result.iterations: 1})
+    return sigma
+
+
+@instrumented
+def vectorized_implied_volatility(price, S, K, t, r, q, flag, full_output=False, profile=False,
+                                  dtype=None, escalate=True, out=None):
+    """Calculate the Black-Scholes-Merton implied volatility of many options at once.
+
+    All rows are solved together with a safeguarded Newton/bisection
+    iteration over the same bracket and tolerances as ``implied_volatility``.
+    Arguments broadcast against each other.  Rows without a root in the
+    bracket are returned as nan instead of raising.
+
+    :param price: the Black-Scholes-Merton option price
+    :type price: float or numpy.ndarray
+    :param S: underlying asset price
+    :type S: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: risk-free interest rate
+    :type r: float or numpy.ndarray
+    :param q: annualized continuous dividend rate
+    :type q: float or numpy.ndarray
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param full_output: also return the per-row converged mask
+    :type full_output: bool
+    :param profile: also return a ``py_vollib.helpers.profiling.Profile`` of the call
+    :type profile: bool
+    :param dtype: floating point type to solve in; numpy.float32 halves the
+        memory traffic, see ``py_vollib.ref_python``
+    :type dtype: numpy.dtype or None
+    :param escalate: solve the rows that do not converge in single
+        precision again in double precision
+    :type escalate: bool
+    :param out: array to write the implied volatilities into, of their
+        broadcast shape and of the type they are solved in
+    :type out: numpy.ndarray or None
+
+    :returns:  float or numpy.ndarray, or a tuple with the converged mask if full_output is True,
+        followed by the profile if profile is True
+
+    >>> S = 100
+    >>> K = numpy.array([90, 100, 110])
+    >>> sigma = numpy.array([.3, .2, .25])
+    >>> flag = ['p', 'c', 'c']
+    >>> t = .5
+    >>> r = .01
+    >>> q = .02
+    >>> price = [black_scholes_merton(f, S, k, t, r, v, q) for f, k, v in zip(flag, K, sigma)]
+    >>> iv, converged = vectorized_implied_volatility(price, S, K, t, r, q, flag, full_output=True)
+    >>> numpy.allclose(iv, sigma, rtol=1e-12, atol=0)
+    True
+    >>> converged
+    array([ True,  True,  True])
+    """
+
+    stages = profiler(profile)
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
+    stages.lap('setup', r, q)
+
+    arguments = (price, S, K, t, r, q, binary_flag_array(flag))
+    shape = numpy.broadcast(*arguments).shape
+    columns = broadcast_columns(arguments, compute_dtype(dtype, out))
+    if out is not None:
+        out = output(out, shape, columns[0].dtype)
+    stages.lap('input', *columns)
+
+    sigma, converged = _solve(*columns, stages=stages)
+
+    if escalate and sigma.dtype != numpy.float64 and not converged.all():
+        rows = numpy.flatnonzero(~converged)
+        sigma[rows], converged[rows] = _solve(*select_rows(arguments, shape, rows), stages=stages)
+
+    if out is None:
+        sigma = sigma.reshape(shape)[()]
+    else:
+        out[...] = sigma.reshape(shape)
+        sigma = out
+    converged = converged.reshape(shape)[()]
+    stages.lap('output', sigma)
+
+    if full_output:
+        return (sigma, converged, stages) if profile else (sigma, converged)
+    return (sigma, stages) if profile else sigma
+
+
+def _solve(price, S, K, t, r, q, theta, stages):
+    """Solve flat columns of arguments in their floating point type."""
+
+    def f(sigma, rows):
+        sqrt_t = numpy.sqrt(t[rows])
+        d_1 = (numpy.log(S[rows] / K[rows]) + (r[rows] - q[rows] + sigma * sigma / 2.0) * t[rows]) / (sigma * sqrt_t)
+        d_2 = d_1 - sigma * sqrt_t
+        discounted_S = S[rows] * numpy.exp(-q[rows] * t[rows])
+        discounted_K = K[rows] * numpy.exp(-r[rows] * t[rows])
+        value = theta[rows] * (discounted_S * N(theta[rows] * d_1) - discounted_K * N(theta[rows] * d_2))
+        return value - price[rows], discounted_S * pdf(d_1) * sqrt_t
+
+    x0 = numpy.sqrt(2 * numpy.abs(numpy.log(S / K) + (r - q) * t) / t)
+    stages.lap('setup', x0)
+
+    sigma, converged = newton_bisection(
+        f,
+        a=1e-12,
+        b=100,
+        x0=x0,
+        xtol=1e-15,
+        rtol=1e-15,
+        maxiter=1000,
+        full_output=True,
+        dtype=x0.dtype
+    )
+    stages.lap('solver', sigma, converged)
+
+    return sigma, converged
 
 
 if __name__ == "__main__":
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+
+"""
+py_vollib.ref_python.solvers
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+A library for option pricing, implied volatility, and
+greek calculation.  py_vollib is based on lets_be_rational,
+a Python wrapper for LetsBeRational by Peter Jaeckel as
+described below.
+
+:copyright: © 2017 Gammon Capital LLC
+:license: MIT, see LICENSE for more details.
+
+py_vollib.ref_python is a pure python version of py_vollib without any dependence on LetsBeRational. It is provided purely as a reference implementation for sanity checking. It is not recommended for industrial use.
++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+This module provides a safeguarded Newton/bisection root finder that solves
+many independent one-dimensional problems at once.  Each row keeps its own
+bracket; a Newton step is taken whenever it lands strictly inside the
+bracket, otherwise the row is bisected.  Rows are dropped from the working
+set as soon as they converge, so later iterations only evaluate the rows
+that still need work.  While instrumentation is enabled, the number of
+iterations each row took is recorded against the calling implied
+volatility function.
+
+The iterates may be single precision, in which case the relative
+tolerance is raised to two machine epsilons of float32, as the double
+precision tolerances cannot be met.  The helpers below lay the arguments
+of the solvers out as one flat array per argument.
+
+"""
+
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+from __future__ import division
+
+# Related third party imports
+import numpy
+
+# Local application/library specific imports
+from py_vollib.helpers.instrumentation import is_enabled, record_iterations
+
+
+# -----------------------------------------------------------------------------
+# FUNCTIONS - ROOT FINDING
+
+
+def newton_bisection(f, a, b, x0, xtol=1e-15, rtol=1e-15, maxiter=1000, full_output=False, dtype=float):
+    """Find the roots of a vector of functions on the brackets [a, b].
+
+    ``f`` is called as ``f(x, rows)`` where ``rows`` is an integer index
+    array selecting the problems that are still being solved and ``x`` holds
+    their current iterates.  It must return the tuple ``(value, derivative)``
+    for those rows.  Rows whose function values at ``a`` and ``b`` have the
+    same sign have no bracketed root and are returned as nan.  The result
+    has the broadcast shape of ``a``, ``b`` and ``x0``.
+
+    The convergence test mirrors ``scipy.optimize.brentq``: a row is done
+    once its step, or its bracket, is no larger than ``xtol + rtol * |x|``.
+
+    :param f: vector objective returning values and derivatives
+    :type f: callable
+    :param a: lower ends of the brackets
+    :type a: float or numpy.ndarray
+    :param b: upper ends of the brackets
+    :type b: float or numpy.ndarray
+    :param x0: starting points, clipped into the brackets
+    :type x0: numpy.ndarray
+    :param xtol: absolute tolerance
+    :type xtol: float
+    :param rtol: relative tolerance
+    :type rtol: float
+    :param maxiter: maximum number of iterations
+    :type maxiter: int
+    :param full_output: also return the per-row converged mask
+    :type full_output: bool
+    :param dtype: floating point type of the iterates
+    :type dtype: numpy.dtype
+
+    :returns:  numpy.ndarray, or (numpy.ndarray, numpy.ndarray) if full_output is True
+
+    >>> c = numpy.array([2., 3., 4.])
+    >>> f = lambda x, rows: (x * x - c[rows], 2 * x)
+    >>> root, converged = newton_bisection(f, 0., 10., numpy.ones(len(c)), full_output=True)
+    >>> numpy.allclose(root, numpy.sqrt(c), rtol=1e-15, atol=0)
+    True
+    >>> converged
+    array([ True,  True,  True])
+
+    >>> c = numpy.array([2., 200.])
+    >>> root, converged = newton_bisection(f, 0., 10., numpy.ones(len(c)), full_output=True)
+    >>> converged
+    array([ True, False])
+    >>> numpy.isnan(root[1])
+    True
+
+    >>> root = newton_bisection(f, 0., 10., numpy.ones(2, dtype=numpy.float32), dtype=numpy.float32)
+    >>> root.dtype, bool(abs(root[0] - numpy.sqrt(2.)) < 1e-6)
+    (dtype('float32'), True)
+    """
+
+    rtol = max(rtol, 2 * numpy.finfo(dtype).eps)
+    a, b, x0 = numpy.broadcast_arrays(*[numpy.asarray(v, dtype=dtype) for v in (a, b, x0)])
+    shape = x0.shape
+    lo = a.ravel().copy()
+    hi = b.ravel().copy()
+    x = numpy.clip(x0.ravel(), lo, hi)
+    rows = numpy.arange(x.size)
+
+    f_lo = f(lo, rows)[0]
+    f_hi = f(hi, rows)[0]
+    sign_lo = numpy.sign(f_lo)
+
+    root = numpy.full(x.size, numpy.nan, dtype=dtype)
+    converged = numpy.zeros(x.size, dtype=bool)
+
+    at_lo = f_lo == 0
+    at_hi = (f_hi == 0) & ~at_lo
+    root[at_lo], root[at_hi] = lo[at_lo], hi[at_hi]
+    converged[at_lo | at_hi] = True
+
+    active = (sign_lo * numpy.sign(f_hi) < 0) & ~converged
+    histogram = {} if is_enabled() else None
+    if histogram is not None and converged.any():
+        histogram[0] = int(converged.sum())
+
+    with numpy.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        for iteration in range(1, maxiter + 1):
+            rows = numpy.flatnonzero(active)
+            if not rows.size:
+                break
+
+            x_k = x[rows]
+            f_k, f_prime_k = f(x_k, rows)
+
+            below = numpy.sign(f_k) == sign_lo[rows]
+            lo_k = numpy.where(below, x_k, lo[rows])
+            hi_k = numpy.where(below, hi[rows], x_k)
+
+            x_next = x_k - f_k / f_prime_k
+            bisect = ~((x_next > lo_k) & (x_next < hi_k))
+            x_next = numpy.where(bisect, .5 * (lo_k + hi_k), x_next)
+
+            tol = xtol + rtol * numpy.abs(x_next)
+            done = ((f_k == 0) |
+                    (numpy.abs(x_next - x_k) <= tol) |
+                    (hi_k - lo_k <= tol) |
+                    (x_next <= lo_k) | (x_next >= hi_k))
+            x_next = numpy.where(f_k == 0, x_k, x_next)
+
+            lo[rows], hi[rows], x[rows] = lo_k, hi_k, x_next
+
+            finished = rows[done]
+            root[finished] = x[finished]
+            converged[finished] = True
+            active[finished] = False
+            if histogram is not None and finished.size:
+                histogram[iteration] = int(finished.size)
+
+    if histogram is not None:
+        record_iterations(histogram, unconverged=x.size - converged.sum())
+
+    root = root.reshape(shape)
+    if full_output:
+        return root, converged.reshape(shape)
+    return root
+
+
+# -----------------------------------------------------------------------------
+# FUNCTIONS - ARGUMENTS
+
+
+def broadcast_columns(values, dtype=float):
+    """Broadcast values against each other, and flatten each of them to
+    a 1-d array of a floating point type.
+
+    :param values: the arguments of a vectorized solver
+    :type values: sequence of float or numpy.ndarray
+    :param dtype: floating point type of the columns
+    :type dtype: numpy.dtype
+
+    :returns:  list of numpy.ndarray
+
+    >>> broadcast_columns([[1, 2], 3.], numpy.float32)
+    [array([1., 2.], dtype=float32), array([3., 3.], dtype=float32)]
+    """
+
+    return [v.ravel() for v in numpy.broadcast_arrays(*[numpy.asarray(v, dtype=dtype) for v in values])]
+
+
+def select_rows(values, shape, rows, dtype=float):
+    """Return some rows of the columns of ``broadcast_columns``, without
+    broadcasting the other rows.
+
+    :param values: the arguments of a vectorized solver
+    :type values: sequence of float or numpy.ndarray
+    :param shape: their broadcast shape
+    :type shape: tuple
+    :param rows: indices into the flattened broadcast shape
+    :type rows: numpy.ndarray
+    :param dtype: floating point type of the columns
+    :type dtype: numpy.dtype
+
+    :returns:  list of numpy.ndarray
+
+    >>> select_rows([[[1, 2], [3, 4]], 5.], (2, 2), numpy.array([1, 2]))
+    [array([2., 3.]), array([5., 5.])]
+    """
+
+    shape = shape or (1,)
+    index = numpy.unravel_index(rows, shape)
+    return [numpy.broadcast_to(numpy.asarray(v, dtype=dtype), shape)[index] for v in values]
+
+
+if __name__ == "__main__":
+    from py_vollib.helpers.doctest_helper import run_doctest
+    run_doctest()
@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+"""
+py_vollib.scenarios
+~~~~~~~~~~~~~~~~~~~
+
+A library for option pricing, implied volatility, and
+greek calculation.  py_vollib is based on lets_be_rational,
+a Python wrapper for LetsBeRational by Peter Jaeckel as
+described below.
+
+:copyright: © 2017 Gammon Capital LLC
+:license: MIT, see LICENSE for more details.
+
+About LetsBeRational:
+~~~~~~~~~~~~~~~~~~~~~
+
+The source code of LetsBeRational resides at www.jaeckel.org/LetsBeRational.7z .
+
+::
+
+    ========================================================================================
+    Copyright © 2013-2014 Peter Jäckel.
+
+    Permission to use, copy, modify, and distribute this software is freely granted,
+    provided that this notice is preserved.
+
+    WARRANTY DISCLAIMER
+    The Software is provided "as is" without warranty of any kind, either express or implied,
+    including without limitation any implied warranties of condition, uninterrupted use,
+    merchantability, fitness for a particular purpose, or non-infringement.
+    ========================================================================================
+
+
+
+
+Scenario repricing:
+~~~~~~~~~~~~~~~~~~~
+
+A book of options is repriced over the grid formed by a vector of
+relative spot shocks, a vector of absolute volatility shocks and a vector
+of horizons.  Each input is given a shape that broadcasts along the grid
+axis it depends on, so intermediate terms are only as large as the axes
+they actually vary along, and only the final prices fill the whole grid.
+Positions are processed in chunks, which bounds the memory used by those
+temporaries however large the book is.
+
+"""
+
+
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+from __future__ import division
+
+# Related third party imports
+import numpy
+
+# Local application/library specific imports
+from py_vollib.curves import Curve, zero_rate
+from py_vollib.helpers import binary_flag_array
+from py_vollib.helpers.exceptions import InvalidArgument
+from py_vollib.ref_python.black_scholes_merton import black_scholes_merton
+
+
+# -----------------------------------------------------------------------------
+# DATA
+
+CHUNK_SIZE = 1024
+
+
+# -----------------------------------------------------------------------------
+# FUNCTIONS
+
+
+def scenario_pnl(flag, S, K, t, r, sigma, q, spot_shocks=(0.0,), vol_shocks=(0.0,), horizons=(0.0,),
+                 quantity=1.0, aggregate=False, chunk_size=CHUNK_SIZE, dtype=float):
+    """Calculate the Black-Scholes-Merton P&L of a book of options over a
+    grid of spot, volatility and horizon scenarios.
+
+    The scenario price of each position uses spot ``S * (1 + spot_shock)``,
+    volatility ``sigma + vol_shock`` and time to expiration ``t - horizon``.
+    Options that expire at or before a horizon are worth their intrinsic
+    value.  The P&L is ``quantity`` times the scenario price less today's
+    price.  Rates and dividend rates given as curves reprice each horizon
+    at the forward rate from the horizon to expiry,
+    ``(R(t) * t - R(horizon) * horizon) / (t - horizon)``; flat rates are
+    used as they are.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param S: underlying asset price
+    :type S: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: risk-free interest rate, or a curve
+    :type r: float, numpy.ndarray or py_vollib.curves.Curve
+    :param sigma: annualized standard deviation, or volatility
+    :type sigma: float or numpy.ndarray
+    :param q: annualized continuous dividend rate, or a carry curve
+    :type q: float, numpy.ndarray or py_vollib.curves.CarryCurve
+    :param spot_shocks: relative changes in the underlying price
+    :type spot_shocks: sequence of float
+    :param vol_shocks: absolute changes in volatility; every shocked
+        volatility must stay positive, or InvalidArgument is raised
+    :type vol_shocks: sequence of float
+    :param horizons: times from now, in years, at which to reprice
+    :type horizons: sequence of float
+    :param quantity: number of options held in each position
+    :type quantity: float or numpy.ndarray
+    :param aggregate: sum the P&L over positions
+    :type aggregate: bool
+    :param chunk_size: number of positions repriced at a time
+    :type chunk_size: int
+    :param dtype: floating point type of the cube; numpy.float32 halves its
+        memory traffic, see ``py_vollib.ref_python``
+    :type dtype: numpy.dtype
+
+    :returns:  numpy.ndarray of shape (positions, spot shocks, vol shocks, horizons),
+        or (spot shocks, vol shocks, horizons) if aggregate is True
+
+    >>> spot_shocks = numpy.linspace(-.1, .1, 21)
+    >>> vol_shocks = numpy.linspace(-.05, .05, 11)
+    >>> horizons = [0.0, 1 / 365., 7 / 365.]
+    >>> K = numpy.array([90.0, 100.0, 110.0])
+    >>> cube = scenario_pnl(['p', 'c', 'c'], 100.0, K, .5, .02, .2, .01,
+    ...                     spot_shocks, vol_shocks, horizons, quantity=[10, -5, 3])
+    >>> cube.shape
+    (3, 21, 11, 3)
+    >>> float(cube[:, 10, 5, 0].max())
+    0.0
+    >>> book = scenario_pnl(['p', 'c', 'c'], 100.0, K, .5, .02, .2, .01,
+    ...                     spot_shocks, vol_shocks, horizons, quantity=[10, -5, 3], aggregate=True)
+    >>> numpy.allclose(book, cube.sum(axis=0))
+    True
+    """
+
+    rate, dividend = r, q
+    r = zero_rate(r, t)
+    q = zero_rate(q, t)
+    flag, S, K, t, r, sigma, q, quantity = [
+        numpy.ravel(x) for x in numpy.broadcast_arrays(
+            numpy.asarray(flag), *[numpy.asarray(x, dtype=dtype) for x in (S, K, t, r, sigma, q, quantity)])]
+    spot = 1.0 + numpy.asarray(spot_shocks, dtype=dtype)[:, None, None]
+    vol = numpy.asarray(vol_shocks, dtype=dtype)[None, :, None]
+    horizon = numpy.asarray(horizons, dtype=dtype)[None, None, :]
+    grid = (spot.shape[0], vol.shape[1], horizon.shape[2])
+    if sigma.min() + vol.min() <= 0:
+        raise InvalidArgument("vol_shocks must leave every volatility positive")
+    r_horizon, q_horizon = [x.zero_rate(horizon) if isinstance(x, Curve) else None for x in (rate, dividend)]
+
+    base = black_scholes_merton(flag, S, K, t, r, sigma, q, dtype=dtype)
+
+    pnl = numpy.zeros(grid if aggregate else (S.size,) + grid, dtype=dtype)
+    for start in range(0, S.size, chunk_size):
+        rows = slice(start, start + chunk_size)
+        chunk = lambda x: x[rows, None, None, None]
+
+        scenario_S = chunk(S) * spot
+        remaining = chunk(t) - horizon
+        expired = remaining <= 0
+        life = numpy.where(expired, 1.0, remaining)
+        price = black_scholes_merton(chunk(flag), scenario_S, chunk(K), life,
+                                     _forward(chunk(r), chunk(t), r_horizon, horizon, life), chunk(sigma) + vol,
+                                     _forward(chunk(q), chunk(t), q_horizon, horizon, life), dtype=dtype)
+        if expired.any():
+            sign = binary_flag_array(chunk(flag)).astype(dtype)
+            intrinsic = numpy.maximum(sign * (scenario_S - chunk(K)), 0.0)
+            price = numpy.where(expired, intrinsic, price)
+
+        price -= chunk(base)
+        price *= chunk(quantity)
+        if aggregate:
+            pnl += price.sum(axis=0)
+        else:
+            pnl[rows] = price
+
+    return pnl
+
+
+def black_scenario_pnl(flag, F, K, t, r, sigma, spot_shocks=(0.0,), vol_shocks=(0.0,), horizons=(0.0,),
+                       quantity=1.0, aggregate=False, chunk_size=CHUNK_SIZE, dtype=float):
+    """Calculate the Black P&L of a book of options on futures over a grid
+    of futures price, volatility and horizon scenarios.
+
+    This is ``scenario_pnl`` with the futures price in place of the
+    underlying asset price and a dividend rate equal to r, under which the
+    Black-Scholes-Merton price is the Black price.
+
+    :param flag: 'c' or 'p' for call or put.
+    :type flag: str or numpy.ndarray
+    :param F: underlying futures price
+    :type F: float or numpy.ndarray
+    :param K: strike price
+    :type K: float or numpy.ndarray
+    :param t: time to expiration in years
+    :type t: float or numpy.ndarray
+    :param r: risk-free interest rate, or a curve
+    :type r: float, numpy.ndarray or py_vollib.curves.Curve
+    :param sigma: annualized standard deviation, or volatility
+    :type sigma: float or numpy.ndarray
+    :param spot_shocks: relative changes in the futures price
+    :type spot_shocks: sequence of float
+    :param vol_shocks: absolute changes in volatility; every shocked
+        volatility must stay positive, or InvalidArgument is raised
+    :type vol_shocks: sequence of float
+    :param horizons: times from now, in years, at which to reprice
+    :type horizons: sequence of float
+    :param quantity: number of options held in each position
+    :type quantity: float or numpy.ndarray
+    :param aggregate: sum the P&L over positions
+    :type aggregate: bool
+    :param chunk_size: number of positions repriced at a time
+    :type chunk_size: int
+    :param dtype: floating point type of the cube; numpy.float32 halves its
+        memory traffic, see ``py_vollib.ref_python``
+    :type dtype: numpy.dtype
+
+    :returns:  numpy.ndarray of shape (positions, spot shocks, vol shocks, horizons),
+        or (spot shocks, vol shocks, horizons) if aggregate is True
+
+    >>> from py_vollib.ref_python.black import black
+    >>> cube = black_scenario_pnl('c', 100.0, 95.0, .5, .02, .2, spot_shocks=[.01])
+    >>> expected = black('c', 101.0, 95.0, .5, .02, .2) - black('c', 100.0, 95.0, .5, .02, .2)
+    >>> abs(cube[0, 0, 0, 0] - expected) < 1e-12
+    True
+    """
+
+    return scenario_pnl(flag, F, K, t, r, sigma, r, spot_shocks, vol_shocks, horizons,
+                        quantity=quantity, aggregate=aggregate, chunk_size=chunk_size, dtype=dtype)
+
+
+def _forward(zero, t, zero_horizon, horizon, life):
+    """Return the rate over the remaining life of the options: the zero
+    rate to expiry if it is flat, and otherwise the forward rate from the
+    horizon to expiry, given the zero rates of the curve to the horizons."""
+
+    if zero_horizon is None:
+        return zero
+    return (zero * t - zero_horizon * horizon) / life
+
+
+if __name__ == "__main__":
+    from py_vollib.helpers.doctest_helper import run_doctest
+    run_doctest()
@@ -17,8 +17,10 @@ setup(
         'py_lets_be_rational',
         'simplejson',
         'numpy',
-        'pandas',
         'scipy'
     ],
+    extras_require={
+        'test': ['pandas']
+    },
     packages=find_packages()
 )
@@ -0,0 +1,65 @@
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+import json
+import unittest
+
+# Related third party imports
+
+# Local application/library specific imports
+from benchmarks import benchmarks
+from benchmarks.run import run
+
+
+class TestBenchmarks(unittest.TestCase):
+
+    def test_every_case_runs(self):
+        cases = benchmarks.cases()
+        names = [case.name for case in cases]
+        self.assertEqual(len(names), len(set(names)))
+        for name in ('py_vollib.black.black', 'py_vollib.black_scholes.implied_volatility.implied_volatility',
+                     'py_vollib.black_scholes_merton.greeks.numerical.vega',
+                     'py_vollib.ref_python.black_scholes_merton.implied_volatility.vectorized_implied_volatility',
+                     'py_vollib.black.implied_volatility_table.implied_volatility_of_undiscounted_option_price'):
+            self.assertIn(name, names)
+        for case in cases:
+            case.prepare(10)()
+
+    def test_vectorized(self):
+        cases = dict((case.name, case) for case in benchmarks.cases())
+        self.assertFalse(cases['py_vollib.black_scholes.black_scholes'].vectorized)
+        self.assertTrue(cases['py_vollib.ref_python.black_scholes.black_scholes'].vectorized)
+        with self.assertRaises(NotImplementedError):
+            cases['py_vollib.black_scholes.black_scholes'].prepare(benchmarks.LOOP_MAX_SIZE + 1)
+
+    def test_asv_classes(self):
+        benchmark = benchmarks.ref_python_black_scholes_merton_black_scholes_merton()
+        self.assertEqual(benchmark.params, [benchmarks.SIZES])
+        benchmark.setup(100)
+        benchmark.time_batch(100)
+
+    def test_report(self):
+        report = json.loads(json.dumps(run(sizes=[1, 100], pattern=r'ref_python\.black\.black$', repeat=2,
+                                           budget=0.)))
+        self.assertEqual([result['size'] for result in report['results']], [1, 100])
+        result = report['results'][1]
+        self.assertEqual(result['benchmark'], 'py_vollib.ref_python.black.black')
+        self.assertGreaterEqual(result['calls'], 1)
+        self.assertLessEqual(result['latency']['p50'], result['latency']['p99'])
+        self.assertGreater(result['throughput'], 0)
+        self.assertGreater(result['peak_memory'], 0)
+        self.assertIn('numpy', report['metadata'])
+
+    def test_import_time(self):
+        report = run(sizes=[1], pattern=r'^import py_vollib\.black_scholes$', repeat=1)
+        self.assertEqual(len(report['results']), 1)
+        result = report['results'][0]
+        self.assertEqual(result['benchmark'], 'import py_vollib.black_scholes')
+        self.assertGreater(result['latency']['min'], 0)
+        self.assertEqual(result['loaded'], [])
+        self.assertEqual(benchmarks.ImportTime().timeraw_import('py_vollib.black'), 'import py_vollib.black')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+import unittest
+
+# Related third party imports
+import numpy
+
+# Local application/library specific imports
+from py_vollib.binomial import leisen_reimer, leisen_reimer_greeks
+from py_vollib.bjerksund_stensland import bjerksund_stensland
+from py_vollib.black_scholes import black_scholes
+from py_vollib.black_scholes_merton import black_scholes_merton
+from py_vollib.helpers import analytical_greeks
+
+
+class TestLeisenReimer(unittest.TestCase):
+
+    def setUp(self):
+        rng = numpy.random.RandomState(0)
+        n = 40
+        self.S = 100.
+        self.K = self.S * numpy.exp(rng.uniform(-.3, .3, n))
+        self.t = rng.uniform(.05, 2, n)
+        self.r = rng.uniform(0., .1, n)
+        self.b = rng.uniform(-.1, .1, n)
+        self.sigma = rng.uniform(.1, .5, n)
+        self.flag = numpy.where(rng.uniform(size=n) < .5, 'c', 'p')
+
+    def args(self, b=None):
+        return self.flag, self.S, self.K, self.t, self.r, self.sigma, self.b if b is None else b
+
+    def test_european_against_black_scholes(self):
+        price = leisen_reimer(*self.args(b=self.r), american=False)
+        for i, (f, k, t, r, sigma) in enumerate(zip(self.flag, self.K, self.t, self.r, self.sigma)):
+            self.assertAlmostEqual(price[i], black_scholes(f, self.S, k, t, r, sigma), delta=1e-4)
+
+    def test_european_against_black_scholes_merton(self):
+        price = leisen_reimer(*self.args(), american=False)
+        for i, (f, k, t, r, sigma, b) in enumerate(zip(*self.args()[:1] + self.args()[2:])):
+            self.assertAlmostEqual(price[i], black_scholes_merton(f, self.S, k, t, r, sigma, r - b), delta=1e-4)
+
+    def test_european_greeks(self):
+        result = leisen_reimer_greeks(*self.args(), american=False)
+        expected = analytical_greeks.greeks(*self.args())
+        tolerance = {'price': 1e-4, 'delta': 2e-3, 'gamma': 1e-3, 'theta': 1e-3}
+        for name, atol in tolerance.items():
+            self.assertTrue(numpy.allclose(result[name], expected[name], rtol=0, atol=atol), name)
+
+    def test_american(self):
+        american = leisen_reimer(*self.args())
+        european = leisen_reimer(*self.args(), american=False)
+        intrinsic = numpy.maximum(numpy.where(self.flag == 'c', 1, -1) * (self.S - self.K), 0)
+        self.assertTrue(numpy.all(american >= european - 1e-12))
+        self.assertTrue(numpy.all(american >= intrinsic - 1e-12))
+        # converged against a finer tree, and just above the Bjerksund-Stensland
+        # approximation, which is a lower bound
+        fine = leisen_reimer(*self.args(), steps=2001)
+        self.assertTrue(numpy.allclose(american, fine, rtol=0, atol=.02))
+        excess = fine - bjerksund_stensland(*self.args())
+        self.assertTrue(numpy.all(excess > -1e-6))
+        self.assertTrue(numpy.all(excess < .005 * self.K))
+
+    def test_no_early_exercise(self):
+        american = leisen_reimer('c', self.S, self.K, self.t, self.r, self.sigma, self.r)
+        european = leisen_reimer('c', self.S, self.K, self.t, self.r, self.sigma, self.r, american=False)
+        self.assertTrue(numpy.allclose(american, european, rtol=0, atol=1e-12))
+
+    def test_mixed_batch(self):
+        exercise = numpy.arange(self.K.size) % 3 == 0
+        result = leisen_reimer_greeks(*self.args(), american=exercise)
+        american = leisen_reimer_greeks(*self.args())
+        european = leisen_reimer_greeks(*self.args(), american=False)
+        for name in ('price', 'delta', 'gamma', 'theta'):
+            expected = numpy.where(exercise, american[name], european[name])
+            self.assertTrue(numpy.allclose(result[name], expected, rtol=1e-12, atol=1e-15), name)
+        single = leisen_reimer(self.flag[3], self.S, self.K[3], self.t[3], self.r[3], self.sigma[3], self.b[3])
+        self.assertAlmostEqual(single, american['price'][3], places=12)
+
+    def test_expired(self):
+        result = leisen_reimer_greeks(['c', 'p', 'c'], 100., [90., 90., 100.], [0., 0., 0.], .05, .2, .05)
+        self.assertTrue(numpy.array_equal(result['price'], [10., 0., 0.]))
+        self.assertTrue(numpy.array_equal(result['delta'], [1., 0., .5]))
+        self.assertTrue(numpy.array_equal(result['gamma'], [0., 0., numpy.inf]))
+        self.assertTrue(numpy.array_equal(result['theta'], [0., 0., 0.]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+import unittest
+
+# Related third party imports
+import numpy
+
+# Local application/library specific imports
+from py_vollib.bjerksund_stensland import bjerksund_stensland
+from py_vollib.bjerksund_stensland.greeks import numerical
+from py_vollib.black_scholes_merton import black_scholes_merton
+from py_vollib.helpers import numerical_greeks
+from py_vollib.helpers.distributions import CBND, CND
+
+
+def binomial_tree(flag, S, K, t, r, sigma, b, steps=2000):
+    """A Cox-Ross-Rubinstein tree with early exercise, used as the reference."""
+    dt = t / steps
+    u = numpy.exp(sigma * numpy.sqrt(dt))
+    p = (numpy.exp(b * dt) - 1 / u) / (u - 1 / u)
+    discount = numpy.exp(-r * dt)
+    sign = 1 if flag == 'c' else -1
+    value = None
+    for i in range(steps, -1, -1):
+        spot = S * u ** numpy.arange(i, -i - 1, -2)
+        exercise = numpy.maximum(sign * (spot - K), 0)
+        if value is None:
+            value = exercise
+        else:
+            value = numpy.maximum(discount * (p * value[:-1] + (1 - p) * value[1:]), exercise)
+    return value[0]
+
+
+class TestCBND(unittest.TestCase):
+
+    def test_special_cases(self):
+        rng = numpy.random.RandomState(0)
+        x = rng.uniform(-3, 3, 100)
+        y = rng.uniform(-3, 3, 100)
+        self.assertTrue(numpy.allclose(CBND(x, y, 0.), CND(x) * CND(y), rtol=0, atol=1e-15))
+        self.assertTrue(numpy.allclose(CBND(x, y, 1.), CND(numpy.minimum(x, y)), rtol=0, atol=1e-15))
+        self.assertTrue(numpy.allclose(CBND(x, y, -1.), numpy.maximum(CND(x) - CND(-y), 0), rtol=0, atol=1e-15))
+
+    def test_vectorized_matches_scalar(self):
+        rng = numpy.random.RandomState(1)
+        x = rng.uniform(-3, 3, 200)
+        y = rng.uniform(-3, 3, 200)
+        rho = rng.uniform(-.999, .999, 200)
+        vector = CBND(x, y, rho)
+        scalar = [CBND(*args) for args in zip(x, y, rho)]
+        self.assertTrue(numpy.allclose(vector, scalar, rtol=0, atol=1e-15))
+
+    def test_symmetry(self):
+        rng = numpy.random.RandomState(2)
+        x = rng.uniform(-3, 3, 200)
+        y = rng.uniform(-3, 3, 200)
+        rho = rng.uniform(-.999, .999, 200)
+        self.assertTrue(numpy.allclose(CBND(x, y, rho), CBND(y, x, rho), rtol=0, atol=1e-14))
+        # P(X < x, Y < y) + P(X < x, Y > y) = P(X < x) + P(X < x, Y > y) = P(X < x)
+        self.assertTrue(numpy.allclose(CBND(x, y, rho) + CBND(x, -y, -rho), CND(x), rtol=0, atol=1e-14))
+
+
+class TestBjerksundStensland(unittest.TestCase):
+
+    def setUp(self):
+        rng = numpy.random.RandomState(0)
+        n = 20
+        self.S = 100.
+        self.K = self.S * numpy.exp(rng.uniform(-.3, .3, n))
+        self.t = rng.uniform(.05, 2, n)
+        self.r = rng.uniform(0., .1, n)
+        self.b = rng.uniform(-.1, .1, n)
+        self.sigma = rng.uniform(.1, .5, n)
+        self.flag = numpy.where(rng.uniform(size=n) < .5, 'c', 'p')
+
+    def test_against_binomial_tree(self):
+        price = bjerksund_stensland(self.flag, self.S, self.K, self.t, self.r, self.sigma, self.b)
+        for i, args in enumerate(zip(self.flag, self.K, self.t, self.r, self.sigma, self.b)):
+            f, k, t, r, sigma, b = args
+            tree = binomial_tree(f, self.S, k, t, r, sigma, b)
+            self.assertLess(abs(price[i] - tree), max(.0015 * k, .01))
+            self.assertAlmostEqual(price[i], bjerksund_stensland(f, self.S, k, t, r, sigma, b), places=12)
+
+    def test_bounds(self):
+        price = bjerksund_stensland(self.flag, self.S, self.K, self.t, self.r, self.sigma, self.b)
+        european = numpy.array([black_scholes_merton(f, self.S, k, t, r, sigma, r - b)
+                                for f, k, t, r, sigma, b in zip(self.flag, self.K, self.t, self.r,
+                                                                self.sigma, self.b)])
+        intrinsic = numpy.maximum(numpy.where(self.flag == 'c', 1, -1) * (self.S - self.K), 0)
+        self.assertTrue(numpy.all(price >= european - 1e-10))
+        self.assertTrue(numpy.all(price >= intrinsic))
+
+    def test_no_early_exercise(self):
+        call = bjerksund_stensland('c', self.S, self.K, self.t, self.r, self.sigma, self.r)
+        european = [black_scholes_merton('c', self.S, k, t, r, sigma, 0.)
+                    for k, t, r, sigma in zip(self.K, self.t, self.r, self.sigma)]
+        self.assertTrue(numpy.allclose(call, european, rtol=1e-12, atol=1e-12))
+
+    def test_deep_in_the_money_is_exercised(self):
+        self.assertEqual(bjerksund_stensland('p', 20., 100., 1., .1, .2, .1), 80.)
+        self.assertEqual(bjerksund_stensland('c', 500., 100., 1., .1, .2, 0.), 400.)
+
+    def test_greeks_match_numerical_greeks(self):
+        result = numerical.greeks(self.flag, self.S, self.K, self.t, self.r, self.sigma, self.b)
+        self.assertTrue(numpy.allclose(result['price'], bjerksund_stensland(
+            self.flag, self.S, self.K, self.t, self.r, self.sigma, self.b)))
+        for name in ('delta', 'gamma', 'theta', 'vega', 'rho'):
+            expected = [getattr(numerical_greeks, name)(f, self.S, k, t, r, sigma, b, bjerksund_stensland)
+                        for f, k, t, r, sigma, b in zip(self.flag, self.K, self.t, self.r, self.sigma, self.b)]
+            self.assertTrue(numpy.allclose(result[name], expected, rtol=1e-8, atol=1e-8), name)
+            single = getattr(numerical, name)(self.flag, self.S, self.K, self.t, self.r, self.sigma, self.b)
+            self.assertTrue(numpy.array_equal(single, result[name]), name)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+import os
+import shutil
+import tempfile
+import unittest
+
+# Related third party imports
+import numpy
+
+# Local application/library specific imports
+from py_vollib.black import undiscounted_black
+from py_vollib.black import implied_volatility_table
+from py_vollib.black.implied_volatility import implied_volatility_of_undiscounted_option_price
+from py_vollib.helpers.constants import FLOAT_MAX, MINUS_FLOAT_MAX
+
+
+class TestImpliedVolatilityTable(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.mkdtemp()
+        cls.path = os.path.join(cls.directory, 'table.npz')
+        implied_volatility_table.load_table(cls.path)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.directory)
+
+    def test_against_lets_be_rational(self):
+        rng = numpy.random.RandomState(0)
+        n = 2000
+        F = 100.
+        K = F * numpy.exp(rng.uniform(-1, 1, n))
+        t = rng.uniform(.01, 5, n)
+        sigma = rng.uniform(.05, 1.5, n)
+        flag = numpy.where(rng.uniform(size=n) < .5, 'c', 'p')
+
+        price = numpy.array([undiscounted_black(F, k, s, tt, f) for k, s, tt, f in zip(K, sigma, t, flag)])
+        expected = numpy.array([implied_volatility_of_undiscounted_option_price(p, F, k, tt, f)
+                                for p, k, tt, f in zip(price, K, t, flag)])
+
+        actual = implied_volatility_table.implied_volatility_of_undiscounted_option_price(price, F, K, t, flag)
+        self.assertTrue(numpy.allclose(actual, expected, rtol=1e-10, atol=0))
+
+    def test_scalar(self):
+        price = undiscounted_black(100., 95., .3, .5, 'p')
+        iv = implied_volatility_table.implied_volatility_of_undiscounted_option_price(price, 100., 95., .5, 'p')
+        self.assertEqual(numpy.ndim(iv), 0)
+        self.assertAlmostEqual(iv, .3, delta=1e-12)
+
+    def test_prices_out_of_bounds(self):
+        iv = implied_volatility_table.implied_volatility_of_undiscounted_option_price(
+            [100., 101., 9., 5.], 100., 90., .5, ['c', 'c', 'c', 'p'])
+        self.assertEqual(list(iv[:3]), [FLOAT_MAX, FLOAT_MAX, MINUS_FLOAT_MAX])
+        self.assertTrue(0 < iv[3] < 1)
+
+    def test_persistence(self):
+        self.assertTrue(os.path.exists(self.path))
+        table = implied_volatility_table.load_table(self.path)
+        rebuilt = implied_volatility_table.build_table()
+        self.assertTrue(numpy.allclose(table['coefficients'], rebuilt['coefficients']))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,166 @@
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+import unittest
+
+# Related third party imports
+import numpy
+
+# Local application/library specific imports
+from py_vollib.binomial import leisen_reimer
+from py_vollib.black_scholes_merton import black_scholes_merton
+from py_vollib.black_scholes_merton.greeks import analytical, numerical
+from py_vollib.black_scholes_merton.implied_volatility import implied_volatility
+from py_vollib.curves import CarryCurve, Curve, zero_rate
+from py_vollib.dividends import DividendSchedule
+from py_vollib.helpers.exceptions import InvalidArgument
+from py_vollib.ref_python import black_scholes_merton as ref
+
+
+class Counting(object):
+
+    evaluations = 0
+
+    def _interpolate(self, t):
+        self.evaluations += 1
+        return super(Counting, self)._interpolate(t)
+
+
+class CountingCurve(Counting, Curve):
+    pass
+
+
+class CountingCarryCurve(Counting, CarryCurve):
+    pass
+
+
+class TestCurve(unittest.TestCase):
+
+    def setUp(self):
+        self.times = numpy.array([1 / 12, .25, .5, 1., 2., 5., 10.])
+        self.rates = numpy.array([.031, .033, .034, .036, .037, .039, .041])
+        self.curve = Curve(self.times, self.rates)
+
+    def test_nodes(self):
+        self.assertTrue(numpy.allclose(self.curve.zero_rate(self.times), self.rates, rtol=1e-14, atol=0))
+
+    def test_log_linear_discount_factors(self):
+        t = numpy.linspace(0., 12., 241)
+        log_discount = numpy.interp(t, numpy.r_[0., self.times], numpy.r_[0., -self.rates * self.times])
+        expected = numpy.where(t > self.times[-1], numpy.exp(-self.rates[-1] * t), numpy.exp(log_discount))
+        self.assertTrue(numpy.allclose(self.curve.discount_factor(t), expected, rtol=1e-14, atol=0))
+        self.assertEqual(self.curve.zero_rate(0.), self.rates[0])
+
+    def test_one_evaluation_per_expiry(self):
+        curve = CountingCurve(self.times, self.rates)
+        expiries = numpy.linspace(.05, 2.5, 12)
+        t = numpy.random.RandomState(0).choice(expiries, 10000)
+        first = curve.zero_rate(t)
+        self.assertEqual(curve.evaluations, 1)
+        self.assertEqual(len(curve._zero_rates), 12)
+        second = curve.zero_rate(t[::-1])
+        self.assertEqual(curve.evaluations, 1)
+        self.assertTrue(numpy.array_equal(second, first[::-1]))
+        self.assertEqual(curve.zero_rate(expiries[3]), first[t == expiries[3]][0])
+
+    def test_invalid(self):
+        with self.assertRaises(InvalidArgument):
+            Curve([1., .5], [.01, .02])
+        with self.assertRaises(InvalidArgument):
+            Curve([0., 1.], [.01, .02])
+        with self.assertRaises(InvalidArgument):
+            Curve([], [])
+
+    def test_zero_rate(self):
+        self.assertEqual(zero_rate(.05, 1.), .05)
+        r = numpy.array([.01, .02])
+        self.assertIs(zero_rate(r, 1.), r)
+
+
+class TestPricers(unittest.TestCase):
+
+    def setUp(self):
+        self.curve = Curve([.25, 1., 3.], [.02, .035, .04])
+        self.S = 100.
+        self.K = numpy.array([90., 100., 110., 120.])
+        self.t = numpy.array([.1, .5, 1.5, 4.])
+        self.sigma = .25
+        self.q = .01
+
+    def test_discounts_like_the_curve(self):
+        # a zero-strike call is worth the forward less the carry, so only
+        # the discount factor of the curve enters
+        price = ref.black_scholes_merton('c', self.S, 1e-300, self.t, self.curve, self.sigma, self.q)
+        self.assertTrue(numpy.allclose(price, self.S * numpy.exp(-self.q * self.t), rtol=1e-14, atol=0))
+        put = ref.black_scholes_merton('p', 1e-300, self.K, self.t, self.curve, self.sigma, self.q)
+        self.assertTrue(numpy.allclose(put, self.K * self.curve.discount_factor(self.t), rtol=1e-14, atol=0))
+
+    def test_same_as_flat_rate_to_expiry(self):
+        r = self.curve.zero_rate(self.t)
+        for k, t, rate in zip(self.K, self.t, r):
+            for flag in ('c', 'p'):
+                price = black_scholes_merton(flag, self.S, k, t, self.curve, self.sigma, self.q)
+                self.assertEqual(price, black_scholes_merton(flag, self.S, k, t, rate, self.sigma, self.q))
+                self.assertEqual(analytical.rho(flag, self.S, k, t, self.curve, self.sigma, self.q),
+                                 analytical.rho(flag, self.S, k, t, rate, self.sigma, self.q))
+                iv = implied_volatility(price, self.S, k, t, self.curve, self.q, flag)
+                self.assertAlmostEqual(iv, self.sigma, delta=1e-12)
+        tree = leisen_reimer('p', self.S, self.K, self.t, self.curve, self.sigma, self.curve.zero_rate(self.t) - self.q)
+        self.assertTrue(numpy.array_equal(tree, leisen_reimer('p', self.S, self.K, self.t, r, self.sigma, r - self.q)))
+
+    def test_dividends(self):
+        schedule = DividendSchedule([1., 1., 1.], [.3, 1.3, 2.3])
+        pv = schedule.present_value(self.t, self.curve)
+        expected = [sum(self.curve.discount_factor(x) for x in (.3, 1.3, 2.3) if x <= t) for t in self.t]
+        self.assertTrue(numpy.allclose(pv, expected, rtol=1e-14, atol=0))
+
+
+class TestCarryCurve(unittest.TestCase):
+
+    def setUp(self):
+        self.dividend = Curve([.25, 1., 2.], [.02, .018, .015])
+        self.borrow = Curve([.1, .5, 3.], [.05, .035, .02])
+        self.carry = CarryCurve(self.dividend, self.borrow)
+        self.r = Curve([.5, 5.], [.03, .04])
+
+    def test_sum_of_parts(self):
+        t = numpy.linspace(0., 6., 301)
+        expected = self.dividend.discount_factor(t) * self.borrow.discount_factor(t)
+        self.assertTrue(numpy.allclose(self.carry.discount_factor(t), expected, rtol=1e-14, atol=0))
+        flat = CarryCurve(.01, self.borrow)
+        self.assertTrue(numpy.allclose(flat.zero_rate(t), self.borrow.zero_rate(t) + .01, rtol=1e-14, atol=0))
+        self.assertEqual(CarryCurve(.01, .02).zero_rate(3.), .03)
+
+    def test_put_call_parity(self):
+        S = 50.
+        K = numpy.linspace(30., 70., 9)
+        t = numpy.linspace(.05, 4., 9)
+        call = ref.black_scholes_merton('c', S, K, t, self.r, .4, self.carry)
+        put = ref.black_scholes_merton('p', S, K, t, self.r, .4, self.carry)
+        forward = S * self.carry.discount_factor(t) - K * self.r.discount_factor(t)
+        self.assertTrue(numpy.allclose(call - put, forward, rtol=1e-12, atol=1e-12))
+
+    def test_black_scholes_merton(self):
+        for t in (.2, .75, 2.5):
+            r, q = self.r.zero_rate(t), self.carry.zero_rate(t)
+            for flag in ('c', 'p'):
+                price = black_scholes_merton(flag, 50., 55., t, self.r, .3, self.carry)
+                self.assertEqual(price, black_scholes_merton(flag, 50., 55., t, r, .3, q))
+                self.assertEqual(analytical.greeks(flag, 50., 55., t, self.r, .3, self.carry),
+                                 analytical.greeks(flag, 50., 55., t, r, .3, q))
+                self.assertEqual(numerical.delta(flag, 50., 55., t, self.r, .3, self.carry),
+                                 numerical.delta(flag, 50., 55., t, r, .3, q))
+                iv = implied_volatility(price, 50., 55., t, self.r, self.carry, flag)
+                self.assertAlmostEqual(iv, .3, delta=1e-12)
+
+    def test_one_evaluation_per_expiry(self):
+        carry = CountingCarryCurve(self.dividend, self.borrow)
+        t = numpy.random.RandomState(1).choice(numpy.linspace(.1, 2., 12), 10000)
+        ref.black_scholes_merton('c', 100., 100., t, self.r, .2, carry)
+        ref.black_scholes_merton('p', 100., 100., t, self.r, .2, carry)
+        self.assertEqual(carry.evaluations, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
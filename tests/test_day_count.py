@@ -0,0 +1,78 @@
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+import datetime
+import unittest
+
+# Related third party imports
+import numpy
+
+# Local application/library specific imports
+from py_vollib.day_count import Calendar, act_365
+from py_vollib.helpers.exceptions import InvalidArgument
+
+
+class TestDayCount(unittest.TestCase):
+
+    def setUp(self):
+        rng = numpy.random.RandomState(5)
+        n = 2000
+        self.holidays = numpy.array(['2024-01-01', '2024-05-27', '2024-07-04', '2024-12-25', '2025-01-01'],
+                                    dtype='datetime64[D]')
+        self.now = numpy.datetime64('2024-01-01') + rng.randint(0, 365 * 86400, n).astype('timedelta64[s]')
+        self.expiry = self.now + rng.randint(0, 2 * 365 * 86400, n).astype('timedelta64[s]')
+
+    def test_act_365(self):
+        expected = [(e.astype(datetime.datetime) - d.astype(datetime.datetime)).total_seconds() / (365 * 86400.)
+                    for d, e in zip(self.now, self.expiry)]
+        self.assertTrue(numpy.allclose(act_365(self.now, self.expiry), expected, rtol=1e-14, atol=0))
+        self.assertIsInstance(act_365(self.now[0], self.expiry[0]), float)
+
+    def test_business_days(self):
+        calendar = Calendar(self.holidays, weekmask='1111010')
+        begin, end = self.now.astype('datetime64[D]'), self.expiry.astype('datetime64[D]')
+        expected = numpy.busday_count(begin, end, weekmask='1111010', holidays=self.holidays)
+        self.assertTrue(numpy.array_equal(calendar.business_days(begin, end), expected))
+        self.assertTrue(numpy.array_equal(calendar.business_days(end, begin), -expected))
+
+    def test_trading_days(self):
+        calendar = Calendar(self.holidays)
+        begin, end = self.now.astype('datetime64[D]'), self.expiry.astype('datetime64[D]')
+        expected = numpy.busday_count(begin, end, holidays=self.holidays) / 252.
+        self.assertTrue(numpy.allclose(calendar.year_fraction(begin, end), expected, rtol=1e-14, atol=0))
+
+        fraction = calendar.year_fraction(self.now, self.expiry)
+        later = calendar.year_fraction(self.now, self.expiry + numpy.timedelta64(1, 'h'))
+        self.assertTrue(numpy.all(later >= fraction))
+        self.assertTrue(numpy.all(numpy.abs(fraction - expected) <= 1 / 252. + 1e-15))
+        # an hour of a Saturday and of a holiday count for nothing
+        self.assertEqual(calendar.year_fraction('2024-07-06T10:00', '2024-07-06T11:00'), 0.)
+        self.assertEqual(calendar.year_fraction('2024-07-04T10:00', '2024-07-04T11:00'), 0.)
+        self.assertAlmostEqual(calendar.year_fraction('2024-07-05T10:00', '2024-07-05T16:00'), .25 / 252, 15)
+
+    def test_session(self):
+        calendar = Calendar(self.holidays, session=(9.5, 16.), overnight_weight=.25, days_per_year=1)
+        day = calendar.year_fraction('2024-07-03T09:30', ['2024-07-03T16:00', '2024-07-05T09:30'])
+        self.assertTrue(numpy.allclose(day, [.75, 1.], rtol=1e-14, atol=0))
+        self.assertAlmostEqual(calendar.year_fraction('2024-07-03T16:00', '2024-07-05T09:30'), .25, 14)
+        self.assertAlmostEqual(calendar.year_fraction('2024-07-03T12:45', '2024-07-03T13:30'), .75 * .75 / 6.5, 14)
+        self.assertAlmostEqual(calendar.year_fraction('2024-07-03T00:00', '2024-07-03T04:00'), .25 * 4 / 17.5, 14)
+
+        whole = Calendar(self.holidays, session=(9.5, 16.), days_per_year=252)
+        midnight = numpy.datetime64('2024-01-01T00:00') + numpy.arange(400) * numpy.timedelta64(1, 'D')
+        self.assertTrue(numpy.allclose(whole.year_fraction(midnight[0], midnight),
+                                       Calendar(self.holidays).year_fraction(midnight[0], midnight),
+                                       rtol=1e-14, atol=1e-15))
+
+    def test_invalid(self):
+        with self.assertRaises(InvalidArgument):
+            Calendar(start='2024-01-01', end='2025-01-01').year_fraction('2023-12-29', '2024-06-01')
+        with self.assertRaises(InvalidArgument):
+            Calendar(session=(16., 9.5))
+        with self.assertRaises(InvalidArgument):
+            Calendar(session=(9.5, 16.), overnight_weight=1.)
+
+
+if __name__ == '__main__':
+    unittest.main()
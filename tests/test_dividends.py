@@ -0,0 +1,72 @@
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+import unittest
+
+# Related third party imports
+import numpy
+
+# Local application/library specific imports
+from py_vollib.black_scholes import black_scholes as bs
+from py_vollib.dividends import DividendSchedule, black_scholes, implied_volatility
+from py_vollib.helpers.exceptions import InvalidArgument
+
+
+class TestDividends(unittest.TestCase):
+
+    def setUp(self):
+        self.schedule = DividendSchedule(
+            [[.4, .4, .4, .4], [2., 2.5, 0., 0.], [1., numpy.nan, numpy.nan, numpy.nan]],
+            [[.1, .35, .6, .85], [.2, .7, 0., 0.], [.5, numpy.nan, numpy.nan, numpy.nan]])
+        self.r = .03
+        numpy.random.seed(11)
+        n = 300
+        self.flag = numpy.where(numpy.random.rand(n) < .5, 'c', 'p')
+        self.underlier = numpy.random.randint(0, 3, n)
+        self.S = numpy.array([50., 120., 30.])[self.underlier]
+        self.K = self.S * numpy.random.uniform(.8, 1.2, n)
+        self.t = numpy.random.choice([.25, .5, .75, 1.], n)
+        self.sigma = numpy.random.uniform(.1, .6, n)
+
+    def test_present_value(self):
+        amounts = [[.4, .4, .4, .4], [2., 2.5], [1.]]
+        ex_dates = [[.1, .35, .6, .85], [.2, .7], [.5]]
+        for valuation in (0., .3):
+            pv = self.schedule.present_value(self.t, self.r, self.underlier, valuation)
+            for i in range(self.t.size):
+                u = self.underlier[i]
+                expected = sum(d * numpy.exp(-self.r * (x - valuation)) for d, x in zip(amounts[u], ex_dates[u])
+                               if valuation < x <= valuation + self.t[i])
+                self.assertAlmostEqual(pv[i], expected, delta=1e-15)
+
+    def test_cache(self):
+        first = self.schedule.discounted(0., self.r)
+        self.assertIs(self.schedule.discounted(0., self.r), first)
+        self.assertIsNot(self.schedule.discounted(.1, self.r), first)
+        self.schedule.clear_cache()
+        self.assertIsNot(self.schedule.discounted(0., self.r), first)
+
+    def test_escrowed_spot(self):
+        price = black_scholes(self.flag, self.S, self.K, self.t, self.r, self.sigma, self.schedule, self.underlier)
+        pv = self.schedule.present_value(self.t, self.r, self.underlier)
+        for i in range(self.t.size):
+            expected = bs(self.flag[i], self.S[i] - pv[i], self.K[i], self.t[i], self.r, self.sigma[i])
+            self.assertAlmostEqual(price[i], expected, delta=1e-10 * self.S[i])
+
+    def test_implied_volatility(self):
+        price = black_scholes(self.flag, self.S, self.K, self.t, self.r, self.sigma, self.schedule, self.underlier)
+        iv = implied_volatility(price, self.S, self.K, self.t, self.r, self.flag, self.schedule, self.underlier)
+        self.assertTrue(numpy.allclose(iv, self.sigma, rtol=1e-9, atol=0))
+
+        price[0] = self.S[0]
+        iv = implied_volatility(price, self.S, self.K, self.t, self.r, self.flag, self.schedule, self.underlier)
+        self.assertTrue(numpy.isnan(iv[0]))
+
+    def test_spot_below_dividends(self):
+        with self.assertRaises(InvalidArgument):
+            black_scholes('c', 2., 2., 1., self.r, .2, self.schedule, underlier=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
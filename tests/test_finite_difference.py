@@ -0,0 +1,87 @@
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+import unittest
+
+# Related third party imports
+import numpy
+
+# Local application/library specific imports
+from py_vollib.binomial import leisen_reimer
+from py_vollib.black_scholes_merton import black_scholes_merton
+from py_vollib.finite_difference import crank_nicolson, crank_nicolson_greeks
+from py_vollib.helpers import analytical_greeks
+
+
+class TestCrankNicolson(unittest.TestCase):
+
+    def setUp(self):
+        rng = numpy.random.RandomState(0)
+        n = 40
+        self.S = 100.
+        self.K = self.S * numpy.exp(rng.uniform(-.3, .3, n))
+        self.t = rng.uniform(.05, 2, n)
+        self.r = rng.uniform(0., .1, n)
+        self.b = rng.uniform(-.1, .1, n)
+        self.sigma = rng.uniform(.1, .5, n)
+        self.flag = numpy.where(rng.uniform(size=n) < .5, 'c', 'p')
+
+    def args(self):
+        return self.flag, self.S, self.K, self.t, self.r, self.sigma, self.b
+
+    def test_european_against_black_scholes_merton(self):
+        price = crank_nicolson(*self.args(), american=False)
+        for i, (f, k, t, r, sigma, b) in enumerate(zip(self.flag, self.K, self.t, self.r, self.sigma, self.b)):
+            self.assertAlmostEqual(price[i], black_scholes_merton(f, self.S, k, t, r, sigma, r - b), delta=.01)
+
+    def test_convergence(self):
+        expected = analytical_greeks.greeks(*self.args())['price']
+        coarse = numpy.abs(crank_nicolson(*self.args(), american=False) - expected)
+        fine = numpy.abs(crank_nicolson(*self.args(), american=False, space_steps=800, time_steps=200) - expected)
+        self.assertLess(fine.max(), coarse.max() / 8)
+
+    def test_european_greeks(self):
+        result = crank_nicolson_greeks(*self.args(), american=False)
+        expected = analytical_greeks.greeks(*self.args())
+        tolerance = {'delta': 1e-3, 'gamma': 1e-4, 'theta': 1e-3}
+        for name, atol in tolerance.items():
+            self.assertTrue(numpy.allclose(result[name], expected[name], rtol=0, atol=atol), name)
+
+    def test_american(self):
+        american = crank_nicolson(*self.args())
+        european = crank_nicolson(*self.args(), american=False)
+        intrinsic = numpy.maximum(numpy.where(self.flag == 'c', 1, -1) * (self.S - self.K), 0)
+        self.assertTrue(numpy.all(american >= european - 1e-12))
+        self.assertTrue(numpy.all(american >= intrinsic - 1e-12))
+        tree = leisen_reimer(*self.args(), steps=2001)
+        self.assertTrue(numpy.allclose(american, tree, rtol=0, atol=.03))
+
+    def test_american_greeks(self):
+        result = crank_nicolson_greeks('p', 100., 110., 1., .08, .3, .08)
+        h = .01
+        up = crank_nicolson('p', 100. + h, 110., 1., .08, .3, .08, space_steps=800, time_steps=200)
+        down = crank_nicolson('p', 100. - h, 110., 1., .08, .3, .08, space_steps=800, time_steps=200)
+        self.assertAlmostEqual(result['delta'], (up - down) / (2 * h), delta=2e-3)
+
+    def test_batching(self):
+        exercise = numpy.arange(self.K.size) % 3 == 0
+        result = crank_nicolson_greeks(*self.args(), american=exercise, chunk_size=7)
+        american = crank_nicolson_greeks(*self.args())
+        european = crank_nicolson_greeks(*self.args(), american=False)
+        for name in ('price', 'delta', 'gamma', 'theta'):
+            expected = numpy.where(exercise, american[name], european[name])
+            self.assertTrue(numpy.allclose(result[name], expected, rtol=1e-12, atol=1e-15), name)
+        single = crank_nicolson(self.flag[3], self.S, self.K[3], self.t[3], self.r[3], self.sigma[3], self.b[3])
+        self.assertAlmostEqual(single, american['price'][3], places=12)
+
+    def test_expired(self):
+        result = crank_nicolson_greeks(['c', 'p', 'c'], 100., [90., 90., 100.], [0., 0., 0.], .05, .2, .05)
+        self.assertTrue(numpy.array_equal(result['price'], [10., 0., 0.]))
+        self.assertTrue(numpy.array_equal(result['delta'], [1., 0., .5]))
+        self.assertTrue(numpy.array_equal(result['gamma'], [0., 0., numpy.inf]))
+        self.assertTrue(numpy.array_equal(result['theta'], [0., 0., 0.]))
+
+
+if __name__ == '__main__':
+    unittest.main()
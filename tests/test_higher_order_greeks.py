@@ -0,0 +1,74 @@
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+import unittest
+
+# Related third party imports
+import numpy
+
+# Local application/library specific imports
+from py_vollib.black.greeks import analytical as black_analytical
+from py_vollib.black_scholes.greeks import analytical as black_scholes_analytical
+from py_vollib.black_scholes_merton.greeks import analytical as black_scholes_merton_analytical
+
+
+FIRST_ORDER = ('delta', 'gamma', 'theta', 'vega', 'rho')
+
+
+class TestHigherOrderGreeks(unittest.TestCase):
+
+    def setUp(self):
+        rng = numpy.random.RandomState(0)
+        n = 50
+        self.S = 100.
+        self.K = self.S * numpy.exp(rng.uniform(-.5, .5, n))
+        self.t = rng.uniform(.1, 2, n)
+        self.r = .04
+        self.q = .015
+        self.sigma = rng.uniform(.1, .6, n)
+        self.flag = numpy.where(rng.uniform(size=n) < .5, 'c', 'p')
+
+    def check(self, module, *extra):
+        def greeks(S=self.S, t=self.t, sigma=self.sigma):
+            return module.greeks(self.flag, S, self.K, t, self.r, sigma, *extra)
+
+        result = greeks()
+
+        for name in FIRST_ORDER:
+            expected = [getattr(module, name)(f, self.S, k, t, self.r, v, *extra)
+                        for f, k, t, v in zip(self.flag, self.K, self.t, self.sigma)]
+            self.assertTrue(numpy.allclose(result[name], expected, rtol=1e-9, atol=1e-12), name)
+
+        h = 1e-5
+
+        def bumped(key, name, scale):
+            up = greeks(**{key: getattr(self, key) + h})[name]
+            down = greeks(**{key: getattr(self, key) - h})[name]
+            return (up - down) / (2 * h) * scale
+
+        expected = {
+            'vanna': bumped('sigma', 'delta', .01),
+            'volga': bumped('sigma', 'vega', .01),
+            'charm': bumped('t', 'delta', -1 / 365.),
+            'speed': bumped('S', 'gamma', 1),
+            'zomma': bumped('sigma', 'gamma', .01),
+            'color': bumped('t', 'gamma', -1 / 365.),
+        }
+        for name, value in expected.items():
+            self.assertTrue(numpy.allclose(result[name], value, rtol=1e-5, atol=1e-10), name)
+            single = getattr(module, name)(self.flag, self.S, self.K, self.t, self.r, self.sigma, *extra)
+            self.assertTrue(numpy.array_equal(single, result[name]), name)
+
+    def test_black(self):
+        self.check(black_analytical)
+
+    def test_black_scholes(self):
+        self.check(black_scholes_analytical)
+
+    def test_black_scholes_merton(self):
+        self.check(black_scholes_merton_analytical, self.q)
+
+
+if __name__ == '__main__':
+    unittest.main()
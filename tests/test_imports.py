@@ -0,0 +1,44 @@
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+import os
+import subprocess
+import sys
+import unittest
+
+# Related third party imports
+
+# Local application/library specific imports
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_ALL = '''
+import pkgutil, sys
+import py_vollib
+for module in pkgutil.walk_packages(py_vollib.__path__, 'py_vollib.'):
+    __import__(module.name)
+print(' '.join(name for name in ('scipy', 'pandas') if name in sys.modules))
+'''
+
+
+class TestImports(unittest.TestCase):
+
+    def test_lazy_dependencies(self):
+        # in a fresh interpreter, as the test runner has imported scipy already
+        output = subprocess.check_output([sys.executable, '-c', IMPORT_ALL], cwd=ROOT).decode()
+        self.assertEqual(output.split(), [])
+
+    def test_scipy_on_first_use(self):
+        script = ('import sys\n'
+                  'from py_vollib.ref_python.black_scholes import black_scholes\n'
+                  'before = "scipy" in sys.modules\n'
+                  'black_scholes("c", 100., 100., .5, .01, .2)\n'
+                  'print(before, "scipy" in sys.modules)')
+        output = subprocess.check_output([sys.executable, '-c', script], cwd=ROOT).decode()
+        self.assertEqual(output.split(), ['False', 'True'])
+
+
+if __name__ == '__main__':
+    unittest.main()
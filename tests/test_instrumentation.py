@@ -0,0 +1,109 @@
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+import threading
+import unittest
+
+# Related third party imports
+import numpy
+
+# Local application/library specific imports
+from py_vollib.black import black
+from py_vollib.black.implied_volatility import implied_volatility as black_iv
+from py_vollib.black_scholes_merton import black_scholes_merton
+from py_vollib.black_scholes_merton.implied_volatility import implied_volatility
+from py_vollib.helpers import instrumentation
+from py_vollib.ref_python.black_scholes import implied_volatility as ref_black_scholes_iv
+from py_vollib.ref_python.black_scholes_merton import black_scholes_merton as ref_black_scholes_merton
+from py_vollib.ref_python.black_scholes_merton import implied_volatility as ref_iv
+
+BSM = 'py_vollib.black_scholes_merton.implied_volatility.implied_volatility'
+BLACK = 'py_vollib.black.implied_volatility.'
+REF = 'py_vollib.ref_python.black_scholes_merton.implied_volatility.'
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def setUp(self):
+        instrumentation.reset()
+        instrumentation.enable()
+
+    def tearDown(self):
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def test_disabled(self):
+        instrumentation.disable()
+        price = black_scholes_merton('c', 100., 100., .5, .01, .2, .02)
+        implied_volatility(price, 100., 100., .5, .01, .02, 'c')
+        ref_iv.vectorized_implied_volatility(price, 100., 100., .5, .01, .02, 'c')
+        self.assertEqual(instrumentation.snapshot(), {})
+
+    def test_calls_and_exceptions(self):
+        price = black_scholes_merton('c', 100., 100., .5, .01, .2, .02)
+        for _ in range(3):
+            self.assertAlmostEqual(implied_volatility(price, 100., 100., .5, .01, .02, 'c'), .2, delta=1e-12)
+        with self.assertRaises(Exception) as raised:
+            implied_volatility(1e-6, 100., 50., .5, .01, .02, 'c')
+
+        counters = instrumentation.snapshot()[BSM]
+        self.assertEqual(counters['calls'], 4)
+        self.assertEqual(counters['exceptions'], {type(raised.exception).__name__: 1})
+        self.assertEqual(counters['iterations'], {})
+        self.assertGreater(counters['time'], 0.)
+
+    def test_nested_calls(self):
+        price = black('p', 101., 102., .5, .01, .2)
+        black_iv(price, 101., 102., .01, .5, 'p')
+        snapshot = instrumentation.snapshot()
+        self.assertEqual(snapshot[BLACK + 'implied_volatility']['calls'], 1)
+        self.assertEqual(snapshot[BLACK + 'implied_volatility_of_discounted_option_price']['calls'], 1)
+
+    def test_scalar_iterations(self):
+        price = black_scholes_merton('p', 100., 110., .5, .01, .25, .02)
+        for _ in range(2):
+            ref_iv.implied_volatility(price, 100., 110., .5, .01, .02, 'p')
+        iterations = instrumentation.snapshot()[REF + 'implied_volatility']['iterations']
+        self.assertEqual(sum(iterations.values()), 2)
+        self.assertEqual(len(iterations), 1)
+
+    def test_vectorized_iterations(self):
+        K = numpy.linspace(60., 140., 50)
+        price = ref_black_scholes_merton('c', 100., K, .5, .01, .25, .02)
+        price[-1] = 200.
+        sigma, converged = ref_iv.vectorized_implied_volatility(price, 100., K, .5, .01, .02, 'c',
+                                                                full_output=True)
+        counters = instrumentation.snapshot()[REF + 'vectorized_implied_volatility']
+        self.assertEqual(counters['calls'], 1)
+        self.assertEqual(sum(counters['iterations'].values()), converged.sum())
+        self.assertEqual(counters['unconverged'], 1)
+        self.assertTrue(all(0 < n <= 1000 for n in counters['iterations']))
+
+    def test_other_model(self):
+        ref_black_scholes_iv.vectorized_implied_volatility([5., 6.], 100., 100., .5, .01, 'c')
+        counters = instrumentation.snapshot()[
+            'py_vollib.ref_python.black_scholes.implied_volatility.vectorized_implied_volatility']
+        self.assertEqual(sum(counters['iterations'].values()), 2)
+
+    def test_threads(self):
+        price = black_scholes_merton('c', 100., 100., .5, .01, .2, .02)
+
+        def solve():
+            for _ in range(50):
+                implied_volatility(price, 100., 100., .5, .01, .02, 'c')
+
+        threads = [threading.Thread(target=solve) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(instrumentation.snapshot()[BSM]['calls'], 200)
+
+    def test_wrapped(self):
+        self.assertEqual(implied_volatility.__name__, 'implied_volatility')
+        self.assertIn('Black-Scholes-Merton', implied_volatility.__doc__)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,201 @@
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+import unittest
+
+# Related third party imports
+import numpy
+
+# Local application/library specific imports
+from py_vollib.black_scholes_merton import black_scholes_merton
+from py_vollib.black_scholes_merton.greeks import analytical
+from py_vollib.helpers.exceptions import InvalidArgument
+from py_vollib.monte_carlo import ArithmeticAsian, European, GeometricAsian, monte_carlo
+from py_vollib.monte_carlo import _merge, _moments
+
+
+class TestMonteCarlo(unittest.TestCase):
+
+    def setUp(self):
+        self.S = 100.
+        self.t = .75
+        self.r = .04
+        self.sigma = .3
+        self.q = .015
+        self.K = numpy.array([80., 95., 100., 105., 130.])
+
+    def simulate(self, payoff, **kwargs):
+        kwargs.setdefault('seed', 1)
+        return monte_carlo(payoff, self.S, self.t, self.r, self.sigma, self.q, **kwargs)
+
+    def test_european_against_black_scholes_merton(self):
+        for flag in ('c', 'p'):
+            result = self.simulate(European(flag, self.K), paths=200000, steps=3)
+            expected = [black_scholes_merton(flag, self.S, k, self.t, self.r, self.sigma, self.q) for k in self.K]
+            self.assertEqual(result['price'].shape, self.K.shape)
+            error = numpy.abs(result['price'] - expected) / result['standard_error']
+            self.assertTrue(numpy.all(error < 4), error)
+            self.assertTrue(numpy.all(result['standard_error'] < .1))
+
+    def test_reproducible(self):
+        payoff = ArithmeticAsian('c', self.K)
+        first = self.simulate(payoff, paths=30000, steps=12, block_size=7000)
+        second = self.simulate(payoff, paths=30000, steps=12, block_size=7000, processes=2)
+        self.assertEqual(first['paths'], 30000)
+        self.assertTrue(numpy.array_equal(first['price'], second['price']))
+        self.assertTrue(numpy.array_equal(first['standard_error'], second['standard_error']))
+        other = self.simulate(payoff, paths=30000, steps=12, block_size=7000, seed=2)
+        self.assertFalse(numpy.array_equal(first['price'], other['price']))
+
+    def test_block_statistics(self):
+        # merging blocks gives the moments of all their samples together
+        rng = numpy.random.RandomState(0)
+        values = rng.standard_normal((1000, 2, 3)) + [[1.], [2.]]
+        n, mean, comoment = _merge([_moments(values[:300]), _moments(values[300:310]), _moments(values[310:])])
+        _, expected_mean, expected_comoment = _moments(values)
+        self.assertEqual(n, 1000)
+        self.assertTrue(numpy.allclose(mean, expected_mean, rtol=1e-13, atol=0))
+        self.assertTrue(numpy.allclose(comoment, expected_comoment, rtol=1e-12, atol=0))
+        self.assertTrue(numpy.allclose(comoment[0, 1], ((values[:, 0] - values[:, 0].mean(axis=0)) *
+                                                        (values[:, 1] - values[:, 1].mean(axis=0))).sum(axis=0)))
+
+    def test_asian(self):
+        european = self.simulate(European('c', 100.), paths=20000)
+        one_date = self.simulate(ArithmeticAsian('c', 100.), paths=20000)
+        self.assertAlmostEqual(european['price'], one_date['price'], places=12)
+        arithmetic = self.simulate(ArithmeticAsian('c', 100.), paths=20000, steps=12)
+        geometric = self.simulate(GeometricAsian('c', 100.), paths=20000, steps=12)
+        self.assertGreater(arithmetic['price'], geometric['price'])
+        self.assertLess(arithmetic['price'], european['price'])
+
+
+class TestVarianceReduction(unittest.TestCase):
+
+    def setUp(self):
+        self.S = 100.
+        self.t = 1.
+        self.r = .05
+        self.sigma = .2
+        self.q = .01
+        self.K = numpy.array([90., 100., 110.])
+
+    def simulate(self, payoff, steps=1, **kwargs):
+        return monte_carlo(payoff, self.S, self.t, self.r, self.sigma, self.q, steps=steps,
+                           paths=2 ** 15, block_size=2 ** 12, seed=3, **kwargs)
+
+    def check(self, payoff, expected, steps=1, minimum_reduction=1., **kwargs):
+        result = self.simulate(payoff, steps=steps, **kwargs)
+        self.assertTrue(numpy.all(numpy.abs(result['price'] - expected) <= 4 * result['standard_error'] + 1e-12), result)
+        self.assertTrue(numpy.all(result['variance_reduction'] > minimum_reduction), result)
+        return result
+
+    def test_plain(self):
+        result = self.simulate(European('c', self.K))
+        self.assertTrue(numpy.allclose(result['variance_reduction'], 1.))
+
+    def test_european(self):
+        payoff = European('c', self.K)
+        expected = payoff.expected_value(self.S, self.t, self.r, self.sigma, self.q, 1)
+        self.check(payoff, expected, antithetic=True)
+        self.check(payoff, expected, minimum_reduction=100, sobol=True)
+        self.check(payoff, expected, minimum_reduction=1000, sobol=True, antithetic=True)
+        # one at-the-money call controls the whole strip
+        self.check(payoff, expected, minimum_reduction=3, control_variate=European('c', 100.))
+
+    def test_geometric_asian_expected_value(self):
+        payoff = GeometricAsian('p', self.K)
+        expected = payoff.expected_value(self.S, self.t, self.r, self.sigma, self.q, 12)
+        self.check(payoff, expected, steps=12, minimum_reduction=10, sobol=True)
+        one_date = GeometricAsian('p', self.K).expected_value(self.S, self.t, self.r, self.sigma, self.q, 1)
+        self.assertTrue(numpy.allclose(one_date, European('p', self.K).expected_value(
+            self.S, self.t, self.r, self.sigma, self.q, 1), rtol=1e-12))
+
+    def test_arithmetic_asian(self):
+        payoff = ArithmeticAsian('c', self.K)
+        control = GeometricAsian('c', self.K)
+        reference = monte_carlo(payoff, self.S, self.t, self.r, self.sigma, self.q, steps=12, paths=2 ** 18,
+                                block_size=2 ** 14, seed=4, sobol=True, control_variate=control)
+        result = self.check(payoff, reference['price'], steps=12, minimum_reduction=300, control_variate=control)
+        self.assertLess(result['standard_error'].max(), .002)
+        self.check(payoff, reference['price'], steps=12, minimum_reduction=300, control_variate=control,
+                   antithetic=True)
+
+    def test_antithetic_block_size(self):
+        self.assertRaises(InvalidArgument, monte_carlo, European('c', 100.), self.S, self.t, self.r, self.sigma,
+                          self.q, block_size=999, antithetic=True)
+
+    def test_antithetic_odd_paths(self):
+        result = monte_carlo(European('c', 100.), self.S, self.t, self.r, self.sigma, self.q, paths=10001,
+                             block_size=1000, antithetic=True, seed=0)
+        self.assertEqual(result['paths'], 10002)
+        self.assertTrue(numpy.isfinite(result['price']) and numpy.isfinite(result['standard_error']))
+
+    def test_sobol_needs_two_blocks(self):
+        self.assertRaises(InvalidArgument, monte_carlo, European('c', 100.), self.S, self.t, self.r, self.sigma,
+                          self.q, paths=1000, block_size=1000, sobol=True)
+        result = monte_carlo(European('c', 100.), self.S, self.t, self.r, self.sigma, self.q, paths=1025,
+                             block_size=1024, sobol=True, seed=0)
+        self.assertEqual(result['paths'], 2048)
+        self.assertTrue(numpy.isfinite(result['standard_error']))
+
+
+class TestGreeks(unittest.TestCase):
+
+    def setUp(self):
+        self.S = 100.
+        self.t = .75
+        self.r = .04
+        self.sigma = .3
+        self.q = .015
+        self.K = numpy.array([80., 100., 130.])
+
+    def simulate(self, payoff, steps=1, **kwargs):
+        kwargs.setdefault('seed', 3)
+        kwargs.setdefault('greeks', True)
+        return monte_carlo(payoff, self.S, self.t, self.r, self.sigma, self.q, steps=steps, **kwargs)
+
+    def check(self, flag, **kwargs):
+        result = self.simulate(European(flag, self.K), **kwargs)
+        for name in ('delta', 'gamma', 'vega'):
+            greek = getattr(analytical, name)
+            expected = [greek(flag, self.S, k, self.t, self.r, self.sigma, self.q) for k in self.K]
+            self.assertEqual(result[name].shape, self.K.shape)
+            error = numpy.abs(result[name] - expected) / result[name + '_standard_error']
+            self.assertTrue(numpy.all(error < 4), (name, error))
+
+    def test_european_against_analytical(self):
+        for flag in ('c', 'p'):
+            self.check(flag, paths=200000)
+            self.check(flag, paths=2 ** 16, block_size=2 ** 12, sobol=True)
+            self.check(flag, paths=100000, steps=4, antithetic=True)
+
+    def test_price_unchanged(self):
+        payoff = ArithmeticAsian('c', self.K)
+        plain = self.simulate(payoff, steps=6, greeks=False)
+        with_greeks = self.simulate(payoff, steps=6)
+        self.assertTrue(numpy.allclose(plain['price'], with_greeks['price'], rtol=1e-12, atol=0))
+        self.assertTrue(numpy.allclose(plain['standard_error'], with_greeks['standard_error'], rtol=1e-12, atol=0))
+
+    def test_geometric_asian_against_closed_form(self):
+        payoff = GeometricAsian('p', 100.)
+        result = self.simulate(payoff, steps=12, paths=200000)
+        price = lambda S, sigma: payoff.expected_value(S, self.t, self.r, sigma, self.q, 12)
+        h = 1e-4
+        expected = {
+            'delta': (price(self.S + h, self.sigma) - price(self.S - h, self.sigma)) / (2 * h),
+            'vega': (price(self.S, self.sigma + h) - price(self.S, self.sigma - h)) / (2 * h) * .01,
+        }
+        for name, value in expected.items():
+            self.assertLess(abs(result[name] - value), 4 * result[name + '_standard_error'], name)
+
+    def test_control_variate_only_applies_to_price(self):
+        payoff = European('c', self.K)
+        plain = self.simulate(payoff, paths=50000)
+        controlled = self.simulate(payoff, paths=50000, control_variate=European('c', 100.))
+        for name in ('delta', 'gamma', 'vega'):
+            self.assertTrue(numpy.allclose(plain[name], controlled[name], rtol=1e-12, atol=0))
+
+
+if __name__ == '__main__':
+    unittest.main()
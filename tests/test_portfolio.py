@@ -0,0 +1,105 @@
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+import unittest
+
+# Related third party imports
+import numpy
+
+# Local application/library specific imports
+from py_vollib.black_scholes_merton.greeks import analytical
+from py_vollib.curves import Curve
+from py_vollib.helpers.exceptions import InvalidArgument
+from py_vollib.portfolio import Portfolio
+
+
+class TestPortfolio(unittest.TestCase):
+
+    def setUp(self):
+        rng = numpy.random.RandomState(0)
+        n = 200
+        self.flag = numpy.where(rng.uniform(size=n) < .5, 'c', 'p')
+        self.S = numpy.array([100., 50., 20.])[rng.randint(0, 3, n)]
+        self.K = self.S * numpy.exp(rng.uniform(-.3, .3, n))
+        self.t = rng.uniform(.05, 2, n)
+        self.sigma = rng.uniform(.1, .5, n)
+        self.quantity = rng.randint(-10, 10, n)
+        self.underlier = numpy.array(['AAA', 'BBB', 'CCC'])[(self.S == 50) + 2 * (self.S == 20)]
+        self.bucket = numpy.digitize(self.t, [.25, .5, 1.])
+        self.portfolio = Portfolio(self.flag, self.S, self.K, self.t, .03, self.sigma, .01,
+                                   quantity=self.quantity, multiplier=100,
+                                   underlier=self.underlier, bucket=self.bucket)
+
+    def test_position_greeks(self):
+        delta = self.portfolio.position_greeks(('delta',))['delta']
+        for i in range(0, 200, 17):
+            expected = analytical.delta(self.flag[i], self.S[i], self.K[i], self.t[i], .03, self.sigma[i], .01)
+            self.assertAlmostEqual(delta[i], 100 * self.quantity[i] * expected, delta=1e-9)
+
+    def test_aggregate(self):
+        position = self.portfolio.position_greeks(('delta', 'vega'))
+        by_underlier = self.portfolio.aggregate(('delta', 'vega'), by='underlier')
+        for i, underlier in enumerate(self.portfolio.underliers):
+            mask = self.underlier == underlier
+            for name in ('delta', 'vega'):
+                self.assertAlmostEqual(by_underlier[name][i], position[name][mask].sum(), delta=1e-8)
+
+        by_both = self.portfolio.aggregate(('vega',), by=('underlier', 'bucket'))['vega']
+        self.assertEqual(by_both.shape, (3, 4))
+        for i, underlier in enumerate(self.portfolio.underliers):
+            for j, bucket in enumerate(self.portfolio.buckets):
+                mask = (self.underlier == underlier) & (self.bucket == bucket)
+                self.assertAlmostEqual(by_both[i, j], position['vega'][mask].sum(), delta=1e-8)
+
+        by_bucket = self.portfolio.aggregate(('vega',), by='bucket')['vega']
+        self.assertTrue(numpy.allclose(by_bucket, by_both.sum(axis=0)))
+
+    def test_incremental_updates(self):
+        rng = numpy.random.RandomState(1)
+        self.portfolio.totals()
+        for _ in range(20):
+            index = rng.choice(200, 5, replace=False)
+            self.portfolio.update(index, quantity=rng.randint(-10, 10, 5), sigma=rng.uniform(.1, .5, 5),
+                                  S=self.portfolio.S[index] * (1 + rng.uniform(-.01, .01, 5)))
+        incremental = self.portfolio.totals()
+        full = self.portfolio.aggregate(self.portfolio.tracked, by=('underlier', 'bucket'))
+        for name in self.portfolio.tracked:
+            self.assertTrue(numpy.allclose(incremental[name], full[name], rtol=1e-12, atol=1e-8), name)
+
+        self.portfolio.recompute()
+        by_underlier = self.portfolio.totals(by='underlier')
+        self.assertTrue(numpy.allclose(by_underlier['vega'], full['vega'].sum(axis=1)))
+
+    def test_updates_resolve_curves(self):
+        curve = Curve([.25, 2.], [.01, .06])
+        dividend = Curve([.5, 1.], [.0, .02])
+        t = numpy.array([.25, .25, 1.])
+        portfolio = Portfolio('c', 100., 100., t, curve, .2, dividend, quantity=[1, 2, -1])
+        portfolio.totals()
+        portfolio.update([0, 2], t=[2., .5])
+        expected = Portfolio('c', 100., 100., [2., .25, .5], curve, .2, dividend, quantity=[1, 2, -1])
+        self.assertTrue(numpy.allclose(portfolio.r, expected.r, rtol=1e-15, atol=0))
+        self.assertTrue(numpy.allclose(portfolio.q, expected.q, rtol=1e-15, atol=0))
+        for name, total in portfolio.totals().items():
+            self.assertTrue(numpy.allclose(total, expected.totals()[name], rtol=1e-12, atol=1e-12), name)
+
+        portfolio.update([1], r=curve, q=.01)
+        flat = Portfolio('c', 100., 100., [.25, 2.], .03, .2)
+        flat.totals()
+        flat.update([0], r=curve)
+        flat.update([1], t=.25, r=.02)
+        self.assertTrue(numpy.allclose(flat.r, [.01, .02], rtol=1e-15, atol=0))
+        expected = Portfolio('c', 100., 100., .25, [.01, .02], .2)
+        self.assertTrue(numpy.allclose(flat.totals()['rho'], expected.totals()['rho'], rtol=1e-12, atol=0))
+
+    def test_invalid_updates(self):
+        self.assertRaises(InvalidArgument, self.portfolio.update, [1, 1], quantity=[1, 2])
+        self.assertRaises(InvalidArgument, self.portfolio.update, [1], underlier=['AAA'])
+
+    def test_invalid_grouping(self):
+        self.assertRaises(InvalidArgument, self.portfolio.aggregate, ('delta',), 'strike')
+
+
+if __name__ == '__main__':
+    unittest.main()
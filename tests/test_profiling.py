@@ -0,0 +1,92 @@
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+import unittest
+
+# Related third party imports
+import numpy
+
+# Local application/library specific imports
+from py_vollib.curves import Curve
+from py_vollib.helpers import analytical_greeks
+from py_vollib.helpers.profiling import Profile
+from py_vollib.ref_python.black import black
+from py_vollib.ref_python.black.implied_volatility import vectorized_implied_volatility as black_iv
+from py_vollib.ref_python.black_scholes import black_scholes
+from py_vollib.ref_python.black_scholes_merton import black_scholes_merton
+from py_vollib.ref_python.black_scholes_merton.implied_volatility import vectorized_implied_volatility
+
+
+class TestProfile(unittest.TestCase):
+
+    def setUp(self):
+        rng = numpy.random.RandomState(0)
+        self.size = 1000
+        self.flag = numpy.where(rng.rand(self.size) < .5, 'c', 'p')
+        self.S = 100.
+        self.K = rng.uniform(80., 120., self.size)
+        self.t = rng.uniform(.1, 2., self.size)
+        self.r = .02
+        self.sigma = rng.uniform(.15, .5, self.size)
+        self.q = .01
+
+    def assertStages(self, profile, stages):
+        self.assertIsInstance(profile, Profile)
+        self.assertEqual(list(profile.stages), stages)
+        for record in profile.stages.values():
+            self.assertGreaterEqual(record['time'], 0.)
+        self.assertAlmostEqual(profile.total, sum(r['time'] for r in profile.stages.values()), delta=1e-12)
+        self.assertEqual(profile.stages['input']['rows'], self.size)
+
+    def test_prices(self):
+        cases = [
+            (black, (self.flag, self.S, self.K, self.t, self.r, self.sigma)),
+            (black_scholes, (self.flag, self.S, self.K, self.t, self.r, self.sigma)),
+            (black_scholes_merton, (self.flag, self.S, self.K, self.t, self.r, self.sigma, self.q)),
+        ]
+        for function, args in cases:
+            price, profile = function(*args, profile=True)
+            self.assertTrue(numpy.array_equal(price, function(*args)))
+            self.assertStages(profile, ['input', 'setup', 'solver'])
+            self.assertEqual(profile.stages['solver']['rows'], self.size)
+            self.assertEqual(profile.stages['solver']['bytes'], 3 * 8 * self.size)
+
+    def test_implied_volatility(self):
+        price = black_scholes_merton(self.flag, self.S, self.K, self.t, self.r, self.sigma, self.q)
+        args = (price, self.S, self.K, self.t, self.r, self.q, self.flag)
+        sigma, converged, profile = vectorized_implied_volatility(*args, full_output=True, profile=True)
+        self.assertTrue(numpy.array_equal(sigma, vectorized_implied_volatility(*args)))
+        self.assertTrue(converged.all())
+        self.assertStages(profile, ['setup', 'input', 'solver', 'output'])
+        self.assertEqual(profile.stages['input']['bytes'], 7 * 8 * self.size)
+
+        sigma, profile = vectorized_implied_volatility(*args, profile=True)
+        self.assertEqual(sigma.shape, (self.size,))
+        self.assertIsInstance(profile, Profile)
+
+    def test_scalar_implied_volatility(self):
+        price = black('c', 100., 100., .5, .02, .2)
+        sigma, profile = black_iv(price, 100., 100., .02, .5, 'c', profile=True)
+        self.assertAlmostEqual(sigma, .2, delta=1e-12)
+        self.assertEqual(profile.stages['output']['rows'], 1)
+
+    def test_greeks(self):
+        args = (self.flag, self.S, self.K, self.t, Curve([.5, 1.], [.02, .03]), self.sigma, .01)
+        result, profile = analytical_greeks.greeks(*args, profile=True)
+        expected = analytical_greeks.greeks(*args)
+        self.assertEqual(list(result), list(expected))
+        for name in expected:
+            self.assertTrue(numpy.array_equal(result[name], expected[name]))
+        self.assertStages(profile, ['input', 'setup', 'solver', 'greeks'])
+        self.assertEqual(profile.stages['greeks']['bytes'], 11 * 8 * self.size)
+
+    def test_report(self):
+        _, profile = black(self.flag, self.S, self.K, self.t, self.r, self.sigma, profile=True)
+        report = str(profile).splitlines()
+        self.assertEqual([line.split()[0] for line in report], ['stage', 'input', 'setup', 'solver', 'total'])
+        self.assertEqual(set(profile.as_dict()), {'stages', 'total'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+import unittest
+
+# Related third party imports
+import numpy
+
+# Local application/library specific imports
+from py_vollib.helpers.dual import Dual, tangent
+from py_vollib.ref_python.black.greeks import adjoint as black_adjoint
+from py_vollib.ref_python.black.greeks import automatic as black_automatic
+from py_vollib.ref_python.black_scholes.greeks import adjoint as black_scholes_adjoint
+from py_vollib.ref_python.black_scholes.greeks import automatic as black_scholes_automatic
+from py_vollib.ref_python.black_scholes_merton import black_scholes_merton
+from py_vollib.ref_python.black_scholes_merton.greeks import adjoint as black_scholes_merton_adjoint
+from py_vollib.ref_python.black_scholes_merton.greeks import automatic as black_scholes_merton_automatic
+
+
+class TestAdjointBookSensitivities(unittest.TestCase):
+
+    def setUp(self):
+        rng = numpy.random.RandomState(0)
+        n = 500
+        self.S = 100.
+        self.K = self.S * numpy.exp(rng.uniform(-.5, .5, n))
+        self.t = .75
+        self.r = .03
+        self.q = .01
+        self.sigma = rng.uniform(.1, .6, n)
+        self.flag = numpy.where(rng.uniform(size=n) < .5, 'c', 'p')
+        self.quantity = rng.randint(-10, 10, n).astype(float)
+
+    def assert_matches_greeks(self, book, greeks, spot):
+        quantity = self.quantity
+        self.assertAlmostEqual(book['value'], numpy.sum(quantity * greeks['price']), delta=1e-9)
+        self.assertAlmostEqual(book[spot], numpy.sum(quantity * greeks['delta']), delta=1e-9)
+        self.assertAlmostEqual(book['r'], numpy.sum(quantity * greeks['rho']) * 100, delta=1e-9)
+        self.assertAlmostEqual(book['t'], -numpy.sum(quantity * greeks['theta']) * 365, delta=1e-9)
+        self.assertEqual(book['sigma'].shape, self.sigma.shape)
+        self.assertTrue(numpy.allclose(book['sigma'], quantity * greeks['vega'] * 100, rtol=0, atol=1e-10))
+
+    def test_black(self):
+        args = (self.flag, self.S, self.K, self.t, self.r, self.sigma)
+        book = black_adjoint.book_sensitivities(*args, quantity=self.quantity)
+        self.assert_matches_greeks(book, black_automatic.greeks(*args), 'F')
+
+    def test_black_scholes(self):
+        args = (self.flag, self.S, self.K, self.t, self.r, self.sigma)
+        book = black_scholes_adjoint.book_sensitivities(*args, quantity=self.quantity)
+        self.assert_matches_greeks(book, black_scholes_automatic.greeks(*args), 'S')
+
+    def test_black_scholes_merton(self):
+        args = (self.flag, self.S, self.K, self.t, self.r, self.sigma, self.q)
+        book = black_scholes_merton_adjoint.book_sensitivities(*args, quantity=self.quantity)
+        self.assert_matches_greeks(book, black_scholes_merton_automatic.greeks(*args), 'S')
+
+        q = Dual(self.q, (1.0,))
+        price = black_scholes_merton(self.flag, self.S, self.K, self.t, self.r, self.sigma, q)
+        self.assertAlmostEqual(book['q'], numpy.sum(self.quantity * tangent(price, 0)), delta=1e-9)
+
+    def test_per_option_spot(self):
+        S = self.S * numpy.ones_like(self.K)
+        args = (self.flag, S, self.K, self.t, self.r, self.sigma, self.q)
+        book = black_scholes_merton_adjoint.book_sensitivities(*args, quantity=self.quantity)
+        greeks = black_scholes_merton_automatic.greeks(*args)
+        self.assertTrue(numpy.allclose(book['S'], self.quantity * greeks['delta'], rtol=0, atol=1e-12))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+import unittest
+
+# Related third party imports
+import numpy
+
+# Local application/library specific imports
+from py_vollib.ref_python.black import black
+from py_vollib.ref_python.black.greeks import analytical as black_analytical
+from py_vollib.ref_python.black.greeks import automatic as black_automatic
+from py_vollib.ref_python.black_scholes import black_scholes
+from py_vollib.ref_python.black_scholes.greeks import analytical as black_scholes_analytical
+from py_vollib.ref_python.black_scholes.greeks import automatic as black_scholes_automatic
+from py_vollib.ref_python.black_scholes_merton import black_scholes_merton
+from py_vollib.ref_python.black_scholes_merton.greeks import analytical as black_scholes_merton_analytical
+from py_vollib.ref_python.black_scholes_merton.greeks import automatic as black_scholes_merton_automatic
+from tests.test_utils import IteratorForTestData
+
+
+class TestAutomaticGreeksAgainstAnalytical(unittest.TestCase):
+
+    def setUp(self):
+        self.S, self.K, self.t, self.r, self.sigma = IteratorForTestData().columns('S', 'K', 't', 'R', 'v')
+
+    def assert_greeks(self, price, analytical, automatic, *args):
+        for flag in ('c', 'p'):
+            result = automatic.greeks(flag, *args)
+            self.assertTrue(numpy.allclose(result['price'], price(flag, *args), rtol=0, atol=1e-10))
+            for name in ('delta', 'gamma', 'theta', 'vega', 'rho'):
+                expected = getattr(analytical, name)(flag, *args)
+                self.assertTrue(numpy.allclose(result[name], expected, rtol=0, atol=1e-10), name)
+                self.assertTrue(numpy.allclose(getattr(automatic, name)(flag, *args), expected, rtol=0, atol=1e-10), name)
+
+    def test_black(self):
+        self.assert_greeks(black, black_analytical, black_automatic,
+                           self.S, self.K, self.t, self.r, self.sigma)
+
+    def test_black_scholes(self):
+        self.assert_greeks(black_scholes, black_scholes_analytical, black_scholes_automatic,
+                           self.S, self.K, self.t, self.r, self.sigma)
+
+    def test_black_scholes_merton(self):
+        self.assert_greeks(black_scholes_merton, black_scholes_merton_analytical, black_scholes_merton_automatic,
+                           self.S, self.K, self.t, self.r, self.sigma, .03)
+
+    def test_flag_array(self):
+        flag = numpy.where(numpy.arange(len(self.S)) % 2, 'p', 'c')
+        result = black_scholes_merton_automatic.greeks(flag, self.S, self.K, self.t, self.r, self.sigma, .03)
+        call = black_scholes_merton_automatic.greeks('c', self.S, self.K, self.t, self.r, self.sigma, .03)
+        put = black_scholes_merton_automatic.greeks('p', self.S, self.K, self.t, self.r, self.sigma, .03)
+        for name in result:
+            self.assertTrue(numpy.allclose(result[name], numpy.where(flag == 'c', call[name], put[name]),
+                                           rtol=0, atol=0), name)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,6 +6,7 @@ from __future__ import print_function
 import unittest
 
 # Related third party imports
+import numpy
 
 # Local application/library specific imports
 from py_vollib.ref_python.black_scholes import black_scholes
@@ -26,6 +27,11 @@ class TestRefPythonBlackScholesAgainstBenchmarkValues(unittest.TestCase):
             self.assertAlmostEqual(black_scholes('c', S, K, t, r, sigma), row['bs_call'], delta=0.000001)
             self.assertAlmostEqual(black_scholes('p', S, K, t, r, sigma), row['bs_put'], delta=0.000001)
 
+    def test_prices_vectorized(self):
+        S, K, t, r, sigma, call, put = self.tdi.columns('S', 'K', 't', 'R', 'v', 'bs_call', 'bs_put')
+        self.assertTrue(numpy.allclose(black_scholes('c', S, K, t, r, sigma), call, rtol=0, atol=0.000001))
+        self.assertTrue(numpy.allclose(black_scholes('p', S, K, t, r, sigma), put, rtol=0, atol=0.000001))
+
     def test_analytical_delta(self):
         while self.tdi.has_next():
             row = self.tdi.next_row()
@@ -6,6 +6,7 @@ from __future__ import print_function
 import unittest
 
 # Related third party imports
+import numpy
 
 # Local application/library specific imports
 from py_vollib.ref_python.black_scholes_merton import black_scholes_merton
@@ -29,6 +30,15 @@ class TestRefPythonBlackScholesMertonAgainstBenchmarkValues(unittest.TestCase):
             self.assertAlmostEqual(black_scholes_merton('c', S, K, t, r, sigma, q), row['bs_call'], delta=0.000001)
             self.assertAlmostEqual(black_scholes_merton('p', S, K, t, r, sigma, q), row['bs_put'], delta=0.000001)
 
+    def test_prices_vectorized(self):
+        S, K, t, r, sigma, call, put = self.tdi.columns('S', 'K', 't', 'R', 'v', 'bs_call', 'bs_put')
+        self.assertTrue(numpy.allclose(black_scholes_merton('c', S, K, t, r, sigma, q), call, rtol=0, atol=0.000001))
+        self.assertTrue(numpy.allclose(black_scholes_merton('p', S, K, t, r, sigma, q), put, rtol=0, atol=0.000001))
+
+        flag = numpy.where(numpy.arange(len(S)) % 2, 'p', 'c')
+        expected = numpy.where(flag == 'c', call, put)
+        self.assertTrue(numpy.allclose(black_scholes_merton(flag, S, K, t, r, sigma, q), expected, rtol=0, atol=0.000001))
+
     def test_analytical_delta(self):
         while self.tdi.has_next():
             row = self.tdi.next_row()
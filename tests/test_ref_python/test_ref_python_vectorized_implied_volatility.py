@@ -0,0 +1,90 @@
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+import unittest
+
+# Related third party imports
+import numpy
+
+# Local application/library specific imports
+from py_vollib.ref_python.black import black
+from py_vollib.ref_python.black import implied_volatility as black_iv
+from py_vollib.ref_python.black_scholes import black_scholes
+from py_vollib.ref_python.black_scholes import implied_volatility as black_scholes_iv
+from py_vollib.ref_python.black_scholes_merton import black_scholes_merton
+from py_vollib.ref_python.black_scholes_merton import implied_volatility as black_scholes_merton_iv
+from py_vollib.ref_python.solvers import newton_bisection
+
+
+class TestVectorizedImpliedVolatilityAgainstBrentq(unittest.TestCase):
+
+    def setUp(self):
+        rng = numpy.random.RandomState(0)
+        n = 200
+        self.S = 100.
+        self.K = self.S * numpy.exp(rng.uniform(-.8, .8, n))
+        self.t = rng.uniform(.02, 3, n)
+        self.r = rng.uniform(0, .08, n)
+        self.q = rng.uniform(0, .05, n)
+        self.sigma = rng.uniform(.03, 2, n)
+        # out-of-the-money options keep the inversion well conditioned
+        self.flag = numpy.where(self.K > self.S * numpy.exp((self.r - self.q) * self.t), 'c', 'p')
+
+    def assert_matches(self, price, expected, actual, converged):
+        self.assertTrue(numpy.all(converged))
+        self.assertTrue(numpy.allclose(actual, expected, rtol=1e-10, atol=0))
+
+    def test_black(self):
+        rows = list(zip(self.flag, self.K, self.t, self.r, self.sigma))
+        price = [black(f, self.S, k, t, r, v) for f, k, t, r, v in rows]
+        expected = [black_iv.implied_volatility(p, self.S, k, r, t, f) for p, (f, k, t, r, v) in zip(price, rows)]
+        actual, converged = black_iv.vectorized_implied_volatility(
+            price, self.S, self.K, self.r, self.t, self.flag, full_output=True)
+        self.assert_matches(price, expected, actual, converged)
+
+    def test_black_scholes(self):
+        rows = list(zip(self.flag, self.K, self.t, self.r, self.sigma))
+        price = [black_scholes(f, self.S, k, t, r, v) for f, k, t, r, v in rows]
+        expected = [black_scholes_iv.implied_volatility(p, self.S, k, t, r, f) for p, (f, k, t, r, v) in zip(price, rows)]
+        actual, converged = black_scholes_iv.vectorized_implied_volatility(
+            price, self.S, self.K, self.t, self.r, self.flag, full_output=True)
+        self.assert_matches(price, expected, actual, converged)
+
+    def test_black_scholes_merton(self):
+        rows = list(zip(self.flag, self.K, self.t, self.r, self.sigma, self.q))
+        price = [black_scholes_merton(f, self.S, k, t, r, v, q) for f, k, t, r, v, q in rows]
+        expected = [black_scholes_merton_iv.implied_volatility(p, self.S, k, t, r, q, f)
+                    for p, (f, k, t, r, v, q) in zip(price, rows)]
+        actual, converged = black_scholes_merton_iv.vectorized_implied_volatility(
+            price, self.S, self.K, self.t, self.r, self.q, self.flag, full_output=True)
+        self.assert_matches(price, expected, actual, converged)
+
+    def test_scalar(self):
+        price = black_scholes_merton('p', 100, 95, .5, .01, .3, .02)
+        iv = black_scholes_merton_iv.vectorized_implied_volatility(price, 100, 95, .5, .01, .02, 'p')
+        self.assertEqual(numpy.ndim(iv), 0)
+        self.assertAlmostEqual(iv, black_scholes_merton_iv.implied_volatility(price, 100, 95, .5, .01, .02, 'p'),
+                               delta=1e-12)
+
+
+class TestNewtonBisection(unittest.TestCase):
+
+    def test_unbracketed_rows(self):
+        c = numpy.array([-1., 4., 2000.])
+        f = lambda x, rows: (x * x * x - c[rows], 3 * x * x)
+        root, converged = newton_bisection(f, 0., 10., numpy.ones(3), full_output=True)
+        self.assertEqual(list(converged), [False, True, False])
+        self.assertTrue(numpy.isnan(root[[0, 2]]).all())
+        self.assertAlmostEqual(root[1], 4 ** (1 / 3.), delta=1e-15)
+
+    def test_bisects_when_newton_leaves_bracket(self):
+        # arctan has vanishing slope far from the root, so plain Newton diverges
+        f = lambda x, rows: (numpy.arctan(x), 1 / (1 + x * x))
+        root, converged = newton_bisection(f, -20., 30., numpy.array([15.]), full_output=True)
+        self.assertTrue(converged[0])
+        self.assertAlmostEqual(root[0], 0, delta=1e-15)
+
+
+if __name__ == '__main__':
+    unittest.main()
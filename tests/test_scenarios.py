@@ -0,0 +1,97 @@
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+from itertools import product
+import unittest
+
+# Related third party imports
+import numpy
+
+# Local application/library specific imports
+from py_vollib.black_scholes_merton import black_scholes_merton
+from py_vollib.curves import Curve
+from py_vollib.helpers.exceptions import InvalidArgument
+from py_vollib.ref_python.black import black
+from py_vollib.scenarios import black_scenario_pnl, scenario_pnl
+
+
+class TestScenarioPnL(unittest.TestCase):
+
+    def setUp(self):
+        rng = numpy.random.RandomState(0)
+        n = 7
+        self.S = 100.
+        self.K = self.S * numpy.exp(rng.uniform(-.3, .3, n))
+        self.t = numpy.array([.5, 1., .02, 2., .25, .75, 1.5])
+        self.sigma = rng.uniform(.15, .4, n)
+        self.flag = numpy.where(rng.uniform(size=n) < .5, 'c', 'p')
+        self.quantity = rng.randint(-5, 5, n)
+        self.r = .03
+        self.q = .01
+        self.spot_shocks = numpy.linspace(-.2, .2, 5)
+        self.vol_shocks = numpy.array([-.05, 0., .05])
+        self.horizons = numpy.array([0., 1 / 365., 30 / 365.])
+
+    def pnl(self, **kwargs):
+        return scenario_pnl(self.flag, self.S, self.K, self.t, self.r, self.sigma, self.q,
+                            self.spot_shocks, self.vol_shocks, self.horizons, quantity=self.quantity, **kwargs)
+
+    def test_against_scalar_pricer(self):
+        cube = self.pnl()
+        self.assertEqual(cube.shape, (7, 5, 3, 3))
+        for i, (j, spot), (k, vol), (l, horizon) in product(range(7), enumerate(self.spot_shocks),
+                                                            enumerate(self.vol_shocks), enumerate(self.horizons)):
+            flag, K, t, sigma = self.flag[i], self.K[i], self.t[i], self.sigma[i]
+            S = self.S * (1 + spot)
+            if t - horizon > 0:
+                price = black_scholes_merton(flag, S, K, t - horizon, self.r, sigma + vol, self.q)
+            else:
+                price = max((S - K) if flag == 'c' else (K - S), 0)
+            base = black_scholes_merton(flag, self.S, K, t, self.r, sigma, self.q)
+            self.assertAlmostEqual(cube[i, j, k, l], self.quantity[i] * (price - base), delta=1e-9)
+
+    def test_chunking_and_aggregation(self):
+        cube = self.pnl()
+        self.assertTrue(numpy.allclose(self.pnl(chunk_size=2), cube, rtol=0, atol=1e-12))
+        self.assertTrue(numpy.allclose(self.pnl(chunk_size=3, aggregate=True), cube.sum(axis=0), rtol=0, atol=1e-12))
+
+    def test_non_positive_shocked_vol(self):
+        self.assertRaises(InvalidArgument, scenario_pnl, 'c', 100., 100., .5, .02, .1, .01, vol_shocks=(-.2,))
+        self.assertRaises(InvalidArgument, scenario_pnl, 'c', 100., 100., .5, .02, .1, .01, vol_shocks=(-.1, 0.))
+        self.assertRaises(InvalidArgument, scenario_pnl, self.flag, self.S, self.K, self.t, self.r, self.sigma,
+                          self.q, vol_shocks=(-self.sigma.min(),))
+
+    def test_curves_use_forward_rates(self):
+        curve = Curve([.25, 2.], [.01, .06])
+        dividend = Curve([.5, 1.], [0., .02])
+        horizons = numpy.array([0., 30 / 365., .4])
+        cube = scenario_pnl(self.flag, self.S, self.K, self.t, curve, self.sigma, dividend,
+                            self.spot_shocks, self.vol_shocks, horizons, quantity=self.quantity)
+        for i, (j, spot), (l, horizon) in product(range(7), enumerate(self.spot_shocks), enumerate(horizons)):
+            flag, K, t, sigma = self.flag[i], self.K[i], self.t[i], self.sigma[i]
+            S = self.S * (1 + spot)
+            if t - horizon > 0:
+                # the rates that grow the discount factors from the horizon to expiry
+                r = numpy.log(curve.discount_factor(horizon) / curve.discount_factor(t)) / (t - horizon)
+                q = numpy.log(dividend.discount_factor(horizon) / dividend.discount_factor(t)) / (t - horizon)
+                price = black_scholes_merton(flag, S, K, t - horizon, r, sigma, q)
+            else:
+                price = max((S - K) if flag == 'c' else (K - S), 0)
+            base = black_scholes_merton(flag, self.S, K, t, curve.zero_rate(t), sigma, dividend.zero_rate(t))
+            self.assertAlmostEqual(cube[i, j, 1, l], self.quantity[i] * (price - base), delta=1e-9)
+
+        black_cube = black_scenario_pnl(self.flag, self.S, self.K, self.t, curve, self.sigma,
+                                        horizons=horizons, quantity=self.quantity)
+        forward = (curve.zero_rate(self.t[:, None]) * self.t[:, None] - curve.zero_rate(horizons) * horizons) / \
+            (self.t[:, None] - horizons)
+        live = self.t[:, None] > horizons
+        price = black(self.flag[:, None], self.S, self.K[:, None], numpy.where(live, self.t[:, None] - horizons, 1.),
+                      forward, self.sigma[:, None])
+        base = black(self.flag, self.S, self.K, self.t, curve, self.sigma)
+        expected = self.quantity[:, None] * (price - base[:, None])
+        self.assertTrue(numpy.allclose(black_cube[:, 0, 0][live], expected[live], rtol=0, atol=1e-9))
+
+
+if __name__ == '__main__':
+    unittest.main()
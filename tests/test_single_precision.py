@@ -0,0 +1,125 @@
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+import unittest
+
+# Related third party imports
+import numpy
+
+# Local application/library specific imports
+from py_vollib.curves import Curve
+from py_vollib.helpers.analytical_greeks import greeks
+from py_vollib.ref_python.black import black
+from py_vollib.ref_python.black.implied_volatility import vectorized_implied_volatility as black_iv
+from py_vollib.ref_python.black_scholes import black_scholes
+from py_vollib.ref_python.black_scholes.implied_volatility import vectorized_implied_volatility as black_scholes_iv
+from py_vollib.ref_python.black_scholes_merton import black_scholes_merton
+from py_vollib.ref_python.black_scholes_merton.implied_volatility import vectorized_implied_volatility
+from py_vollib.scenarios import scenario_pnl
+
+
+class TestSinglePrecision(unittest.TestCase):
+
+    def setUp(self):
+        rng = numpy.random.RandomState(0)
+        size = 10000
+        self.flag = numpy.where(rng.rand(size) < .5, 'c', 'p')
+        self.S = 100.
+        self.K = rng.uniform(50., 150., size)
+        self.t = rng.uniform(.02, 2., size)
+        self.r = rng.uniform(0., .05, size)
+        self.q = rng.uniform(0., .03, size)
+        self.sigma = rng.uniform(.1, .8, size)
+
+    def test_prices(self):
+        cases = [
+            (black, (self.flag, self.S, self.K, self.t, self.r, self.sigma)),
+            (black_scholes, (self.flag, self.S, self.K, self.t, self.r, self.sigma)),
+            (black_scholes_merton, (self.flag, self.S, self.K, self.t, self.r, self.sigma, self.q)),
+        ]
+        for function, args in cases:
+            double = function(*args)
+            single = function(*args, dtype=numpy.float32)
+            self.assertEqual(single.dtype, numpy.float32)
+            self.assertLess(numpy.max(numpy.abs(single - double)), 1e-6 * self.S)
+            self.assertTrue(numpy.array_equal(function(*args, dtype=numpy.float64), double))
+
+    def test_scalar_and_curve(self):
+        price = black_scholes_merton('c', 100., 100., .5, Curve([1.], [.02]), .2, .01, dtype=numpy.float32)
+        self.assertIsInstance(price, numpy.float32)
+        self.assertAlmostEqual(price, black_scholes_merton('c', 100., 100., .5, .02, .2, .01), delta=1e-5)
+
+    def test_scalars_are_single_precision(self):
+        # computed in float32, not computed in float64 and rounded, which
+        # would always land within half a float32 spacing of the double
+        for function in (black_scholes, black_scholes_merton):
+            single, double = [], []
+            for i in range(200):
+                args = (self.flag[i], self.S, self.K[i], self.t[i], self.r[i], self.sigma[i])
+                args += (self.q[i],) if function is black_scholes_merton else ()
+                single.append(function(*args, dtype=numpy.float32))
+                double.append(function(*args))
+                self.assertIsInstance(single[-1], numpy.float32)
+            single, double = numpy.array(single), numpy.array(double)
+            spacings = numpy.abs(single - double) / numpy.spacing(double.astype(numpy.float32))
+            self.assertGreater(numpy.mean(single != double.astype(numpy.float32)), .25)
+            self.assertGreater(spacings.max(), 4)
+            self.assertLess(numpy.max(numpy.abs(single - double) / (1 + double)), 1e-5)
+
+    def test_greeks(self):
+        args = (self.flag, self.S, self.K, self.t, self.r, self.sigma, self.r - self.q)
+        double = greeks(*args)
+        single = greeks(*args, dtype=numpy.float32)
+        self.assertEqual(list(single), list(double))
+        for name in double:
+            self.assertEqual(single[name].dtype, numpy.float32)
+            scale = numpy.max(numpy.abs(double[name]))
+            self.assertLess(numpy.max(numpy.abs(single[name] - double[name])), 1e-5 * scale, name)
+
+    def test_implied_volatility(self):
+        price = black_scholes_merton(self.flag, self.S, self.K, self.t, self.r, self.sigma, self.q)
+        sigma, converged = vectorized_implied_volatility(price, self.S, self.K, self.t, self.r, self.q, self.flag,
+                                                         full_output=True, dtype=numpy.float32)
+        self.assertEqual(sigma.dtype, numpy.float32)
+        vega = greeks(self.flag, self.S, self.K, self.t, self.r, self.sigma, self.r - self.q)['vega']
+        sensitive = converged & (vega > 1e-3)
+        self.assertGreater(sensitive.mean(), .9)
+        self.assertLess(numpy.max(numpy.abs(sigma[sensitive] - self.sigma[sensitive])), 1e-3)
+
+    def test_escalation(self):
+        # in the money with little time value, which single precision cannot bracket
+        K = numpy.array([100., 64.76855782, 76.50396984])
+        t = numpy.array([.1, .05653995, .05715185])
+        sigma = numpy.array([.2, .39226252, .21284137])
+        price = black_scholes_merton('c', 100., K, t, .02, sigma, 0.)
+        single, converged = vectorized_implied_volatility(price, 100., K, t, .02, 0., 'c', full_output=True,
+                                                          dtype=numpy.float32, escalate=False)
+        escalated, escalated_converged = vectorized_implied_volatility(price, 100., K, t, .02, 0., 'c',
+                                                                       full_output=True, dtype=numpy.float32)
+        self.assertEqual(converged.tolist(), [True, False, False])
+        self.assertTrue(numpy.isnan(single[1:]).all())
+        self.assertTrue(escalated_converged.all())
+        self.assertEqual(escalated.dtype, numpy.float32)
+        self.assertTrue(numpy.allclose(escalated, sigma, rtol=1e-5, atol=0))
+
+    def test_other_models(self):
+        price = black('c', 100., self.K, self.t, self.r, self.sigma)
+        sigma = black_iv(price, 100., self.K, self.r, self.t, 'c', dtype=numpy.float32)
+        self.assertEqual(sigma.dtype, numpy.float32)
+        price = black_scholes('p', 100., self.K, self.t, self.r, self.sigma)
+        sigma = black_scholes_iv(price, 100., self.K, self.t, self.r, 'p', dtype=numpy.float32)
+        self.assertEqual(sigma.dtype, numpy.float32)
+
+    def test_scenarios(self):
+        args = (self.flag[:50], self.S, self.K[:50], self.t[:50], self.r[:50], self.sigma[:50], self.q[:50],
+                numpy.linspace(-.1, .1, 5), [-.05, 0., .05], [0., 7 / 365., 1.])
+        double = scenario_pnl(*args)
+        single = scenario_pnl(*args, dtype=numpy.float32)
+        self.assertEqual(single.dtype, numpy.float32)
+        self.assertEqual(single.nbytes * 2, double.nbytes)
+        self.assertLess(numpy.max(numpy.abs(single - double)), 1e-4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -52,6 +52,16 @@ class IteratorForTestData(object):
 
     def has_next(self):
         return self.row_id < self.row_count
+
+    def columns(self, *names):
+        """Return the named columns as numpy arrays, for testing
+        vectorized functions against all rows at once.
+
+        >>> S, K = IteratorForTestData().columns('S', 'K')
+        >>> print (S[0])
+        100.0
+        """
+        return [self.df[name].values for name in names]
     
     
 # -----------------------------------------------------------------------------
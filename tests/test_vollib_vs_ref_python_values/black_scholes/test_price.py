@@ -5,11 +5,12 @@
 import unittest
 
 # Related third party imports
+import numpy
 
 # Local application/library specific imports
 from py_vollib.black_scholes import black_scholes as c_black_scholes
 from py_vollib.ref_python.black_scholes import black_scholes as py_black_scholes
-from tests.test_utils import almost_equal
+from tests.test_utils import almost_equal, IteratorForTestData
 
 
 class TestPrice(unittest.TestCase):
@@ -38,6 +39,14 @@ class TestPrice(unittest.TestCase):
         py_price = py_black_scholes(flag, S, K, t, r, sigma)
         self.assertTrue(almost_equal(c_price, py_price))
 
+    def test_test_data(self):
+        S, K, t, r, sigma = IteratorForTestData().columns('S', 'K', 't', 'R', 'v')
+        flag = numpy.where(numpy.arange(len(K)) % 2, 'p', 'c')
+
+        c_price = [c_black_scholes(f, spot, k, tt, rr, v) for f, spot, k, tt, rr, v in zip(flag, S, K, t, r, sigma)]
+        py_price = py_black_scholes(flag, S, K, t, r, sigma)
+        self.assertTrue(numpy.allclose(c_price, py_price, rtol=0, atol=1.0e-7))
+
 
 if __name__ == '__main__':
     unittest.main()
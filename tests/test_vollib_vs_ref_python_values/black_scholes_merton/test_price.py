@@ -5,11 +5,12 @@
 import unittest
 
 # Related third party imports
+import numpy
 
 # Local application/library specific imports
 from py_vollib.black_scholes_merton import black_scholes_merton as c_black_scholes_merton
 from py_vollib.ref_python.black_scholes_merton import black_scholes_merton as py_black_scholes_merton
-from tests.test_utils import almost_equal
+from tests.test_utils import almost_equal, IteratorForTestData
 
 
 class TestPrice(unittest.TestCase):
@@ -40,6 +41,15 @@ class TestPrice(unittest.TestCase):
         py_price = py_black_scholes_merton(flag, S, K, t, r, sigma, q)
         self.assertTrue(almost_equal(c_price, py_price))
 
+    def test_test_data(self):
+        S, K, t, r, sigma = IteratorForTestData().columns('S', 'K', 't', 'R', 'v')
+        q = .02
+        flag = numpy.where(numpy.arange(len(K)) % 2, 'p', 'c')
+
+        c_price = [c_black_scholes_merton(f, spot, k, tt, rr, v, q) for f, spot, k, tt, rr, v in zip(flag, S, K, t, r, sigma)]
+        py_price = py_black_scholes_merton(flag, S, K, t, r, sigma, q)
+        self.assertTrue(numpy.allclose(c_price, py_price, rtol=0, atol=1.0e-7))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,154 @@
+# -----------------------------------------------------------------------------
+# IMPORTS
+
+# Standard library imports
+import tracemalloc
+import unittest
+
+# Related third party imports
+import numpy
+
+# Local application/library specific imports
+from py_vollib.black.greeks import analytical as black_greeks
+from py_vollib.black_scholes.greeks import analytical as black_scholes_greeks
+from py_vollib.black_scholes_merton.greeks import analytical as black_scholes_merton_greeks
+from py_vollib.curves import Curve
+from py_vollib.helpers.analytical_greeks import GREEKS, greeks
+from py_vollib.helpers.exceptions import InvalidArgument
+from py_vollib.helpers.workspace import Workspace
+from py_vollib.ref_python.black import black
+from py_vollib.ref_python.black_scholes import black_scholes
+from py_vollib.ref_python.black_scholes_merton import black_scholes_merton
+from py_vollib.ref_python.black_scholes_merton.implied_volatility import vectorized_implied_volatility
+
+
+class TestWorkspace(unittest.TestCase):
+
+    def setUp(self):
+        rng = numpy.random.RandomState(0)
+        self.size = 10000
+        self.flag = numpy.where(rng.rand(self.size) < .5, 'c', 'p')
+        self.S = 100.
+        self.K = rng.uniform(50., 150., self.size)
+        self.t = rng.uniform(.02, 2., self.size)
+        self.r = rng.uniform(0., .05, self.size)
+        self.sigma = rng.uniform(.1, .8, self.size)
+        self.q = rng.uniform(0., .03, self.size)
+
+    def pricers(self):
+        return [
+            (black, (self.flag, self.S, self.K, self.t, self.r, self.sigma)),
+            (black_scholes, (self.flag, self.S, self.K, self.t, self.r, self.sigma)),
+            (black_scholes_merton, (self.flag, self.S, self.K, self.t, self.r, self.sigma, self.q)),
+        ]
+
+    def peak_memory(self, call):
+        tracemalloc.start()
+        try:
+            baseline = tracemalloc.get_traced_memory()[0]
+            call()
+            return tracemalloc.get_traced_memory()[1] - baseline
+        finally:
+            tracemalloc.stop()
+
+    def test_prices_are_unchanged(self):
+        for function, args in self.pricers():
+            out = numpy.empty(self.size)
+            price = function(*args, out=out, workspace=Workspace())
+            self.assertIs(price, out)
+            self.assertTrue(numpy.array_equal(price, function(*args)), function.__name__)
+
+    def test_greeks_are_unchanged(self):
+        args = (self.flag, self.S, self.K, self.t, self.r, self.sigma, self.r - self.q)
+        expected = greeks(*args)
+        out = dict((name, numpy.empty(self.size)) for name in GREEKS)
+        result = greeks(*args, out=out, workspace=Workspace())
+        self.assertEqual(list(result), list(expected))
+        for name in GREEKS:
+            self.assertIs(result[name], out[name])
+            self.assertTrue(numpy.array_equal(result[name], expected[name]), name)
+
+    def test_partial_out(self):
+        args = (self.flag, self.S, self.K, self.t, self.r, self.sigma, self.r - self.q)
+        out = {'theta': numpy.empty(self.size)}
+        result = greeks(*args, out=out)
+        self.assertIs(result['theta'], out['theta'])
+        self.assertTrue(numpy.array_equal(result['vega'], greeks(*args)['vega']))
+
+    def test_model_greeks(self):
+        for module, args in [
+                (black_greeks, (self.flag, self.S, self.K, self.t, self.r, self.sigma)),
+                (black_scholes_greeks, (self.flag, self.S, self.K, self.t, self.r, self.sigma)),
+                (black_scholes_merton_greeks, (self.flag, self.S, self.K, self.t, self.r, self.sigma, self.q))]:
+            expected = module.greeks(*args)
+            out = dict((name, numpy.empty(self.size)) for name in GREEKS)
+            result, profile = module.greeks(*args, out=out, workspace=Workspace(), profile=True)
+            for name in GREEKS:
+                self.assertIs(result[name], out[name])
+                self.assertTrue(numpy.array_equal(result[name], expected[name]), (module.__name__, name))
+            single = module.greeks(*args, dtype=numpy.float32)
+            self.assertEqual(set(value.dtype for value in single.values()), set([numpy.dtype(numpy.float32)]))
+
+    def test_steady_state_allocates_nothing(self):
+        # large enough that numpy's fixed size ufunc buffers are smaller than a column
+        size = 10 * self.size
+        flag, K, t, r, sigma, q = [numpy.tile(v, 10) for v in (self.flag, self.K, self.t, self.r, self.sigma, self.q)]
+        b = r - q
+        workspace = Workspace()
+        price = numpy.empty(size)
+        out = dict((name, numpy.empty(size)) for name in GREEKS)
+        calls = [lambda: black_scholes_merton(flag, self.S, K, t, r, sigma, q, out=price, workspace=workspace),
+                 lambda: greeks(flag, self.S, K, t, r, sigma, b, out=out, workspace=workspace)]
+        for call in calls:
+            call()
+            allocations = workspace.allocations
+            self.assertLess(self.peak_memory(call), size * 8)
+            self.assertEqual(workspace.allocations, allocations)
+
+    def test_workspace_follows_the_shape(self):
+        workspace = Workspace()
+        black_scholes_merton('c', 100., self.K, .5, .02, .2, .01, workspace=workspace)
+        allocations = workspace.allocations
+        price = black_scholes_merton('c', 100., self.K[:10], .5, .02, .2, .01, workspace=workspace)
+        self.assertGreater(workspace.allocations, allocations)
+        self.assertTrue(numpy.array_equal(price, black_scholes_merton('c', 100., self.K[:10], .5, .02, .2, .01)))
+
+    def test_single_precision(self):
+        out = numpy.empty(self.size, numpy.float32)
+        args = (self.flag, self.S, self.K, self.t, self.r, self.sigma, self.q)
+        price = black_scholes_merton(*args, out=out)
+        self.assertEqual(price.dtype, numpy.float32)
+        self.assertLess(numpy.max(numpy.abs(price - black_scholes_merton(*args))), 1e-4)
+        with self.assertRaises(InvalidArgument):
+            black_scholes_merton(*args, out=out, dtype=numpy.float64)
+
+    def test_curves_and_scalars(self):
+        curve = Curve([.5, 2.], [.01, .03])
+        price = black_scholes_merton('p', 100., self.K, self.t, curve, self.sigma, .01, workspace=Workspace())
+        self.assertTrue(numpy.array_equal(price, black_scholes_merton('p', 100., self.K, self.t, curve,
+                                                                      self.sigma, .01)))
+        out = numpy.empty(())
+        black_scholes('c', 100., 95., .5, .02, .2, out=out)
+        self.assertEqual(out[()], black_scholes('c', 100., 95., .5, .02, .2))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(InvalidArgument):
+            black_scholes_merton(self.flag, self.S, self.K, self.t, self.r, self.sigma, self.q,
+                                 out=numpy.empty(self.size + 1))
+        with self.assertRaises(InvalidArgument):
+            black_scholes_merton(['c', 'x'], 100., 100., .5, .02, .2, 0., workspace=Workspace())
+
+    def test_implied_volatility(self):
+        price = black_scholes_merton(self.flag, self.S, self.K, self.t, self.r, self.sigma, self.q)
+        out = numpy.empty(self.size)
+        sigma = vectorized_implied_volatility(price, self.S, self.K, self.t, self.r, self.q, self.flag, out=out)
+        self.assertIs(sigma, out)
+        expected = vectorized_implied_volatility(price, self.S, self.K, self.t, self.r, self.q, self.flag)
+        self.assertTrue(numpy.array_equal(sigma, expected, equal_nan=True))
+        with self.assertRaises(InvalidArgument):
+            vectorized_implied_volatility(price, self.S, self.K, self.t, self.r, self.q, self.flag,
+                                          out=numpy.empty(self.size, numpy.float32), dtype=numpy.float64)
+
+
+if __name__ == '__main__':
+    unittest.main()